@@ -8,6 +8,9 @@ Kullanim:
     python analyze.py SASA --period 6mo
     python analyze.py GARAN --detailed
     python analyze.py THYAO --macro
+    python analyze.py THYAO --profile
+    python analyze.py THYA --on-unknown resolve
+    python analyze.py THYAO --timeframe 15m --period 5d
 
 Yazar: Berke Yildirim
 Tarih: 2025-11-09
@@ -17,12 +20,13 @@ Guncelleme: 2025-11-11 (Faz 2: Makro entegrasyonu)
 import sys
 import argparse
 import os
-from src.data.fetcher import fetch_stock_data
 from src.data.bist_stocks import is_valid_bist_stock, suggest_similar_stocks
-from src.analysis.technical import analyze_stock, generate_signals
-from src.reporting.terminal import print_analysis_report, print_hybrid_report
-from src.macro.fetcher import MacroDataFetcher
-from src.analysis.hybrid import HybridAnalyzer
+from src.data.symbol_matcher import resolve_symbol
+from src.utils.profiling import enable_profiling, profile_stage, print_profile_report, dump_trace
+
+
+# Analizdeki en uzun gösterge penceresi (MA200)
+LONGEST_WINDOW = 200
 
 
 def main():
@@ -38,6 +42,13 @@ Ornekler:
   python analyze.py SASA --period 6mo    # 6 aylik veri
   python analyze.py THYAO --macro        # Hibrid analiz (Teknik + Makro)
   python analyze.py GARAN --detailed     # Detayli rapor
+  python analyze.py THYAO --no-cache     # Cache'i atla, veriyi yeniden cek
+  python analyze.py THYAO --profile      # Asama bazli sure dokumu
+  python analyze.py THYAO --trace t.json # Profil izini JSON'a kaydet
+  python analyze.py THYAO --no-cache --record data/tapes   # Cevaplari kaydet
+  python analyze.py THYAO --no-cache --replay data/tapes   # Internetsiz tekrar oynat
+  python analyze.py "turk hava" --on-unknown resolve       # Soru sormadan THYAO'ya coz
+  python analyze.py THYAO --timeframe 15m --period 5d      # 1m tabandan 15 dakikalik barlar
 
 Desteklenen periyotlar:
   1d, 5d, 1mo, 3mo, 6mo, 1y (varsayilan), 2y, 5y, max
@@ -59,12 +70,61 @@ Not: --macro kullanmadan once: python update_macro.py
         help='Veri periyodu (varsayilan: 1y)'
     )
     
+    parser.add_argument(
+        '--timeframe',
+        choices=['1m', '5m', '15m', '30m', '1h', '1d', '1wk'],
+        help='Saklanan 1m barlardan turetilen zaman diliminde analiz '
+             '(ayri ag istegi yok; gostergeler bar sayisina gore calisir)'
+    )
+    
     parser.add_argument(
         '--macro',
         action='store_true',
         help='Makroekonomik analiz ekle (Hibrid mod)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disk cache\'ini kullanma, veriyi her zaman internetten cek'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Asama bazli sure, cagri sayisi ve veri miktari raporu'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        type=str,
+        metavar='DOSYA',
+        help='Profil izini JSON olarak kaydet (chrome://tracing ile acilir, --profile icerir)'
+    )
+    
+    parser.add_argument(
+        '--record',
+        type=str,
+        metavar='KLASOR',
+        help='Cekilen ham verileri klasore kaydet (sonra --replay ile kullanilir)'
+    )
+    
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='KLASOR',
+        help='Internete cikmadan kayitli veriyi kullan'
+    )
+    
+    parser.add_argument(
+        '--on-unknown',
+        choices=['ask', 'resolve', 'continue'],
+        default='ask',
+        help='Listede olmayan hisse kodu: ask=sor (terminal yoksa onerilerle cik), '
+             'resolve=en yakin koda otomatik coz (gecerli gorunen kodlar degistirilmez), '
+             'continue=oldugu gibi devam et'
+    )
+    
     parser.add_argument(
         '--detailed',
         action='store_true',
@@ -73,6 +133,24 @@ Not: --macro kullanmadan once: python update_macro.py
     
     args = parser.parse_args()
     
+    if args.profile or args.trace:
+        enable_profiling()
+    
+    # Ağır modüller (pandas, göstergeler) argümanlar okunduktan sonra yüklenir:
+    # --help anında cevaplanır. yfinance sadece cache bayatsa yüklenir.
+    with profile_stage('importlar'):
+        from src.data.fetcher import fetch_stock_data
+        from src.analysis.technical import analyze_stock, generate_signals
+        from src.reporting.terminal import print_analysis_report, print_hybrid_report
+    
+    if args.record or args.replay:
+        from src.data.providers import configure_provider
+        try:
+            configure_provider(record=args.record, replay=args.replay)
+        except ValueError as e:
+            print(f"[HATA] {e}")
+            sys.exit(1)
+    
     # Hisse kodunu büyük harfe çevir
     symbol = args.symbol.upper().strip()
     
@@ -96,30 +174,61 @@ Not: --macro kullanmadan once: python update_macro.py
             for s in similar[:5]:
                 print(f"  - {s}")
         
-        response = input(f"\nYine de devam etmek istiyor musunuz? (e/h): ")
-        if response.lower() != 'e':
-            print("[IPTAL] Analiz iptal edildi.")
-            sys.exit(0)
+        # Toplu işlerde (terminal yoksa) soru sorulamaz: tahminle başka hisseyi
+        # analiz etmek yerine öneriler yazdırılıp hata koduyla çıkılır
+        mode = args.on_unknown
+        if mode == 'ask' and not sys.stdin.isatty():
+            print("[IPTAL] Terminal yok, onay alinamadi. "
+                  "--on-unknown resolve veya --on-unknown continue kullanin.")
+            sys.exit(1)
+        
+        if mode == 'resolve':
+            resolved = resolve_symbol(symbol)
+            if resolved is None:
+                print(f"[IPTAL] '{symbol}' tek bir hisse koduna cozulemedi "
+                      f"(listede olmayan gercek bir kod ise --on-unknown continue kullanin).")
+                sys.exit(1)
+            print(f"[OK] '{symbol}' -> {resolved} olarak cozuldu.")
+            symbol = resolved
+        elif mode == 'ask':
+            response = input(f"\nYine de devam etmek istiyor musunuz? (e/h): ")
+            if response.lower() != 'e':
+                print("[IPTAL] Analiz iptal edildi.")
+                sys.exit(0)
     
     # Veri çek
-    print(f"\n[ADIM 1] {symbol} verisi cekiliyor ({args.period})...")
-    data = fetch_stock_data(symbol, period=args.period)
+    print(f"\n[ADIM 1] {symbol} verisi cekiliyor ({args.period}{', ' + args.timeframe if args.timeframe else ''})...")
+    with profile_stage('ADIM 1: veri'):
+        if args.timeframe:
+            from src.data.resample import fetch_bars
+            data = fetch_bars(symbol, args.timeframe, period=args.period, use_cache=not args.no_cache)
+        else:
+            data = fetch_stock_data(symbol, period=args.period, use_cache=not args.no_cache)
     
     if data is None or data.empty:
         print(f"[HATA] {symbol} verisi cekilemedi. Hisse kodu dogru mu?")
         sys.exit(1)
     
-    print(f"[OK] {len(data)} gunluk veri cekildi.")
+    print(f"[OK] {len(data)} {args.timeframe + ' bar' if args.timeframe else 'gunluk veri'} cekildi.")
+    
+    # 1m taban ~30 gün geriye gider: 1d/1wk barlar uzun pencereli göstergelere yetmez
+    if args.timeframe and len(data) < LONGEST_WINDOW:
+        print(f"[UYARI] {len(data)} adet {args.timeframe} bar, MA{LONGEST_WINDOW} icin en az "
+              f"{LONGEST_WINDOW} bar gerekir; bu pencereli gostergeler sinyale katilmaz.")
+        if args.timeframe in ('1d', '1wk'):
+            print("[ONERI] Uzun gunluk gecmis icin --timeframe olmadan calistirin (orn: --period 2y).")
     
     # Analiz yap
     print(f"\n[ADIM 2] Teknik gostergeler hesaplaniyor...")
-    analysis = analyze_stock(data, symbol=symbol)
+    with profile_stage('ADIM 2: gostergeler'):
+        analysis = analyze_stock(data, symbol=symbol)
     
     print(f"[OK] {len(analysis.get('signals', []))} gosterge hesaplandi.")
     
     # Sinyal üret
     print(f"\n[ADIM 3] Genel sinyal uretiliyor...")
-    signals = generate_signals(analysis)
+    with profile_stage('ADIM 3: sinyal'):
+        signals = generate_signals(analysis)
     
     print(f"[OK] Analiz tamamlandi!")
     
@@ -127,9 +236,14 @@ Not: --macro kullanmadan once: python update_macro.py
     if args.macro:
         print(f"\n[ADIM 4] Makroekonomik veriler yukleniyor...")
         
-        # Makro veri yükle
-        fetcher = MacroDataFetcher()
-        macro_data = fetcher.load_from_config()
+        with profile_stage('ADIM 4: makro veri'):
+            # Makro modülleri sadece --macro ile yüklenir
+            from src.macro.fetcher import MacroDataFetcher
+            from src.analysis.hybrid import HybridAnalyzer
+            
+            # Makro veri yükle
+            fetcher = MacroDataFetcher()
+            macro_data = fetcher.load_from_config()
         
         if macro_data is None:
             print(f"[HATA] Makro veriler bulunamadi!")
@@ -143,22 +257,25 @@ Not: --macro kullanmadan once: python update_macro.py
         
         technical_score = signals.get('score', 50)  # Teknik skor (0-100)
         
-        hybrid_analyzer = HybridAnalyzer(
-            technical_score=technical_score,
-            macro_data=macro_data,
-            symbol=symbol
-        )
-        
-        hybrid_result = hybrid_analyzer.calculate_hybrid_score()
-        recommendation = hybrid_analyzer.get_recommendation(hybrid_result)
+        with profile_stage('ADIM 5: hibrid'):
+            hybrid_analyzer = HybridAnalyzer(
+                technical_score=technical_score,
+                macro_data=macro_data,
+                symbol=symbol
+            )
+            
+            hybrid_result = hybrid_analyzer.calculate_hybrid_score()
+            recommendation = hybrid_analyzer.get_recommendation(hybrid_result)
         
         print(f"[OK] Hibrid analiz tamamlandi!")
         
         # Hibrid rapor yazdır
-        print_hybrid_report(analysis, signals, hybrid_result, recommendation)
+        with profile_stage('rapor'):
+            print_hybrid_report(analysis, signals, hybrid_result, recommendation)
     else:
         # Normal teknik rapor
-        print_analysis_report(analysis, signals)
+        with profile_stage('rapor'):
+            print_analysis_report(analysis, signals)
         
         # Makro öneri
         print(f"\n[IPUCU] Makroekonomik faktörleri de analiz etmek icin:")
@@ -168,6 +285,12 @@ Not: --macro kullanmadan once: python update_macro.py
     if args.detailed:
         print("[BILGI] Detayli rapor ozelligi yakinda eklenecek...")
     
+    # Profil raporu
+    if args.profile or args.trace:
+        print_profile_report()
+    if args.trace:
+        dump_trace(args.trace)
+    
     return 0
 
 
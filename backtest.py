@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Backtest Scripti
+
+Mevcut teknik sinyal stratejisini (generate_signals) geçmiş veriler
+üzerinde test eder: "Son 5 yılda bu strateji %X kazandırırdı".
+
+Kullanim:
+    python backtest.py THYAO
+    python backtest.py THYAO SASA GARAN --period 10y
+    python backtest.py --list BIST100 --period 10y
+"""
+
+import sys
+import argparse
+import pandas as pd
+from src.data.fetcher import get_multiple_stocks
+from src.data.bist_stocks import get_stock_list
+from src.backtesting.engine import (
+    run_backtest, build_signal_panel, DEFAULT_COMMISSION, DEFAULT_SLIPPAGE
+)
+
+
+def print_backtest_report(result: dict, top: int = 10) -> None:
+    """Backtest sonuçlarını terminale yazdırır"""
+    metrics = result['metrics'].sort_values('total_return', ascending=False)
+
+    print("\n" + "=" * 78)
+    print(f"{'HISSE':8} {'GETIRI':>9} {'CAGR':>8} {'SHARPE':>7} {'MAX DD':>8} "
+          f"{'ISLEM':>6} {'KAZANMA':>8} {'MARUZIYET':>10}")
+    print("-" * 78)
+
+    # Çok hisse varsa en iyi ve en kötü 'top' hisse gösterilir
+    if len(metrics) > top * 2:
+        shown = pd.concat([metrics.head(top), metrics.tail(top)])
+    else:
+        shown = metrics
+
+    for i, (symbol, m) in enumerate(shown.iterrows()):
+        if len(shown) < len(metrics) and i == top:
+            print("...")
+        print(f"{symbol:8} {m['total_return']:>+8.1%} {m['cagr']:>+8.1%} {m['sharpe']:>7.2f} "
+              f"{m['max_drawdown']:>8.1%} {int(m['trades']):>6} {m['win_rate']:>8.0%} "
+              f"{m['exposure']:>10.0%}")
+
+    p = result['portfolio_metrics']
+    print("-" * 78)
+    print(f"{'PORTFOY':8} {p['total_return']:>+8.1%} {p['cagr']:>+8.1%} {p['sharpe']:>7.2f} "
+          f"{p['max_drawdown']:>8.1%} {int(p['trades']):>6} {p['win_rate']:>8.0%} "
+          f"{p['exposure']:>10.0%}")
+    print("=" * 78)
+
+
+def main():
+    """Ana fonksiyon"""
+
+    parser = argparse.ArgumentParser(
+        description='Teknik sinyal stratejisini gecmis veriyle test et',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ornekler:
+  python backtest.py THYAO                       # 5 yillik tek hisse testi
+  python backtest.py THYAO SASA --period 10y     # Birden fazla hisse
+  python backtest.py --list BIST100 --period 10y # Tum BIST100 (esit agirlikli portfoy)
+  python backtest.py THYAO --commission 0.001    # Farkli komisyon
+
+Strateji: BUY/STRONG_BUY -> al, SELL/STRONG_SELL -> sat, digerleri -> pozisyonu koru
+        """
+    )
+
+    parser.add_argument(
+        'symbols',
+        nargs='*',
+        help='Hisse kodlari (bos birakilirsa --list kullanilir)'
+    )
+
+    parser.add_argument(
+        '--list',
+        type=str,
+        default='BIST30',
+        help='Hisse listesi: BIST30, BIST100, POPULAR (varsayilan: BIST30)'
+    )
+
+    parser.add_argument(
+        '--period',
+        type=str,
+        default='5y',
+        help='Test periyodu (varsayilan: 5y)'
+    )
+
+    parser.add_argument(
+        '--commission',
+        type=float,
+        default=DEFAULT_COMMISSION,
+        help=f'Tek yon komisyon orani (varsayilan: {DEFAULT_COMMISSION})'
+    )
+
+    parser.add_argument(
+        '--slippage',
+        type=float,
+        default=DEFAULT_SLIPPAGE,
+        help=f'Tek yon kayma orani (varsayilan: {DEFAULT_SLIPPAGE})'
+    )
+
+    args = parser.parse_args()
+
+    symbols = [s.upper() for s in args.symbols] or get_stock_list(args.list)
+
+    print("=" * 78)
+    print(f"BACKTEST ({len(symbols)} hisse, {args.period})")
+    print("=" * 78)
+
+    print(f"\n[ADIM 1] Veriler yukleniyor...")
+    stocks = get_multiple_stocks(symbols, period=args.period, show_stats=False)
+
+    if not stocks:
+        print("[HATA] Hicbir hisse verisi cekilemedi!")
+        return 1
+
+    print(f"\n[ADIM 2] Gecmis sinyaller hesaplaniyor...")
+    panels = build_signal_panel(stocks)
+
+    print(f"\n[ADIM 3] Strateji simule ediliyor...")
+    result = run_backtest(
+        panels['close'],
+        panels['signals'],
+        commission=args.commission,
+        slippage=args.slippage
+    )
+
+    print_backtest_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n[IPTAL] Kullanici tarafindan iptal edildi.")
+        sys.exit(0)
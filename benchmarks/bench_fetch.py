@@ -0,0 +1,137 @@
+"""
+Veri Çekme Throughput / Retry Benchmark Scripti
+
+İnternete çıkmadan, ReplayProvider ile simüle edilmiş ağ koşullarında
+(gecikme + hata oranı) veri çekme yolunu ölçer:
+
+    - tek tek: fetch_stock_data (retry + backoff), run_concurrent ile paralel
+    - toplu:   download_batch (batch_size'lık gruplar)
+
+Kasetler sentetik OHLCV ile geçici klasöre yazılır (veya --tapes ile
+RecordingProvider'ın kaydettiği gerçek kasetler kullanılır). Seed sabit
+olduğu için aynı parametrelerle her çalıştırma aynı hata dizisini üretir.
+
+Kullanim:
+    python benchmarks/bench_fetch.py
+    python benchmarks/bench_fetch.py --latency 0.2 --error-rates 0 0.1 0.3
+    python benchmarks/bench_fetch.py --tapes data/tapes --symbols 30
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.bist_stocks import BIST100
+from src.data.concurrency import configure_rate_limit, run_concurrent
+from src.data.fetcher import fetch_stock_data, download_batch
+from src.data.providers import TapeStore, ReplayProvider, set_provider
+
+
+def write_synthetic_tapes(directory: str, symbols: List[str], bars: int = 2520) -> None:
+    """Her sembol için sentetik günlük OHLCV kaseti yazar"""
+    store = TapeStore(directory)
+    rng = np.random.default_rng(0)
+    index = pd.date_range(end=pd.Timestamp.now(tz='Europe/Istanbul').normalize(),
+                          periods=bars, freq='B')
+
+    for symbol in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, bars)))
+        store.save(f"{symbol}.IS", pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+            'Volume': rng.integers(100_000, 5_000_000, bars).astype(float),
+            'Dividends': 0.0, 'Stock Splits': 0.0,
+        }, index=index))
+
+
+def run_single(provider: ReplayProvider, symbols: List[str], workers: int,
+               retry_count: int, retry_delay: float) -> Dict[str, float]:
+    """fetch_stock_data ile tek tek (retry'lı) çekim"""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results, _ = run_concurrent(
+            lambda s: fetch_stock_data(s, period='1y', use_cache=False,
+                                       retry_count=retry_count, retry_delay=retry_delay),
+            symbols, max_workers=workers
+        )
+    return {'wall': time.perf_counter() - started, 'ok': len(results)}
+
+
+def run_batch(provider: ReplayProvider, symbols: List[str], batch_size: int) -> Dict[str, float]:
+    """download_batch ile toplu çekim (retry yok, kayıplar sayılır)"""
+    started = time.perf_counter()
+    ok = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(0, len(symbols), batch_size):
+            ok += len(download_batch(symbols[i:i + batch_size], period='1y') or {})
+    return {'wall': time.perf_counter() - started, 'ok': ok}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Internetsiz veri cekme throughput/retry benchmark')
+    parser.add_argument('--symbols', type=int, default=50, help='Hisse sayisi (varsayilan: 50)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Istek basina gecikme, s (varsayilan: 0.05)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Rastgele ek gecikme ust siniri, s')
+    parser.add_argument('--error-rates', type=float, nargs='+', default=[0.0, 0.1, 0.3],
+                        help='Denenecek hata oranlari (varsayilan: 0 0.1 0.3)')
+    parser.add_argument('--workers', type=int, default=8, help='Eszamanli istek sayisi (varsayilan: 8)')
+    parser.add_argument('--retry-count', type=int, default=3, help='fetch_stock_data deneme sayisi')
+    parser.add_argument('--retry-delay', type=float, default=0.05, help='Ilk backoff ust siniri, s')
+    parser.add_argument('--batch-size', type=int, default=25, help='Toplu istek buyuklugu')
+    parser.add_argument('--rate', type=float, default=1000.0,
+                        help='Paylasilan hiz limiti, istek/s (varsayilan: 1000 = pratikte limitsiz)')
+    parser.add_argument('--tapes', type=str, help='Hazir kaset klasoru (varsayilan: sentetik)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    symbols = BIST100[:args.symbols]
+    directory = args.tapes
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix='bench_tapes_')
+        write_synthetic_tapes(directory, symbols)
+
+    configure_rate_limit(args.rate)
+
+    print("=" * 86)
+    print(f"VERI CEKME BENCHMARK ({len(symbols)} hisse, gecikme {args.latency * 1000:.0f}"
+          f"+{args.jitter * 1000:.0f} ms, {args.workers} worker, hiz limiti {args.rate:g}/s)")
+    print("=" * 86)
+    print(f"{'YOL':10} {'HATA ORANI':>10} {'SURE':>9} {'HISSE/S':>9} {'BASARI':>9} "
+          f"{'ISTEK':>7} {'HATA':>6} {'ISTEK/HISSE':>12}")
+    print("-" * 86)
+
+    for error_rate in args.error_rates:
+        for mode in ('tek tek', 'toplu'):
+            provider = ReplayProvider(directory, latency=args.latency, jitter=args.jitter,
+                                      error_rate=error_rate, seed=args.seed)
+            previous = set_provider(provider)
+            try:
+                if mode == 'tek tek':
+                    result = run_single(provider, symbols, args.workers,
+                                        args.retry_count, args.retry_delay)
+                else:
+                    result = run_batch(provider, symbols, args.batch_size)
+            finally:
+                set_provider(previous)
+
+            counts = provider.counts
+            print(f"{mode:10} {error_rate:>9.0%} {result['wall']:>8.2f}s "
+                  f"{result['ok'] / result['wall']:>9.1f} {result['ok']:>4}/{len(symbols):<4} "
+                  f"{counts['requests']:>7} {counts['errors']:>6} "
+                  f"{counts['requests'] / len(symbols):>12.2f}")
+
+    print("=" * 86)
+    print("[OK] Ayni seed ile sonuclar (istek/hata sayilari) tekrarlanabilir.")
+
+
+if __name__ == "__main__":
+    main()
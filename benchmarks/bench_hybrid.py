@@ -0,0 +1,103 @@
+"""
+Toplu Hibrid Skor Benchmark Scripti
+
+Hisse ve tarih başına HybridAnalyzer(...).calculate_hybrid_score()
+döngüsü ile HybridAnalyzer.score_batch'in (makro skor tarih başına,
+sektör skoru sektör başına bir kez) tarih x hisse hesabını karşılaştırır
+ve hibrid skor / sinyal / uyum / risk sonuçlarının aynı olduğunu doğrular.
+
+Makro geçmiş sentetiktir; ardışık günler aynı anlık görüntüyü paylaşır
+(MacroHistoryStore.as_of_many davranışı gibi).
+
+Kullanim:
+    python benchmarks/bench_hybrid.py
+    python benchmarks/bench_hybrid.py --symbols 100 --dates 250 2520
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.bist_stocks import BIST100
+from src.analysis.hybrid import HybridAnalyzer
+from benchmarks.bench_macro import make_history
+
+
+def make_inputs(n_symbols: int, n_dates: int, seed: int = 7):
+    """Teknik skor tablosu (tarih x hisse) ve tarih başına makro görüntü listesi"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2015-01-01', periods=n_dates)
+    symbols = BIST100[:n_symbols]
+    technical = pd.DataFrame(rng.integers(-150, 150, (n_dates, len(symbols))).astype(float),
+                             index=dates, columns=symbols)
+
+    # Makro veri haftada bir güncellenir, aradaki günler aynı görüntüyü kullanır
+    weekly = [snapshot or {} for snapshot in make_history(n_dates // 5 + 1, seed=seed)]
+    for snapshot in weekly:
+        snapshot['eur_try'] = {'current': 40.0, 'change_30d': float(rng.uniform(-5, 5))}
+    snapshots = [weekly[i // 5] for i in range(n_dates)]
+
+    return technical, snapshots
+
+
+def scalar_loop(technical: pd.DataFrame, snapshots, limit=None):
+    """Eski yol: her (tarih, hisse) için ayrı HybridAnalyzer"""
+    results = {}
+    for i, date in enumerate(technical.index[:limit]):
+        for symbol in technical.columns:
+            analyzer = HybridAnalyzer(technical.iat[i, technical.columns.get_loc(symbol)],
+                                      snapshots[i], symbol)
+            results[(date, symbol)] = analyzer.calculate_hybrid_score()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hibrid skor: hisse/tarih dongusu vs score_batch')
+    parser.add_argument('--symbols', type=int, default=100, help='Hisse sayisi (varsayilan: 100)')
+    parser.add_argument('--dates', type=int, nargs='+', default=[250, 2520], help='Tarih sayilari')
+    parser.add_argument('--scalar-limit', type=int, default=250,
+                        help='Skaler dongu en fazla bu kadar tarihte olculur, fazlasi tahmin edilir')
+    args = parser.parse_args()
+
+    print("=" * 84)
+    print(f"TOPLU HIBRID SKOR BENCHMARK ({args.symbols} hisse)")
+    print("=" * 84)
+    print(f"{'TARIH':>7} {'SATIR':>9} {'DONGU':>12} {'SCORE_BATCH':>12} {'HIZLANMA':>9} {'FARK':>6}")
+    print("-" * 84)
+
+    for n_dates in args.dates:
+        technical, snapshots = make_inputs(args.symbols, n_dates)
+        measured = min(n_dates, args.scalar_limit)
+
+        start = time.perf_counter()
+        expected = scalar_loop(technical, snapshots, limit=measured)
+        scalar_time = (time.perf_counter() - start) * n_dates / measured
+
+        start = time.perf_counter()
+        table = HybridAnalyzer.score_batch(technical, snapshots)
+        batch_time = time.perf_counter() - start
+
+        mismatches = 0
+        for key, result in expected.items():
+            row = table.loc[key]
+            if (result['hybrid_score'], result['signal'], result['alignment']['status'],
+                    result['risk']['level']) != (row['hybrid_score'], row['signal'],
+                                                 row['alignment'], row['risk']):
+                mismatches += 1
+
+        estimate = '~' if measured < n_dates else ' '
+        print(f"{n_dates:>7} {len(table):>9} {estimate}{scalar_time * 1000:>9.0f}ms "
+              f"{batch_time * 1000:>10.1f}ms {scalar_time / batch_time:>8.0f}x {mismatches:>6}")
+
+    print("=" * 84)
+    print("~: skaler dongu ilk --scalar-limit tarihte olculup orantili tahmin edildi")
+
+
+if __name__ == "__main__":
+    main()
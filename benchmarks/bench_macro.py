@@ -0,0 +1,121 @@
+"""
+Makro Skor Benchmark Scripti
+
+MacroAnalyzer.calculate_overall_macro_score'un tarih başına skaler
+döngüsü ile MacroAnalyzer.score_many'nin (eşik tabloları + np.searchsorted)
+tek seferlik vektörel hesabını karşılaştırır. Tüm bileşen skorlarının,
+toplam/normalize skorun ve özet metninin birebir aynı olduğunu doğrular.
+
+Sentetik geçmiş, eşik değerlerinin tam üstüne düşen günleri ve eksik
+(None) alanları da içerir.
+
+Kullanim:
+    python benchmarks/bench_macro.py
+    python benchmarks/bench_macro.py --sizes 1000 10000 100000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.macro.analyzer import MacroAnalyzer
+
+
+FACTOR_KEYS = {'usd': 'usd_try', 'tcmb': 'tcmb_rate', 'bist': 'bist100', 'oil': 'oil', 'gold': 'gold'}
+
+
+def make_history(n: int, seed: int = 42) -> List[Optional[Dict]]:
+    """Eşik sınırları ve eksik veriler içeren sentetik makro geçmiş"""
+    rng = random.Random(seed)
+    ladders = MacroAnalyzer.LADDERS
+
+    def value(table, low, high):
+        r = rng.random()
+        if r < 0.05:
+            return None
+        if r < 0.30:
+            return float(rng.choice(ladders[table][0]))   # tam eşik değeri
+        return round(rng.uniform(low, high), 2)
+
+    history = []
+    for _ in range(n):
+        if rng.random() < 0.01:
+            history.append(None)
+            continue
+        history.append({
+            'usd_try': {'current': value('usd_level', 25, 55), 'change_30d': value('usd_momentum', -6, 8)},
+            'bist100': {'current': 10000.0, 'trend': rng.choice(['up', 'down', 'flat']),
+                        'change_30d': round(rng.uniform(-15, 15), 2)},
+            'oil': {'current': value('oil_level', 40, 110), 'change_30d': value('oil_momentum', -25, 25)},
+            'gold': {'current': value('gold_level', 1500, 2500), 'change_30d': value('gold_momentum', -20, 20)},
+            'tcmb_rate': value('tcmb_level', 25, 60),
+        })
+    return history
+
+
+def scalar_scores(history: List[Optional[Dict]]) -> List[Optional[Dict]]:
+    """Eski yol: her tarih için ayrı MacroAnalyzer"""
+    return [MacroAnalyzer(s).calculate_overall_macro_score() if s else None for s in history]
+
+
+def verify(expected: List[Optional[Dict]], table) -> int:
+    """Skaler ve vektörel sonuçlardaki farklı satır sayısı"""
+    mismatches = 0
+    for row, result in zip(table.itertuples(), expected):
+        if result is None:
+            continue
+        components = [result['components'][key]['score'] for key in FACTOR_KEYS.values()]
+        if (components != [getattr(row, name) for name in FACTOR_KEYS]
+                or result['total_score'] != row.total_score
+                or result['normalized_score'] != row.normalized_score
+                or result['summary'] != row.summary):
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Makro skor: skaler dongu vs vektorel')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help='Tarih sayilari (varsayilan: 1000 10000 100000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Tekrar sayisi (en iyi sure)')
+    args = parser.parse_args()
+
+    print("=" * 84)
+    print("MAKRO SKOR BENCHMARK (calculate_overall_macro_score dongusu vs score_many)")
+    print("=" * 84)
+    print(f"{'TARIH':>9} {'SKALER':>11} {'VEKTOREL':>11} {'(TABLO)':>11} {'HIZLANMA':>9} {'(TABLO)':>9} {'FARK':>6}")
+    print("-" * 84)
+
+    for n in args.sizes:
+        history = make_history(n)
+
+        def best(func):
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = func()
+                times.append(time.perf_counter() - start)
+            return min(times), result
+
+        scalar_time, expected = best(lambda: scalar_scores(history))
+        vector_time, table = best(lambda: MacroAnalyzer.score_many(history))
+
+        # Geçmiş tabloya bir kez çevrilmişse (örn. parametre taramasında) sadece skor maliyeti
+        frame = MacroAnalyzer.macro_frame(history)
+        frame_time, _ = best(lambda: MacroAnalyzer.score_many(frame))
+
+        mismatches = verify(expected, table)
+        print(f"{n:>9} {scalar_time * 1000:>9.1f}ms {vector_time * 1000:>9.1f}ms {frame_time * 1000:>9.1f}ms "
+              f"{scalar_time / vector_time:>8.1f}x {scalar_time / frame_time:>8.1f}x {mismatches:>6}")
+
+    print("=" * 84)
+    print("VEKTOREL: anlik goruntu listesi -> skor, (TABLO): hazir macro_frame -> skor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Çoklu Zaman Dilimi (Resample) Benchmark Scripti
+
+Sentetik 1m taban üzerinde:
+
+    - pandas resample().agg() ile resample_ohlcv (reduceat) karşılaştırması
+      (süre + sonuçların birebir aynı olduğu)
+    - BarStore: tekrar istekte cache isabeti, tabana yeni dakika eklenince
+      artımlı güncelleme ve tam yeniden hesap süreleri
+    - Disk: sadece 1m saklamak ile her interval'i ayrı saklamanın
+      Parquet boyutu
+
+İnternet gerektirmez.
+
+Kullanim:
+    python benchmarks/bench_resample.py
+    python benchmarks/bench_resample.py --days 20 250
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.resample import AGGREGATIONS, BarStore, resample_ohlcv
+
+
+PANDAS_RULES = {'5m': '5min', '15m': '15min', '1h': '1h', '1d': '1D', '1wk': 'W-MON'}
+
+
+def make_minutes(n_days: int, seed: int = 42) -> pd.DataFrame:
+    """n_days işlem günü için 10:00-18:00 arası 1m OHLCV"""
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range('2024-01-01', periods=n_days)
+    minutes = pd.to_timedelta(np.arange(480), unit='min') + pd.Timedelta(hours=10)
+    index = pd.DatetimeIndex((days.values[:, None] + minutes.values[None, :]).ravel())
+    index = index.tz_localize('Europe/Istanbul')
+
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, len(index))))
+    spread = np.abs(rng.normal(0, 0.001, len(index)))
+    return pd.DataFrame({
+        'Open': close * (1 + rng.normal(0, 0.0003, len(index))),
+        'High': close * (1 + spread),
+        'Low': close * (1 - spread),
+        'Close': close,
+        'Volume': rng.integers(100, 50_000, len(index)).astype(float),
+    }, index=index)
+
+
+def best(func, repeat: int):
+    """En iyi süre (saniye) ve son sonuç"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def parquet_bytes(data: pd.DataFrame) -> int:
+    buffer = io.BytesIO()
+    data.to_parquet(buffer)
+    return buffer.tell()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='1m tabandan resample: pandas vs reduceat, BarStore cache')
+    parser.add_argument('--days', type=int, nargs='+', default=[20, 250],
+                        help='Islem gunu sayilari (varsayilan: 20 250)')
+    parser.add_argument('--repeat', type=int, default=5, help='Tekrar sayisi (en iyi sure)')
+    args = parser.parse_args()
+
+    rules = {column: AGGREGATIONS[column] for column in ('Open', 'High', 'Low', 'Close', 'Volume')}
+
+    for n_days in args.days:
+        base = make_minutes(n_days)
+
+        print("=" * 72)
+        print(f"RESAMPLE BENCHMARK ({n_days} gun, {len(base):,} adet 1m bar)")
+        print("=" * 72)
+        print(f"{'HEDEF':6} {'BAR':>8} {'PANDAS':>11} {'REDUCEAT':>11} {'HIZLANMA':>9} {'AYNI':>6}")
+        print("-" * 72)
+
+        for timeframe, rule in PANDAS_RULES.items():
+            pandas_time, expected = best(
+                lambda: base.resample(rule, label='left', closed='left').agg(rules).dropna(subset=['Close']),
+                args.repeat)
+            vector_time, result = best(lambda: resample_ohlcv(base, timeframe), args.repeat)
+            print(f"{timeframe:6} {len(result):>8,} {pandas_time * 1000:>9.2f}ms {vector_time * 1000:>9.2f}ms "
+                  f"{pandas_time / vector_time:>8.1f}x {str(result.equals(expected)):>6}")
+
+        # BarStore: tam hesap, cache isabeti, yeni dakika sonrası artımlı güncelleme
+        print("-" * 72)
+        head, tail = base.iloc[:-1], base.iloc[-1:]
+        full_times, hit_times, incremental_times = [], [], []
+        correct = True
+        for _ in range(args.repeat):
+            store = BarStore()
+            store.ingest('BENCH', head)
+
+            start = time.perf_counter()
+            store.bars('BENCH', '15m', refresh=False)
+            full_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            store.bars('BENCH', '15m', refresh=False)
+            hit_times.append(time.perf_counter() - start)
+
+            store.ingest('BENCH', tail)
+            start = time.perf_counter()
+            updated = store.bars('BENCH', '15m', refresh=False)
+            incremental_times.append(time.perf_counter() - start)
+            correct = correct and updated.equals(resample_ohlcv(base, '15m'))
+
+        print(f"BarStore 15m: tam {min(full_times) * 1000:.2f}ms, "
+              f"cache {min(hit_times) * 1e6:.0f}us, "
+              f"+1 dakika artimli {min(incremental_times) * 1000:.2f}ms (tam hesapla ayni: {correct})")
+
+        # Disk: tek taban vs her interval ayrı dosya
+        base_size = parquet_bytes(base)
+        all_sizes = base_size + sum(parquet_bytes(resample_ohlcv(base, tf)) for tf in PANDAS_RULES)
+        print(f"Disk: sadece 1m {base_size / 1024:,.0f} KB, "
+              f"1m + {len(PANDAS_RULES)} interval {all_sizes / 1024:,.0f} KB "
+              f"(%{(1 - base_size / all_sizes) * 100:.0f} tasarruf, ayri ag istegi yok)")
+
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
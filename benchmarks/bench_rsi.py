@@ -0,0 +1,105 @@
+"""
+RSI Benchmark Scripti
+
+Vektörel Wilder smoothing'li calculate_rsi ile eski döngülü
+(iloc tabanlı) implementasyonu karşılaştırır. Sonuçların 1e-9
+toleransla aynı olduğunu doğrular ve hızlanmayı raporlar.
+
+Kullanim:
+    python benchmarks/bench_rsi.py
+    python benchmarks/bench_rsi.py --sizes 10000 100000
+    python benchmarks/bench_rsi.py --legacy-limit 100000   # 1M'de eski yontemi atla
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.indicators.momentum import calculate_rsi
+
+
+def legacy_rsi(data: pd.DataFrame, period: int = 14, column: str = 'Close') -> pd.Series:
+    """Eski döngülü RSI implementasyonu (referans olarak birebir korunmuştur)"""
+    
+    delta = data[column].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    
+    avg_gain = gain.rolling(window=period, min_periods=period).mean()
+    avg_loss = loss.rolling(window=period, min_periods=period).mean()
+    
+    for i in range(period, len(data)):
+        avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (period - 1) + gain.iloc[i]) / period
+        avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (period - 1) + loss.iloc[i]) / period
+    
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def make_prices(n_bars: int, seed: int = 42) -> pd.DataFrame:
+    """Rastgele yürüyüş ile sentetik kapanış fiyatları üretir"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, 0.02, n_bars)
+    close = 100 * np.exp(np.cumsum(returns))
+    index = pd.date_range('2000-01-01', periods=n_bars, freq='min')
+    return pd.DataFrame({'Close': close}, index=index)
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """En iyi çalışma süresini (saniye) döndürür"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RSI vektorel vs dongu benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--period', type=int, default=14)
+    parser.add_argument('--legacy-limit', type=int, default=None,
+                        help='Bu bar sayisinin ustunde eski yontemi calistirma')
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print(f"{'Bar':>10} | {'Eski (s)':>10} | {'Yeni (s)':>10} | {'Hizlanma':>9} | {'Max Fark':>10}")
+    print("-" * 70)
+    
+    for n_bars in args.sizes:
+        data = make_prices(n_bars)
+        
+        new_time = time_call(calculate_rsi, data, args.period)
+        new_rsi = calculate_rsi(data, args.period)
+        
+        if args.legacy_limit is not None and n_bars > args.legacy_limit:
+            print(f"{n_bars:>10,} | {'atlandi':>10} | {new_time:>10.4f} | {'-':>9} | {'-':>10}")
+            continue
+        
+        # Eski yöntem yavaş olduğu için tek sefer ölçülür
+        legacy_time = time_call(legacy_rsi, data, args.period, repeat=1)
+        old_rsi = legacy_rsi(data, args.period)
+        
+        max_diff = float(np.nanmax(np.abs(new_rsi.values - old_rsi.values)))
+        same_nan = bool((new_rsi.isna() == old_rsi.isna()).all())
+        
+        if max_diff > 1e-9 or not same_nan:
+            print(f"[HATA] {n_bars} bar icin sonuclar uyusmuyor! (fark={max_diff:.3e})")
+            sys.exit(1)
+        
+        speedup = legacy_time / new_time if new_time > 0 else float('inf')
+        print(f"{n_bars:>10,} | {legacy_time:>10.4f} | {new_time:>10.4f} | {speedup:>8.0f}x | {max_diff:>10.2e}")
+    
+    print("=" * 70)
+    print("[OK] Tum boyutlarda sonuclar 1e-9 toleransla ayni.")
+
+
+if __name__ == "__main__":
+    main()
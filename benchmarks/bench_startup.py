@@ -0,0 +1,118 @@
+"""
+Açılış Süresi Benchmark Scripti
+
+Komut satırı scriptlerinin soğuk açılış (import) maliyetini
+`python -X importtime` ile ölçer. Her senaryo ayrı bir yorumlayıcıda
+çalıştırılır; import süresi stderr'deki importtime satırlarının
+toplamıdır, duvar saati süresi süreç başlangıç-bitiş farkıdır.
+
+Referans senaryo ("eski eager import"), analyze.py'nin eski tepe
+seviye import zincirini (yfinance + pandas + makro + hibrid + rapor)
+birebir tekrarlar; diğer senaryolar buna göre kıyaslanır.
+
+Kullanim:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Eski analyze.py'nin tepe seviye importları (lazy import öncesi)
+EAGER_IMPORTS = (
+    "import yfinance, pandas; "
+    "import src.data.fetcher, src.data.bist_stocks, src.analysis.technical, "
+    "src.reporting.terminal, src.macro.fetcher, src.analysis.hybrid"
+)
+
+# Cache'ten analiz: analyze.py'nin --macro olmadan yüklediği modüller
+CACHED_IMPORTS = (
+    "import src.data.bist_stocks, src.data.fetcher, src.analysis.technical, "
+    "src.reporting.terminal"
+)
+
+SCENARIOS = {
+    'eski eager import': ['-c', EAGER_IMPORTS],
+    'analyze.py --help': ['analyze.py', '--help'],
+    'update_macro.py --help': ['update_macro.py', '--help'],
+    'analiz (cache)': ['-c', CACHED_IMPORTS],
+}
+
+
+def run_scenario(args: List[str]) -> Dict[str, object]:
+    """Senaryoyu -X importtime ile bir kez çalıştırır"""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - started
+
+    # Satır formatı: "import time: self [us] | cumulative | paket"
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        modules.add(name.strip())
+
+    return {
+        'wall': wall,
+        'imports': total_us / 1e6,
+        'yfinance': 'yfinance' in modules,
+        'pandas': 'pandas' in modules,
+        'ok': proc.returncode == 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Script acilis suresi benchmark')
+    parser.add_argument('--repeat', type=int, default=5, help='Tekrar sayisi (medyan raporlanir)')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"ACILIS SURESI BENCHMARK (-X importtime, {args.repeat} tekrar, medyan)")
+    print("=" * 78)
+    print(f"{'SENARYO':26} {'DUVAR':>9} {'IMPORT':>9} {'HIZLANMA':>9} {'PANDAS':>7} {'YFINANCE':>9}")
+    print("-" * 78)
+
+    baseline = None
+    results = {}
+    for name, scenario in SCENARIOS.items():
+        runs = [run_scenario(scenario) for _ in range(args.repeat)]
+        if not all(r['ok'] for r in runs):
+            print(f"{name:26} [HATA] Senaryo calismadi")
+            continue
+
+        wall = statistics.median(r['wall'] for r in runs)
+        imports = statistics.median(r['imports'] for r in runs)
+        baseline = baseline or wall
+        results[name] = wall
+
+        print(f"{name:26} {wall * 1000:>7.0f}ms {imports * 1000:>7.0f}ms {baseline / wall:>8.1f}x "
+              f"{'evet' if runs[0]['pandas'] else '-':>7} {'evet' if runs[0]['yfinance'] else '-':>9}")
+
+    print("=" * 78)
+
+    if 'eski eager import' in results and 'analyze.py --help' in results:
+        speedup = results['eski eager import'] / results['analyze.py --help']
+        status = "[OK]" if speedup >= 5 else "[UYARI]"
+        print(f"\n{status} --help yolu eski acilistan {speedup:.1f}x hizli (hedef: >= 5x)")
+
+    if 'analiz (cache)' in results:
+        saved = results['eski eager import'] - results['analiz (cache)']
+        print(f"[OK] Cache'ten analizde yfinance yuklenmiyor: {saved * 1000:.0f} ms kazanc")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Gösterge Benchmark Paketi (Regresyon Kontrollü)
+
+src/indicators/ altındaki tüm fonksiyonları, analyze_stock,
+analyze_history, generate_signals ve hibrid skorlayıcıyı sentetik
+OHLCV verisiyle ölçer:
+
+    - Tek hisse:  1k / 100k / 1M satır
+    - Panel:      1 / 30 / 100 hisse x 2520 bar (10 yıl günlük)
+    - Skaler:     tek değer yorumlayıcıları (çağrı başına süre)
+
+Her ölçüm için en iyi süre ve tracemalloc tepe belleği JSON baseline'a
+yazılır. Sonraki çalıştırmalar baseline ile kıyaslanır; bir ölçüm
+eşikten (varsayılan %25) fazla yavaşlarsa veya bellek kullanımı artarsa
+script 1 koduyla çıkar. İnternet gerektirmez.
+
+Kullanim:
+    python benchmarks/bench_suite.py --save              # Baseline olustur
+    python benchmarks/bench_suite.py                     # Baseline ile kiyasla
+    python benchmarks/bench_suite.py --sizes 1k 100k --filter rsi
+    python benchmarks/bench_suite.py --threshold 10 --memory-threshold 50
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.indicators.momentum import (
+    wilder_smoothing, calculate_rsi, calculate_macd, interpret_rsi, interpret_macd,
+    rsi_signal_codes, interpret_rsi_series, macd_signal_codes, interpret_macd_series
+)
+from src.indicators.volatility import (
+    calculate_bollinger_bands, interpret_bollinger_bands, bollinger_signal_codes,
+    interpret_bollinger_bands_series
+)
+from src.indicators.trend import (
+    calculate_moving_averages, detect_ma_cross, interpret_moving_averages,
+    ma_signal_codes, interpret_moving_averages_series
+)
+from src.indicators.volume import (
+    analyze_volume, volume_signal_codes, analyze_volume_series, detect_volume_trend
+)
+from src.indicators.signals import decode_signals, signal_direction, shift_rows
+from src.indicators.primitives import PrimitiveCache, get_primitive_cache
+from src.indicators.streaming import StreamingIndicators
+from src.indicators.panel import (
+    build_panel, panel_rsi, panel_macd, panel_bollinger_bands, panel_moving_averages,
+    panel_volume, calculate_panel_indicators, panel_snapshot
+)
+from src.analysis.technical import analyze_stock, analyze_history, generate_signals
+from src.analysis.hybrid import HybridAnalyzer
+from src.backtesting.engine import run_backtest
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SERIES_SIZES = {'1k': 1_000, '100k': 100_000, '1M': 1_000_000}
+PANEL_SIZES = {'1x2520': (1, 2520), '30x2520': (30, 2520), '100x2520': (100, 2520)}
+
+# Sentetik makro snapshot (config/macro_data.json ile aynı yapı)
+MACRO_DATA = {
+    'last_update': '2025-01-01 18:30:00',
+    'usd_try': {'current': 42.23, 'change_30d': 1.26},
+    'eur_try': {'current': 49.03, 'change_30d': 0.38},
+    'bist100': {'current': 10576.45, 'trend': 'flat', 'change_30d': -2.2},
+    'oil': {'current': 60.84, 'change_30d': -1.44},
+    'gold': {'current': 4120.4, 'change_30d': 3.62},
+    'tcmb_rate': 39.5
+}
+
+# Bir ölçüm: (fonksiyon, çağrı sayısı). Süre çağrı başına raporlanır.
+Case = Tuple[Callable[[], object], int]
+
+
+# =============================================================================
+# Sentetik veri
+# =============================================================================
+
+def make_ohlcv(n_bars: int, seed: int = 42) -> pd.DataFrame:
+    """Rastgele yürüyüşle sentetik OHLCV üretir"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0002, 0.02, n_bars)))
+    spread = np.abs(rng.normal(0, 0.01, n_bars))
+    index = pd.date_range('2000-01-01', periods=n_bars, freq='min')
+    return pd.DataFrame({
+        'Open': close * (1 + rng.normal(0, 0.005, n_bars)),
+        'High': close * (1 + spread),
+        'Low': close * (1 - spread),
+        'Close': close,
+        'Volume': rng.integers(100_000, 5_000_000, n_bars).astype(float)
+    }, index=index)
+
+
+def make_stocks(n_symbols: int, n_bars: int, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """Aynı tarih indeksli sentetik hisse sözlüğü"""
+    index = pd.date_range('2015-01-01', periods=n_bars, freq='B')
+    stocks = {}
+    for i in range(n_symbols):
+        data = make_ohlcv(n_bars, seed + i)
+        data.index = index
+        stocks[f"HISSE{i}"] = data
+    return stocks
+
+
+# =============================================================================
+# Ölçüm tanımları
+# =============================================================================
+
+def series_cases(data: pd.DataFrame) -> Dict[str, Case]:
+    """Tek hisse (n satır) fonksiyonları"""
+    close, volume = data['Close'], data['Volume']
+    gains = close.diff().clip(lower=0)
+
+    rsi = calculate_rsi(data)
+    macd, signal, hist = calculate_macd(data)
+    upper, middle, lower = calculate_bollinger_bands(data)
+    mas = calculate_moving_averages(data)
+    avg_volume = volume.rolling(20).mean()
+    codes, _ = rsi_signal_codes(rsi.to_numpy())
+
+    cases = {
+        'momentum.wilder_smoothing': (lambda: wilder_smoothing(gains), 1),
+        'momentum.calculate_rsi': (lambda: calculate_rsi(data), 1),
+        'momentum.calculate_macd': (lambda: calculate_macd(data), 1),
+        'momentum.rsi_signal_codes': (lambda: rsi_signal_codes(rsi.to_numpy()), 1),
+        'momentum.interpret_rsi_series': (lambda: interpret_rsi_series(rsi), 1),
+        'momentum.macd_signal_codes': (
+            lambda: macd_signal_codes(macd.to_numpy(), signal.to_numpy(), hist.to_numpy()), 1),
+        'momentum.interpret_macd_series': (lambda: interpret_macd_series(macd, signal, hist), 1),
+        'volatility.calculate_bollinger_bands': (lambda: calculate_bollinger_bands(data), 1),
+        'volatility.bollinger_signal_codes': (
+            lambda: bollinger_signal_codes(close.to_numpy(), upper.to_numpy(),
+                                           middle.to_numpy(), lower.to_numpy()), 1),
+        'volatility.interpret_bollinger_bands_series': (
+            lambda: interpret_bollinger_bands_series(close, upper, middle, lower), 1),
+        'trend.calculate_moving_averages': (lambda: calculate_moving_averages(data), 1),
+        'trend.detect_ma_cross': (lambda: detect_ma_cross(mas[50], mas[200], lookback=10), 1),
+        'trend.ma_signal_codes': (
+            lambda: ma_signal_codes(close.to_numpy(), [ma.to_numpy() for ma in mas.values()]), 1),
+        'trend.interpret_moving_averages_series': (
+            lambda: interpret_moving_averages_series(close, mas), 1),
+        'volume.analyze_volume': (lambda: analyze_volume(data), 1),
+        'volume.volume_signal_codes': (
+            lambda: volume_signal_codes(volume.to_numpy(), avg_volume.to_numpy(), close.to_numpy()), 1),
+        'volume.analyze_volume_series': (lambda: analyze_volume_series(data), 1),
+        'volume.detect_volume_trend': (lambda: detect_volume_trend(data), 1),
+        'signals.decode_signals': (lambda: decode_signals(codes), 1),
+        'signals.signal_direction': (lambda: signal_direction(codes), 1),
+        'signals.shift_rows': (lambda: shift_rows(close.to_numpy()), 1),
+        'primitives.sma_ema_std_diff': (lambda: _primitives(data), 1),
+        'analysis.analyze_stock': (lambda: analyze_stock(data, symbol='HISSE'), 1),
+        'analysis.analyze_history': (lambda: analyze_history(data), 1),
+    }
+
+    # Akış modu bar bar Python döngüsüdür; 1M satırda dakikalar sürer
+    if len(data) <= 100_000:
+        cases['streaming.warm_up'] = (lambda: StreamingIndicators().warm_up(data), 1)
+
+    return cases
+
+
+def _primitives(data: pd.DataFrame) -> None:
+    """Boş bir PrimitiveCache ile temel primitifleri hesaplar"""
+    cache = PrimitiveCache()
+    cache.sma(data, 20)
+    cache.ema(data, 12)
+    cache.std(data, 20)
+    cache.diff(data)
+
+
+def panel_cases(stocks: Dict[str, pd.DataFrame]) -> Dict[str, Case]:
+    """Çok hisse (hisse x bar) panel fonksiyonları"""
+    close = build_panel(stocks, 'Close')
+    volume = build_panel(stocks, 'Volume')
+    indicators = calculate_panel_indicators(close, volume)
+
+    rng = np.random.default_rng(0)
+    signals = pd.DataFrame(
+        rng.choice(['BUY', 'HOLD', 'SELL'], close.shape, p=[0.05, 0.9, 0.05]),
+        index=close.index, columns=close.columns
+    )
+    technical = rng.uniform(0, 100, close.shape)
+    sector = rng.uniform(-3, 3, close.shape)
+    macro_raw = rng.uniform(-10, 10, (len(close), 1))
+
+    return {
+        'panel.build_panel': (lambda: build_panel(stocks, 'Close'), 1),
+        'panel.panel_rsi': (lambda: panel_rsi(close), 1),
+        'panel.panel_macd': (lambda: panel_macd(close), 1),
+        'panel.panel_bollinger_bands': (lambda: panel_bollinger_bands(close), 1),
+        'panel.panel_moving_averages': (lambda: panel_moving_averages(close), 1),
+        'panel.panel_volume': (lambda: panel_volume(close, volume), 1),
+        'panel.calculate_panel_indicators': (lambda: calculate_panel_indicators(close, volume), 1),
+        'panel.panel_snapshot': (lambda: panel_snapshot(indicators), 1),
+        'hybrid.combine_scores': (
+            lambda: HybridAnalyzer.combine_scores(technical, macro_raw, sector), 1),
+        'backtest.run_backtest': (lambda: run_backtest(close, signals), 1),
+    }
+
+
+def scalar_cases() -> Dict[str, Case]:
+    """Tek değer yorumlayıcıları (binlerce kez çağrılır, çağrı başına süre)"""
+    data = make_ohlcv(300)
+    analysis = analyze_stock(data, symbol='HISSE')
+    stream = StreamingIndicators()
+    stream.warm_up(data)
+    prices = iter(np.tile(data['Close'].to_numpy(), 1000))
+
+    return {
+        'momentum.interpret_rsi': (lambda: interpret_rsi(45.3), 10_000),
+        'momentum.interpret_macd': (lambda: interpret_macd(1.2, 0.8, 0.4, 0.7, 0.9), 10_000),
+        'volatility.interpret_bollinger_bands': (
+            lambda: interpret_bollinger_bands(101.0, 110.0, 100.0, 90.0), 10_000),
+        'trend.interpret_moving_averages': (
+            lambda: interpret_moving_averages(101.0, {20: 99.0, 50: 102.0, 200: 95.0}), 10_000),
+        'streaming.update': (lambda: stream.update(next(prices), 1_000_000.0), 10_000),
+        'analysis.generate_signals': (lambda: generate_signals(analysis), 10_000),
+        'hybrid.calculate_hybrid_score': (
+            lambda: HybridAnalyzer(62, MACRO_DATA, 'THYAO').calculate_hybrid_score(), 1_000),
+    }
+
+
+# =============================================================================
+# Ölçüm
+# =============================================================================
+
+def measure(case: Case, repeat: int, memory: bool) -> Dict[str, float]:
+    """
+    En iyi çağrı süresini ve tepe belleği ölçer.
+
+    Primitif cache her tekrardan önce temizlenir; aksi halde aynı
+    DataFrame için ikinci çağrı cache'ten döner ve ölçüm anlamsızlaşır.
+    """
+    func, number = case
+    primitives = get_primitive_cache()
+
+    # Isınma: ilk çağrıdaki tek seferlik maliyetler (lazy import, önbellekler) ölçülmesin
+    primitives.clear()
+    func()
+
+    best = float('inf')
+    for _ in range(repeat):
+        primitives.clear()
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    result = {'time': best}
+
+    if memory:
+        primitives.clear()
+        gc.collect()
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['peak_mb'] = peak / 2**20
+
+    return result
+
+
+def iter_groups(sizes: List[str]):
+    """(boyut etiketi, ölçüm sözlüğü) çiftlerini sırayla üretir (veri tek tek bellekte)"""
+    if 'scalar' in sizes:
+        yield 'scalar', scalar_cases()
+    for label, n_bars in SERIES_SIZES.items():
+        if label in sizes:
+            yield label, series_cases(make_ohlcv(n_bars))
+    for label, (n_symbols, n_bars) in PANEL_SIZES.items():
+        if label in sizes:
+            yield label, panel_cases(make_stocks(n_symbols, n_bars))
+
+
+def compare(result: Dict[str, float], base: Optional[Dict[str, float]], args) -> Tuple[str, List[str]]:
+    """Baseline ile kıyaslar: (durum etiketi, regresyon açıklamaları)"""
+    if base is None:
+        return 'YENI', []
+
+    problems = []
+    time_delta = result['time'] / base['time'] - 1
+    if time_delta * 100 > args.threshold and result['time'] - base['time'] > args.min_time:
+        problems.append(f"sure %{time_delta * 100:+.0f}")
+
+    if 'peak_mb' in result and 'peak_mb' in base and base['peak_mb'] > 0:
+        mem_delta = result['peak_mb'] / base['peak_mb'] - 1
+        if mem_delta * 100 > args.memory_threshold and result['peak_mb'] - base['peak_mb'] > args.min_mb:
+            problems.append(f"bellek %{mem_delta * 100:+.0f}")
+
+    return ('REGRESYON' if problems else 'OK'), problems
+
+
+def main():
+    all_sizes = ['scalar', *SERIES_SIZES, *PANEL_SIZES]
+
+    parser = argparse.ArgumentParser(description='Gosterge benchmark paketi (regresyon kontrollu)')
+    parser.add_argument('--sizes', nargs='+', default=all_sizes, choices=all_sizes,
+                        help='Olculecek boyutlar (varsayilan: hepsi)')
+    parser.add_argument('--filter', type=str, default=None, help='Sadece adinda bu metin gecen olcumler')
+    parser.add_argument('--repeat', type=int, default=5, help='Tekrar sayisi (en iyisi alinir, 1M icin en fazla 2)')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='Baseline JSON dosyasi')
+    parser.add_argument('--save', action='store_true', help='Sonuclari baseline olarak kaydet')
+    parser.add_argument('--threshold', type=float, default=25.0, help='Izin verilen sure artisi, %% (varsayilan: 25)')
+    parser.add_argument('--memory-threshold', type=float, default=25.0,
+                        help='Izin verilen tepe bellek artisi, %% (varsayilan: 25)')
+    parser.add_argument('--min-time', type=float, default=0.001,
+                        help='Bundan kucuk mutlak sure artislari (s) gurultu sayilir (varsayilan: 0.001)')
+    parser.add_argument('--min-mb', type=float, default=1.0,
+                        help='Bundan kucuk mutlak bellek artislari (MB) gurultu sayilir (varsayilan: 1)')
+    parser.add_argument('--no-memory', action='store_true', help='Tepe bellek olcumunu atla (daha hizli)')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+        print(f"[OK] Baseline yuklendi: {args.baseline} ({len(baseline)} olcum)")
+    elif not args.save:
+        print(f"[UYARI] Baseline yok ({args.baseline}). Olusturmak icin: --save")
+
+    print("=" * 96)
+    print(f"{'OLCUM':44} {'BOYUT':>9} {'SURE':>11} {'BASELINE':>11} {'FARK':>7} {'TEPE MB':>8}  DURUM")
+    print("-" * 96)
+
+    results, regressions = {}, []
+    for label, cases in iter_groups(args.sizes):
+        repeat = min(args.repeat, 2) if label == '1M' else args.repeat
+        for name, case in cases.items():
+            if args.filter and args.filter not in name:
+                continue
+
+            key = f"{name}@{label}"
+            result = measure(case, repeat, memory=not args.no_memory)
+            results[key] = result
+
+            base = baseline.get(key)
+            status, problems = compare(result, base, args)
+            if problems:
+                regressions.append(f"{key}: {', '.join(problems)}")
+
+            base_text = f"{base['time'] * 1000:>9.3f}ms" if base else f"{'-':>11}"
+            delta_text = f"{(result['time'] / base['time'] - 1) * 100:>+6.0f}%" if base else f"{'-':>7}"
+            peak_text = f"{result['peak_mb']:>8.1f}" if 'peak_mb' in result else f"{'-':>8}"
+            print(f"{name:44} {label:>9} {result['time'] * 1000:>9.3f}ms {base_text} {delta_text} "
+                  f"{peak_text}  {status}")
+        del cases
+        gc.collect()
+
+    print("=" * 96)
+
+    if args.save:
+        payload = {
+            'meta': {
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'pandas': pd.__version__,
+                'machine': platform.machine(),
+                'cpu_count': os.cpu_count(),
+            },
+            'results': results
+        }
+        # Kısmi çalıştırma (--sizes / --filter) mevcut baseline'ın diğer ölçümlerini silmesin
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                payload['results'] = {**json.load(f).get('results', {}), **results}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        print(f"[OK] Baseline kaydedildi: {args.baseline} ({len(payload['results'])} olcum)")
+        return 0
+
+    if regressions:
+        print(f"\n[HATA] {len(regressions)} olcumde regresyon (esik: sure %{args.threshold:.0f}, "
+              f"bellek %{args.memory_threshold:.0f}):")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    print(f"\n[OK] {len(results)} olcum, regresyon yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
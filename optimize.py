@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Parametre Optimizasyon Scripti
+
+Gösterge eşiklerini (RSI 30/70, Bollinger 2σ, ...) ve hibrid/makro
+ağırlıklarını geçmiş veriyle test eder. Kombinasyonlar tüm CPU
+çekirdeklerinde paralel değerlendirilir, sonuçlar eğitim skoruna göre
+sıralanıp out-of-sample test skoruyla birlikte raporlanır.
+
+Kullanim:
+    python optimize.py --list BIST30 --period 10y
+    python optimize.py --method random --iter 2000 --hybrid
+    python optimize.py --space space.json --out results.csv
+    python optimize.py --walk-forward --train-years 3 --test-years 1
+"""
+
+import sys
+import json
+import argparse
+from src.data.fetcher import get_multiple_stocks
+from src.data.bist_stocks import get_stock_list
+from src.indicators.panel import build_panel
+from src.backtesting.optimizer import (
+    optimize, build_macro_inputs, DEFAULT_SPACE, HYBRID_SPACE
+)
+from src.backtesting.walkforward import walk_forward
+
+
+def print_walk_forward_report(result: dict, space: dict) -> None:
+    """Walk-forward pencerelerini ve out-of-sample özetini yazdırır"""
+    columns = ['fold', 'test_start', 'test_end', *space.keys(), 'train_sharpe',
+               'test_sharpe', 'test_total_return']
+    print("\nPencere basina secilen parametreler:")
+    print(result['folds'][columns].round(3).to_string(index=False))
+
+    m = result['oos_metrics']
+    print("\n" + "=" * 70)
+    print(f"OUT-OF-SAMPLE: Getiri {m['total_return']:+.1%} | CAGR {m['cagr']:+.1%} | "
+          f"Sharpe {m['sharpe']:.2f} | Max DD {m['max_drawdown']:.1%} | {int(m['trades'])} islem")
+    print("=" * 70)
+
+
+def main():
+    """Ana fonksiyon"""
+
+    parser = argparse.ArgumentParser(
+        description='Strateji parametrelerini paralel grid/random search ile optimize et',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ornekler:
+  python optimize.py                                  # BIST30, 10 yil, varsayilan grid
+  python optimize.py --method random --iter 2000      # 2000 rastgele kombinasyon
+  python optimize.py --hybrid                         # Hibrid + makro agirliklarini da ara
+  python optimize.py --space space.json --out sonuc.csv
+  python optimize.py --walk-forward                   # 3 yil egitim / 1 yil test kayan pencereler
+
+space.json ornegi:
+  {"rsi_oversold": [25, 30], "bb_std": [1.5, 2.5], "technical_weight": [0.6, 0.8]}
+        """
+    )
+
+    parser.add_argument('symbols', nargs='*', help='Hisse kodlari (bos birakilirsa --list kullanilir)')
+    parser.add_argument('--list', type=str, default='BIST30', help='Hisse listesi (varsayilan: BIST30)')
+    parser.add_argument('--period', type=str, default='10y', help='Veri periyodu (varsayilan: 10y)')
+    parser.add_argument('--method', type=str, default='grid', choices=['grid', 'random'],
+                        help='Arama yontemi (varsayilan: grid)')
+    parser.add_argument('--iter', type=int, default=500, help='Random search kombinasyon sayisi')
+    parser.add_argument('--space', type=str, help='Arama uzayi JSON dosyasi')
+    parser.add_argument('--hybrid', action='store_true', help='Makro gecmisle hibrid skoru optimize et')
+    parser.add_argument('--walk-forward', action='store_true',
+                        help='Kayan egitim/test pencereleriyle walk-forward dogrulama')
+    parser.add_argument('--train-years', type=float, default=3.0,
+                        help='Walk-forward egitim penceresi, yil (varsayilan: 3)')
+    parser.add_argument('--test-years', type=float, default=1.0,
+                        help='Walk-forward test penceresi, yil (varsayilan: 1)')
+    parser.add_argument('--anchored', action='store_true',
+                        help='Walk-forward egitim penceresi hep ilk bardan baslasin')
+    parser.add_argument('--train', type=float, default=0.7, help='Egitim donemi orani (varsayilan: 0.7)')
+    parser.add_argument('--metric', type=str, default='sharpe', help='Siralama metrigi (varsayilan: sharpe)')
+    parser.add_argument('--workers', type=int, default=None, help='Surec sayisi (varsayilan: CPU sayisi)')
+    parser.add_argument('--top', type=int, default=20, help='Gosterilecek sonuc sayisi')
+    parser.add_argument('--out', type=str, help='Tum sonuclari CSV olarak kaydet')
+
+    args = parser.parse_args()
+
+    if args.space:
+        with open(args.space, 'r', encoding='utf-8') as f:
+            space = json.load(f)
+    else:
+        space = dict(DEFAULT_SPACE)
+        if args.hybrid:
+            space.update(HYBRID_SPACE)
+
+    symbols = [s.upper() for s in args.symbols] or get_stock_list(args.list)
+
+    print("=" * 70)
+    print(f"PARAMETRE OPTIMIZASYONU ({len(symbols)} hisse, {args.period})")
+    print("=" * 70)
+
+    stocks = get_multiple_stocks(symbols, period=args.period, show_stats=False)
+    if not stocks:
+        print("[HATA] Hicbir hisse verisi cekilemedi!")
+        return 1
+
+    close = build_panel(stocks, 'Close')
+    volume = build_panel(stocks, 'Volume')
+
+    macro = None
+    if args.hybrid:
+        print("\n[MAKRO] Point-in-time makro skorlari hazirlaniyor...")
+        macro = build_macro_inputs(close.index, list(close.columns))
+        if macro is None:
+            return 1
+
+    if args.walk_forward:
+        result = walk_forward(
+            close, volume, space,
+            train_years=args.train_years,
+            test_years=args.test_years,
+            anchored=args.anchored,
+            method=args.method,
+            n_iter=args.iter,
+            metric=args.metric,
+            max_workers=args.workers,
+            macro=macro
+        )
+        print_walk_forward_report(result, space)
+
+        if args.out:
+            result['results'].to_csv(args.out, index=False)
+            print(f"\n[OK] Sonuclar kaydedildi: {args.out}")
+        return 0
+
+    table = optimize(
+        close, volume, space,
+        method=args.method,
+        n_iter=args.iter,
+        train_ratio=args.train,
+        metric=args.metric,
+        max_workers=args.workers,
+        macro=macro
+    )
+
+    print(f"\nEn iyi {args.top} kombinasyon (egitim {args.metric} skoruna gore):")
+    print(table.head(args.top).round(3).to_string(index=False))
+
+    if args.out:
+        table.to_csv(args.out, index=False)
+        print(f"\n[OK] Sonuclar kaydedildi: {args.out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n[IPTAL] Kullanici tarafindan iptal edildi.")
+        sys.exit(0)
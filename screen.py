@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Hisse Tarama Scripti
+
+Bir hisse listesinin tamamını (BIST30, BIST100, POPULAR) teknik
+(opsiyonel: hibrid) analizden geçirip skora göre sıralı tablo yazdırır.
+Etkileşimsizdir: bilinmeyen hisse için soru sormaz, atlar.
+
+Kullanim:
+    python screen.py
+    python screen.py --universe BIST100 --macro
+    python screen.py THYAO SASA GARAN --top 3
+"""
+
+import sys
+import argparse
+import pandas as pd
+from src.data.fetcher import get_multiple_stocks
+from src.data.providers import configure_provider
+from src.data.bist_stocks import get_stock_list, is_valid_bist_stock
+from src.analysis.screener import screen_universe
+from src.macro.fetcher import MacroDataFetcher
+
+
+def _fmt(value, spec: str, width: int) -> str:
+    """Sayıyı biçimlendirir; eksik değer (None / NaN) '-' olarak yazılır"""
+    if value is None or pd.isna(value):
+        align = spec[0] if spec[0] in '<>^' else '>'
+        return f"{'-':{align}{width}}"
+    return f"{float(value):{spec}}"
+
+
+def print_screen_report(table, top: int = 20) -> None:
+    """Tarama sonuçlarını terminale yazdırır"""
+    hybrid = 'hybrid_score' in table.columns
+    ranked = table[table['rank'].notna()] if 'error' in table.columns else table
+
+    width = 86 if hybrid else 70
+    print("\n" + "=" * width)
+    header = (f"{'#':>3} {'HISSE':8} {'FIYAT':>10} {'SINYAL':12} {'GUVEN':>6} "
+              f"{'SKOR':>6} {'AL/SAT':>7} {'RSI':>6}")
+    if hybrid:
+        header += f" {'HIBRID':>7} {'KARAR':>6}"
+    print(header)
+    print("-" * width)
+
+    for _, row in ranked.head(top).iterrows():
+        line = (f"{int(row['rank']):>3} {row['symbol']:8} {_fmt(row['price'], '>10.2f', 10)} "
+                f"{str(row['signal']):12} {_fmt(row['confidence'], '>5.0f', 5)}% "
+                f"{_fmt(row['score'], '>+6.0f', 6)} "
+                f"{_fmt(row['buy_count'], '>3.0f', 3)}/{_fmt(row['sell_count'], '<3.0f', 3)} "
+                f"{_fmt(row['rsi'], '>6.1f', 6)}")
+        if hybrid:
+            line += f" {_fmt(row['hybrid_score'], '>7.1f', 7)} {str(row['hybrid_signal']):>6}"
+        print(line)
+
+    print("=" * width)
+
+    if len(ranked) < len(table):
+        print(f"[UYARI] {len(table) - len(ranked)} hisse analiz edilemedi.")
+
+
+def main():
+    """Ana fonksiyon"""
+
+    parser = argparse.ArgumentParser(
+        description='Hisse listesini paralel tarayip skora gore sirala',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ornekler:
+  python screen.py                          # BIST30 teknik tarama
+  python screen.py --universe BIST100       # BIST100 teknik tarama
+  python screen.py --universe BIST100 --macro --top 10
+  python screen.py THYAO SASA GARAN         # Belirli hisseler
+  python screen.py --out tarama.csv         # Tum sonuclari CSV'ye kaydet
+        """
+    )
+
+    parser.add_argument('symbols', nargs='*', help='Hisse kodlari (bos birakilirsa --universe kullanilir)')
+    parser.add_argument('--universe', type=str, default='BIST30',
+                        help='Hisse listesi: BIST30, BIST100, POPULAR (varsayilan: BIST30)')
+    parser.add_argument('--period', type=str, default='1y', help='Veri periyodu (varsayilan: 1y)')
+    parser.add_argument('--macro', action='store_true', help='Hibrid skor (Teknik + Makro) ekle')
+    parser.add_argument('--workers', type=int, default=None, help='Surec sayisi (varsayilan: CPU sayisi)')
+    parser.add_argument('--top', type=int, default=20, help='Gosterilecek hisse sayisi (varsayilan: 20)')
+    parser.add_argument('--out', type=str, help='Tum sonuclari CSV olarak kaydet')
+    parser.add_argument('--record', type=str, metavar='KLASOR',
+                        help='Cekilen ham verileri klasore kaydet (sonra --replay ile kullanilir)')
+    parser.add_argument('--replay', type=str, metavar='KLASOR',
+                        help='Internete cikmadan kayitli veriyi kullan')
+
+    args = parser.parse_args()
+
+    try:
+        configure_provider(record=args.record, replay=args.replay)
+    except ValueError as e:
+        print(f"[HATA] {e}")
+        return 1
+
+    if args.symbols:
+        symbols = [s.upper().strip() for s in args.symbols]
+        unknown = [s for s in symbols if not is_valid_bist_stock(s)]
+        if unknown:
+            print(f"[UYARI] BIST100 listesinde olmayan hisseler de taranacak: {', '.join(unknown)}")
+    else:
+        symbols = get_stock_list(args.universe)
+        if not symbols:
+            return 1
+
+    print("=" * 70)
+    print(f"HISSE TARAMA ({len(symbols)} hisse, {args.period})")
+    print("=" * 70)
+
+    macro_data = None
+    if args.macro:
+        macro_data = MacroDataFetcher().load_from_config()
+        if macro_data is None:
+            print("[HATA] Makro veriler bulunamadi!")
+            print("[COZUM] Once makro verileri guncelleyin: python update_macro.py")
+            return 1
+
+    stocks = get_multiple_stocks(symbols, period=args.period, show_stats=False)
+    if not stocks:
+        print("[HATA] Hicbir hisse verisi cekilemedi!")
+        return 1
+
+    table = screen_universe(stocks, macro_data=macro_data, max_workers=args.workers)
+    print_screen_report(table, top=args.top)
+
+    if args.out:
+        table.to_csv(args.out, index=False)
+        print(f"\n[OK] Sonuclar kaydedildi: {args.out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n[IPTAL] Kullanici tarafindan iptal edildi.")
+        sys.exit(0)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Analiz Servisi Scripti
+
+Fiyat verilerini, gösterge sonuçlarını ve makro veriyi bellekte tutan
+yerel HTTP/JSON servisini başlatır. Cache'teki hisseler için her istek
+birkaç milisaniyede cevaplanır.
+
+Kullanim:
+    python serve.py
+    python serve.py --port 9000 --preload BIST100
+
+Ornek istekler:
+    curl http://127.0.0.1:8765/analyze/THYAO
+    curl http://127.0.0.1:8765/hybrid/THYAO
+    curl "http://127.0.0.1:8765/screen?universe=BIST30&macro=1&top=10"
+"""
+
+import sys
+import argparse
+from src.data.bist_stocks import get_stock_list
+from src.service.daemon import AnalysisService, create_server
+
+
+def main():
+    """Ana fonksiyon"""
+
+    parser = argparse.ArgumentParser(
+        description='Bellekte cache tutan yerel analiz servisi (HTTP/JSON)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Adresler:
+  GET /health                          Servis durumu
+  GET /analyze/THYAO                   Teknik analiz + sinyal
+  GET /hybrid/THYAO                    Hibrid analiz (Teknik + Makro)
+  GET /screen?universe=BIST30&top=20   Sirali tarama (&macro=1 ile hibrid)
+        """
+    )
+
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Dinlenecek adres (varsayilan: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port (varsayilan: 8765)')
+    parser.add_argument('--period', type=str, default='1y', help='Veri periyodu (varsayilan: 1y)')
+    parser.add_argument('--preload', type=str, default=None,
+                        help='Baslangicta bellege alinacak liste: BIST30, BIST100, POPULAR')
+
+    args = parser.parse_args()
+
+    service = AnalysisService(period=args.period)
+
+    if args.preload:
+        print(f"[BEKLE] {args.preload} bellege aliniyor...")
+        ready = service.preload(get_stock_list(args.preload))
+        print(f"[OK] {ready} hisse hazir.")
+
+    service.macro_data()
+
+    server = create_server(service, host=args.host, port=args.port)
+    print(f"[OK] Servis calisiyor: http://{args.host}:{args.port} (durdurmak icin Ctrl+C)")
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n[IPTAL] Servis durduruldu.")
+        sys.exit(0)
@@ -5,7 +5,10 @@ Bu modül teknik göstergeleri birleştirerek
 genel analiz ve sinyal üretir.
 """
 
-from .technical import analyze_stock, generate_signals
-
-__all__ = ['analyze_stock', 'generate_signals']
+from ..utils.lazy import lazy_exports
 
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.technical': ['analyze_stock', 'generate_signals'],
+    '.screener': ['screen_universe']
+})
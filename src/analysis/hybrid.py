@@ -3,14 +3,29 @@ Hibrid analiz motoru
 Teknik analiz + Makroekonomik analiz birleştirme
 """
 
-from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from bisect import bisect_right
+from typing import Dict, List, Optional, Union
 from ..macro.analyzer import MacroAnalyzer
 from ..macro.sectors import SectorAnalyzer
+from ..utils.profiling import profiled
+from ..utils.numeric import py_round
 
 
 class HybridAnalyzer:
     """Teknik ve makro analizi birleştiren sınıf"""
     
+    # Hibrid skor eşikleri: skor >= eşik[i-1] -> SIGNAL_LEVELS[i] (sinyal, emoji, güven)
+    SIGNAL_EDGES = (25, 40, 50, 65)
+    SIGNAL_LEVELS = (
+        ('SAT', '[-]', 'YÜKSEK'),
+        ('SAT', '[-]', 'ORTA'),
+        ('BEK', '[o]', 'DÜŞÜK'),
+        ('AL', '[+]', 'ORTA'),
+        ('AL', '[+]', 'YÜKSEK'),
+    )
+    
     def __init__(self, technical_score: float, macro_data: Dict, symbol: str):
         """
         Args:
@@ -26,6 +41,43 @@ class HybridAnalyzer:
         self.macro_analyzer = MacroAnalyzer(macro_data)
         self.sector_analyzer = SectorAnalyzer(macro_data)
     
+    @staticmethod
+    def combine_scores(technical_score, macro_score_raw, sector_score,
+                       technical_weight: float = 0.70, macro_weight: float = 0.30):
+        """
+        Teknik, makro ve sektör skorlarını hibrid skora çevirir
+        
+        Skaler değerlerle veya NumPy dizileriyle (örn: tarih x hisse) çalışır,
+        böylece optimizasyon binlerce tarih için aynı formülü tek seferde uygular.
+        
+        Args:
+            technical_score: Teknik skor
+            macro_score_raw: Genel makro skor (-10 ile +10 arası)
+            sector_score: Sektöre özel skor
+            technical_weight: Teknik ağırlık
+            macro_weight: Makro ağırlık
+            
+        Returns:
+            tuple: (hibrid skor 0-100, sektörle birleşik makro skor, 0-100'e normalize makro skor)
+        """
+        # Ağırlıkları normalize et (toplamı 1 olsun)
+        total_weight = technical_weight + macro_weight
+        technical_weight = technical_weight / total_weight
+        macro_weight = macro_weight / total_weight
+        
+        # Sektörel skoru makro skora ekle (ağırlık: 0.3)
+        combined_macro_score = (macro_score_raw * 0.7) + (sector_score * 0.3)
+        combined_macro_normalized = (combined_macro_score + 10) * 5  # 0-100'e normalize
+        
+        # Final hibrid skor, 0-100 arasında tut
+        hybrid_score = np.clip(
+            technical_score * technical_weight + combined_macro_normalized * macro_weight,
+            0, 100
+        )
+        
+        return hybrid_score, combined_macro_score, combined_macro_normalized
+    
+    @profiled()
     def calculate_hybrid_score(self, 
                                technical_weight: float = 0.70,
                                macro_weight: float = 0.30) -> Dict:
@@ -39,11 +91,6 @@ class HybridAnalyzer:
         Returns:
             Dict: Hibrid analiz sonuçları
         """
-        # Ağırlıkları normalize et (toplamı 1 olsun)
-        total_weight = technical_weight + macro_weight
-        technical_weight = technical_weight / total_weight
-        macro_weight = macro_weight / total_weight
-        
         # Genel makro analiz
         macro_result = self.macro_analyzer.calculate_overall_macro_score()
         macro_score_raw = macro_result['total_score']  # -10 ile +10 arası
@@ -53,40 +100,14 @@ class HybridAnalyzer:
         sector_score, sector_desc = self.sector_analyzer.analyze_sector_specific(self.symbol)
         sector = self.sector_analyzer.get_sector(self.symbol)
         
-        # Sektörel skoru makro skora ekle (ağırlık: 0.3)
-        combined_macro_score = (macro_score_raw * 0.7) + (sector_score * 0.3)
-        combined_macro_normalized = (combined_macro_score + 10) * 5  # 0-100'e normalize
-        
-        # Final hibrid skor
-        hybrid_score = (
-            self.technical_score * technical_weight +
-            combined_macro_normalized * macro_weight
+        # Sektörel skor eklenip final hibrid skor hesaplanır
+        hybrid_score, combined_macro_score, combined_macro_normalized = self.combine_scores(
+            self.technical_score, macro_score_raw, sector_score, technical_weight, macro_weight
         )
-        
-        # 0-100 arasında tut
-        hybrid_score = max(0, min(100, hybrid_score))
+        hybrid_score = float(hybrid_score)
         
         # Sinyal belirleme
-        if hybrid_score >= 65:
-            signal = 'AL'
-            signal_emoji = '[+]'
-            confidence = 'YÜKSEK'
-        elif hybrid_score >= 50:
-            signal = 'AL'
-            signal_emoji = '[+]'
-            confidence = 'ORTA'
-        elif hybrid_score >= 40:
-            signal = 'BEK'
-            signal_emoji = '[o]'
-            confidence = 'DÜŞÜK'
-        elif hybrid_score >= 25:
-            signal = 'SAT'
-            signal_emoji = '[-]'
-            confidence = 'ORTA'
-        else:
-            signal = 'SAT'
-            signal_emoji = '[-]'
-            confidence = 'YÜKSEK'
+        signal, signal_emoji, confidence = self.SIGNAL_LEVELS[bisect_right(self.SIGNAL_EDGES, hybrid_score)]
         
         # Uyum analizi (teknik ve makro uyumlu mu?)
         tech_direction = 'ALIŞ' if self.technical_score >= 50 else 'SATIŞ'
@@ -126,8 +147,8 @@ class HybridAnalyzer:
             'signal_emoji': signal_emoji,
             'confidence': confidence,
             'weights': {
-                'technical': round(technical_weight * 100, 1),
-                'macro': round(macro_weight * 100, 1)
+                'technical': round(technical_weight / (technical_weight + macro_weight) * 100, 1),
+                'macro': round(macro_weight / (technical_weight + macro_weight) * 100, 1)
             },
             'technical': {
                 'score': round(self.technical_score, 1),
@@ -155,6 +176,111 @@ class HybridAnalyzer:
             }
         }
     
+    @classmethod
+    @profiled()
+    def score_batch(cls, technical: Union[pd.DataFrame, pd.Series, Dict[str, float]],
+                    macro: Union[Dict, List[Optional[Dict]], object],
+                    technical_weight: float = 0.70,
+                    macro_weight: float = 0.30) -> pd.DataFrame:
+        """
+        Çok sayıda hisse ve tarih için hibrid skoru tek seferde hesaplar.
+        
+        Genel makro skor tarih başına bir kez (MacroAnalyzer.score_many),
+        sektör skoru tarih ve sektör başına bir kez hesaplanır; teknik
+        skorlarla birleştirme tarih x hisse dizileri üzerinde yapılır.
+        Her satır, aynı girdilerle calculate_hybrid_score() sonucuyla aynıdır.
+        
+        Args:
+            technical: Teknik skorlar - tarih x hisse DataFrame, ya da tek tarih
+                       için {hisse: skor} / Series. NaN skorlu satırlar atlanır.
+            macro: Tek makro sözlüğü (tüm tarihler için), tarih sayısı kadar
+                   sözlük listesi veya MacroHistoryStore (tarih bazlı as_of).
+                   Makro verisi olmayan (None) tarihlerde makro/sektör skoru 0'dır.
+            technical_weight: Teknik ağırlık
+            macro_weight: Makro ağırlık
+        
+        Returns:
+            pd.DataFrame: (date, symbol) indeksli; technical_score, macro_score,
+                          sector, sector_score, macro_combined, macro_normalized,
+                          hybrid_score, signal, confidence, alignment, risk sütunları
+        
+        Örnek:
+            >>> technical = pd.DataFrame({'THYAO': [62, 48], 'GARAN': [35, 71]}, index=dates)
+            >>> table = HybridAnalyzer.score_batch(technical, MacroHistoryStore())
+            >>> table.loc[dates[-1]].sort_values('hybrid_score', ascending=False)
+        """
+        if not isinstance(technical, pd.DataFrame):
+            technical = pd.DataFrame([pd.Series(technical, dtype=float)])
+        
+        dates = technical.index
+        symbols = [str(col) for col in technical.columns]
+        
+        # Tarih başına makro anlık görüntü
+        if isinstance(macro, dict):
+            snapshots = [macro] * len(dates)
+        elif hasattr(macro, 'as_of_many'):
+            snapshots = macro.as_of_many(list(dates))
+        else:
+            snapshots = list(macro)
+        
+        if len(snapshots) != len(dates):
+            raise ValueError(f"Makro veri sayisi ({len(snapshots)}) tarih sayisiyla ({len(dates)}) ayni olmali")
+        
+        # 1) Genel makro skor: tüm tarihler için tek vektörel çağrı
+        macro_raw = MacroAnalyzer.score_many(snapshots)['total_score'].to_numpy()
+        
+        # 2) Sektör skoru: her (farklı anlık görüntü, sektör) için bir kez
+        sector_of = [SectorAnalyzer({}).get_sector(symbol) for symbol in symbols]
+        sectors = list(dict.fromkeys(sector_of))
+        column_of = np.array([sectors.index(sector) for sector in sector_of], dtype=int)
+        
+        sector_table = np.zeros((len(dates), len(sectors)))
+        computed: Dict[int, np.ndarray] = {}
+        for i, snapshot in enumerate(snapshots):
+            key = id(snapshot)
+            if key not in computed:
+                analyzer = SectorAnalyzer(snapshot or {})
+                computed[key] = np.array([analyzer.analyze_sector(sector)[0] for sector in sectors], dtype=float)
+            sector_table[i] = computed[key]
+        sector_score = sector_table[:, column_of]
+        
+        # 3) Teknik skorlarla birleştirme (tarih x hisse)
+        tech = technical.to_numpy(dtype=float)
+        hybrid, combined, normalized = cls.combine_scores(
+            tech, macro_raw[:, None], sector_score, technical_weight, macro_weight
+        )
+        
+        # Sinyal, uyum ve risk (calculate_hybrid_score ile aynı kurallar)
+        level = np.searchsorted(cls.SIGNAL_EDGES, hybrid, side='right')
+        signal = np.array([row[0] for row in cls.SIGNAL_LEVELS], dtype=object)[level]
+        confidence = np.array([row[2] for row in cls.SIGNAL_LEVELS], dtype=object)[level]
+        
+        tech_buy = tech >= 50
+        macro_buy = normalized >= 50
+        aligned = tech_buy == macro_buy
+        
+        risk = np.where(
+            aligned,
+            np.where((hybrid >= 65) | (hybrid <= 35), 'DÜŞÜK', 'ORTA'),
+            np.where((signal == 'AL') & ~macro_buy, 'YÜKSEK', 'ORTA')
+        )
+        
+        table = pd.DataFrame({
+            'technical_score': tech.ravel(),
+            'macro_score': np.repeat(macro_raw, len(symbols)),
+            'sector': np.tile(np.array([sector or 'Bilinmiyor' for sector in sector_of], dtype=object), len(dates)),
+            'sector_score': py_round(sector_score, 1).ravel(),
+            'macro_combined': py_round(combined, 2).ravel(),
+            'macro_normalized': py_round(normalized, 1).ravel(),
+            'hybrid_score': py_round(hybrid, 1).ravel(),
+            'signal': signal.ravel(),
+            'confidence': confidence.ravel(),
+            'alignment': np.where(aligned, 'UYUMLU', 'ÇATIŞMA').ravel(),
+            'risk': risk.ravel(),
+        }, index=pd.MultiIndex.from_product([dates, symbols], names=['date', 'symbol']))
+        
+        return table[~np.isnan(tech.ravel())]
+    
     def get_recommendation(self, hybrid_result: Dict) -> str:
         """
         Hibrid analiz sonucuna göre yatırım önerisi üretir
@@ -258,4 +384,17 @@ if __name__ == "__main__":
     print(f"Hibrid Skor: {result2['hybrid_score']}/100")
     print(f"Sinyal: {result2['signal_emoji']} {result2['signal']} (Güven: {result2['confidence']})")
     print(f"Uyum: {result2['alignment']['emoji']} {result2['alignment']['status']}")
-
+    
+    # Test 3: Toplu skor (tarih x hisse) - makro skor tarih başına bir kez
+    print("\n" + "=" * 60)
+    print("TEST 3: Toplu Hibrid Skor (3 tarih x 4 hisse)")
+    print("=" * 60)
+    
+    dates = pd.date_range('2025-11-07', periods=3, freq='B')
+    technical = pd.DataFrame({'THYAO': [75, 60, 45], 'GARAN': [30, 55, 70],
+                              'EREGL': [50, 50, 50], 'ASELS': [80, 20, 65]}, index=dates)
+    batch = HybridAnalyzer.score_batch(technical, test_macro_data)
+    print(batch[['technical_score', 'sector', 'hybrid_score', 'signal', 'alignment', 'risk']].to_string())
+    
+    first = batch.loc[(dates[0], 'THYAO')]
+    print(f"\nTek tek hesapla ayni (THYAO, 75): {first['hybrid_score'] == result1['hybrid_score']}")
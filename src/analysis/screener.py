@@ -0,0 +1,243 @@
+"""
+Çoklu Hisse Tarayıcı (Screener)
+
+Bir hisse listesinin (BIST30, BIST100, ...) tamamı için analyze_stock +
+generate_signals (+ opsiyonel hibrid skor) çalıştırıp sıralı tablo üretir.
+
+Hisseler birbirinden bağımsız olduğu için analiz süreç havuzunda
+(ProcessPoolExecutor) paralel yapılır; veri ana süreçte tek seferde
+(cache / toplu indirme ile) çekilir, worker'lar internete çıkmaz.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .technical import analyze_stock, generate_signals
+from .hybrid import HybridAnalyzer
+
+
+# Sıralamada aynı skora sahip hisseler için sinyal önceliği
+SIGNAL_ORDER = {
+    'STRONG_BUY': 6, 'BUY': 5, 'HOLD_BUY': 4, 'HOLD': 3,
+    'HOLD_SELL': 2, 'SELL': 1, 'STRONG_SELL': 0
+}
+
+
+def summarize_analysis(symbol: str, analysis: Dict, signals: Dict,
+                       hybrid: Optional[Dict] = None) -> Dict[str, Any]:
+    """
+    analyze_stock / generate_signals (/ hibrid) çıktısından tablo satırı üretir.
+
+    Args:
+        symbol: Hisse kodu
+        analysis: analyze_stock() çıktısı
+        signals: generate_signals() çıktısı
+        hybrid: HybridAnalyzer.calculate_hybrid_score() çıktısı (opsiyonel)
+
+    Returns:
+        dict: Özet satır (sinyal, güven, skor, ...)
+    """
+    row = {
+        'symbol': symbol,
+        'price': analysis['current_price'],
+        'date': analysis['date'],
+        'signal': signals['overall_signal'],
+        'confidence': signals['confidence'],
+        'score': signals.get('score', 0),
+        'buy_count': signals.get('buy_count', 0),
+        'sell_count': signals.get('sell_count', 0),
+        'rsi': analysis['indicators'].get('RSI', {}).get('value'),
+    }
+
+    if hybrid is not None:
+        row.update({
+            'hybrid_score': hybrid['hybrid_score'],
+            'hybrid_signal': hybrid['signal'],
+            'risk': hybrid['risk']['level'],
+        })
+
+    return row
+
+
+def screen_symbol(symbol: str, data: pd.DataFrame, macro_data: Optional[Dict] = None) -> Dict[str, Any]:
+    """
+    Tek hisseyi analiz edip tablo satırı döndürür.
+
+    Args:
+        symbol: Hisse kodu
+        data: Fiyat verileri
+        macro_data: Makro veriler (verilirse hibrid skor eklenir)
+
+    Returns:
+        dict: Özet satır (sinyal, güven, skor, ...) veya {'symbol', 'error'}
+    """
+    try:
+        analysis = analyze_stock(data, symbol=symbol)
+        signals = generate_signals(analysis)
+
+        if 'error' in signals:
+            return {'symbol': symbol, 'error': signals['error']}
+
+        hybrid = None
+        if macro_data is not None:
+            hybrid = HybridAnalyzer(
+                technical_score=signals.get('score', 50),
+                macro_data=macro_data,
+                symbol=symbol
+            ).calculate_hybrid_score()
+
+        return summarize_analysis(symbol, analysis, signals, hybrid)
+
+    except Exception as e:
+        return {'symbol': symbol, 'error': str(e)}
+
+
+def _screen_job(job: Tuple[str, pd.DataFrame, Optional[Dict]]) -> Dict[str, Any]:
+    """Süreç havuzu için tek argümanlı sarmalayıcı"""
+    return screen_symbol(*job)
+
+
+def screen_universe(
+    stocks: Dict[str, pd.DataFrame],
+    macro_data: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    sort_by: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Tüm hisseleri paralel analiz edip sıralı tablo döndürür.
+
+    Args:
+        stocks: {symbol: DataFrame} (get_multiple_stocks çıktısı)
+        macro_data: Makro veriler (verilirse hibrid skor hesaplanır)
+        max_workers: Süreç sayısı (varsayılan: CPU sayısı, 1 = tek süreç)
+        sort_by: Sıralama sütunu (varsayılan: hibrid varsa 'hybrid_score', yoksa 'score')
+
+    Returns:
+        pd.DataFrame: Sıralı sonuçlar ('rank' sütunu ile). Analiz edilemeyen
+                      hisseler 'error' sütunuyla en sona eklenir.
+
+    Örnek:
+        >>> stocks = get_multiple_stocks(get_stock_list('BIST30'))
+        >>> table = screen_universe(stocks)
+        >>> print(table.head(10))
+    """
+    # Worker'lar sadece teknik analiz yapar; hibrid skor sonda tüm hisseler için
+    # tek seferde hesaplanır (makro skor hisse başına tekrar hesaplanmaz)
+    jobs = [(symbol, data, None) for symbol, data in stocks.items()]
+    max_workers = min(max_workers or os.cpu_count() or 1, max(1, len(jobs)))
+
+    start = time.perf_counter()
+
+    if max_workers == 1:
+        rows = [_screen_job(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rows = list(executor.map(_screen_job, jobs, chunksize=chunksize))
+
+    if macro_data is not None:
+        rows = add_hybrid_scores(rows, macro_data)
+
+    elapsed = time.perf_counter() - start
+    print(f"[OK] {len(jobs)} hisse {elapsed:.2f} s'de tarandi ({max_workers} surec)")
+
+    return rank_table(rows, sort_by)
+
+
+def add_hybrid_scores(rows: List[Dict[str, Any]], macro_data: Dict) -> List[Dict[str, Any]]:
+    """
+    Teknik tarama satırlarına hibrid skor, sinyal ve riski toplu ekler.
+
+    HybridAnalyzer.score_batch ile genel makro skor bir kez, sektör
+    skorları sektör başına bir kez hesaplanır. Sonuç, her hisse için
+    screen_symbol(..., macro_data) ile aynıdır.
+
+    Args:
+        rows: screen_symbol() satırları (hatalı satırlar olduğu gibi kalır)
+        macro_data: Makro veriler
+
+    Returns:
+        list: Aynı satırlar (yerinde güncellenmiş)
+    """
+    valid = [row for row in rows if 'error' not in row]
+    if not valid:
+        return rows
+
+    table = HybridAnalyzer.score_batch(
+        {row['symbol']: row['score'] for row in valid}, macro_data
+    ).droplevel('date')
+
+    for row in valid:
+        hybrid = table.loc[row['symbol']]
+        row.update({
+            'hybrid_score': float(hybrid['hybrid_score']),
+            'hybrid_signal': hybrid['signal'],
+            'risk': hybrid['risk'],
+        })
+
+    return rows
+
+
+def rank_table(rows: List[Dict[str, Any]], sort_by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Tarama satırlarını skora göre sıralayıp 'rank' sütunu ekler.
+
+    Hatalı satırlar ({'symbol', 'error'}) uyarı olarak yazdırılır ve
+    tablonun sonuna eklenir.
+    """
+    table = pd.DataFrame(rows)
+    if table.empty:
+        return table
+
+    errors = None
+    if 'error' in table.columns:
+        errors = table.loc[table['error'].notna(), ['symbol', 'error']]
+        table = table[table['error'].isna()].drop(columns='error')
+        for _, row in errors.iterrows():
+            print(f"[UYARI] {row['symbol']}: {row['error']}")
+
+    sort_by = sort_by or ('hybrid_score' if 'hybrid_score' in table.columns else 'score')
+    table = table.assign(_order=table['signal'].map(SIGNAL_ORDER)).sort_values(
+        [sort_by, '_order', 'confidence'], ascending=False
+    ).drop(columns='_order')
+    table.insert(0, 'rank', range(1, len(table) + 1))
+
+    table = table.reset_index(drop=True)
+    if errors is not None and not errors.empty:
+        table = pd.concat([table, errors], ignore_index=True)
+
+    return table
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import numpy as np
+
+    print("=" * 60)
+    print("HISSE TARAYICI - TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(7)
+    index = pd.date_range('2024-01-01', periods=250, freq='B')
+    stocks = {}
+    for i in range(40):
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, len(index))))
+        stocks[f"HISSE{i}"] = pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+            'Volume': rng.integers(100_000, 5_000_000, len(index)).astype(float)
+        }, index=index)
+
+    serial = screen_universe(stocks, max_workers=1)
+    parallel = screen_universe(stocks, max_workers=4)
+
+    print(f"\nTek surec ve paralel sonuc ayni: {serial.equals(parallel)}")
+    print("\nEn iyi 5 hisse:")
+    print(parallel.head().to_string(index=False))
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
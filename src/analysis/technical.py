@@ -5,33 +5,61 @@ Tüm teknik göstergeleri birleştirerek
 kapsamlı analiz yapar ve sinyaller üretir.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List
-from ..indicators.momentum import calculate_rsi, calculate_macd, interpret_rsi, interpret_macd
-from ..indicators.volatility import calculate_bollinger_bands, interpret_bollinger_bands
-from ..indicators.trend import calculate_moving_averages, interpret_moving_averages, detect_ma_cross
-from ..indicators.volume import analyze_volume
+from typing import Dict, List, Union
+from ..indicators.momentum import (
+    calculate_rsi, calculate_macd, interpret_rsi, interpret_macd,
+    interpret_rsi_series, interpret_macd_series
+)
+from ..indicators.volatility import (
+    calculate_bollinger_bands, interpret_bollinger_bands, interpret_bollinger_bands_series
+)
+from ..indicators.trend import (
+    calculate_moving_averages, interpret_moving_averages, detect_ma_cross,
+    interpret_moving_averages_series
+)
+from ..indicators.volume import analyze_volume, analyze_volume_series
+from ..utils.profiling import profiled
 
 
-def analyze_stock(data: pd.DataFrame, symbol: str = "") -> Dict:
+# Sinyal tablosundaki gösterge önekleri (analyze_stock'taki sıra ile)
+SIGNAL_PREFIXES = ['rsi', 'macd', 'bb', 'ma', 'volume']
+
+
+def _bar_label(moment: pd.Timestamp) -> str:
+    """Bar zamanı: günlük barlarda tarih, gün içi barlarda tarih + saat"""
+    if moment.hour or moment.minute:
+        return moment.strftime('%Y-%m-%d %H:%M')
+    return str(moment.date())
+
+
+@profiled()
+def analyze_stock(data: pd.DataFrame, symbol: str = "", full_history: bool = False) -> Union[Dict, pd.DataFrame]:
     """
     Hisse için kapsamlı teknik analiz yapar.
     
     Args:
         data: Fiyat verileri
         symbol: Hisse kodu
+        full_history: True ise sadece son bar değil, HER bar için
+                      sinyal tablosu döndürür (backtest için)
     
     Returns:
-        dict: Tüm analiz sonuçları
+        dict: Tüm analiz sonuçları (full_history=False)
+        pd.DataFrame: Bar bazlı sinyal tablosu (full_history=True, bkz. analyze_history)
     """
     
+    if full_history:
+        return analyze_history(data)
+    
     if data is None or data.empty:
         return {'error': 'Veri yok'}
     
     results = {
         'symbol': symbol,
         'current_price': float(data['Close'].iloc[-1]),
-        'date': str(data.index[-1].date()),
+        'date': _bar_label(data.index[-1]),
         'indicators': {},
         'signals': []
     }
@@ -122,6 +150,7 @@ def analyze_stock(data: pd.DataFrame, symbol: str = "") -> Dict:
     return results
 
 
+@profiled()
 def generate_signals(analysis: Dict) -> Dict:
     """
     Tüm göstergelerin sinyallerini birleştirerek
@@ -209,3 +238,85 @@ def generate_signals(analysis: Dict) -> Dict:
         'avg_strength': int(avg_strength)
     }
 
+
+def analyze_history(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Her bar için gösterge sinyallerini ve genel kararı vektörel hesaplar.
+    
+    analyze_stock + generate_signals'ın tüm geçmişe uygulanmış halidir;
+    her satır, o bara kadar olan veriyle yapılan analizin sonucudur.
+    
+    Args:
+        data: Fiyat verileri
+    
+    Returns:
+        pd.DataFrame: Satırlar bar, sütunlar:
+            close, {rsi,macd,bb,ma,volume}_signal / _strength,
+            score, overall_signal, confidence
+    
+    Örnek:
+        >>> signals = analyze_stock(data, 'THYAO', full_history=True)
+        >>> buys = signals[signals['overall_signal'].isin(['BUY', 'STRONG_BUY'])]
+    """
+    
+    if data is None or data.empty:
+        return pd.DataFrame()
+    
+    close = data['Close']
+    macd_line, signal_line, histogram = calculate_macd(data)
+    upper, middle, lower = calculate_bollinger_bands(data)
+    
+    parts = {
+        'rsi': interpret_rsi_series(calculate_rsi(data)),
+        'macd': interpret_macd_series(macd_line, signal_line, histogram),
+        'bb': interpret_bollinger_bands_series(close, upper, middle, lower),
+        'ma': interpret_moving_averages_series(close, calculate_moving_averages(data, periods=[20, 50, 200])),
+        'volume': analyze_volume_series(data)
+    }
+    
+    table = pd.DataFrame({'close': close})
+    for prefix in SIGNAL_PREFIXES:
+        table[f'{prefix}_signal'] = parts[prefix]['signal']
+        table[f'{prefix}_strength'] = parts[prefix]['strength']
+    
+    return generate_signal_series(table)
+
+
+def generate_signal_series(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    generate_signals'ın bar bazlı tabloya vektörel uygulanmış hali.
+    
+    Args:
+        table: {prefix}_signal ve {prefix}_strength sütunlu sinyal tablosu
+    
+    Returns:
+        pd.DataFrame: score, overall_signal ve confidence eklenmiş tablo
+    """
+    
+    score = np.zeros(len(table))
+    prefixes = [p for p in SIGNAL_PREFIXES if f'{p}_signal' in table.columns]
+    
+    for prefix in prefixes:
+        signal = table[f'{prefix}_signal'].astype(str)
+        strength = table[f'{prefix}_strength'].to_numpy(dtype=float)
+        direction = np.where(signal.str.contains('BUY'), 1, np.where(signal.str.contains('SELL'), -1, 0))
+        score += direction * strength
+    
+    conditions = [score > 100, score > 50, score > 0, score < -100, score < -50, score < 0]
+    overall = np.select(conditions, ['STRONG_BUY', 'BUY', 'HOLD_BUY', 'STRONG_SELL', 'SELL', 'HOLD_SELL'],
+                        default='HOLD')
+    confidence = np.select(conditions, [
+        np.minimum(95, 60 + score / 10),
+        np.minimum(85, 50 + score / 10),
+        40 + score / 5,
+        np.minimum(95, 60 + -score / 10),
+        np.minimum(85, 50 + -score / 10),
+        40 + -score / 5
+    ], default=30)
+    
+    result = table.copy()
+    result['score'] = np.trunc(score).astype(int)
+    result['overall_signal'] = overall
+    result['confidence'] = np.trunc(confidence).astype(int)
+    
+    return result
@@ -0,0 +1,17 @@
+"""
+Backtesting Modülü
+
+Bu modül sinyal stratejilerini geçmiş veriler üzerinde test eder
+ve performans metriklerini hesaplar.
+"""
+
+from ..utils.lazy import lazy_exports
+
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.engine': [
+        'run_backtest', 'backtest_positions', 'backtest_stock', 'build_signal_panel',
+        'signals_to_positions'
+    ],
+    '.walkforward': ['walk_forward', 'make_folds']
+})
@@ -0,0 +1,514 @@
+"""
+Paralel Parametre Optimizasyonu (Grid / Random Search)
+
+RSI 30/70, Bollinger 2σ, hibrid 0.70/0.30 ağırlıkları ve makro faktör
+ağırlıkları gibi elle seçilmiş parametreleri geçmiş veriyle test eder.
+
+Nasıl Çalışır?
+-------------
+1. Fiyat/hacim panelleri (bar x hisse) shared memory'ye BİR KEZ kopyalanır.
+   Worker süreçlerine DataFrame pickle'lanmaz, sadece bellek bloğunun adı gider.
+2. Her worker başlarken parametreden bağımsız göstergeleri (RSI, MACD,
+   rolling ortalama/std, MA'lar) bir kez hesaplar.
+3. Her parametre kombinasyonu için sadece eşik/ağırlık uygulanır
+   (np.select), sinyaller pozisyona çevrilir ve backtest yapılır.
+4. Veri eğitim (in-sample) ve test (out-of-sample) olarak ikiye bölünür.
+   Sıralama eğitim skoruna göre yapılır, test skoru aşırı uyumu (overfitting)
+   görmek için raporlanır.
+
+Örnek:
+    >>> space = {'rsi_oversold': [25, 30, 35], 'rsi_overbought': [65, 70, 75],
+    ...          'bb_std': [1.5, 2.0, 2.5]}
+    >>> table = optimize(close_panel, volume_panel, space, max_workers=8)
+    >>> print(table.head(10))
+"""
+
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .engine import (
+    strategy_returns, calculate_metrics, _listed, _log_returns, _trade_returns,
+    DEFAULT_COMMISSION, DEFAULT_SLIPPAGE, TRADING_DAYS
+)
+from ..indicators.panel import panel_rsi, panel_macd, panel_moving_averages
+from ..indicators.momentum import rsi_signal_codes, macd_signal_codes
+from ..indicators.volatility import bollinger_signal_codes
+from ..indicators.trend import ma_signal_codes
+from ..indicators.volume import volume_signal_codes
+from ..analysis.hybrid import HybridAnalyzer
+from ..macro.analyzer import MacroAnalyzer
+
+
+# Mevcut (elle seçilmiş) parametreler - arama uzayında olmayanlar bunları kullanır
+DEFAULT_PARAMS = {
+    # Teknik eşikler
+    'rsi_oversold': 30,
+    'rsi_overbought': 70,
+    'bb_std': 2.0,
+    'volume_threshold': 1.5,
+    # generate_signals: score > 50 -> BUY, score < -50 -> SELL
+    'entry_score': 50,
+    'exit_score': -50,
+    # Hibrid (sadece makro veri verilirse)
+    'technical_weight': 0.70,
+    'macro_weight': 0.30,
+    'hybrid_entry': 50,   # HybridAnalyzer: >= 50 -> AL
+    'hybrid_exit': 40,    # HybridAnalyzer: < 40 -> SAT
+    # MacroAnalyzer faktör ağırlıkları
+    **{f'w_{name}': weight for name, weight in MacroAnalyzer.DEFAULT_WEIGHTS.items()}
+}
+
+MACRO_FACTORS = list(MacroAnalyzer.DEFAULT_WEIGHTS.keys())
+
+# Varsayılan arama uzayı (optimize.py --space verilmezse)
+DEFAULT_SPACE = {
+    'rsi_oversold': [20, 25, 30, 35],
+    'rsi_overbought': [65, 70, 75, 80],
+    'bb_std': [1.5, 2.0, 2.5, 3.0],
+    'entry_score': [30, 50, 70],
+    'exit_score': [-30, -50, -70],
+}
+
+# Hibrid mod için ek arama uzayı
+HYBRID_SPACE = {
+    'technical_weight': [0.5, 0.6, 0.7, 0.8, 0.9],
+    'macro_weight': [0.1, 0.2, 0.3, 0.4, 0.5],
+    'w_usd': [0.2, 0.3, 0.4],
+    'w_bist': [0.2, 0.3, 0.4],
+}
+
+
+# =============================================================================
+# Shared memory
+# =============================================================================
+
+class SharedArrays:
+    """NumPy dizilerini süreçler arası paylaşılan belleğe koyar"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Args:
+            arrays: {isim: dizi} - her dizi ayrı bir shared memory bloğuna kopyalanır
+        """
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.specs: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array, dtype=float)
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            self._blocks.append(block)
+            self.specs[name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self) -> None:
+        """Bellek bloklarını serbest bırakır"""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_arrays(specs: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """
+    Shared memory bloklarına kopyalamadan bağlanır.
+
+    Returns:
+        tuple: ({isim: dizi}, blok listesi - diziler kullanıldıkça açık tutulmalı)
+    """
+    arrays, blocks = {}, []
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        blocks.append(block)
+    return arrays, blocks
+
+
+# =============================================================================
+# Parametre uzayı
+# =============================================================================
+
+def grid_search_space(space: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Tüm kombinasyonları üretir.
+
+    Args:
+        space: {parametre: [değerler]}
+
+    Returns:
+        List[Dict]: Parametre kombinasyonları
+    """
+    keys = list(space.keys())
+    return [dict(zip(keys, values)) for values in itertools.product(*space.values())]
+
+
+def random_search_space(space: Dict[str, Any], n_iter: int = 200, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Rastgele kombinasyonlar üretir.
+
+    Args:
+        space: {parametre: [değerler]} veya {parametre: (alt, üst)} (sürekli aralık)
+        n_iter: Kombinasyon sayısı
+        seed: Rastgelelik tohumu
+
+    Returns:
+        List[Dict]: Parametre kombinasyonları
+    """
+    rng = np.random.default_rng(seed)
+    combos = []
+
+    for _ in range(n_iter):
+        combo = {}
+        for key, values in space.items():
+            if isinstance(values, tuple):
+                combo[key] = float(rng.uniform(values[0], values[1]))
+            else:
+                combo[key] = values[int(rng.integers(len(values)))]
+        combos.append(combo)
+
+    return combos
+
+
+# =============================================================================
+# Sinyal hesaplama
+# =============================================================================
+
+def compute_base_indicators(close: np.ndarray, volume: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Parametreden bağımsız göstergeleri bir kez hesaplar (worker başına).
+
+    Args:
+        close: Kapanış paneli (bar x hisse)
+        volume: Hacim paneli (opsiyonel)
+
+    Returns:
+        dict: Gösterge adı -> dizi
+    """
+    close_df = pd.DataFrame(close)
+    macd, signal, histogram = panel_macd(close_df)
+    mas = panel_moving_averages(close_df, [20, 50, 200])
+
+    base = {
+        'rsi': panel_rsi(close_df).to_numpy(),
+        'macd': macd.to_numpy(),
+        'macd_signal': signal.to_numpy(),
+        'macd_histogram': histogram.to_numpy(),
+        'bb_middle': mas[20].to_numpy(),
+        'bb_std': close_df.rolling(window=20).std().to_numpy(),
+        'mas': [ma.to_numpy() for ma in mas.values()],
+    }
+
+    if volume is not None:
+        base['avg_volume'] = pd.DataFrame(volume).rolling(window=20).mean().to_numpy()
+
+    return base
+
+
+def technical_scores(base: Dict[str, np.ndarray], close: np.ndarray,
+                     volume: Optional[np.ndarray], params: Dict[str, Any]) -> np.ndarray:
+    """
+    generate_signals skorunu (Σ yön x güç) tüm barlar ve hisseler için hesaplar.
+
+    Returns:
+        np.ndarray: Bar x hisse teknik skor
+    """
+    width = base['bb_std'] * params['bb_std']
+
+    parts = [
+        rsi_signal_codes(base['rsi'], params['rsi_oversold'], params['rsi_overbought'])[:2],
+        macd_signal_codes(base['macd'], base['macd_signal'], base['macd_histogram'])[:2],
+        bollinger_signal_codes(close, base['bb_middle'] + width, base['bb_middle'], base['bb_middle'] - width)[:2],
+        ma_signal_codes(close, base['mas'])[:2],
+    ]
+    if volume is not None:
+        parts.append(volume_signal_codes(volume, base['avg_volume'], close, params['volume_threshold'])[:2])
+
+    score = np.zeros(close.shape)
+    for codes, strength in parts:
+        score += np.sign(codes) * strength
+
+    return score
+
+
+def target_positions(entry: np.ndarray, exit_: np.ndarray) -> np.ndarray:
+    """Giriş/çıkış maskelerinden hedef pozisyon (arada önceki pozisyon korunur)"""
+    target = np.where(entry, 1.0, np.where(exit_, 0.0, np.nan))
+    return pd.DataFrame(target).ffill().fillna(0.0).to_numpy()
+
+
+def build_macro_inputs(dates: pd.Index, symbols: List[str], history=None) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Hibrid optimizasyon için point-in-time makro girdileri hazırlar.
+
+    Her bar için o tarihte bilinen makro veri (MacroHistoryStore.as_of)
+    ile faktör skorları ve hisse bazlı sektör skorları bir kez hesaplanır.
+
+    Args:
+        dates: Bar tarihleri
+        symbols: Hisse kodları (panel sütun sırası)
+        history: MacroHistoryStore (varsayılan: data/macro_history.db)
+
+    Returns:
+        dict: {'components': bar x 5 faktör, 'sector': bar x hisse} veya None
+    """
+    from ..macro.history import MacroHistoryStore
+    from ..macro.sectors import SectorAnalyzer
+
+    history = history or MacroHistoryStore()
+    snapshots = history.as_of_many(list(dates))
+
+    if not any(snapshots):
+        print("[UYARI] Makro gecmis bulunamadi (python update_macro.py --backfill 10y)")
+        return None
+
+    # Faktör skorları tüm tarihler için tek vektörel çağrıda (makro verisi olmayan gün = 0)
+    components = MacroAnalyzer.score_many(snapshots)[MACRO_FACTORS].to_numpy()
+    sector = np.zeros((len(dates), len(symbols)))
+    cache: Dict[int, np.ndarray] = {}
+
+    for i, snapshot in enumerate(snapshots):
+        if snapshot is None:
+            continue
+
+        # Ardışık günler aynı görüntüyü paylaşır -> bir kez hesapla
+        key = id(snapshot)
+        if key not in cache:
+            sectors = SectorAnalyzer(snapshot)
+            cache[key] = np.array([sectors.analyze_sector_specific(symbol)[0] for symbol in symbols])
+        sector[i] = cache[key]
+
+    return {'components': components, 'sector': sector}
+
+
+def hybrid_scores(technical: np.ndarray, macro: Dict[str, np.ndarray], params: Dict[str, Any]) -> np.ndarray:
+    """HybridAnalyzer formülünü tüm barlar ve hisseler için uygular"""
+    weights = np.array([params[f'w_{name}'] for name in MACRO_FACTORS])
+
+    # MacroAnalyzer: -10..+10 arası kırpılır ve 2 haneye yuvarlanır
+    macro_raw = np.round(np.clip(macro['components'] @ weights, -10, 10), 2)
+
+    hybrid, _, _ = HybridAnalyzer.combine_scores(
+        technical, macro_raw[:, None], macro['sector'],
+        params['technical_weight'], params['macro_weight']
+    )
+    return hybrid
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(specs: Dict, split: int, costs: Tuple[float, float]) -> None:
+    """Worker başlangıcı: shared memory'ye bağlan, temel göstergeleri hesapla"""
+    arrays, blocks = attach_arrays(specs)
+
+    _WORKER.clear()
+    _WORKER.update({
+        'arrays': arrays,
+        'blocks': blocks,
+        'split': split,
+        'costs': costs,
+        'base': compute_base_indicators(arrays['close'], arrays.get('volume')),
+    })
+
+
+def _segment_metrics(position: pd.DataFrame, returns: pd.DataFrame,
+                     close: np.ndarray) -> Dict[str, float]:
+    """Bir dönem (eğitim/test) için eşit ağırlıklı portföy metrikleri (backtest_positions ile aynı)"""
+    trades = _trade_returns(position.to_numpy(), _log_returns(returns.to_numpy()))
+    listed = _listed(close, returns)
+    portfolio = calculate_metrics(
+        returns.where(listed).mean(axis=1).fillna(0.0).to_frame('portfolio'),
+        position.where(listed).mean(axis=1).fillna(0.0).to_frame('portfolio'),
+        [np.concatenate(trades)],
+        TRADING_DAYS
+    ).iloc[0]
+    return portfolio.to_dict()
+
+
+def strategy_for_params(params: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Parametrelerle tüm seri için pozisyon ve net getirileri hesaplar (worker içinde).
+
+    Göstergeler nedensel (sadece geçmiş barları kullanır) olduğu için
+    tüm seride bir kez hesaplanıp istenen döneme dilimlenebilir.
+
+    Returns:
+        tuple: (uygulanan pozisyonlar, net getiriler) - bar x hisse
+    """
+    arrays = _WORKER['arrays']
+    full = {**DEFAULT_PARAMS, **params}
+    close, volume = arrays['close'], arrays.get('volume')
+
+    score = technical_scores(_WORKER['base'], close, volume, full)
+
+    if 'macro_components' in arrays:
+        hybrid = hybrid_scores(score, {'components': arrays['macro_components'],
+                                       'sector': arrays['macro_sector']}, full)
+        target = target_positions(hybrid >= full['hybrid_entry'], hybrid < full['hybrid_exit'])
+    else:
+        target = target_positions(score > full['entry_score'], score < full['exit_score'])
+
+    commission, slippage = _WORKER['costs']
+    return strategy_returns(pd.DataFrame(close), pd.DataFrame(target), commission, slippage)
+
+
+def segment_metrics(position: pd.DataFrame, returns: pd.DataFrame, start: int, end: int,
+                    prefix: str) -> Dict[str, float]:
+    """Bir dönemin ([start, end) barları) özet metriklerini '{prefix}_{metrik}' anahtarlarıyla döndürür"""
+    metrics = _segment_metrics(position.iloc[start:end], returns.iloc[start:end],
+                               _WORKER['arrays']['close'][start:end])
+    return {f'{prefix}_{name}': metrics[name]
+            for name in ['sharpe', 'total_return', 'max_drawdown', 'win_rate', 'trades']}
+
+
+def evaluate_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Tek parametre kombinasyonunu değerlendirir (worker içinde çalışır).
+
+    Returns:
+        dict: Parametreler + train_* ve test_* metrikleri
+    """
+    position, returns = strategy_for_params(params)
+
+    split = _WORKER['split']
+    result = dict(params)
+    result.update(segment_metrics(position, returns, 0, split, 'train'))
+    result.update(segment_metrics(position, returns, split, len(returns), 'test'))
+
+    return result
+
+
+# =============================================================================
+# Ana fonksiyon
+# =============================================================================
+
+def optimize(
+    close: pd.DataFrame,
+    volume: Optional[pd.DataFrame] = None,
+    space: Optional[Dict[str, Any]] = None,
+    method: str = 'grid',
+    n_iter: int = 200,
+    train_ratio: float = 0.7,
+    metric: str = 'sharpe',
+    max_workers: Optional[int] = None,
+    macro: Optional[Dict[str, np.ndarray]] = None,
+    commission: float = DEFAULT_COMMISSION,
+    slippage: float = DEFAULT_SLIPPAGE,
+    seed: int = 42
+) -> pd.DataFrame:
+    """
+    Parametre kombinasyonlarını paralel değerlendirip sıralı tablo döndürür.
+
+    Args:
+        close: Kapanış paneli (bar x hisse)
+        volume: Hacim paneli (opsiyonel)
+        space: Arama uzayı {parametre: [değerler] veya (alt, üst)} - bkz. DEFAULT_PARAMS
+        method: 'grid' (tüm kombinasyonlar) veya 'random'
+        n_iter: Random search kombinasyon sayısı
+        train_ratio: Eğitim dönemi oranı (kalanı out-of-sample test)
+        metric: Sıralama metriği ('sharpe', 'total_return', 'win_rate', ...)
+        max_workers: Süreç sayısı (varsayılan: CPU sayısı, 1 = tek süreç)
+        macro: build_macro_inputs çıktısı (verilirse hibrid skor optimize edilir)
+        commission: Tek yön komisyon
+        slippage: Tek yön kayma
+        seed: Random search tohumu
+
+    Returns:
+        pd.DataFrame: Eğitim metriğine göre sıralı sonuçlar (train_* ve test_* sütunları)
+    """
+    space = space or DEFAULT_SPACE
+    unknown = set(space) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametre(ler): {', '.join(sorted(unknown))}")
+
+    if method == 'grid':
+        combos = grid_search_space(space)
+    elif method == 'random':
+        combos = random_search_space(space, n_iter, seed)
+    else:
+        raise ValueError(f"Gecersiz yontem '{method}'. 'grid' veya 'random' kullanin.")
+
+    arrays = {'close': close.to_numpy(dtype=float)}
+    if volume is not None:
+        arrays['volume'] = volume.reindex_like(close).to_numpy(dtype=float)
+    if macro is not None:
+        arrays['macro_components'] = macro['components']
+        arrays['macro_sector'] = macro['sector']
+
+    split = int(len(close) * train_ratio)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    print(f"[OPTIMIZE] {len(combos)} kombinasyon, {close.shape[1]} hisse x {len(close)} bar, "
+          f"{max_workers} surec")
+    start = time.perf_counter()
+
+    with SharedArrays(arrays) as shared:
+        init_args = (shared.specs, split, (commission, slippage))
+
+        if max_workers == 1:
+            _init_worker(*init_args)
+            results = [evaluate_params(combo) for combo in combos]
+            _WORKER.clear()
+        else:
+            chunksize = max(1, len(combos) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=init_args) as executor:
+                results = list(executor.map(evaluate_params, combos, chunksize=chunksize))
+
+    elapsed = time.perf_counter() - start
+    print(f"[OK] {len(combos)} kombinasyon {elapsed:.1f} s'de degerlendirildi "
+          f"({elapsed / max(1, len(combos)) * 1000:.0f} ms/kombinasyon)")
+
+    table = pd.DataFrame(results).sort_values(f'train_{metric}', ascending=False, na_position='last')
+    table.insert(0, 'rank', range(1, len(table) + 1))
+
+    return table.reset_index(drop=True)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PARALEL PARAMETRE OPTIMIZASYONU - TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(21)
+    n_bars, n_symbols = 1500, 30
+    index = pd.date_range('2019-01-01', periods=n_bars, freq='B')
+    columns = [f"HISSE{i}" for i in range(n_symbols)]
+    close = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, (n_bars, n_symbols)), axis=0)),
+                         index=index, columns=columns)
+    volume = pd.DataFrame(rng.integers(100_000, 5_000_000, (n_bars, n_symbols)).astype(float),
+                          index=index, columns=columns)
+
+    space = {
+        'rsi_oversold': [25, 30, 35],
+        'rsi_overbought': [65, 70, 75],
+        'bb_std': [1.5, 2.0, 2.5],
+        'entry_score': [30, 50, 70],
+    }
+
+    table = optimize(close, volume, space, max_workers=4)
+
+    print("\nEn iyi 5 kombinasyon (egitim Sharpe'ina gore):")
+    columns = ['rank', *space.keys(), 'train_sharpe', 'test_sharpe', 'test_total_return']
+    print(table[columns].head().to_string(index=False))
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
@@ -0,0 +1,371 @@
+"""
+Walk-Forward Doğrulama
+
+Parametreleri kayan eğitim pencerelerinde seçip hemen ardından gelen
+(görülmemiş) test penceresinde çalıştırır, test dönemlerini uç uca
+ekleyerek gerçekçi bir out-of-sample getiri eğrisi üretir:
+
+    |---- eğitim ----|-- test --|
+          |---- eğitim ----|-- test --|
+                |---- eğitim ----|-- test --|
+
+Tekrar hesaplamayı önlemek için:
+- Temel göstergeler (RSI, MACD, Bollinger, MA, hacim) her süreçte tüm
+  seri üzerinde BİR kez hesaplanır (optimizer._init_worker).
+- Her kombinasyonun pozisyon/getiri serisi de bir kez hesaplanır ve tüm
+  pencerelere dilimlenir; göstergeler nedensel olduğu için dilim, pencere
+  bazında yeniden hesaplamayla aynı sinyali verir (ısınma dönemi bonus).
+- Kombinasyonlar (ve böylece tüm pencereleri) CPU çekirdeklerine dağıtılır.
+
+Out-of-sample Eğri:
+    Her pencerede seçilen kombinasyonun test dilimi uç uca eklenir. Pencere
+    başında pozisyon, seçilen kombinasyonun eğitim dönemindeki (sanal)
+    pozisyonundan değil, bir önceki pencerenin kapanış pozisyonundan (ilk
+    pencerede nakit) devralınır. Devralınan pozisyon, yeni kombinasyon o
+    hissede ilk kez işlem yapana (pozisyonu değişene) kadar tutulur; getiri
+    ve maliyetler bu gerçek pozisyondan yeniden hesaplanır.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .engine import (
+    _asset_returns, _listed, _log_returns, _trade_returns, calculate_metrics,
+    DEFAULT_COMMISSION, DEFAULT_SLIPPAGE, TRADING_DAYS
+)
+from .optimizer import (
+    DEFAULT_PARAMS, DEFAULT_SPACE, SharedArrays, grid_search_space, random_search_space,
+    _init_worker, _WORKER, strategy_for_params, segment_metrics
+)
+
+
+def make_folds(
+    n_bars: int,
+    train_bars: int,
+    test_bars: int,
+    step: Optional[int] = None,
+    anchored: bool = False
+) -> List[Tuple[int, int, int]]:
+    """
+    Walk-forward pencerelerini üretir.
+
+    Args:
+        n_bars: Toplam bar sayısı
+        train_bars: Eğitim penceresi uzunluğu
+        test_bars: Test penceresi uzunluğu
+        step: Pencere kaydırma miktarı (varsayılan: test_bars -> test dönemleri örtüşmez)
+        anchored: True ise eğitim hep ilk bardan başlar (genişleyen pencere)
+
+    Returns:
+        list: (eğitim başı, eğitim sonu = test başı, test sonu) indeksleri
+
+    Örnek:
+        >>> make_folds(1000, 500, 100)
+        [(0, 500, 600), (100, 600, 700), (200, 700, 800), (300, 800, 900), (400, 900, 1000)]
+    """
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("Egitim ve test pencereleri pozitif olmali")
+
+    step = step or test_bars
+    folds = []
+    train_end = train_bars
+    while train_end + test_bars <= n_bars:
+        train_start = 0 if anchored else train_end - train_bars
+        folds.append((train_start, train_end, train_end + test_bars))
+        train_end += step
+
+    return folds
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def _init_walk_forward(specs: Dict, folds: List[Tuple[int, int, int]],
+                       costs: Tuple[float, float]) -> None:
+    """Worker başlangıcı: optimizer worker'ı + pencere listesi"""
+    _init_worker(specs, 0, costs)
+    _WORKER['folds'] = folds
+
+
+def evaluate_folds(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Tek kombinasyonu tüm pencerelerde değerlendirir (worker içinde çalışır).
+
+    Strateji tüm seride bir kez hesaplanır, pencereler yalnızca dilimdir.
+
+    Returns:
+        list: Her pencere için train_* / test_* metrikleri
+    """
+    position, returns = strategy_for_params(params)
+
+    results = []
+    for train_start, train_end, test_end in _WORKER['folds']:
+        result = segment_metrics(position, returns, train_start, train_end, 'train')
+        result.update(segment_metrics(position, returns, train_end, test_end, 'test'))
+        results.append(result)
+
+    return results
+
+
+def stitch_out_of_sample(
+    folds: List[Tuple[int, int, int]],
+    chosen: List[Dict[str, Any]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pencere başına seçilen kombinasyonların test dilimlerini uç uca ekler
+    (worker bağlamında çalışır).
+
+    Test dönemleri örtüşüyorsa ilk pencerenin barları tutulur. Her pencere,
+    bir önceki pencerenin kapanış pozisyonunu (ilk pencerede nakit) devralır
+    ve her hissede bu pozisyonu, seçilen kombinasyonun pozisyonu pencere
+    içinde ilk kez değişene kadar tutar; o bardan sonra kombinasyonu izler.
+    Net getiriler bu pozisyondan (maliyet dahil) yeniden hesaplanır.
+
+    Args:
+        folds: make_folds çıktısı
+        chosen: Her pencere için seçilen parametreler
+
+    Returns:
+        tuple: (bar indeksleri, pozisyonlar, net getiriler) - bar x hisse
+    """
+    commission, slippage = _WORKER['costs']
+    cost = commission + slippage
+    asset_returns = _asset_returns(pd.DataFrame(_WORKER['arrays']['close'])).to_numpy()
+    n_symbols = asset_returns.shape[1]
+
+    strategies = {}
+    indices, positions, returns = [], [], []
+    covered_end = 0
+    previous = np.zeros(n_symbols)
+
+    for (_, train_end, test_end), params in zip(folds, chosen):
+        start = max(train_end, covered_end)
+        if start >= test_end:
+            continue
+
+        key = tuple(sorted(params.items()))
+        if key not in strategies:
+            strategies[key] = strategy_for_params(params)[0].to_numpy(dtype=float)
+        position = strategies[key]
+
+        # Kombinasyonun (sanal) pozisyonu ilk değiştiği bardan itibaren izlenir
+        virtual = position[start - 1:test_end] if start > 0 else \
+            np.vstack([np.zeros((1, n_symbols)), position[:test_end]])
+        traded = np.logical_or.accumulate(np.diff(virtual, axis=0) != 0, axis=0)
+        fold_pos = np.where(traded, position[start:test_end], previous)
+
+        turnover = np.abs(np.diff(np.vstack([previous, fold_pos]), axis=0))
+        fold_ret = np.maximum(fold_pos * asset_returns[start:test_end] - turnover * cost, -1.0)
+
+        indices.append(np.arange(start, test_end))
+        positions.append(fold_pos)
+        returns.append(fold_ret)
+        previous = fold_pos[-1]
+        covered_end = test_end
+
+    return np.concatenate(indices), np.vstack(positions), np.vstack(returns)
+
+
+# =============================================================================
+# Ana fonksiyon
+# =============================================================================
+
+def walk_forward(
+    close: pd.DataFrame,
+    volume: Optional[pd.DataFrame] = None,
+    space: Optional[Dict[str, Any]] = None,
+    train_years: float = 3.0,
+    test_years: float = 1.0,
+    step_years: Optional[float] = None,
+    anchored: bool = False,
+    method: str = 'grid',
+    n_iter: int = 200,
+    metric: str = 'sharpe',
+    max_workers: Optional[int] = None,
+    macro: Optional[Dict[str, np.ndarray]] = None,
+    commission: float = DEFAULT_COMMISSION,
+    slippage: float = DEFAULT_SLIPPAGE,
+    seed: int = 42
+) -> Dict[str, Any]:
+    """
+    Walk-forward doğrulama: her pencerede en iyi parametreyi eğitim
+    döneminde seçer, sonraki test döneminde çalıştırır.
+
+    Args:
+        close: Kapanış paneli (bar x hisse), tercihen 5-10 yıl
+        volume: Hacim paneli (opsiyonel)
+        space: Arama uzayı (bkz. optimizer.DEFAULT_PARAMS)
+        train_years: Eğitim penceresi (yıl, 252 bar/yıl)
+        test_years: Test penceresi (yıl)
+        step_years: Kaydırma (varsayılan: test_years)
+        anchored: True ise genişleyen eğitim penceresi
+        method: 'grid' veya 'random'
+        n_iter: Random search kombinasyon sayısı
+        metric: Eğitim döneminde seçim metriği
+        max_workers: Süreç sayısı (varsayılan: CPU sayısı, 1 = tek süreç)
+        macro: build_macro_inputs çıktısı (verilirse hibrid skor kullanılır)
+        commission: Tek yön komisyon
+        slippage: Tek yön kayma
+        seed: Random search tohumu
+
+    Returns:
+        dict: {
+            'folds': Pencere başına seçilen parametreler ve metrikler,
+            'results': Tüm kombinasyon x pencere metrikleri,
+            'oos_returns': Uç uca eklenmiş test dönemi portföy getirisi,
+            'oos_metrics': Out-of-sample portföy metrikleri
+        }
+    """
+    space = space or DEFAULT_SPACE
+    unknown = set(space) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametre(ler): {', '.join(sorted(unknown))}")
+
+    if method == 'grid':
+        combos = grid_search_space(space)
+    elif method == 'random':
+        combos = random_search_space(space, n_iter, seed)
+    else:
+        raise ValueError(f"Gecersiz yontem '{method}'. 'grid' veya 'random' kullanin.")
+
+    step_years = step_years or test_years
+    folds = make_folds(
+        len(close),
+        int(train_years * TRADING_DAYS),
+        int(test_years * TRADING_DAYS),
+        int(step_years * TRADING_DAYS),
+        anchored
+    )
+    if not folds:
+        raise ValueError(f"{len(close)} bar, {train_years}+{test_years} yillik pencere icin yetersiz")
+
+    arrays = {'close': close.to_numpy(dtype=float)}
+    if volume is not None:
+        arrays['volume'] = volume.reindex_like(close).to_numpy(dtype=float)
+    if macro is not None:
+        arrays['macro_components'] = macro['components']
+        arrays['macro_sector'] = macro['sector']
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    print(f"[WALK-FORWARD] {len(folds)} pencere x {len(combos)} kombinasyon, "
+          f"{close.shape[1]} hisse x {len(close)} bar, {max_workers} surec")
+    start = time.perf_counter()
+
+    with SharedArrays(arrays) as shared:
+        init_args = (shared.specs, folds, (commission, slippage))
+
+        if max_workers == 1:
+            _init_walk_forward(*init_args)
+            evaluated = [evaluate_folds(combo) for combo in combos]
+        else:
+            chunksize = max(1, len(combos) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_walk_forward,
+                                     initargs=init_args) as executor:
+                evaluated = list(executor.map(evaluate_folds, combos, chunksize=chunksize))
+            # OOS eğrisi için seçilen kombinasyonlar ana süreçte yeniden oynatılır
+            _init_walk_forward(*init_args)
+
+        elapsed = time.perf_counter() - start
+        print(f"[OK] {len(combos) * len(folds)} pencere testi {elapsed:.1f} s'de tamamlandi")
+
+        # Tüm sonuçlar: kombinasyon x pencere
+        rows = []
+        for combo_id, (combo, fold_results) in enumerate(zip(combos, evaluated)):
+            for fold_id, result in enumerate(fold_results):
+                row = {'combo': combo_id, 'fold': fold_id, **combo}
+                row.update(result)
+                rows.append(row)
+        results = pd.DataFrame(rows)
+
+        # Her pencerede eğitim metriğine göre en iyi kombinasyon
+        key = f'train_{metric}'
+        best_rows = (results.sort_values(key, ascending=False, na_position='last')
+                     .groupby('fold', sort=True).head(1).sort_values('fold'))
+
+        fold_rows = []
+        for (train_start, train_end, test_end), (_, row) in zip(folds, best_rows.iterrows()):
+            combo_id, fold_id = int(row['combo']), int(row['fold'])
+
+            fold_rows.append({
+                'fold': fold_id,
+                'train_start': close.index[train_start],
+                'test_start': close.index[train_end],
+                'test_end': close.index[test_end - 1],
+                **combos[combo_id],
+                **{k: row[k] for k in results.columns if k.startswith(('train_', 'test_'))}
+            })
+
+        # Seçilen kombinasyonlar pencere sınırlarında birleştirilir
+        chosen = [combos[int(combo_id)] for combo_id in best_rows['combo']]
+        test_index, oos_pos, oos_ret = stitch_out_of_sample(folds, chosen)
+        _WORKER.clear()
+
+    trades = _trade_returns(oos_pos, _log_returns(oos_ret))
+    # Portföy ortalaması sadece o barda işlem gören hisseler üzerinden (engine ile aynı)
+    listed = _listed(close.to_numpy(dtype=float)[test_index], oos_ret)
+    oos = pd.DataFrame({
+        'returns': pd.DataFrame(oos_ret).where(listed).mean(axis=1).fillna(0.0).to_numpy(),
+        'exposure': pd.DataFrame(oos_pos).where(listed).mean(axis=1).fillna(0.0).to_numpy()
+    }, index=close.index[test_index])
+
+    oos_metrics = calculate_metrics(
+        oos[['returns']].rename(columns={'returns': 'portfolio'}),
+        oos[['exposure']].rename(columns={'exposure': 'portfolio'}),
+        [np.concatenate(trades)],
+        TRADING_DAYS
+    ).iloc[0].to_dict()
+
+    return {
+        'folds': pd.DataFrame(fold_rows),
+        'results': results,
+        'oos_returns': oos['returns'],
+        'oos_metrics': oos_metrics
+    }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("=" * 60)
+    print("WALK-FORWARD DOGRULAMA - TEST")
+    print("=" * 60)
+
+    print("\nPencereler (1000 bar, 500 egitim, 100 test):")
+    for fold in make_folds(1000, 500, 100):
+        print(f"  {fold}")
+
+    rng = np.random.default_rng(21)
+    n_bars, n_symbols = 2520, 30
+    index = pd.date_range('2015-01-01', periods=n_bars, freq='B')
+    columns = [f"HISSE{i}" for i in range(n_symbols)]
+    close = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, (n_bars, n_symbols)), axis=0)),
+                         index=index, columns=columns)
+    volume = pd.DataFrame(rng.integers(100_000, 5_000_000, (n_bars, n_symbols)).astype(float),
+                          index=index, columns=columns)
+
+    space = {
+        'rsi_oversold': [25, 30, 35],
+        'rsi_overbought': [65, 70, 75],
+        'entry_score': [30, 50, 70],
+    }
+
+    print()
+    result = walk_forward(close, volume, space, train_years=3, test_years=1, max_workers=4)
+
+    print("\nPencere basina secilen parametreler:")
+    shown = ['fold', 'test_start', 'test_end', *space.keys(), 'train_sharpe', 'test_sharpe']
+    print(result['folds'][shown].round(3).to_string(index=False))
+
+    m = result['oos_metrics']
+    print(f"\nOut-of-sample: getiri {m['total_return']:+.1%}, Sharpe {m['sharpe']:.2f}, "
+          f"max DD {m['max_drawdown']:.1%}, {int(m['trades'])} islem")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
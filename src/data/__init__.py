@@ -5,14 +5,14 @@ Bu modül, hisse senedi fiyat verilerini ve makro ekonomik
 verileri çeker ve yönetir.
 """
 
-from .fetcher import fetch_stock_data, get_stock_info
-from .bist_stocks import BIST30, BIST100, is_valid_bist_stock
-
-__all__ = [
-    'fetch_stock_data',
-    'get_stock_info',
-    'BIST30',
-    'BIST100',
-    'is_valid_bist_stock'
-]
+from ..utils.lazy import lazy_exports
 
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.fetcher': ['fetch_stock_data', 'get_stock_info'],
+    '.bist_stocks': ['BIST30', 'BIST100', 'is_valid_bist_stock', 'get_sector', 'get_index_flags',
+                     'IndexFlag'],
+    '.symbol_matcher': ['suggest_symbols', 'resolve_symbol'],
+    '.resample': ['fetch_bars', 'resample_ohlcv', 'get_bar_store'],
+    '.providers': ['get_provider', 'set_provider', 'RecordingProvider', 'ReplayProvider']
+})
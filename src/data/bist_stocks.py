@@ -4,118 +4,129 @@ BIST Hisse Listesi
 Bu modül BIST30 ve BIST100 endekslerindeki hisse kodlarını içerir.
 Hisse geçerliliği kontrolü ve liste yönetimi sağlar.
 
+Sektör tanımlarının TEK kaynağı da bu modüldür (SECTOR_STOCKS);
+SectorAnalyzer ve get_sector_stocks aynı tabloyu kullanır. Import
+anında sembol -> sektör ve sembol -> endeks bayrakları indeksleri
+hazırlanır, sorgular O(1)'dir.
+
 Not: Liste değişebilir, periyodik olarak güncellenmeli.
 """
 
-from typing import List, Optional
+from enum import IntFlag
+from typing import Dict, FrozenSet, List, Optional
 
 # BIST 30 Endeksi (En likit 30 hisse)
 # Güncelleme tarihi: 2025-11 (örnektir, güncel liste için KAP'a bakın)
-BIST30 = [
-    'ASELS',  # ASELSAN
-    'BIMAS',  # BİM
-    'EREGL',  # EREĞLİ
-    'GARAN',  # GARANTİ BANKASI
-    'HEKTS',  # HEKTAŞ
-    'ISCTR',  # İŞ BANKASI (C)
-    'KCHOL',  # KOÇ HOLDING
-    'KOZAA',  # KOZA ANADOLU METAL
-    'KOZAL',  # KOZA ALTIN
-    'PETKM',  # PETKIM
-    'PGSUS',  # PEGASUS
-    'SAHOL',  # SABANCI HOLDING
-    'SASA',   # SASA
-    'SISE',   # ŞİŞE CAM
-    'TAVHL',  # TAV HAVALİMANLARI
-    'TCELL',  # TURKCELL
-    'THYAO',  # TÜRK HAVA YOLLARI
-    'TKFEN',  # TEKFEN
-    'TOASO',  # TOFAŞ OTO. FAB.
-    'TUPRS',  # TÜPRAŞ
-    'VAKBN',  # VAKIFBANK
-    'YKBNK',  # YAPI KREDİ
-]
+BIST30_NAMES = {
+    'ASELS': 'ASELSAN',
+    'BIMAS': 'BİM',
+    'EREGL': 'EREĞLİ',
+    'GARAN': 'GARANTİ BANKASI',
+    'HEKTS': 'HEKTAŞ',
+    'ISCTR': 'İŞ BANKASI (C)',
+    'KCHOL': 'KOÇ HOLDİNG',
+    'KOZAA': 'KOZA ANADOLU METAL',
+    'KOZAL': 'KOZA ALTIN',
+    'PETKM': 'PETKİM',
+    'PGSUS': 'PEGASUS',
+    'SAHOL': 'SABANCI HOLDİNG',
+    'SASA': 'SASA',
+    'SISE': 'ŞİŞE CAM',
+    'TAVHL': 'TAV HAVALİMANLARI',
+    'TCELL': 'TURKCELL',
+    'THYAO': 'TÜRK HAVA YOLLARI',
+    'TKFEN': 'TEKFEN',
+    'TOASO': 'TOFAŞ OTOMOBİL',
+    'TUPRS': 'TÜPRAŞ',
+    'VAKBN': 'VAKIFBANK',
+    'YKBNK': 'YAPI KREDİ',
+}
+BIST30 = list(BIST30_NAMES)
 
 # BIST 100 Endeksi (100 hisse - tam liste çok uzun, örnekler)
 # Not: BIST30 hepsi BIST100'de de vardır
-BIST100 = BIST30 + [
-    'ADEL',   # ADEL
-    'ADESE',  # ADESE
-    'AEFES',  # ANADOLU EFES
-    'AFYON',  # AFYON ÇİMENTO
-    'AGHOL',  # AG ANADOLU GRUBU
-    'AKBNK',  # AKBANK
-    'AKCNS',  # AKÇANSA
-    'AKENR',  # AK ENERJİ
-    'AKSA',   # AKSA
-    'AKSEN',  # AKSA ENERJİ
-    'ALARK',  # ALARKO
-    'ALBRK',  # AL BARAKA TÜRK
-    'ALGYO',  # ALARKO GYO
-    'ALKIM',  # ALKİM
-    'ANSGR',  # ANSGr
-    'ARCLK',  # ARÇELİK
-    'ARDYZ',  # ARDEMİR
-    'ASTOR',  # ASTOR
-    'BAGFS',  # BAGFAŞ
-    'BANVT',  # BANVİT
-    'BRSAN',  # BORUSAN
-    'BFREN',  # BOSCH FREN
-    'BRYAT',  # BORUSAN YATIRIM
-    'BTCIM',  # BATIÇİM
-    'BUCIM',  # BURÇELİK
-    'CCOLA',  # COCA COLA
-    'CEMTS',  # ÇEMTAŞ
-    'CIMSA',  # ÇİMSA
-    'DOAS',   # DOĞAN
-    'DOHOL',  # DOĞAN HOLDING
-    'ECILC',  # EIS ECZA
-    'EGEEN',  # EGE ENDÜSTRİ
-    'EKGYO',  # EMLAK KONUT GYO
-    'ENKAI',  # ENKA
-    'ENJSA',  # ENERJISA
-    'EUPWR',  # EUROPOWER
-    'FROTO',  # FORD OTOSAN
-    'GESAN',  # GESAN
-    'GLYHO',  # GLOBAL YATIRIM
-    'GOLTS',  # GÖLTAŞ
-    'GOODY',  # GOODYEAR
-    'GOZDE',  # GÖZDE
-    'GUBRF',  # GÜBRE FABRİKALARI
-    'HALKB',  # HALK BANKASI
-    'IPEKE',  # İPEK DOĞAL
-    'JANTS',  # JANTSA
-    'KARSN',  # KARSAN
-    'KARTN',  # KARTONSAN
-    'KORDS',  # KORDSA
-    'KONYA',  # KONYA ÇİMENTO
-    'KRDMD',  # KARDEMIR (D)
-    'KTLEV',  # KITLE
-    'LOGO',   # LOGO YAZILIM
-    'MAVI',   # MAVİ GİYİM
-    'MGROS',  # MİGROS
-    'ODAS',   # ODAŞ
-    'OTKAR',  # OTOKAR
-    'OYAKC',  # OYAK ÇİMENTO
-    'PENTA',  # PENTA
-    'PRKME',  # PARK ELEKT.
-    'QUAGR',  # QUA GRANITE
-    'SELEC',  # SELÇUK ECZA
-    'SKBNK',  # ŞEKERBANK
-    'SOKM',   # ŞOK MARKETLER
-    'TATGD',  # TAT GIDA
-    'TBORG',  # T.TUBORG
-    'TKNSA',  # TEKNOSA
-    'TMSN',   # TÜMOSAN
-    'TRGYO',  # TORUNLAR GYO
-    'TSKB',   # TSKB
-    'TTKOM',  # TÜRK TELEKOM
-    'TTRAK',  # TÜRK TRAKTÖR
-    'ULKER',  # ÜLKER
-    'VESTL',  # VESTEL
-    'VESBE',  # VESTEL BEYAZ
-    'YATAS',  # YATAŞ
-]
+_BIST100_EXTRA_NAMES = {
+    'ADEL': 'ADEL',
+    'ADESE': 'ADESE',
+    'AEFES': 'ANADOLU EFES',
+    'AFYON': 'AFYON ÇİMENTO',
+    'AGHOL': 'AG ANADOLU GRUBU',
+    'AKBNK': 'AKBANK',
+    'AKCNS': 'AKÇANSA',
+    'AKENR': 'AK ENERJİ',
+    'AKSA': 'AKSA',
+    'AKSEN': 'AKSA ENERJİ',
+    'ALARK': 'ALARKO',
+    'ALBRK': 'AL BARAKA TÜRK',
+    'ALGYO': 'ALARKO GYO',
+    'ALKIM': 'ALKİM',
+    'ANSGR': 'ANADOLU SİGORTA',
+    'ARCLK': 'ARÇELİK',
+    'ARDYZ': 'ARD YAZILIM',
+    'ASTOR': 'ASTOR',
+    'BAGFS': 'BAGFAŞ',
+    'BANVT': 'BANVİT',
+    'BRSAN': 'BORUSAN BORU',
+    'BFREN': 'BOSCH FREN',
+    'BRYAT': 'BORUSAN YATIRIM',
+    'BTCIM': 'BATIÇİM',
+    'BUCIM': 'BURSA ÇİMENTO',
+    'CCOLA': 'COCA COLA',
+    'CEMTS': 'ÇEMTAŞ',
+    'CIMSA': 'ÇİMSA',
+    'DOAS': 'DOĞUŞ OTOMOTİV',
+    'DOHOL': 'DOĞAN HOLDİNG',
+    'ECILC': 'EİS ECZACIBAŞI İLAÇ',
+    'EGEEN': 'EGE ENDÜSTRİ',
+    'EKGYO': 'EMLAK KONUT GYO',
+    'ENKAI': 'ENKA',
+    'ENJSA': 'ENERJİSA',
+    'EUPWR': 'EUROPOWER',
+    'FROTO': 'FORD OTOSAN',
+    'GESAN': 'GESAN',
+    'GLYHO': 'GLOBAL YATIRIM HOLDİNG',
+    'GOLTS': 'GÖLTAŞ',
+    'GOODY': 'GOODYEAR',
+    'GOZDE': 'GÖZDE GİRİŞİM',
+    'GUBRF': 'GÜBRE FABRİKALARI',
+    'HALKB': 'HALK BANKASI',
+    'IPEKE': 'İPEK DOĞAL ENERJİ',
+    'JANTS': 'JANTSA',
+    'KARSN': 'KARSAN',
+    'KARTN': 'KARTONSAN',
+    'KORDS': 'KORDSA',
+    'KONYA': 'KONYA ÇİMENTO',
+    'KRDMD': 'KARDEMİR (D)',
+    'KTLEV': 'KATILIMEVİM',
+    'LOGO': 'LOGO YAZILIM',
+    'MAVI': 'MAVİ GİYİM',
+    'MGROS': 'MİGROS',
+    'ODAS': 'ODAŞ',
+    'OTKAR': 'OTOKAR',
+    'OYAKC': 'OYAK ÇİMENTO',
+    'PENTA': 'PENTA',
+    'PRKME': 'PARK ELEKTRİK',
+    'QUAGR': 'QUA GRANITE',
+    'SELEC': 'SELÇUK ECZA',
+    'SKBNK': 'ŞEKERBANK',
+    'SOKM': 'ŞOK MARKETLER',
+    'TATGD': 'TAT GIDA',
+    'TBORG': 'TÜRK TUBORG',
+    'TKNSA': 'TEKNOSA',
+    'TMSN': 'TÜMOSAN',
+    'TRGYO': 'TORUNLAR GYO',
+    'TSKB': 'TSKB',
+    'TTKOM': 'TÜRK TELEKOM',
+    'TTRAK': 'TÜRK TRAKTÖR',
+    'ULKER': 'ÜLKER',
+    'VESTL': 'VESTEL',
+    'VESBE': 'VESTEL BEYAZ',
+    'YATAS': 'YATAŞ',
+}
+BIST100 = BIST30 + list(_BIST100_EXTRA_NAMES)
+
+# Hisse kodu -> şirket adı (bulanık arama için, bkz. symbol_matcher.py)
+STOCK_NAMES: Dict[str, str] = {**BIST30_NAMES, **_BIST100_EXTRA_NAMES}
 
 # Alternatif: Popüler hisseler (trading için sıkça kullanılanlar)
 POPULAR_STOCKS = [
@@ -141,6 +152,119 @@ POPULAR_STOCKS = [
     'SISE',   # Cam
 ]
 
+# Sektör tanımları (tek kaynak). Anahtarlar SectorAnalyzer'ın kullandığı
+# kodlardır; her hisse en fazla bir sektörde yer alabilir.
+SECTOR_STOCKS = {
+    'airline': ['THYAO', 'PGSUS'],                                  # Havayolu
+    'bank': ['GARAN', 'AKBNK', 'ISCTR', 'YKBNK', 'HALKB', 'VAKBN',
+             'SKBNK', 'ALBRK'],                                     # Bankacılık
+    'holding': ['SAHOL', 'KCHOL', 'DOHOL', 'TAVHL', 'AGHOL'],       # Holding
+    'energy': ['TUPRS', 'PETKM', 'PENTA', 'AKENR', 'AKSEN',
+               'EUPWR', 'ENJSA'],                                   # Enerji
+    'tech': ['ASELS', 'LOGO', 'NETAS', 'KAREL'],                    # Teknoloji
+    'export': ['EREGL', 'ARCLK', 'VESTL', 'FROTO', 'TOASO', 'SISE'],  # İhracatçı sanayi
+    'automotive': ['OTKAR', 'TTRAK', 'KARSN'],                      # Otomotiv (ihracatçılar hariç)
+    'retail': ['BIMAS', 'MGROS', 'SOKM', 'MAVI'],                   # İthalatçı perakende
+    'food': ['ULKER', 'CCOLA', 'TATGD', 'AEFES', 'TBORG'],          # Gıda / içecek
+    'tourism': ['MAALT', 'AYCES', 'KSTUR'],                         # Turizm
+    'telecom': ['TTKOM', 'TCELL'],                                  # Telekom
+}
+
+# Türkçe sektör adları -> sektör kodu (büyük harf, İ -> I)
+SECTOR_ALIASES = {
+    'BANKA': 'bank',
+    'HAVAYOLU': 'airline',
+    'HAVACILIK': 'airline',
+    'HOLDING': 'holding',
+    'ENERJI': 'energy',
+    'TEKNOLOJI': 'tech',
+    'IHRACAT': 'export',
+    'IHRACATCI': 'export',
+    'OTOMOTIV': 'automotive',
+    'PERAKENDE': 'retail',
+    'GIDA': 'food',
+    'TURIZM': 'tourism',
+    'TELEKOM': 'telecom',
+}
+
+
+class IndexFlag(IntFlag):
+    """Hissenin dahil olduğu listeler (bit bayrakları)"""
+    NONE = 0
+    BIST30 = 1
+    BIST100 = 2
+    POPULAR = 4
+
+
+# Liste adı -> üyeler (frozenset: O(1) üyelik)
+INDEX_MEMBERS: Dict[str, FrozenSet[str]] = {
+    'BIST30': frozenset(BIST30),
+    'BIST100': frozenset(BIST100),
+    'POPULAR': frozenset(POPULAR_STOCKS),
+}
+
+
+def _build_sector_index() -> Dict[str, str]:
+    """Sembol -> sektör ters indeksini kurar (bir hisse iki sektörde olamaz)"""
+    index = {}
+    for sector, stocks in SECTOR_STOCKS.items():
+        for stock in stocks:
+            if stock in index:
+                raise ValueError(f"{stock} iki sektorde tanimli: {index[stock]}, {sector}")
+            index[stock] = sector
+    return index
+
+
+def _build_flag_index() -> Dict[str, IndexFlag]:
+    """Sembol -> endeks bayrakları indeksini kurar"""
+    flags: Dict[str, IndexFlag] = {}
+    for name, members in INDEX_MEMBERS.items():
+        for stock in members:
+            flags[stock] = flags.get(stock, IndexFlag.NONE) | IndexFlag[name]
+    return flags
+
+
+SECTOR_MEMBERS: Dict[str, FrozenSet[str]] = {
+    sector: frozenset(stocks) for sector, stocks in SECTOR_STOCKS.items()
+}
+SYMBOL_SECTOR: Dict[str, str] = _build_sector_index()
+SYMBOL_FLAGS: Dict[str, IndexFlag] = _build_flag_index()
+
+
+def normalize_symbol(symbol: str) -> str:
+    """Hisse kodunu indeks anahtarına çevirir (örn: ' thyao.is' -> 'THYAO')"""
+    symbol = symbol.strip().upper()
+    return symbol[:-3] if symbol.endswith('.IS') else symbol
+
+
+def get_sector(symbol: str) -> Optional[str]:
+    """
+    Hissenin sektör kodunu döndürür (O(1)).
+    
+    Args:
+        symbol (str): Hisse kodu (.IS uzantılı olabilir)
+    
+    Returns:
+        str: Sektör kodu (örn: 'bank') veya None
+    
+    Örnek:
+        >>> get_sector('GARAN')
+        'bank'
+    """
+    return SYMBOL_SECTOR.get(normalize_symbol(symbol))
+
+
+def get_index_flags(symbol: str) -> IndexFlag:
+    """
+    Hissenin dahil olduğu listeleri bayrak olarak döndürür.
+    
+    Örnek:
+        >>> flags = get_index_flags('THYAO')
+        >>> IndexFlag.BIST30 in flags
+        True
+    """
+    return SYMBOL_FLAGS.get(normalize_symbol(symbol), IndexFlag.NONE)
+
 
 def is_valid_bist_stock(symbol: str, check_list: str = 'BIST100') -> bool:
     """
@@ -161,18 +285,10 @@ def is_valid_bist_stock(symbol: str, check_list: str = 'BIST100') -> bool:
         False
     """
     
-    symbol = symbol.strip().upper()
-    
-    # .IS suffix'ini çıkar
-    if symbol.endswith('.IS'):
-        symbol = symbol[:-3]
+    # Bilinmeyen liste adı için varsayılan: BIST100
+    flag = IndexFlag.__members__.get(check_list.upper(), IndexFlag.BIST100) or IndexFlag.BIST100
     
-    if check_list.upper() == 'BIST30':
-        return symbol in BIST30
-    elif check_list.upper() == 'POPULAR':
-        return symbol in POPULAR_STOCKS
-    else:  # Default: BIST100
-        return symbol in BIST100
+    return bool(get_index_flags(symbol) & flag)
 
 
 def get_stock_list(list_name: str = 'BIST100') -> List[str]:
@@ -203,10 +319,13 @@ def get_stock_list(list_name: str = 'BIST100') -> List[str]:
 def suggest_similar_stocks(symbol: str, max_results: int = 5) -> List[str]:
     """
     Girilen hisse koduna benzer hisse kodları önerir.
-    (Basit string similarity, kullanıcı yazım hatası yaptıysa yardımcı olur)
+    (Yazım hatası, harf yer değiştirmesi veya şirket adı ile arama)
+    
+    Düzenleme mesafesi + şirket adı trigram indeksini kullanır,
+    bkz. src/data/symbol_matcher.py. En yakın öneri önce gelir.
     
     Args:
-        symbol (str): Aranacak hisse kodu
+        symbol (str): Aranacak hisse kodu veya şirket adı
         max_results (int): Maksimum öneri sayısı
     
     Returns:
@@ -215,60 +334,37 @@ def suggest_similar_stocks(symbol: str, max_results: int = 5) -> List[str]:
     Örnek:
         >>> suggest_similar_stocks('THYA')  # THYAO yazım hatası
         ['THYAO']
+        >>> suggest_similar_stocks('türk hava')[0]
+        'THYAO'
     """
     
-    symbol = symbol.strip().upper()
-    
-    if symbol.endswith('.IS'):
-        symbol = symbol[:-3]
-    
-    # Basit benzerlik: içinde geçen harfler
-    similar = []
+    # Eşleştirici bu modülün tablolarını kullanır, import döngüsü olmasın diye burada
+    from .symbol_matcher import suggest_symbols
     
-    for stock in BIST100:
-        # Tam eşleşme
-        if stock == symbol:
-            return [stock]
-        
-        # Başlangıç eşleşmesi
-        if stock.startswith(symbol[:2]):
-            similar.append(stock)
-        
-        # İçinde geçiyor mu
-        elif symbol[:3] in stock:
-            similar.append(stock)
-    
-    return similar[:max_results]
+    return suggest_symbols(symbol, max_results)
 
 
 def get_sector_stocks(sector: str) -> List[str]:
     """
-    Belirtilen sektördeki hisseleri döndürür (basit versiyon).
+    Belirtilen sektördeki hisseleri döndürür.
     
     Args:
-        sector (str): Sektör adı
-                      - 'BANKA', 'HAVAYOLU', 'ENERJİ', 'TEKNOLOJİ', vb.
+        sector (str): Sektör kodu ('bank', 'airline', ...) veya Türkçe adı
+                      ('BANKA', 'HAVAYOLU', 'ENERJİ', 'TEKNOLOJİ', vb.)
     
     Returns:
-        list: O sektördeki bilinen hisseler
+        list: O sektördeki bilinen hisseler (bilinmeyen sektör için boş)
     
-    Not: Bu basit bir implement, geliştirilmeli
+    Örnek:
+        >>> get_sector_stocks('BANKA') == get_sector_stocks('bank')
+        True
     """
     
-    sector = sector.upper()
+    key = sector.strip()
+    if key not in SECTOR_STOCKS:
+        key = SECTOR_ALIASES.get(key.upper().replace('İ', 'I'), key.lower())
     
-    sectors = {
-        'BANKA': ['AKBNK', 'GARAN', 'ISCTR', 'YKBNK', 'VAKBN', 'HALKB', 'SKBNK', 'ALBRK'],
-        'HAVAYOLU': ['THYAO', 'PGSUS'],
-        'ENERJI': ['AKSEN', 'AKENR', 'EUPWR', 'ENJSA'],
-        'TEKNOLOJİ': ['ASELS', 'LOGO', 'TCELL', 'TTKOM'],
-        'PERAKENDE': ['BIMAS', 'SOKM', 'MGROS', 'MAVI'],
-        'OTOMOTİV': ['TOASO', 'FROTO', 'OTKAR', 'TTRAK', 'KARSN'],
-        'HOLDİNG': ['KCHOL', 'SAHOL', 'DOHOL', 'AGHOL'],
-        'GIDA': ['ULKER', 'CCOLA', 'TATGD', 'AEFES', 'TBORG'],
-    }
-    
-    return sectors.get(sector, [])
+    return list(SECTOR_STOCKS.get(key, []))
 
 
 # Test fonksiyonu
@@ -304,6 +400,10 @@ if __name__ == "__main__":
         stocks = get_sector_stocks(sector)
         print(f"  {sector}: {', '.join(stocks[:5])}")
     
+    print("\n🔍 Sembol İndeksi:")
+    for stock in ['THYAO', 'akbnk.is', 'OTKAR', 'FAKE123']:
+        print(f"  {stock}: sektor={get_sector(stock)}, listeler={get_index_flags(stock)!r}")
+    
     print("\n" + "=" * 60)
     print("✅ TÜM TESTLER TAMAMLANDI!")
     print("=" * 60)
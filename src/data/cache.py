@@ -0,0 +1,565 @@
+"""
+OHLCV Disk Cache Modülü
+
+Çekilen fiyat verilerini data/ohlcv/ klasöründe sütun bazlı (Parquet)
+dosyalar olarak saklar. Her sembol + interval için tek dosya tutulur:
+
+    data/ohlcv/THYAO_1d.parquet   -> Fiyat verileri
+    data/ohlcv/THYAO_1d.json      -> Meta bilgi (ne zaman, hangi periyot)
+
+Tazelik Kuralları:
+    - Günlük/haftalık/aylık barlar: Bir sonraki seans kapanışına kadar geçerli
+      (Cuma akşamı çekilen veri Pazartesi kapanışına kadar kullanılır)
+    - Dakikalık/saatlik barlar: Seans içinde 1 bar süresi kadar geçerli,
+      seans dışında bir sonraki seans açılışına kadar geçerli
+
+Örnek Kullanım:
+    >>> from src.data.cache import get_default_cache
+    >>> cache = get_default_cache()
+    >>> data = cache.get('THYAO', period='6mo', interval='1d')
+    >>> if data is None:
+    ...     print("Cache'te yok veya bayat, internetten cekilmeli")
+"""
+
+import os
+import json
+import pandas as pd
+from datetime import datetime, timedelta, timezone, time as dtime
+from typing import Optional, Dict, Any
+
+
+# Borsa İstanbul saat dilimi (UTC+3, yaz saati uygulaması yok)
+# Not: zoneinfo yerine sabit offset kullanıyoruz (Windows'ta tzdata gerekmesin)
+BIST_TZ = timezone(timedelta(hours=3))
+
+# Seans saatleri (kapanış seansı dahil)
+SESSION_OPEN = dtime(10, 0)
+SESSION_CLOSE = dtime(18, 10)
+
+# Periyotların gün karşılığı (cache'in bir isteği kapsayıp kapsamadığı için)
+PERIOD_DAYS = {
+    '1d': 1,
+    '5d': 5,
+    '1mo': 31,
+    '3mo': 92,
+    '6mo': 183,
+    'ytd': 366,
+    '1y': 366,
+    '2y': 731,
+    '5y': 1827,
+    '10y': 3653,
+    'max': None,  # Sınırsız
+}
+
+# Gün içi interval'lerin süresi
+INTRADAY_INTERVALS = {
+    '1m': timedelta(minutes=1),
+    '2m': timedelta(minutes=2),
+    '5m': timedelta(minutes=5),
+    '15m': timedelta(minutes=15),
+    '30m': timedelta(minutes=30),
+    '60m': timedelta(minutes=60),
+    '90m': timedelta(minutes=90),
+    '1h': timedelta(hours=1),
+}
+
+# Tekrar çekilen bar ile cache'teki bar arasında kabul edilen göreli fark
+# (üstünde ise geçmiş temettü/bölünme ile yeniden düzeltilmiş sayılır)
+ADJUSTMENT_TOLERANCE = 1e-4
+
+
+def _is_session_day(day: datetime) -> bool:
+    """Hafta içi mi? (Resmi tatiller dikkate alınmaz)"""
+    return day.weekday() < 5
+
+
+def next_session_close(moment: datetime) -> datetime:
+    """
+    Verilen andan sonraki ilk seans kapanışını döndürür.
+
+    Args:
+        moment: Referans zaman (timezone-aware)
+
+    Returns:
+        datetime: Bir sonraki seans kapanış zamanı (BIST saati)
+    """
+    local = moment.astimezone(BIST_TZ)
+    candidate = datetime.combine(local.date(), SESSION_CLOSE, tzinfo=BIST_TZ)
+
+    # Bugünün kapanışı geçtiyse veya bugün seans yoksa sonraki güne geç
+    while candidate <= local or not _is_session_day(candidate):
+        candidate += timedelta(days=1)
+
+    return candidate
+
+
+def next_session_open(moment: datetime) -> datetime:
+    """
+    Verilen andan sonraki ilk seans açılışını döndürür.
+
+    Args:
+        moment: Referans zaman (timezone-aware)
+
+    Returns:
+        datetime: Bir sonraki seans açılış zamanı (BIST saati)
+    """
+    local = moment.astimezone(BIST_TZ)
+    candidate = datetime.combine(local.date(), SESSION_OPEN, tzinfo=BIST_TZ)
+
+    while candidate <= local or not _is_session_day(candidate):
+        candidate += timedelta(days=1)
+
+    return candidate
+
+
+def is_session_open(moment: datetime) -> bool:
+    """Verilen anda seans açık mı?"""
+    local = moment.astimezone(BIST_TZ)
+    return _is_session_day(local) and SESSION_OPEN <= local.time() < SESSION_CLOSE
+
+
+def expires_at(fetched_at: datetime, interval: str) -> datetime:
+    """
+    Belirli bir interval için çekilen verinin ne zamana kadar taze sayılacağını hesaplar.
+
+    Args:
+        fetched_at: Verinin çekildiği zaman (timezone-aware)
+        interval: Veri aralığı ('1m', '1h', '1d', '1wk', ...)
+
+    Returns:
+        datetime: Geçerlilik bitiş zamanı
+
+    Örnek:
+        >>> # Cuma 19:00'da çekilen günlük veri Pazartesi 18:10'a kadar geçerli
+        >>> expires_at(datetime(2025, 11, 7, 19, 0, tzinfo=BIST_TZ), '1d')
+    """
+    if interval in INTRADAY_INTERVALS:
+        if is_session_open(fetched_at):
+            # Seans içinde: yeni bar oluşana kadar
+            return min(fetched_at + INTRADAY_INTERVALS[interval],
+                       next_session_close(fetched_at))
+        # Seans dışında: seans açılana kadar yeni bar gelmez
+        return next_session_open(fetched_at)
+
+    # Günlük ve daha uzun barlar: bir sonraki kapanışa kadar
+    return next_session_close(fetched_at)
+
+
+def period_covers(cached_period: str, requested_period: str) -> bool:
+    """
+    Cache'teki periyot istenen periyodu kapsıyor mu?
+
+    Args:
+        cached_period: Cache'e yazılırken kullanılan periyot
+        requested_period: İstenen periyot
+
+    Returns:
+        bool: Kapsıyorsa True
+    """
+    if cached_period not in PERIOD_DAYS or requested_period not in PERIOD_DAYS:
+        return cached_period == requested_period
+
+    cached_days = PERIOD_DAYS[cached_period]
+    requested_days = PERIOD_DAYS[requested_period]
+
+    if cached_days is None:
+        return True
+    if requested_days is None:
+        return False
+
+    return cached_days >= requested_days
+
+
+def history_adjusted(cached: pd.DataFrame, new_data: pd.DataFrame,
+                     tolerance: float = ADJUSTMENT_TOLERANCE) -> bool:
+    """
+    Tekrar çekilen barlar cache'teki geçmişten farklı düzeltilmiş mi?
+
+    Geçmiş auto_adjust=True ile çekilir: temettü veya bölünme (bedelsiz
+    dahil) sonrası sağlayıcı tüm eski fiyatları yeniden ölçekler, yeni
+    barları eski cache'in sonuna eklemek seriye sahte bir sıçrama koyar.
+    Çakışan barlarda Open karşılaştırılır (seans içinde yazılmış yarım
+    barın Open'ı değişmez); Close sadece cache'in son barından önceki
+    (tamamlanmış) barlarda karşılaştırılır.
+
+    Args:
+        cached: Cache'teki veri
+        new_data: Yeni çekilen barlar (aynı zaman dilimine çevrilmiş)
+        tolerance: Kabul edilen göreli fark
+
+    Returns:
+        bool: Çakışan bir bar toleranstan fazla farklıysa True
+    """
+    overlap = cached.index.intersection(new_data.index)
+    if overlap.empty:
+        return False
+
+    checks = [('Open', overlap), ('Close', overlap[overlap < cached.index[-1]])]
+
+    for column, index in checks:
+        if column not in cached.columns or column not in new_data.columns or index.empty:
+            continue
+        old = cached.loc[index, column].to_numpy(dtype=float)
+        new = new_data.loc[index, column].to_numpy(dtype=float)
+        valid = (old == old) & (new == new)
+        diff = abs(new[valid] - old[valid])
+        if (diff > tolerance * abs(old[valid])).any():
+            return True
+
+    return False
+
+
+def slice_to_period(data: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Daha uzun periyotlu cache verisini istenen periyoda kırpar.
+
+    Args:
+        data: Tarih indeksli fiyat verileri
+        period: İstenen periyot ('5d', '3mo', '1y', ...)
+
+    Returns:
+        pd.DataFrame: Kırpılmış veri
+    """
+    if data.empty or period not in PERIOD_DAYS or PERIOD_DAYS[period] is None:
+        return data
+
+    last = data.index[-1]
+
+    if period.endswith('d'):
+        # '1d', '5d': son N işlem günü (takvim günü değil)
+        days = int(period[:-1])
+        session_days = data.index.normalize().unique()
+        start = session_days[-days] if len(session_days) >= days else session_days[0]
+    elif period == 'ytd':
+        start = last.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    else:
+        start = last - timedelta(days=PERIOD_DAYS[period])
+
+    return data[data.index >= start]
+
+
+class OHLCVCache:
+    """Sembol + interval bazlı OHLCV disk cache'i"""
+
+    def __init__(self, cache_dir: str = "data/ohlcv"):
+        """
+        Args:
+            cache_dir: Cache dosyalarının tutulacağı klasör
+        """
+        self.cache_dir = cache_dir
+
+    def _safe_symbol(self, symbol: str) -> str:
+        """Sembolü dosya adına uygun hale getirir (örn: 'THYAO.IS' -> 'THYAO', 'TRY=X' -> 'TRY_X')"""
+        symbol = symbol.strip().upper()
+        if symbol.endswith('.IS'):
+            symbol = symbol[:-3]
+
+        return symbol.replace('=', '_').replace('^', '_').replace('/', '_')
+
+    def _paths(self, symbol: str, interval: str) -> Dict[str, str]:
+        """Sembol ve interval için veri/meta dosya yollarını döndürür"""
+        base = os.path.join(self.cache_dir, f"{self._safe_symbol(symbol)}_{interval}")
+
+        return {'data': base + '.parquet', 'meta': base + '.json'}
+
+    def load(self, symbol: str, interval: str = "1d") -> Optional[Dict[str, Any]]:
+        """
+        Cache'teki veriyi tazelikten bağımsız olarak yükler.
+
+        Args:
+            symbol: Hisse kodu
+            interval: Veri aralığı
+
+        Returns:
+            dict: {'data': DataFrame, 'meta': dict}
+            None: Cache'te yoksa veya okunamıyorsa
+        """
+        paths = self._paths(symbol, interval)
+
+        if not (os.path.exists(paths['data']) and os.path.exists(paths['meta'])):
+            return None
+
+        try:
+            with open(paths['meta'], 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            data = pd.read_parquet(paths['data'])
+            return {'data': data, 'meta': meta}
+
+        except Exception as e:
+            print(f"[UYARI] {symbol} cache dosyasi okunamadi: {e}")
+            return None
+
+    def load_meta(self, symbol: str, interval: str = "1d") -> Optional[Dict[str, Any]]:
+        """
+        Sadece meta dosyasını okur (Parquet açılmaz).
+
+        Args:
+            symbol: Hisse kodu
+            interval: Veri aralığı
+
+        Returns:
+            dict: Meta bilgi (rows, first_bar, last_bar, last_row, fetched_at, ...)
+            None: Cache'te yoksa veya okunamıyorsa
+        """
+        paths = self._paths(symbol, interval)
+
+        if not (os.path.exists(paths['data']) and os.path.exists(paths['meta'])):
+            return None
+
+        try:
+            with open(paths['meta'], 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def is_fresh(self, meta: Dict[str, Any], interval: str,
+                 now: Optional[datetime] = None) -> bool:
+        """
+        Meta bilgisine göre cache hâlâ taze mi?
+
+        Args:
+            meta: Cache meta bilgisi (fetched_at içerir)
+            interval: Veri aralığı
+            now: Şimdiki zaman (test için dışarıdan verilebilir)
+
+        Returns:
+            bool: Taze ise True
+        """
+        now = now or datetime.now(timezone.utc)
+
+        try:
+            fetched_at = datetime.fromisoformat(meta['fetched_at'])
+        except (KeyError, ValueError):
+            return False
+
+        return now < expires_at(fetched_at, interval)
+
+    def get(self, symbol: str, period: str = "1y", interval: str = "1d",
+            now: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """
+        Taze ve istenen periyodu kapsayan cache verisini döndürür.
+
+        Args:
+            symbol: Hisse kodu
+            period: İstenen periyot
+            interval: Veri aralığı
+            now: Şimdiki zaman (test için)
+
+        Returns:
+            pd.DataFrame: İstenen periyoda kırpılmış veri
+            None: Cache yok, bayat veya periyodu kapsamıyor
+        """
+        cached = self.load(symbol, interval)
+
+        if cached is None:
+            return None
+
+        meta = cached['meta']
+
+        if not period_covers(meta.get('period', ''), period):
+            return None
+
+        if not self.is_fresh(meta, interval, now=now):
+            return None
+
+        return slice_to_period(cached['data'], period)
+
+    def save(self, symbol: str, data: pd.DataFrame, period: str,
+             interval: str = "1d", fetched_at: Optional[datetime] = None) -> bool:
+        """
+        Veriyi cache'e yazar (eski dosyanın üzerine).
+
+        Args:
+            symbol: Hisse kodu
+            data: Kaydedilecek fiyat verileri
+            period: Verinin kapsadığı periyot
+            interval: Veri aralığı
+            fetched_at: Verinin çekildiği zaman (varsayılan: şimdi)
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        paths = self._paths(symbol, interval)
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+
+        meta = {
+            'symbol': symbol.strip().upper(),
+            'interval': interval,
+            'period': period,
+            'fetched_at': fetched_at.isoformat(),
+            'rows': len(data),
+            'first_bar': str(data.index[0]) if len(data) else None,
+            'last_bar': str(data.index[-1]) if len(data) else None,
+            # Son barın değerleri: satır sayısı/zamanı aynı kalıp içerik değişirse fark edilsin
+            'last_row': data.iloc[-1:].to_json(orient='values', double_precision=15) if len(data) else None,
+        }
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Önce geçici dosyaya yaz, sonra taşı (yarım dosya kalmasın)
+            tmp_data = paths['data'] + '.tmp'
+            tmp_meta = paths['meta'] + '.tmp'
+
+            data.to_parquet(tmp_data)
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2, ensure_ascii=False)
+
+            os.replace(tmp_data, paths['data'])
+            os.replace(tmp_meta, paths['meta'])
+            return True
+
+        except Exception as e:
+            print(f"[UYARI] {symbol} cache'e yazilamadi: {e}")
+            return False
+
+    def last_bar(self, symbol: str, period: str = "1y",
+                 interval: str = "1d") -> Optional[pd.Timestamp]:
+        """
+        Artımlı (delta) güncelleme için cache'teki son barın zamanını döndürür.
+
+        Sadece meta dosyası okunur (Parquet açılmaz). Cache istenen
+        periyodu kapsamıyorsa None döner - bu durumda tam çekim gerekir.
+
+        Args:
+            symbol: Hisse kodu
+            period: İstenen periyot
+            interval: Veri aralığı
+
+        Returns:
+            pd.Timestamp: Cache'teki son bar zamanı
+            None: Cache yok veya periyodu kapsamıyor
+        """
+        meta = self.load_meta(symbol, interval)
+
+        if meta is None:
+            return None
+
+        if not meta.get('last_bar') or not period_covers(meta.get('period', ''), period):
+            return None
+
+        return pd.Timestamp(meta['last_bar'])
+
+    def append(self, symbol: str, new_data: pd.DataFrame,
+               interval: str = "1d") -> Optional[pd.DataFrame]:
+        """
+        Yeni barları cache'teki verinin sonuna ekler.
+
+        Aynı zamana sahip barlarda yeni gelen kazanır (örn: seans içinde
+        çekilmiş yarım günlük bar, kapanış sonrası tam bar ile değişir).
+        Boş cevapta (yeni bar yok) da fetched_at güncellenir (cache tekrar
+        taze olur); new_data None ise (istek başarısız) cache'e dokunulmaz.
+        Tekrar çekilen barlar cache'tekinden farklı düzeltilmişse (temettü,
+        bölünme) cache silinir; çağıran tüm periyodu yeniden çekmelidir.
+
+        Args:
+            symbol: Hisse kodu
+            new_data: Yeni çekilen barlar (boş olabilir, None = cevap yok)
+            interval: Veri aralığı
+
+        Returns:
+            pd.DataFrame: Birleştirilmiş tüm veri
+            None: Cache'te birleştirilecek veri yoksa veya geçmiş yeniden
+                  düzeltildiği için cache silindiyse
+        """
+        cached = self.load(symbol, interval)
+
+        if cached is None:
+            return None
+
+        merged = cached['data']
+
+        if new_data is None:
+            return merged
+
+        if not new_data.empty:
+            # Zaman dilimi ve çözünürlük farklarını eşitle (Parquet us, yfinance ns)
+            new_data = new_data.copy()
+            if merged.index.tz is not None and new_data.index.tz is not None:
+                new_data.index = new_data.index.tz_convert(merged.index.tz)
+
+            if history_adjusted(merged, new_data):
+                print(f"[UYARI] {symbol} gecmis fiyatlar yeniden duzeltilmis (temettu/bolunme); "
+                      f"cache silinip tam periyot cekilecek.")
+                self.clear(symbol, interval)
+                return None
+
+            merged = pd.concat([merged, new_data])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+
+        self.save(symbol, merged, period=cached['meta'].get('period', 'max'), interval=interval)
+
+        return merged
+
+    def clear(self, symbol: Optional[str] = None, interval: Optional[str] = None) -> int:
+        """
+        Cache dosyalarını siler.
+
+        Args:
+            symbol: Sadece bu sembolü sil (None = hepsi)
+            interval: Sadece bu interval'i sil (None = hepsi)
+
+        Returns:
+            int: Silinen dosya sayısı
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        prefix = f"{self._safe_symbol(symbol)}_" if symbol else ''
+        suffix = f"_{interval}" if interval else ''
+
+        targets = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(('.parquet', '.json'))
+            and name.startswith(prefix)
+            and os.path.splitext(name)[0].endswith(suffix)
+        ]
+
+        removed = 0
+        for path in targets:
+            if os.path.exists(path):
+                os.remove(path)
+                removed += 1
+
+        return removed
+
+
+# Varsayılan (paylaşılan) cache örneği
+_default_cache: Optional[OHLCVCache] = None
+
+
+def get_default_cache() -> OHLCVCache:
+    """
+    Uygulama genelinde kullanılan varsayılan cache'i döndürür.
+
+    Returns:
+        OHLCVCache: data/ohlcv klasörünü kullanan cache
+    """
+    global _default_cache
+
+    if _default_cache is None:
+        _default_cache = OHLCVCache()
+
+    return _default_cache
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("=" * 60)
+    print("OHLCV CACHE - TEST")
+    print("=" * 60)
+
+    friday_evening = datetime(2025, 11, 7, 19, 0, tzinfo=BIST_TZ)
+    monday_noon = datetime(2025, 11, 10, 12, 0, tzinfo=BIST_TZ)
+
+    print(f"\nCuma 19:00 gunluk veri gecerlilik: {expires_at(friday_evening, '1d')}")
+    print(f"Pazartesi 12:00 5m veri gecerlilik: {expires_at(monday_noon, '5m')}")
+    print(f"Cuma 19:00 5m veri gecerlilik:     {expires_at(friday_evening, '5m')}")
+
+    print(f"\n'1y' cache '6mo' istegini kapsar mi? {period_covers('1y', '6mo')}")
+    print(f"'3mo' cache '1y' istegini kapsar mi? {period_covers('3mo', '1y')}")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
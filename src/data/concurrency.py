@@ -0,0 +1,306 @@
+"""
+Eşzamanlı Veri Çekme Altyapısı
+
+Bu modül çoklu hisse çekimini hızlandıran yardımcıları içerir:
+- TokenBucket: Paylaşılan istek hızı sınırlayıcı (rate limiter)
+- backoff_delay: Üstel bekleme + rastgele sapma (exponential backoff with jitter)
+- FetchStats: Hisse bazlı gecikme istatistikleri
+- run_concurrent: Sınırlı sayıda worker ile paralel çalıştırma
+
+Neden Token Bucket?
+------------------
+Sabit time.sleep(0.5) izin verilen hızın altında kalır ve paralel
+worker'larla birlikte çalışmaz. Token bucket ise tüm thread'ler arasında
+paylaşılır: kova dolu iken istekler hemen geçer (burst), boşaldığında
+saniyede 'rate' istek hızına iner. Böylece limit aşılmadan tam hız kullanılır.
+
+Örnek Kullanım:
+    >>> from src.data.concurrency import run_concurrent
+    >>> results, stats = run_concurrent(fetch_one, ['THYAO', 'SASA'], max_workers=8)
+    >>> stats.print_report()
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+
+class TokenBucket:
+    """Thread-safe token bucket hız sınırlayıcı"""
+
+    def __init__(self, rate: float = 5.0, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Saniyede eklenen token (izin verilen ortalama istek/saniye)
+            capacity: Kova kapasitesi (ani patlama limiti, varsayılan: rate,
+                      en az 1 - rate < 1 iken kova tam bir token tutabilsin)
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate pozitif olmali: {rate}")
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"Kapasite pozitif olmali: {capacity}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Geçen süreye göre kovayı doldurur (lock altında çağrılır)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Token alır, gerekirse token oluşana kadar bekler.
+
+        Args:
+            tokens: Harcanacak token sayısı (toplu istekler için >1 olabilir)
+
+        Returns:
+            float: Beklenen süre (saniye)
+
+        Raises:
+            ValueError: tokens kova kapasitesinden büyükse (hiç karşılanamaz)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"{tokens} token istendi, kova kapasitesi {self.capacity}")
+
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                # Eksik token'ın oluşması için gereken süre
+                sleep_for = (tokens - self._tokens) / self.rate
+
+            time.sleep(sleep_for)
+            waited += sleep_for
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Üstel bekleme süresi hesaplar (full jitter).
+
+    Deneme sayısı arttıkça bekleme üst sınırı 2 katına çıkar, gerçek
+    bekleme 0 ile bu sınır arasında rastgele seçilir. Böylece aynı anda
+    hata alan worker'lar aynı anda tekrar denemez (thundering herd).
+
+    Args:
+        attempt: Kaçıncı deneme (0'dan başlar)
+        base: İlk denemedeki üst sınır (saniye)
+        cap: Maksimum bekleme (saniye)
+
+    Returns:
+        float: Beklenecek süre (saniye)
+
+    Örnek:
+        >>> backoff_delay(0, base=2.0)  # 0-2 saniye arası
+        >>> backoff_delay(3, base=2.0)  # 0-16 saniye arası
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# Paylaşılan varsayılan hız sınırlayıcı
+_default_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """
+    Tüm veri çekme fonksiyonlarının paylaştığı hız sınırlayıcıyı döndürür.
+
+    Returns:
+        TokenBucket: Varsayılan limiter (5 istek/saniye)
+    """
+    global _default_limiter
+
+    with _limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = TokenBucket(rate=5.0)
+        return _default_limiter
+
+
+def configure_rate_limit(rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """
+    Paylaşılan hız sınırlayıcıyı yeniden ayarlar.
+
+    Args:
+        rate: Saniyede izin verilen istek
+        capacity: Ani patlama limiti
+
+    Returns:
+        TokenBucket: Yeni limiter
+    """
+    global _default_limiter
+
+    with _limiter_lock:
+        _default_limiter = TokenBucket(rate=rate, capacity=capacity)
+        return _default_limiter
+
+
+class FetchStats:
+    """Hisse bazlı veri çekme gecikmelerini toplayan sınıf (thread-safe)"""
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+
+    def record(self, symbol: str, latency: float, success: bool, source: str = 'network') -> None:
+        """
+        Bir hissenin çekim sonucunu kaydeder.
+
+        Args:
+            symbol: Hisse kodu
+            latency: Geçen süre (saniye)
+            success: Veri geldi mi
+            source: 'cache', 'batch' veya 'network'
+        """
+        with self._lock:
+            self.records[symbol] = {
+                'latency': latency,
+                'success': success,
+                'source': source,
+            }
+
+    def finish(self) -> None:
+        """Toplam süre ölçümünü bitirir"""
+        self._finished = time.perf_counter()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Gecikme istatistiklerini hesaplar.
+
+        Returns:
+            dict: count, success, wall_time ve kaynak bazlı mean/p50/p95/max (ms)
+        """
+        end = self._finished if self._finished is not None else time.perf_counter()
+
+        result = {
+            'count': len(self.records),
+            'success': sum(1 for r in self.records.values() if r['success']),
+            'wall_time': end - self._started,
+            'by_source': {},
+        }
+
+        sources = sorted({r['source'] for r in self.records.values()})
+        for source in sources:
+            latencies = sorted(r['latency'] for r in self.records.values() if r['source'] == source)
+            n = len(latencies)
+            result['by_source'][source] = {
+                'count': n,
+                'mean_ms': sum(latencies) / n * 1000,
+                'p50_ms': latencies[n // 2] * 1000,
+                'p95_ms': latencies[min(n - 1, int(n * 0.95))] * 1000,
+                'max_ms': latencies[-1] * 1000,
+            }
+
+        return result
+
+    def slowest(self, n: int = 5) -> List[Tuple[str, float]]:
+        """En yavaş n hisseyi (sembol, saniye) olarak döndürür"""
+        items = sorted(self.records.items(), key=lambda kv: kv[1]['latency'], reverse=True)
+        return [(symbol, rec['latency']) for symbol, rec in items[:n]]
+
+    def print_report(self) -> None:
+        """Gecikme istatistiklerini terminale yazdırır"""
+        summary = self.summary()
+
+        print(f"\n[ISTATISTIK] {summary['success']}/{summary['count']} hisse, "
+              f"toplam sure {summary['wall_time']:.2f} s")
+
+        for source, s in summary['by_source'].items():
+            print(f"  {source:8}: {s['count']:4} hisse | ort {s['mean_ms']:8.1f} ms | "
+                  f"p50 {s['p50_ms']:8.1f} ms | p95 {s['p95_ms']:8.1f} ms | max {s['max_ms']:8.1f} ms")
+
+        slow = [(sym, lat) for sym, lat in self.slowest() if self.records[sym]['source'] != 'cache']
+        if slow:
+            print("  En yavas: " + ", ".join(f"{sym} ({lat * 1000:.0f} ms)" for sym, lat in slow))
+
+
+def run_concurrent(
+    func: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int = 8,
+    stats: Optional[FetchStats] = None,
+    source: str = 'network',
+    key: Callable[[Any], str] = str
+) -> Tuple[Dict[str, Any], FetchStats]:
+    """
+    Bir fonksiyonu öğeler üzerinde sınırlı sayıda thread ile paralel çalıştırır.
+
+    Ağ istekleri GIL'i bıraktığı için thread havuzu yeterlidir. Hız
+    sınırlaması func içinde (paylaşılan TokenBucket ile) yapılmalıdır.
+
+    Args:
+        func: Her öğe için çağrılacak fonksiyon (None dönerse başarısız sayılır)
+        items: İşlenecek öğeler (örn: hisse kodları)
+        max_workers: Eşzamanlı worker sayısı
+        stats: Sonuçların ekleneceği istatistik nesnesi (None = yeni oluştur)
+        source: İstatistikte görünecek kaynak adı
+        key: Öğeden sonuç anahtarı üreten fonksiyon
+
+    Returns:
+        tuple: ({anahtar: sonuç}, FetchStats) - başarısızlar sonuçta yer almaz
+    """
+    stats = stats or FetchStats()
+    results: Dict[str, Any] = {}
+
+    def _timed(item):
+        start = time.perf_counter()
+        try:
+            value = func(item)
+        except Exception as e:
+            print(f"[HATA] {key(item)}: {e}")
+            value = None
+        return item, value, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(_timed, item) for item in items]
+
+        for future in as_completed(futures):
+            item, value, latency = future.result()
+            success = value is not None
+            stats.record(key(item), latency, success, source=source)
+            if success:
+                results[key(item)] = value
+
+    return results, stats
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ESZAMANLI CEKIM ALTYAPISI - TEST")
+    print("=" * 60)
+
+    bucket = TokenBucket(rate=20, capacity=5)
+
+    def fake_fetch(symbol):
+        bucket.acquire()
+        time.sleep(0.05)  # Ağ gecikmesi taklidi
+        return symbol.lower()
+
+    symbols = [f"HISSE{i}" for i in range(40)]
+    results, stats = run_concurrent(fake_fetch, symbols, max_workers=8)
+    stats.finish()
+
+    print(f"\n40 sahte istek, 20 istek/s limit -> {len(results)} sonuc")
+    stats.print_report()
+
+    print("\nBackoff ornekleri (base=2s):")
+    for attempt in range(5):
+        print(f"  Deneme {attempt}: {backoff_delay(attempt, base=2.0):.2f} s")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
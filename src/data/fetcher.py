@@ -4,25 +4,62 @@ BIST Hisse Veri Çekme Modülü
 Bu modül yfinance kullanarak BIST hisselerinin fiyat ve
 hacim verilerini çeker. Error handling ve cache mekanizması içerir.
 
+Sağlayıcı: İstekler src/data/providers.py'deki paylaşılan sağlayıcıdan
+geçer (varsayılan yfinance). Kayıt/replay sağlayıcısıyla internetsiz
+ve tekrarlanabilir çalıştırılabilir.
+
+Cache: Çekilen veriler data/ohlcv/ altında Parquet olarak saklanır
+(bkz. src/data/cache.py). Taze cache varsa internete hiç çıkılmaz.
+
 Örnek Kullanım:
     >>> from src.data.fetcher import fetch_stock_data
     >>> data = fetch_stock_data('THYAO', period='3mo')
     >>> print(data.tail())
 """
 
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable
+from .cache import OHLCVCache, get_default_cache, slice_to_period, INTRADAY_INTERVALS
+from .concurrency import get_rate_limiter, backoff_delay, run_concurrent, FetchStats
+from .providers import get_provider
+from ..utils.profiling import profiled, record_bytes
+
+
+# yfinance'in gün içi barlarda start ile istenebilen en eski geçmiş
+# (1m: istek başına 7 gün, 2m-90m: 60 gün, saatlik: 730 gün; sınırda pay bırakıldı)
+INTRADAY_START_WINDOW = {
+    '1m': timedelta(days=6),
+    '2m': timedelta(days=59),
+    '5m': timedelta(days=59),
+    '15m': timedelta(days=59),
+    '30m': timedelta(days=59),
+    '60m': timedelta(days=729),
+    '90m': timedelta(days=59),
+    '1h': timedelta(days=729),
+}
 
 
+def _outside_start_window(start: pd.Timestamp, interval: str) -> bool:
+    """Gün içi artımlı istek için start, sağlayıcının geriye gidebildiği pencerenin dışında mı?"""
+    window = INTRADAY_START_WINDOW.get(interval)
+    if window is None:
+        return False
+    now = pd.Timestamp.now(tz=start.tz) if start.tz is not None else pd.Timestamp.now()
+    return now - start > window
+
+
+@profiled()
 def fetch_stock_data(
     symbol: str,
     period: str = "1y",
     interval: str = "1d",
     retry_count: int = 3,
-    retry_delay: float = 2.0
+    retry_delay: float = 2.0,
+    use_cache: bool = True,
+    incremental: bool = True,
+    cache: Optional[OHLCVCache] = None
 ) -> Optional[pd.DataFrame]:
     """
     BIST hissesi için fiyat ve hacim verisi çeker.
@@ -35,7 +72,13 @@ def fetch_stock_data(
         interval (str): Veri aralığı
                         - "1m", "5m", "15m", "30m", "60m", "1d", "1wk", "1mo"
         retry_count (int): Hata durumunda tekrar deneme sayısı
-        retry_delay (float): Denemeler arası bekleme süresi (saniye)
+        retry_delay (float): İlk tekrar denemedeki bekleme üst sınırı (saniye);
+                             sonraki denemelerde üstel artar (jitter ile)
+        use_cache (bool): Önce disk cache'ine bak, çekilen veriyi cache'e yaz
+                          (False = her zaman internetten çek)
+        incremental (bool): Cache bayatsa sadece son bardan sonrasını çek
+                            ve cache'e ekle (False = tüm periyodu yeniden çek)
+        cache (OHLCVCache): Kullanılacak disk cache'i (varsayılan: get_default_cache())
     
     Returns:
         pd.DataFrame: Tarih indeksli DataFrame
@@ -58,8 +101,16 @@ def fetch_stock_data(
     Notlar:
         - BIST hisseleri için otomatik ".IS" suffix eklenir
         - yfinance API'si bazen yavaş olabilir (1-3 saniye)
-        - Rate limit durumunda otomatik retry yapar
-        - Internet bağlantısı gereklidir
+        - Rate limit durumunda üstel bekleme ile otomatik retry yapar
+        - Tüm istekler paylaşılan hız sınırlayıcıdan geçer (src/data/concurrency.py)
+        - Taze cache varsa internet bağlantısı gerekmez
+          (günlük veri bir sonraki seans kapanışına kadar taze sayılır)
+        - Bayat cache varsa sadece eksik barlar çekilir (start=son bar),
+          yıllarca değişmeyen geçmiş tekrar indirilmez
+        - Tekrar çekilen son bar cache'tekinden farklıysa (temettü/bölünme
+          sonrası geçmiş yeniden düzeltilmiş) cache silinip periyot tamamen çekilir
+        - Gün içi cache'in son barı sağlayıcının start penceresinden eskiyse
+          (1m: ~7 gün) periyodun tamamı çekilip cache'teki geçmişle birleştirilir
     """
     
     # Symbol'ü büyük harfe çevir ve temizle
@@ -71,16 +122,71 @@ def fetch_stock_data(
     else:
         ticker_symbol = symbol
     
+    # Önce cache'e bak
+    cache = (cache or get_default_cache()) if use_cache else None
+    delta_start = None
+    
+    if cache is not None:
+        cached = cache.get(symbol, period=period, interval=interval)
+        if cached is not None and not cached.empty:
+            print(f"[CACHE] {symbol} verisi cache'ten okundu ({len(cached)} satir)")
+            return cached
+        
+        # Bayat ama periyodu kapsayan cache varsa sadece eksik barları çek
+        if incremental:
+            delta_start = cache.last_bar(symbol, period=period, interval=interval)
+    
+    # İstek parametreleri: tam periyot veya son bardan itibaren
+    request = {'interval': interval}
+    
+    if delta_start is None:
+        request['period'] = period
+    elif interval in INTRADAY_INTERVALS:
+        if _outside_start_window(delta_start, interval):
+            # start ile bu kadar geriye gidilemez (boş/hatalı cevap cache'i tazeymiş
+            # gibi işaretlerdi): periyodun tamamı çekilip eski geçmişle birleştirilir
+            print(f"[UYARI] {symbol} cache'in son bari ({delta_start}) {interval} icin cok eski; "
+                  f"son {period} cekilip birlestirilecek, aradaki barlar eksik kalir.")
+            request['period'] = period
+        else:
+            request['start'] = delta_start
+    else:
+        # Son barı da tekrar iste (seans içinde yazılmış yarım bar olabilir)
+        request['start'] = delta_start.strftime('%Y-%m-%d')
+    
     # Retry mekanizması ile veri çek
     for attempt in range(retry_count):
         try:
-            print(f"[VERI] {symbol} verisi cekiliyor... (Deneme {attempt + 1}/{retry_count})")
+            if delta_start is not None:
+                print(f"[VERI] {symbol} yeni barlar cekiliyor ({delta_start} sonrasi)... (Deneme {attempt + 1}/{retry_count})")
+            else:
+                print(f"[VERI] {symbol} verisi cekiliyor... (Deneme {attempt + 1}/{retry_count})")
+            
+            # Ticker objesi oluştur (varsayılan sağlayıcı: yfinance, bkz. src/data/providers.py)
+            ticker = get_provider().ticker(ticker_symbol)
             
-            # yfinance Ticker objesi oluştur
-            ticker = yf.Ticker(ticker_symbol)
+            # Geçmiş verileri çek (paylaşılan hız limiti ile)
+            get_rate_limiter().acquire()
+            data = ticker.history(**request)
+            record_bytes(data.memory_usage(index=True).sum())
             
-            # Geçmiş verileri çek
-            data = ticker.history(period=period, interval=interval)
+            # Artımlı mod: yeni barları cache'e ekle (boş olabilir, örn: tatil)
+            if delta_start is not None:
+                if not data.empty:
+                    data.columns = [col.strip() for col in data.columns]
+                
+                merged = cache.append(symbol, data, interval=interval)
+                
+                if merged is not None and not merged.empty:
+                    print(f"[OK] {symbol} cache guncellendi! ({len(data)} yeni/guncel bar, toplam {len(merged)} satir)")
+                    return slice_to_period(merged, period)
+                
+                # Cache okunamadıysa veya geçmiş yeniden düzeltildiyse tam çekime dön
+                delta_start = None
+                request = {'period': period, 'interval': interval}
+                get_rate_limiter().acquire()
+                data = ticker.history(**request)
+                record_bytes(data.memory_usage(index=True).sum())
             
             # Veri kontrolü
             if data.empty:
@@ -92,14 +198,19 @@ def fetch_stock_data(
             
             print(f"[OK] {symbol} verisi basariyla cekildi! ({len(data)} satir)")
             
+            # Sonraki çağrılar için cache'e yaz
+            if cache is not None:
+                cache.save(symbol, data, period=period, interval=interval)
+            
             return data
             
         except Exception as e:
             print(f"[HATA] (Deneme {attempt + 1}): {str(e)}")
             
             if attempt < retry_count - 1:
-                print(f"[BEKLE] {retry_delay} saniye sonra tekrar deneniyor...")
-                time.sleep(retry_delay)
+                delay = backoff_delay(attempt, base=retry_delay)
+                print(f"[BEKLE] {delay:.1f} saniye sonra tekrar deneniyor...")
+                time.sleep(delay)
             else:
                 print(f"[HATA] {symbol} verisi {retry_count} denemeden sonra cekilemedi.")
                 return None
@@ -132,7 +243,7 @@ def get_stock_info(symbol: str) -> Optional[Dict[str, Any]]:
         ticker_symbol = symbol
     
     try:
-        ticker = yf.Ticker(ticker_symbol)
+        ticker = get_provider().ticker(ticker_symbol)
         info = ticker.info
         
         if not info:
@@ -181,13 +292,154 @@ def get_latest_price(symbol: str) -> Optional[float]:
     return None
 
 
-def get_multiple_stocks(symbols: list, period: str = "1y") -> Dict[str, pd.DataFrame]:
+def _to_ticker_symbol(symbol: str) -> str:
+    """Hisse kodunu yfinance sembolüne çevirir (örn: 'thyao' -> 'THYAO.IS')"""
+    symbol = symbol.strip().upper()
+    return symbol if symbol.endswith('.IS') else f"{symbol}.IS"
+
+
+def split_batch_frame(raw: Optional[pd.DataFrame], ticker_symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Çoklu hisse indirmesinin (yf.download, group_by='ticker') sonucunu
+    hisse bazlı DataFrame'lere ayırır.
+    
+    Args:
+        raw: Sütunları (ticker, alan) MultiIndex olan toplu veri
+        ticker_symbols: İstenen yfinance sembolleri (örn: ['THYAO.IS', 'SASA.IS'])
+    
+    Returns:
+        dict: {ticker_symbol: DataFrame} - verisi gelmeyen hisseler dahil edilmez
+    
+    Not:
+        Toplu indirmede tüm hisseler ortak bir tarih indeksine yerleşir.
+        Bir hissenin işlem görmediği günler tamamen NaN satır olur, bunlar atılır.
+    """
+    
+    frames = {}
+    
+    if raw is None or raw.empty:
+        return frames
+    
+    for ticker_symbol in ticker_symbols:
+        if isinstance(raw.columns, pd.MultiIndex):
+            if ticker_symbol not in raw.columns.get_level_values(0):
+                continue
+            frame = raw[ticker_symbol]
+        elif len(ticker_symbols) == 1:
+            # Tek hisse, düz sütunlar (eski yfinance davranışı)
+            frame = raw
+        else:
+            continue
+        
+        frame = frame.dropna(how='all')
+        
+        # Fiyatı hiç olmayan satırlar da veri sayılmaz
+        if 'Close' in frame.columns:
+            frame = frame[frame['Close'].notna()]
+        
+        if frame.empty:
+            continue
+        
+        frame = frame.copy()
+        frame.columns = [str(col).strip() for col in frame.columns]
+        frame.columns.name = None
+        frames[ticker_symbol] = frame
+    
+    return frames
+
+
+@profiled()
+def download_batch(
+    symbols: List[str],
+    period: Optional[str] = "1y",
+    interval: str = "1d",
+    start: Optional[str] = None,
+    downloader: Optional[Callable[..., pd.DataFrame]] = None
+) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Birden fazla hissenin verisini TEK bir toplu istekle çeker.
+    
+    Args:
+        symbols: Hisse kodları (örn: ['THYAO', 'SASA'])
+        period: Zaman aralığı (start verilirse kullanılmaz)
+        interval: Veri aralığı
+        start: Bu tarihten itibaren çek (artımlı güncelleme için)
+        downloader: yf.download yerine kullanılacak fonksiyon
+                    (test için kayıtlı cevap dönen bir taklit verilebilir)
+    
+    Returns:
+        dict: {symbol: DataFrame} - sadece verisi gelen hisseler
+        None: Toplu istek başarısız olduysa (ağ hatası vb.) - hiçbir
+              hisse için "yeni bar yok" sonucu çıkarılmamalı
+    
+    Örnek:
+        >>> frames = download_batch(['THYAO', 'SASA', 'GARAN'], period='3mo')
+        >>> print(frames['THYAO'].tail())
+    """
+    
+    downloader = downloader or get_provider().download
+    ticker_map = {_to_ticker_symbol(s): s.strip().upper() for s in symbols}
+    
+    request = {'interval': interval}
+    if start is not None:
+        request['start'] = start
+    else:
+        request['period'] = period
+    
+    try:
+        get_rate_limiter().acquire()
+        raw = downloader(
+            list(ticker_map.keys()),
+            group_by='ticker',
+            actions=True,          # Ticker.history() ile aynı sütunlar
+            auto_adjust=True,
+            ignore_tz=False,       # Tarih indeksi timezone bilgisini korusun
+            threads=True,
+            progress=False,
+            **request
+        )
+    except Exception as e:
+        print(f"[HATA] Toplu indirme basarisiz: {e}")
+        return None
+    
+    if isinstance(raw, pd.DataFrame):
+        record_bytes(raw.memory_usage(index=True).sum())
+    
+    frames = split_batch_frame(raw, list(ticker_map.keys()))
+    
+    return {ticker_map[t]: frame for t, frame in frames.items()}
+
+
+def get_multiple_stocks(symbols: list, period: str = "1y",
+                        interval: str = "1d",
+                        incremental: bool = True,
+                        batch_size: int = 50,
+                        max_workers: int = 8,
+                        downloader: Optional[Callable[..., pd.DataFrame]] = None,
+                        show_stats: bool = True) -> Dict[str, pd.DataFrame]:
     """
     Birden fazla hissenin verisini aynı anda çeker.
     
+    Çalışma sırası:
+        1. Taze cache'i olan hisseler diskten okunur (internet yok)
+        2. Kalanlar batch_size'lık gruplar halinde TEK istekle indirilir
+           (cache'i bayat olanlar için sadece son bardan sonrası istenir)
+        3. Toplu indirmede gelmeyen hisseler tek tek (retry ile) denenir
+    
+    2. ve 3. adımlar max_workers thread ile paralel çalışır. Tüm istekler
+    paylaşılan token bucket hız sınırlayıcısından geçer, bu yüzden sabit
+    bekleme yoktur: izin verilen hız kadar istek atılır, fazlası beklemeye girer.
+    
     Args:
         symbols (list): Hisse kodları listesi
         period (str): Zaman aralığı
+        interval (str): Veri aralığı
+        incremental (bool): Bayat cache için sadece yeni barları çek
+        batch_size (int): Bir toplu istekteki maksimum hisse sayısı
+                          (0 = toplu indirme kapalı, hepsi tek tek)
+        max_workers (int): Eşzamanlı istek sayısı
+        downloader: yf.download yerine kullanılacak fonksiyon (test için)
+        show_stats (bool): Sonda hisse bazlı gecikme istatistiklerini yazdır
     
     Returns:
         dict: {symbol: DataFrame} formatında
@@ -198,22 +450,104 @@ def get_multiple_stocks(symbols: list, period: str = "1y") -> Dict[str, pd.DataF
         ...     print(f"{symbol}: {len(data)} gün verisi")
     """
     
+    symbols = [s.strip().upper() for s in symbols]
     results = {}
+    cache = get_default_cache()
+    stats = FetchStats()
     
+    # 1) Taze cache
+    pending = []
     for symbol in symbols:
-        print(f"\n{'='*50}")
-        data = fetch_stock_data(symbol, period=period)
+        started = time.perf_counter()
+        cached = cache.get(symbol, period=period, interval=interval)
+        if cached is not None and not cached.empty:
+            results[symbol] = cached
+            stats.record(symbol, time.perf_counter() - started, True, source='cache')
+        else:
+            pending.append(symbol)
+    
+    if len(results):
+        print(f"[CACHE] {len(results)}/{len(symbols)} hisse cache'ten okundu.")
+    
+    # 2) Toplu indirme - aynı başlangıç noktasına sahip hisseler birlikte istenir
+    failed = list(pending)
+    
+    if pending and batch_size > 0:
+        groups: Dict[Optional[str], List[str]] = {}
+        for symbol in pending:
+            last = cache.last_bar(symbol, period=period, interval=interval) if incremental else None
+            start = None
+            if last is not None:
+                start = str(last) if interval in INTRADAY_INTERVALS else last.strftime('%Y-%m-%d')
+            groups.setdefault(start, []).append(symbol)
+        
+        chunks = [
+            (start, group[i:i + batch_size])
+            for start, group in groups.items()
+            for i in range(0, len(group), batch_size)
+        ]
         
-        if data is not None:
-            results[symbol] = data
+        def _fetch_chunk(job):
+            start, chunk = job
+            mode = f"{start} sonrasi" if start else period
+            print(f"[VERI] {len(chunk)} hisse toplu cekiliyor ({mode}, {interval})...")
+            
+            started = time.perf_counter()
+            frames = download_batch(chunk, period=period, interval=interval,
+                                    start=start, downloader=downloader)
+            latency = time.perf_counter() - started
+            
+            chunk_results = {}
+            for symbol in chunk:
+                # İstek başarısızsa veya hisse cevapta yoksa tek tek denenecek
+                # (bayat cache "taze" işaretlenmesin)
+                data = frames.get(symbol) if frames is not None else None
+                
+                if data is not None and start is not None:
+                    # Geçmiş yeniden düzeltildiyse cache silinir, tek tek denemede tam çekilir
+                    merged = cache.append(symbol, data, interval=interval)
+                    if merged is not None and not merged.empty:
+                        chunk_results[symbol] = slice_to_period(merged, period)
+                elif data is not None:
+                    cache.save(symbol, data, period=period, interval=interval)
+                    chunk_results[symbol] = data
+                
+                stats.record(symbol, latency, symbol in chunk_results, source='batch')
+            
+            return chunk_results
+        
+        chunk_outputs, _ = run_concurrent(
+            _fetch_chunk, chunks, max_workers=max_workers,
+            stats=FetchStats(), key=lambda job: job[1][0]
+        )
+        for chunk_results in chunk_outputs.values():
+            results.update(chunk_results)
         
-        # API'yi yormamak için kısa bekleme
-        time.sleep(0.5)
+        failed = [s for s in pending if s not in results]
+        
+        if failed:
+            print(f"[UYARI] Toplu indirmede gelmeyen {len(failed)} hisse tek tek denenecek: {', '.join(failed)}")
+    
+    # 3) Tek tek deneme (retry + backoff ile, paralel)
+    if failed:
+        single_results, _ = run_concurrent(
+            lambda symbol: fetch_stock_data(symbol, period=period, interval=interval,
+                                            incremental=incremental),
+            failed, max_workers=max_workers, stats=stats, source='network'
+        )
+        results.update(single_results)
+    
+    stats.finish()
     
     print(f"\n{'='*50}")
-    print(f"[OK] {len(results)}/{len(symbols)} hisse basariyla cekildi.\n")
+    print(f"[OK] {len(results)}/{len(symbols)} hisse basariyla cekildi.")
+    
+    if show_stats:
+        stats.print_report()
+    print()
     
-    return results
+    # Sonuçları istenen sırayla döndür
+    return {s: results[s] for s in symbols if s in results}
 
 
 # Test fonksiyonu (bu dosyayı doğrudan çalıştırırsanız)
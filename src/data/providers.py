@@ -0,0 +1,494 @@
+"""
+Veri Sağlayıcı (Provider) Katmanı
+
+Tüm internet erişimi (fetch_stock_data, get_stock_info, download_batch,
+MacroDataFetcher) tek bir sağlayıcı arayüzünden geçer:
+
+    provider.ticker(symbol).history(period=..., interval=..., start=..., end=...)
+    provider.ticker(symbol).info
+    provider.download(tickers, period=..., interval=..., group_by='ticker', ...)
+
+Sağlayıcılar:
+- YFinanceProvider: Gerçek Yahoo Finance (varsayılan)
+- RecordingProvider: Başka bir sağlayıcının cevaplarını diske kaydeder ("kaset")
+- ReplayProvider: Kaydedilmiş kasetleri internetsiz sunar; gecikme ve hata
+  oranı ayarlanabilir, böylece throughput ve retry davranışı tekrarlanabilir
+  şekilde ölçülebilir
+
+Kaset formatı: <klasör>/<SEMBOL>_<interval>.parquet (tüm kayıtların birleşimi)
+ve <klasör>/<SEMBOL>_info.json. Replay, istenen period/start/end aralığını
+bu birleşik seriden keser; kayıt anındaki tarihe bağlı değildir.
+
+Örnek Kullanım:
+    >>> from src.data.providers import RecordingProvider, ReplayProvider, set_provider
+    >>> set_provider(RecordingProvider(directory='data/tapes'))   # internetten çek + kaydet
+    >>> fetch_stock_data('THYAO', use_cache=False)
+    >>> set_provider(ReplayProvider('data/tapes', latency=0.2, error_rate=0.1))
+    >>> fetch_stock_data('THYAO', use_cache=False)                # internetsiz
+"""
+
+import os
+import json
+import time
+import random
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+from .cache import slice_to_period
+
+
+def load_yfinance():
+    """
+    yfinance modülünü ilk kullanımda yükler.
+
+    yfinance importu yaklaşık 0.8 saniye sürer. Taze cache'ten okunan
+    analizlerde ve --help gibi yollarda hiç gerekmediği için modül
+    seviyesinde değil, internete çıkılacağı anda import edilir.
+    """
+    import yfinance
+    return yfinance
+
+
+class SimulatedFetchError(Exception):
+    """ReplayProvider'ın hata oranına göre fırlattığı yapay hata"""
+
+
+class DataProvider:
+    """Sağlayıcı arayüzü (yfinance'in kullandığımız alt kümesi)"""
+
+    def ticker(self, symbol: str) -> Any:
+        """history(**kwargs) metodu ve info özelliği olan nesne döndürür"""
+        raise NotImplementedError
+
+    def download(self, tickers: List[str], **kwargs) -> pd.DataFrame:
+        """Çoklu sembol toplu indirme (yf.download ile aynı imza)"""
+        raise NotImplementedError
+
+
+class YFinanceProvider(DataProvider):
+    """Gerçek Yahoo Finance sağlayıcısı"""
+
+    def ticker(self, symbol: str) -> Any:
+        return load_yfinance().Ticker(symbol)
+
+    def download(self, tickers: List[str], **kwargs) -> pd.DataFrame:
+        return load_yfinance().download(tickers, **kwargs)
+
+
+class TapeStore:
+    """Kaydedilmiş cevapların (kasetlerin) disk deposu"""
+
+    def __init__(self, directory: str = "data/tapes"):
+        """
+        Args:
+            directory: Kaset dosyalarının tutulacağı klasör
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def _base(self, symbol: str) -> str:
+        safe = symbol.strip().upper().replace('=', '_').replace('^', '_').replace('/', '_')
+        return os.path.join(self.directory, safe)
+
+    def load(self, symbol: str, interval: str = "1d") -> Optional[pd.DataFrame]:
+        """Sembolün kayıtlı serisini döndürür (yoksa None)"""
+        path = f"{self._base(symbol)}_{interval}.parquet"
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            print(f"[UYARI] {symbol} kaseti okunamadi: {e}")
+            return None
+
+    def save(self, symbol: str, data: pd.DataFrame, interval: str = "1d") -> bool:
+        """
+        Yeni cevabı sembolün kasetiyle birleştirip yazar.
+
+        Aynı tarihli barlarda yeni kayıt eskisinin yerine geçer. Saat dilimi
+        farklıysa (örn. ignore_tz=True ile gelen veri) yeni veri mevcut
+        kasetin dilimine yerel saat korunarak çevrilir.
+        """
+        if data is None or data.empty:
+            return False
+
+        path = f"{self._base(symbol)}_{interval}.parquet"
+
+        with self._lock:
+            existing = self.load(symbol, interval)
+
+            if existing is not None and not existing.empty:
+                data = data.copy()
+                data.index = _match_tz(data.index, existing.index.tz)
+                data = pd.concat([existing, data])
+                data = data[~data.index.duplicated(keep='last')].sort_index()
+
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                data.to_parquet(path + '.tmp')
+                os.replace(path + '.tmp', path)
+                return True
+            except Exception as e:
+                print(f"[UYARI] {symbol} kaseti yazilamadi: {e}")
+                return False
+
+    def load_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Sembolün kayıtlı info sözlüğünü döndürür (yoksa None)"""
+        path = f"{self._base(symbol)}_info.json"
+
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_info(self, symbol: str, info: Dict[str, Any]) -> None:
+        """Info sözlüğünü kaydeder (JSON'a yazılamayan alanlar metne çevrilir)"""
+        os.makedirs(self.directory, exist_ok=True)
+
+        with open(f"{self._base(symbol)}_info.json", 'w', encoding='utf-8') as f:
+            json.dump(info, f, indent=2, ensure_ascii=False, default=str)
+
+
+def _match_tz(index: pd.DatetimeIndex, tz) -> pd.DatetimeIndex:
+    """İndeksi verilen saat dilimine yerel saati koruyarak uyarlar"""
+    if index.tz is None and tz is not None:
+        return index.tz_localize(tz)
+    if index.tz is not None and tz is None:
+        return index.tz_localize(None)
+    if index.tz is not None and str(index.tz) != str(tz):
+        return index.tz_convert(tz)
+    return index
+
+
+def _to_timestamp(value: Union[str, datetime, pd.Timestamp, None], tz) -> Optional[pd.Timestamp]:
+    """start/end parametresini indeksle karşılaştırılabilir hale getirir"""
+    if value is None:
+        return None
+
+    value = pd.Timestamp(value)
+    if value.tz is None and tz is not None:
+        return value.tz_localize(tz)
+    if value.tz is not None and tz is None:
+        return value.tz_localize(None)
+    return value
+
+
+def select_range(data: pd.DataFrame, period: Optional[str] = None,
+                 start=None, end=None) -> pd.DataFrame:
+    """
+    Kayıtlı seriden yfinance history() parametrelerine karşılık gelen aralığı keser.
+
+    Args:
+        data: Kaset serisi
+        period: '5d', '3mo', '1y', 'max' ... (start verilirse kullanılmaz)
+        start: Bu tarihten itibaren (dahil)
+        end: Bu tarihe kadar (hariç, yfinance ile aynı)
+
+    Returns:
+        pd.DataFrame: Kesilmiş veri (kopya)
+    """
+    if data.empty:
+        return data.copy()
+
+    tz = data.index.tz
+    start = _to_timestamp(start, tz)
+    end = _to_timestamp(end, tz)
+
+    if start is not None:
+        data = data[data.index >= start]
+    if end is not None:
+        data = data[data.index < end]
+    if start is None and period:
+        data = slice_to_period(data, period)
+
+    return data.copy()
+
+
+class _RecordingTicker:
+    """Alttaki ticker'ın cevaplarını kasete yazan sarmalayıcı"""
+
+    def __init__(self, provider: 'RecordingProvider', symbol: str):
+        self._provider = provider
+        self._symbol = symbol
+        self._ticker = provider.inner.ticker(symbol)
+
+    def history(self, **kwargs) -> pd.DataFrame:
+        data = self._ticker.history(**kwargs)
+        self._provider.store.save(self._symbol, data, kwargs.get('interval', '1d'))
+        return data
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        info = self._ticker.info
+        if info:
+            self._provider.store.save_info(self._symbol, info)
+        return info
+
+
+class RecordingProvider(DataProvider):
+    """Başka bir sağlayıcının cevaplarını diske kaydeden sağlayıcı"""
+
+    def __init__(self, inner: Optional[DataProvider] = None, directory: str = "data/tapes"):
+        """
+        Args:
+            inner: Asıl veri kaynağı (varsayılan: YFinanceProvider)
+            directory: Kasetlerin yazılacağı klasör
+        """
+        self.inner = inner or YFinanceProvider()
+        self.store = TapeStore(directory)
+
+    def ticker(self, symbol: str) -> _RecordingTicker:
+        return _RecordingTicker(self, symbol)
+
+    def download(self, tickers: List[str], **kwargs) -> pd.DataFrame:
+        from .fetcher import split_batch_frame
+
+        raw = self.inner.download(tickers, **kwargs)
+
+        # Toplu cevap sembol bazlı kasetlere bölünür; replay history() ile de sunabilir
+        interval = kwargs.get('interval', '1d')
+        for symbol, frame in split_batch_frame(raw, list(tickers)).items():
+            self.store.save(symbol, frame, interval)
+
+        return raw
+
+
+class _ReplayTicker:
+    """Kasetten cevap veren yfinance.Ticker benzeri nesne"""
+
+    def __init__(self, provider: 'ReplayProvider', symbol: str):
+        self._provider = provider
+        self._symbol = symbol
+
+    def history(self, period: Optional[str] = "1mo", interval: str = "1d",
+                start=None, end=None, **kwargs) -> pd.DataFrame:
+        self._provider._simulate()
+
+        data = self._provider.store.load(self._symbol, interval)
+        if data is None:
+            # yfinance bilinmeyen sembolde boş tablo döndürür
+            self._provider._count('missing')
+            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+
+        return select_range(data, period=period, start=start, end=end)
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        self._provider._simulate()
+        return self._provider.store.load_info(self._symbol) or {}
+
+
+class ReplayProvider(DataProvider):
+    """
+    Kaydedilmiş kasetleri internetsiz sunan sağlayıcı.
+
+    Her istek latency + U(0, jitter) saniye bekler ve error_rate olasılıkla
+    SimulatedFetchError fırlatır (yfinance'in rate limit hatası gibi).
+    seed verilirse hata dizisi her çalıştırmada aynıdır.
+    """
+
+    def __init__(self, directory: str = "data/tapes", latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            directory: Kasetlerin okunacağı klasör
+            latency: İstek başına sabit gecikme (saniye)
+            jitter: Gecikmeye eklenen rastgele üst sınır (saniye)
+            error_rate: İsteğin yapay hatayla bitme olasılığı (0-1)
+            seed: Rastgele sayı üreteci tohumu (tekrarlanabilirlik için)
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate 0-1 arasinda olmali: {error_rate}")
+
+        self.store = TapeStore(directory)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {'requests': 0, 'errors': 0, 'missing': 0}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] += 1
+
+    def _simulate(self) -> None:
+        """Ağ gecikmesi ve hata taklidi"""
+        with self._lock:
+            self.counts['requests'] += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.counts['errors'] += 1
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if failed:
+            raise SimulatedFetchError("Too Many Requests. Rate limited. (simulated)")
+
+    def ticker(self, symbol: str) -> _ReplayTicker:
+        return _ReplayTicker(self, symbol)
+
+    def download(self, tickers: List[str], period: Optional[str] = "1mo",
+                 interval: str = "1d", start=None, end=None,
+                 ignore_tz: Optional[bool] = None, **kwargs) -> pd.DataFrame:
+        """Toplu indirme taklidi: tek gecikme/hata, (ticker, alan) sütunlu tablo"""
+        self._simulate()
+
+        if isinstance(tickers, str):
+            tickers = tickers.split()
+
+        frames = {}
+        for symbol in tickers:
+            data = self.store.load(symbol, interval)
+            if data is None:
+                self._count('missing')
+                continue
+
+            data = select_range(data, period=period, start=start, end=end)
+            if ignore_tz and data.index.tz is not None:
+                data.index = data.index.tz_localize(None)
+            frames[symbol] = data
+
+        if not frames:
+            return pd.DataFrame()
+
+        return pd.concat(frames, axis=1)
+
+    def reset_counts(self) -> None:
+        """İstek/hata sayaçlarını sıfırlar"""
+        with self._lock:
+            self.counts = {key: 0 for key in self.counts}
+
+
+# Paylaşılan varsayılan sağlayıcı
+_default_provider: Optional[DataProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_provider() -> DataProvider:
+    """
+    Tüm veri çekme fonksiyonlarının kullandığı sağlayıcıyı döndürür.
+
+    Returns:
+        DataProvider: Varsayılan olarak YFinanceProvider
+    """
+    global _default_provider
+
+    with _provider_lock:
+        if _default_provider is None:
+            _default_provider = YFinanceProvider()
+        return _default_provider
+
+
+def set_provider(provider: Optional[DataProvider]) -> Optional[DataProvider]:
+    """
+    Paylaşılan sağlayıcıyı değiştirir.
+
+    Args:
+        provider: Yeni sağlayıcı (None = varsayılana, yfinance'e dön)
+
+    Returns:
+        DataProvider: Önceki sağlayıcı
+    """
+    global _default_provider
+
+    with _provider_lock:
+        previous = _default_provider
+        _default_provider = provider
+        return previous
+
+
+def configure_provider(record: Optional[str] = None, replay: Optional[str] = None,
+                       latency: float = 0.0, error_rate: float = 0.0,
+                       seed: Optional[int] = None) -> DataProvider:
+    """
+    Komut satırı scriptleri için: --record / --replay seçeneklerine göre
+    sağlayıcıyı ayarlar.
+
+    Args:
+        record: Kasetlerin kaydedileceği klasör
+        replay: Kasetlerin okunacağı klasör (record ile birlikte verilemez)
+        latency: Replay gecikmesi (saniye)
+        error_rate: Replay hata oranı (0-1)
+        seed: Replay tohumu
+
+    Returns:
+        DataProvider: Etkin sağlayıcı
+    """
+    if record and replay:
+        raise ValueError("--record ve --replay birlikte kullanilamaz")
+
+    if replay:
+        if not os.path.isdir(replay):
+            raise ValueError(f"Kaset klasoru bulunamadi: {replay}")
+        set_provider(ReplayProvider(replay, latency=latency, error_rate=error_rate, seed=seed))
+        print(f"[VERI] Kayitli veri kullaniliyor (internet yok): {replay}")
+    elif record:
+        set_provider(RecordingProvider(directory=record))
+        print(f"[VERI] Cekilen veriler kaydediliyor: {record}")
+
+    return get_provider()
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import tempfile
+    import numpy as np
+
+    print("=" * 60)
+    print("VERI SAGLAYICI - TEST")
+    print("=" * 60)
+
+    class FakeProvider(DataProvider):
+        """İnternetsiz test için sabit veri dönen sağlayıcı"""
+
+        class _Ticker:
+            def __init__(self, symbol):
+                index = pd.date_range('2024-01-01', periods=300, freq='B', tz='Europe/Istanbul')
+                close = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, len(index)))
+                self.frame = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1,
+                                           'Close': close, 'Volume': 1e6}, index=index)
+                self.info = {'longName': symbol, 'sector': 'Test'}
+
+            def history(self, period='1y', interval='1d', **kwargs):
+                return slice_to_period(self.frame, period)
+
+        def ticker(self, symbol):
+            return self._Ticker(symbol)
+
+    directory = tempfile.mkdtemp(prefix='tapes_')
+
+    recorder = RecordingProvider(FakeProvider(), directory=directory)
+    recorded = recorder.ticker('THYAO.IS').history(period='1y', interval='1d')
+    recorder.ticker('THYAO.IS').info
+    print(f"\n[OK] Kaydedildi: {len(recorded)} bar -> {os.listdir(directory)}")
+
+    replay = ReplayProvider(directory)
+    replayed = replay.ticker('THYAO.IS').history(period='1y', interval='1d')
+    print(f"[OK] Replay ayni veri: {replayed.equals(recorded)}")
+    print(f"[OK] 3mo kesiti: {len(replay.ticker('THYAO.IS').history(period='3mo'))} bar")
+    print(f"[OK] Bilinmeyen sembol bos: {replay.ticker('YOKBU.IS').history(period='1y').empty}")
+
+    batch = replay.download(['THYAO.IS', 'YOKBU.IS'], period='1mo', group_by='ticker')
+    print(f"[OK] Toplu indirme sutunlari: {sorted(set(batch.columns.get_level_values(0)))}")
+
+    flaky = ReplayProvider(directory, latency=0.001, error_rate=0.3, seed=42)
+    for _ in range(100):
+        try:
+            flaky.ticker('THYAO.IS').history(period='5d')
+        except SimulatedFetchError:
+            pass
+    print(f"[OK] %30 hata orani, 100 istek: {flaky.counts}")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
@@ -0,0 +1,573 @@
+"""
+Çoklu Zaman Dilimi (Timeframe) Modülü
+
+Dakikalık (1m) barlar tek sefer saklanır; 5m/15m/30m/1h/1d/1wk barlar
+istendiğinde bu tabandan türetilir. Her interval için ayrı ağ isteği ve
+ayrı disk dosyası gerekmez:
+
+    data/ohlcv/THYAO_1m.parquet   -> Tek saklanan çözünürlük (taban)
+    (5m, 15m, 1h, 1d, 1wk)        -> Bellekte türetilir, cache'lenir
+
+Yeniden örnekleme vektöreldir: her bar için bin anahtarı (zaman damgası //
+bin süresi) hesaplanır, sıralı veride bin sınırları bulunur ve OHLCV
+sütunları np.maximum/minimum/add.reduceat ile tek geçişte toplanır.
+Boş binler (seans dışı, öğle arası) üretilmez.
+
+Türetilen tablolar BarStore'da sembol + timeframe için saklanır. Sürüm
+anahtarı satır sayısı, ilk/son bar zamanı ve son barın OHLCV değerleridir
+(son bar yerinde güncellense de fark edilir). Taban BarStore üzerinden
+değiştiğinde (ingest veya diskten yeniden yükleme) eski ve yeni taban
+karşılaştırılıp değişen ilk barın zamanı kaydedilir; türetilmiş tabloda
+sadece bu zamandan önce biten binler tutulur, değişen bin ve sonrası
+yeniden hesaplanır. Kaydı olmayan bir değişiklikte tablo baştan hesaplanır.
+
+Örnek Kullanım:
+    >>> from src.data.resample import fetch_bars
+    >>> bars = fetch_bars('THYAO', '15m', period='5d')
+    >>> daily = fetch_bars('THYAO', '1d')   # ağ isteği yok, aynı 1m taban
+
+Not: yfinance 1m veriyi sadece son ~30 gün için verir. Taban her
+güncellemede birleştirilerek saklandığı için geçmiş zamanla birikir;
+daha uzun günlük geçmiş için fetch_stock_data(interval='1d') kullanılmalı.
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple, Any
+
+from .cache import OHLCVCache, get_default_cache, slice_to_period
+from ..utils.profiling import profiled
+
+
+# Saklanan tek çözünürlük
+BASE_INTERVAL = '1m'
+
+# Taban güncellenirken istenen periyot (yfinance 1m için istek başına en fazla 7 gün)
+BASE_PERIOD = '5d'
+
+_MINUTE_NS = 60 * 1_000_000_000
+_DAY_NS = 24 * 60 * _MINUTE_NS
+
+# Timeframe -> bin süresi (ns). Haftalık binler Pazartesi 00:00'da başlar.
+TIMEFRAMES: Dict[str, int] = {
+    '1m': _MINUTE_NS,
+    '2m': 2 * _MINUTE_NS,
+    '5m': 5 * _MINUTE_NS,
+    '15m': 15 * _MINUTE_NS,
+    '30m': 30 * _MINUTE_NS,
+    '60m': 60 * _MINUTE_NS,
+    '1h': 60 * _MINUTE_NS,
+    '1d': _DAY_NS,
+    '1wk': 7 * _DAY_NS,
+}
+
+# 1970-01-01 Perşembe; haftalık binleri Pazartesiye hizalamak için kaydırma
+_WEEK_OFFSET_NS = 4 * _DAY_NS
+
+# Sütun -> toplama kuralı (listede olmayan sütunlarda binin son değeri)
+AGGREGATIONS = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+    'Dividends': 'sum',
+    'Stock Splits': 'max',
+}
+
+
+# Zaman birimi -> nanosaniye çarpanı (Parquet'ten gelen indeks 'us' olabilir)
+_UNIT_NS = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
+
+
+def _local_stamps(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Borsanın yerel saatine göre ns zaman damgaları (günlük bin = yerel takvim günü).
+
+    tz_localize(None) tüm satırlar için saat dilimi çevirisi yapar (1m veride
+    yavaş). Aralıkta UTC farkı hiç değişmiyorsa (İstanbul: 2016'dan beri +3)
+    sabit fark eklemek yeterli; bu, gün başına bir örnekle kontrol edilir.
+    """
+    stamps = index.asi8 * _UNIT_NS[index.unit]
+    if index.tz is None or len(index) == 0:
+        return stamps
+
+    probes = pd.date_range(index[0], index[-1], freq='D').append(index[-1:])
+    offsets = probes.tz_localize(None).as_unit('ns').asi8 - probes.as_unit('ns').asi8
+    if (offsets == offsets[0]).all():
+        return stamps + offsets[0]
+
+    return index.tz_localize(None).as_unit('ns').asi8
+
+
+def _bin_keys(index: pd.DatetimeIndex, timeframe: str) -> np.ndarray:
+    """Her barın bin numarası (yerel saate göre, sıralı indekste artan)"""
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Gecersiz timeframe: {timeframe} (desteklenen: {', '.join(TIMEFRAMES)})")
+
+    stamps = _local_stamps(index)
+
+    if timeframe == '1wk':
+        return (stamps - _WEEK_OFFSET_NS) // TIMEFRAMES[timeframe]
+    return stamps // TIMEFRAMES[timeframe]
+
+
+def _bin_labels(keys: np.ndarray, timeframe: str, like: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Bin numaralarını bin başlangıç zamanına çevirir (kaynak indeksin tz/birimiyle)"""
+    stamps = keys * TIMEFRAMES[timeframe]
+    if timeframe == '1wk':
+        stamps = stamps + _WEEK_OFFSET_NS
+
+    labels = pd.DatetimeIndex(stamps.astype('datetime64[ns]'), name=like.name)
+    if like.tz is not None:
+        labels = labels.tz_localize(like.tz)
+    return labels.as_unit(like.unit)
+
+
+@profiled()
+def resample_ohlcv(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    OHLCV verisini daha büyük zaman dilimine çevirir (vektörel).
+
+    Sonuç pandas'ın resample(label='left', closed='left') + boş binleri
+    atma davranışıyla aynıdır (kesirli hacimlerde toplama sırası kaynaklı
+    son basamak farkı hariç), ama tek geçişte reduceat ile hesaplanır.
+
+    Args:
+        data: Zaman sıralı OHLCV verisi (örn: 1m barlar)
+        timeframe: Hedef zaman dilimi ('5m', '15m', '1h', '1d', '1wk', ...)
+
+    Returns:
+        pd.DataFrame: Bin başlangıç zamanı indeksli OHLCV
+
+    Örnek:
+        >>> bars_15m = resample_ohlcv(bars_1m, '15m')
+    """
+    if data is None or data.empty:
+        return data
+
+    # Fiyatı olmayan (NaN) dakika barları bine katılmaz
+    if 'Close' in data.columns:
+        valid = data['Close'].notna().to_numpy()
+        if not valid.all():
+            data = data[valid]
+            if data.empty:
+                return data
+
+    keys = _bin_keys(data.index, timeframe)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    columns = {}
+    for column in data.columns:
+        values = data[column].to_numpy()
+        rule = AGGREGATIONS.get(column, 'last')
+
+        if rule == 'first':
+            columns[column] = values[starts]
+        elif rule == 'last':
+            columns[column] = values[ends]
+        elif rule == 'max':
+            columns[column] = np.maximum.reduceat(values, starts)
+        elif rule == 'min':
+            columns[column] = np.minimum.reduceat(values, starts)
+        else:
+            columns[column] = np.add.reduceat(values, starts)
+
+    return pd.DataFrame(columns, index=_bin_labels(keys[starts], timeframe, data.index))
+
+
+def _row_fingerprint(data: pd.DataFrame, position: int) -> bytes:
+    """Bir satırın değerlerinden karşılaştırma anahtarı (NaN'lar da eşit sayılır)"""
+    position %= len(data)
+    row = data.iloc[position:position + 1]
+    try:
+        return row.to_numpy(dtype=float).tobytes()
+    except (TypeError, ValueError):
+        return repr(row.to_numpy().tolist()).encode()
+
+
+def _first_change(old: Optional[pd.DataFrame], new: pd.DataFrame, start: int = 0) -> Optional[pd.Timestamp]:
+    """
+    İki taban arasında değişen (farklı, eklenen veya silinen) ilk barın zamanı.
+
+    Args:
+        old: Önceki taban
+        new: Yeni taban
+        start: Bu konumdan önceki satırların aynı olduğu biliniyorsa karşılaştırma başlangıcı
+
+    Returns:
+        pd.Timestamp: İlk değişen bar (ikisinden erken olanı)
+        None: Tabanlar aynı
+    """
+    if old is None or old.empty:
+        return new.index[0] if not new.empty else None
+    if new.empty:
+        return old.index[0]
+
+    common = min(len(old), len(new))
+    if start < common:
+        old_part, new_part = old.iloc[start:common], new.iloc[start:common]
+        same = old_part.index == new_part.index
+        if list(old.columns) == list(new.columns):
+            a, b = old_part.to_numpy(), new_part.to_numpy()
+            same &= ((a == b) | (pd.isna(a) & pd.isna(b))).all(axis=1)
+        else:
+            same[:] = False
+        changed = np.flatnonzero(~same)
+        if len(changed):
+            position = start + changed[0]
+            return min(old.index[position], new.index[position])
+
+    if len(old) == len(new):
+        return None
+    return (new if len(new) > len(old) else old).index[common]
+
+
+class BarStore:
+    """
+    1m taban + türetilmiş zaman dilimleri deposu.
+
+    Taban OHLCVCache'te (interval='1m') tutulur; türetilmiş tablolar
+    bellekte sembol + timeframe için saklanır ve taban değişmedikçe
+    yeniden hesaplanmaz.
+    """
+
+    def __init__(self, cache: Optional[OHLCVCache] = None):
+        """
+        Args:
+            cache: 1m tabanın saklandığı disk cache'i (None: sadece bellek)
+        """
+        self.cache = cache
+        self._base: Dict[str, Tuple[Any, pd.DataFrame]] = {}
+        # (sembol, timeframe) -> {'version', 'frame', 'changed_from', 'target'}
+        self._derived: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.counts = {'hit': 0, 'incremental': 0, 'full': 0}
+
+    @staticmethod
+    def _key(symbol: str) -> str:
+        symbol = symbol.strip().upper()
+        return symbol[:-3] if symbol.endswith('.IS') else symbol
+
+    @staticmethod
+    def _version(data: pd.DataFrame) -> Tuple[int, Any, Any, Optional[bytes]]:
+        """Tabanın sürüm anahtarı: (satır, ilk bar, son bar, son bar değerleri)"""
+        if data.empty:
+            return (0, None, None, None)
+        return (len(data), data.index[0], data.index[-1], _row_fingerprint(data, -1))
+
+    def ingest(self, symbol: str, bars: pd.DataFrame, persist: bool = True) -> pd.DataFrame:
+        """
+        Yeni 1m barları tabana ekler (aynı zamanlı barlarda yeni gelen kazanır).
+
+        Args:
+            symbol: Hisse kodu
+            bars: 1m barlar
+            persist: Birleşik tabanı disk cache'ine de yaz
+
+        Returns:
+            pd.DataFrame: Güncel taban
+        """
+        key = self._key(symbol)
+        if persist:
+            base = self.base(key, refresh=False)
+        else:
+            base = self._base.get(key, (None, None))[1]
+
+        if base is not None and not base.empty:
+            bars = bars.copy()
+            if base.index.tz is not None and bars.index.tz is not None:
+                bars.index = bars.index.tz_convert(base.index.tz)
+            merged = pd.concat([base, bars])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+            # Gelen ilk bardan önceki satırlar değişmez; karşılaştırma oradan başlar
+            start = base.index.searchsorted(bars.index.min()) if not bars.empty else len(base)
+            changed_from = _first_change(base, merged, start)
+        else:
+            merged = bars.sort_index()
+            changed_from = _first_change(None, merged)
+
+        version = None
+        if persist and self.cache is not None:
+            self.cache.save(key, merged, period='max', interval=BASE_INTERVAL)
+            version = self._disk_version(key)
+
+        with self._lock:
+            self._base[key] = (version, merged)
+            self._mark_changed(key, base, merged, changed_from)
+        return merged
+
+    def _mark_changed(self, key: str, old: Optional[pd.DataFrame], new: pd.DataFrame,
+                      changed_from: Optional[pd.Timestamp]) -> None:
+        """
+        Taban old -> new değiştiğinde türetilmiş tablolara değişen ilk barı işler (lock altında).
+
+        Tablo old tabandan (veya zaten işlenmiş bir önceki değişiklikten)
+        üretilmemişse değişiklik zinciri kopar ve tablo baştan hesaplanır.
+        """
+        if changed_from is None:
+            return
+
+        old_version = self._version(old) if old is not None else None
+        new_version = self._version(new)
+
+        for (symbol, _), entry in self._derived.items():
+            if symbol != key:
+                continue
+            known = entry.get('target') or entry['version']
+            if known != old_version:
+                entry['changed_from'], entry['target'] = None, None
+                continue
+            pending = entry.get('changed_from')
+            entry['changed_from'] = changed_from if pending is None else min(pending, changed_from)
+            entry['target'] = new_version
+
+    def _disk_version(self, key: str) -> Any:
+        """Disk tabanının meta bilgisinden sürüm anahtarı (Parquet açılmaz)"""
+        if self.cache is None:
+            return None
+        meta = self.cache.load_meta(key, BASE_INTERVAL)
+        if meta is None:
+            return None
+        return (meta.get('rows'), meta.get('first_bar'), meta.get('last_bar'),
+                meta.get('last_row'), meta.get('fetched_at'))
+
+    def base(self, symbol: str, refresh: bool = True, use_cache: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Sembolün 1m tabanını döndürür.
+
+        Args:
+            symbol: Hisse kodu
+            refresh: Önce fetch_stock_data ile tabanı güncelle
+                     (taze cache varsa ağ isteği yapılmaz, bayatsa sadece yeni barlar çekilir)
+            use_cache: False ise disk cache'i kullanılmaz, taban bellekte birikir
+
+        Returns:
+            pd.DataFrame: Birikmiş 1m barlar
+            None: Veri yoksa
+        """
+        key = self._key(symbol)
+
+        if refresh:
+            # Döngüsel import olmasın diye burada (fetcher -> cache)
+            from .fetcher import fetch_stock_data
+
+            if self.cache is None or not use_cache:
+                fresh = fetch_stock_data(key, period=BASE_PERIOD, interval=BASE_INTERVAL, use_cache=False)
+                if fresh is None or fresh.empty:
+                    return self._base.get(key, (None, None))[1]
+                return self.ingest(key, fresh, persist=False)
+
+            fresh = fetch_stock_data(key, period=BASE_PERIOD, interval=BASE_INTERVAL, cache=self.cache)
+            if fresh is None:
+                meta = self.cache.load_meta(key, BASE_INTERVAL)
+                if meta is not None:
+                    print(f"[UYARI] {key} 1m taban guncellenemedi, eski barlar kullaniliyor "
+                          f"(son bar: {meta.get('last_bar')})")
+
+        if self.cache is None:
+            return self._base.get(key, (None, None))[1]
+
+        # Disk tabanı değişmediyse bellektekini kullan
+        version = self._disk_version(key)
+        with self._lock:
+            cached = self._base.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        loaded = self.cache.load(key, BASE_INTERVAL)
+        if loaded is None:
+            return None
+
+        # Disk tabanı başka yoldan (fetch_stock_data ile ekleme) değişti: ilk farkı işle
+        previous = cached[1] if cached is not None else None
+        changed_from = _first_change(previous, loaded['data'])
+
+        with self._lock:
+            self._base[key] = (version, loaded['data'])
+            self._mark_changed(key, previous, loaded['data'], changed_from)
+        return loaded['data']
+
+    def resample(self, symbol: str, base: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+        """
+        Tabandan timeframe tablosunu üretir; mümkünse önceki sonucu artımlı günceller.
+
+        Args:
+            symbol: Hisse kodu (cache anahtarı)
+            base: 1m taban
+            timeframe: Hedef zaman dilimi
+
+        Returns:
+            pd.DataFrame: Türetilmiş barlar
+        """
+        if timeframe == BASE_INTERVAL:
+            return base
+
+        key = (self._key(symbol), timeframe)
+        version = self._version(base)
+
+        with self._lock:
+            entry = self._derived.get(key)
+
+        if entry is not None and entry['version'] == version:
+            with self._lock:
+                self.counts['hit'] += 1
+            return entry['frame']
+
+        # Taban bu tabloya kadar izlenen değişikliklerle geldiyse: değişen ilk
+        # barın bininden önce biten binler tutulur, o bin ve sonrası yeniden hesaplanır
+        changed_from = None
+        if entry is not None and entry.get('target') == version and not entry['frame'].empty:
+            changed_from = entry.get('changed_from')
+
+        frame, mode = None, 'full'
+        if changed_from is not None:
+            stamp = pd.DatetimeIndex([changed_from])
+            label = _bin_labels(_bin_keys(stamp, timeframe), timeframe, base.index)[0]
+            previous = entry['frame']
+            kept = previous.iloc[:previous.index.searchsorted(label)]
+            if len(kept):
+                tail = resample_ohlcv(base.iloc[base.index.searchsorted(label):], timeframe)
+                frame, mode = pd.concat([kept, tail]), 'incremental'
+
+        if frame is None:
+            frame = resample_ohlcv(base, timeframe)
+
+        with self._lock:
+            self._derived[key] = {'version': version, 'frame': frame}
+            self.counts[mode] += 1
+        return frame
+
+    def bars(self, symbol: str, timeframe: str = '15m', period: Optional[str] = None,
+             refresh: bool = True, use_cache: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Sembolün istenen zaman dilimindeki barlarını döndürür.
+
+        Args:
+            symbol: Hisse kodu
+            timeframe: '1m', '5m', '15m', '30m', '1h', '1d', '1wk'
+            period: Son N dönem ('5d', '1mo', ...). None: birikmiş tüm geçmiş
+            refresh: Önce 1m tabanı güncelle
+            use_cache: Disk cache'ini kullan
+
+        Returns:
+            pd.DataFrame: OHLCV barlar
+            None: Veri yoksa
+        """
+        if timeframe not in TIMEFRAMES:
+            raise ValueError(f"Gecersiz timeframe: {timeframe} (desteklenen: {', '.join(TIMEFRAMES)})")
+
+        base = self.base(symbol, refresh=refresh, use_cache=use_cache)
+        if base is None or base.empty:
+            return None
+
+        frame = self.resample(symbol, base, timeframe)
+        return slice_to_period(frame, period) if period else frame
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Bellekteki taban ve türetilmiş tabloları siler (disk cache'e dokunmaz)"""
+        with self._lock:
+            if symbol is None:
+                self._base.clear()
+                self._derived.clear()
+                return
+            key = self._key(symbol)
+            self._base.pop(key, None)
+            for derived_key in [k for k in self._derived if k[0] == key]:
+                del self._derived[derived_key]
+
+
+# Varsayılan (paylaşılan) depo
+_default_store: Optional[BarStore] = None
+_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """
+    Uygulama genelinde kullanılan varsayılan bar deposunu döndürür.
+
+    Returns:
+        BarStore: Varsayılan OHLCV cache'ini kullanan depo
+    """
+    global _default_store
+
+    with _store_lock:
+        if _default_store is None:
+            _default_store = BarStore(get_default_cache())
+        return _default_store
+
+
+def fetch_bars(symbol: str, timeframe: str = '15m', period: Optional[str] = None,
+               use_cache: bool = True) -> Optional[pd.DataFrame]:
+    """
+    Hisse barlarını istenen zaman diliminde döndürür (tek 1m taban üzerinden).
+
+    Args:
+        symbol: Hisse kodu (örn: 'THYAO')
+        timeframe: '1m', '5m', '15m', '30m', '1h', '1d', '1wk'
+        period: Son N dönem ('5d', '1mo', ...). None: birikmiş tüm geçmiş
+        use_cache: Disk cache'ini kullan
+
+    Returns:
+        pd.DataFrame: OHLCV barlar
+        None: Veri çekilemediyse
+
+    Örnek:
+        >>> hourly = fetch_bars('GARAN', '1h', period='5d')
+    """
+    return get_bar_store().bars(symbol, timeframe, period=period, use_cache=use_cache)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("COKLU ZAMAN DILIMI - TEST")
+    print("=" * 60)
+
+    # Sentetik 1m taban: 20 işlem günü, 10:00-18:00
+    rng = np.random.default_rng(0)
+    days = pd.bdate_range('2025-10-01', periods=20, tz='Europe/Istanbul')
+    index = pd.DatetimeIndex(np.concatenate([
+        (day + pd.Timedelta(hours=10) + pd.to_timedelta(np.arange(480), unit='min')).values
+        for day in days.tz_localize(None)
+    ])).tz_localize('Europe/Istanbul')
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, len(index))))
+    base = pd.DataFrame({
+        'Open': close, 'High': close * 1.001, 'Low': close * 0.999, 'Close': close,
+        'Volume': rng.integers(100, 10_000, len(index)).astype(float),
+    }, index=index)
+    print(f"\n[OK] Taban: {len(base)} adet 1m bar")
+
+    rules = {column: AGGREGATIONS[column] for column in base.columns}
+    pandas_rules = {'15m': '15min', '1h': '1h', '1d': '1D', '1wk': 'W-MON'}
+    for timeframe, rule in pandas_rules.items():
+        kwargs = {'label': 'left', 'closed': 'left'}
+        expected = base.resample(rule, **kwargs).agg(rules).dropna(subset=['Close'])
+        result = resample_ohlcv(base, timeframe)
+        print(f"  {timeframe:4}: {len(result):5} bar, pandas ile ayni: {result.equals(expected)}")
+
+    store = BarStore()
+    store.ingest('TEST', base.iloc[:-100])
+    store.bars('TEST', '15m', refresh=False)
+    start = time.perf_counter()
+    store.bars('TEST', '15m', refresh=False)
+    print(f"\n[CACHE] Tekrar istek: {(time.perf_counter() - start) * 1e6:.0f} µs")
+    store.ingest('TEST', base.iloc[-100:])
+    incremental = store.bars('TEST', '15m', refresh=False)
+    print(f"[OK] Artimli guncelleme tam hesapla ayni: {incremental.equals(resample_ohlcv(base, '15m'))}")
+
+    # Son bar yerinde düzeltilirse (satır sayısı ve zaman aynı) sonuç yenilenmeli
+    corrected = base.copy()
+    corrected.iloc[-1, corrected.columns.get_loc('Close')] *= 1.01
+    store.ingest('TEST', corrected.iloc[-1:])
+    updated = store.bars('TEST', '15m', refresh=False)
+    print(f"[OK] Son bar duzeltmesi sonrasi tam hesapla ayni: {updated.equals(resample_ohlcv(corrected, '15m'))}")
+    print(f"[OK] Sayaclar: {store.counts}")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
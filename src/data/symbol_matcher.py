@@ -0,0 +1,336 @@
+"""
+Bulanık Hisse Kodu Eşleştirici
+
+Serbest metinle girilen hisse kodlarını (yazım hatası, .IS uzantısı,
+şirket adı) bilinen BIST sembollerine çözer. İndeksler bir kez kurulur,
+sorgu başına sadece küçük bir aday kümesi taranır:
+
+    - Silme komşuluğu indeksi (symmetric delete): her sembolden en
+      fazla k harf silinerek oluşan varyantlar önceden saklanır. Sorgunun
+      varyantları bu tabloda aranır, bulunan birkaç aday düzenleme
+      mesafesi (ekleme/silme/değiştirme + yan yana harf yer değiştirme)
+      ile doğrulanır. Mesafesi k'yı aşmayan her sembol bulunur.
+      (4-6 harfli kodlarda BK-tree neredeyse tüm düğümleri gezdiği için
+      tercih edilmedi.)
+    - Trigram indeksi: şirket adlarında ('turk hava' -> THYAO) n-gram
+      benzerliği (Dice katsayısı) ile arama.
+
+Türkçe karakterler ASCII'ye katlanır ('TÜPRAŞ' == 'TUPRAS'), büyük/küçük
+harf farkı yoktur.
+
+Kullanım:
+    >>> from src.data.symbol_matcher import suggest_symbols, resolve_symbol
+    >>> suggest_symbols('THYA')
+    ['THYAO']
+    >>> resolve_symbol('garan.is')
+    'GARAN'
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from .bist_stocks import STOCK_NAMES, SYMBOL_SECTOR
+
+
+# Tek başına geçerli bir BIST kodu olabilecek biçim (4-5 harf, örn: SASA, THYAO)
+_TICKER_SHAPE = re.compile(r'[A-Z]{4,5}')
+
+# Türkçe harfleri ASCII karşılıklarına katlama tablosu
+_FOLD = str.maketrans('çÇğĞıİöÖşŞüÜâÂîÎûÛ', 'cCgGiIoOsSuUaAiIuU')
+
+
+def fold_text(text: str) -> str:
+    """Metni karşılaştırma anahtarına çevirir (Türkçe harf katlama + büyük harf)"""
+    return ' '.join(text.translate(_FOLD).upper().split())
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    İki metin arasındaki düzenleme mesafesi (optimal string alignment).
+
+    Ekleme, silme, değiştirme ve yan yana iki harfin yer değiştirmesi
+    ('THYOA' -> 'THYAO') birer işlem sayılır.
+
+    Args:
+        a, b: Karşılaştırılacak metinler
+        max_distance: Verilirse mesafe bunu aştığı anda max_distance + 1 döner
+
+    Returns:
+        int: Mesafe
+    """
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+
+    return previous[-1]
+
+
+def _deletes(word: str, depth: int) -> Set[str]:
+    """Kelimeden en fazla depth harf silinerek elde edilen tüm varyantlar (kendisi dahil)"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))} - variants
+        variants |= frontier
+    return variants
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Kelime sınırları işaretlenmiş trigram kümesi ('TAV' -> {' TA', 'TAV', 'AV '})"""
+    grams = set()
+    for token in text.split():
+        padded = f" {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SymbolMatcher:
+    """
+    Hisse kodu + şirket adı bulanık eşleştiricisi.
+
+    Args:
+        names: Sembol -> şirket adı (adı olmayan semboller için boş metin)
+        max_distance: İndeksin desteklediği en büyük düzenleme mesafesi
+
+    Örnek:
+        >>> matcher = SymbolMatcher({'THYAO': 'TÜRK HAVA YOLLARI', 'GARAN': 'GARANTİ BANKASI'})
+        >>> matcher.suggest('TYHAO')
+        ['THYAO']
+        >>> matcher.resolve('turk hava yollari')
+        'THYAO'
+    """
+
+    # Şirket adı eşleşmesi için en düşük Dice benzerliği
+    MIN_NAME_SIMILARITY = 0.4
+
+    # Tekrarlanan sorgular (API/tarayıcı) için sonuç cache boyutu
+    CACHE_SIZE = 4096
+
+    def __init__(self, names: Dict[str, str], max_distance: int = 2):
+        self.symbols = frozenset(names)
+        self.max_distance = max_distance
+        self._ranked = lru_cache(maxsize=self.CACHE_SIZE)(self._rank)
+
+        # Silme varyantı -> semboller
+        self._deletes: Dict[str, Set[str]] = {}
+        for symbol in self.symbols:
+            for variant in _deletes(symbol, max_distance):
+                self._deletes.setdefault(variant, set()).add(symbol)
+
+        # Katlanmış şirket adı -> sembol ve trigram -> semboller indeksleri
+        self._names: Dict[str, str] = {}
+        self._name_grams: Dict[str, Set[str]] = {}
+        self._gram_index: Dict[str, Set[str]] = {}
+        for symbol, name in names.items():
+            folded = fold_text(name)
+            if not folded:
+                continue
+            self._names.setdefault(folded, symbol)
+            grams = _trigrams(folded)
+            self._name_grams[symbol] = grams
+            for gram in grams:
+                self._gram_index.setdefault(gram, set()).add(symbol)
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Sorguyu karşılaştırma anahtarına çevirir ('thyao.is' -> 'THYAO')"""
+        query = fold_text(query)
+        return query[:-3] if query.endswith('.IS') else query
+
+    @staticmethod
+    def looks_like_ticker(query: str) -> bool:
+        """Normalize edilmiş sorgu tek başına bir BIST kodu olabilir mi (4-5 harf)"""
+        return bool(_TICKER_SHAPE.fullmatch(query))
+
+    def _symbol_matches(self, query: str, max_distance: int) -> Dict[str, int]:
+        """Düzenleme mesafesi max_distance'ı aşmayan semboller: sembol -> mesafe"""
+        max_distance = min(max_distance, self.max_distance)
+        candidates: Set[str] = set()
+        for variant in _deletes(query, max_distance):
+            candidates.update(self._deletes.get(variant, ()))
+
+        matches = {}
+        for symbol in candidates:
+            distance = edit_distance(query, symbol, max_distance)
+            if distance <= max_distance:
+                matches[symbol] = distance
+        return matches
+
+    def _name_matches(self, query: str) -> Dict[str, float]:
+        """Şirket adı eşleşmeleri: sembol -> maliyet (0: ad sorguyla başlıyor)"""
+        matches = {}
+        for name, symbol in self._names.items():
+            if name.startswith(query):
+                matches[symbol] = 0.0
+
+        grams = _trigrams(query)
+        if not grams:
+            return matches
+
+        # Sadece en az bir trigramı paylaşan adlar puanlanır
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for symbol in self._gram_index.get(gram, ()):
+                shared[symbol] = shared.get(symbol, 0) + 1
+
+        for symbol, count in shared.items():
+            dice = 2 * count / (len(grams) + len(self._name_grams[symbol]))
+            if dice >= self.MIN_NAME_SIMILARITY:
+                matches[symbol] = min(matches.get(symbol, 2.0), 2 * (1 - dice))
+        return matches
+
+    def ranked(self, query: str, max_distance: int = 2) -> List[Tuple[float, str]]:
+        """
+        Aday sembolleri maliyete göre sıralı döndürür.
+
+        Maliyet sembol için düzenleme mesafesi, şirket adı için
+        2 * (1 - Dice benzerliği) (ad sorguyla başlıyorsa 0) olur;
+        bir sembol için ikisinden küçüğü alınır.
+
+        Args:
+            query: Serbest metin (kod veya şirket adı)
+            max_distance: Sembolde izin verilen en büyük düzenleme mesafesi
+                          (indeksin max_distance'ı ile sınırlı)
+
+        Returns:
+            list: (maliyet, sembol) listesi; tam eşleşmede [(0, sembol)]
+        """
+        return list(self._ranked(self.normalize(query), max_distance))
+
+    def _rank(self, query: str, max_distance: int) -> Tuple[Tuple[float, str], ...]:
+        """ranked'ın cache'lenen çekirdeği (query normalize edilmiş)"""
+        if not query:
+            return ()
+        if query in self.symbols:
+            return ((0.0, query),)
+
+        costs: Dict[str, float] = {}
+        if ' ' not in query:
+            for symbol, distance in self._symbol_matches(query, max_distance).items():
+                costs[symbol] = float(distance)
+
+        for symbol, cost in self._name_matches(query).items():
+            costs[symbol] = min(costs.get(symbol, cost), cost)
+
+        return tuple(sorted((cost, symbol) for symbol, cost in costs.items()))
+
+    def suggest(self, query: str, max_results: int = 5, max_distance: int = 2) -> List[str]:
+        """
+        Sorguya en yakın sembolleri önerir (en yakın önce).
+
+        Örnek:
+            >>> get_symbol_matcher().suggest('GARNA')
+            ['GARAN']
+        """
+        return [symbol for _, symbol in self.ranked(query, max_distance)[:max_results]]
+
+    def resolve(self, query: str, max_distance: int = 1) -> Optional[str]:
+        """
+        Sorguyu etkileşimsiz olarak tek bir sembole çözer (toplu işler için).
+
+        Tam eşleşme, ya da maliyeti max_distance'ı aşmayan ve ikinciden
+        kesin olarak daha iyi olan tek aday varsa onu döndürür; belirsizse None.
+
+        Sorgu kendi başına geçerli bir kod biçimindeyse (4-5 harf) aynı
+        uzunlukta harf değiştirerek başka koda çözülmez: KRDMA / KRDMB
+        (KRDMD'nin diğer pay grupları) veya VAKFN (VAKBN değil, ayrı şirket)
+        listede olmayan gerçek hisseler olabilir. Eksik/fazla harf (THYA) ve
+        yan yana harf yer değiştirmesi (TYHAO) çözülür.
+
+        Örnek:
+            >>> get_symbol_matcher().resolve('THYA')
+            'THYAO'
+            >>> get_symbol_matcher().resolve('VAKFN') is None
+            True
+            >>> get_symbol_matcher().resolve('XYZ') is None
+            True
+        """
+        ranked = self.ranked(query, max_distance)
+        if not ranked or ranked[0][0] > max_distance:
+            return None
+        if len(ranked) > 1 and ranked[1][0] == ranked[0][0]:
+            return None
+
+        symbol = ranked[0][1]
+        query = self.normalize(query)
+        if (query != symbol and self.looks_like_ticker(query)
+                and len(query) == len(symbol) and sorted(query) != sorted(symbol)):
+            return None
+        return symbol
+
+
+_default_matcher: Optional[SymbolMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_symbol_matcher() -> SymbolMatcher:
+    """Bilinen tüm BIST sembolleri (liste + sektör tablosu) için ortak eşleştirici"""
+    global _default_matcher
+    with _matcher_lock:
+        if _default_matcher is None:
+            names = {symbol: '' for symbol in SYMBOL_SECTOR}
+            names.update(STOCK_NAMES)
+            _default_matcher = SymbolMatcher(names)
+        return _default_matcher
+
+
+def suggest_symbols(query: str, max_results: int = 5) -> List[str]:
+    """Ortak eşleştirici ile öneri listesi (bkz. SymbolMatcher.suggest)"""
+    return get_symbol_matcher().suggest(query, max_results)
+
+
+def resolve_symbol(query: str, max_distance: int = 1) -> Optional[str]:
+    """Ortak eşleştirici ile etkileşimsiz çözümleme (bkz. SymbolMatcher.resolve)"""
+    return get_symbol_matcher().resolve(query, max_distance)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("BULANIK HİSSE KODU EŞLEŞTİRİCİ - TEST")
+    print("=" * 60)
+
+    matcher = get_symbol_matcher()
+    print(f"\n[OK] {len(matcher.symbols)} sembol indekslendi")
+
+    queries = ['THYAO', 'thyao.is', 'THYA', 'TYHAO', 'GARNA', 'AKBANK', 'türk hava',
+               'tupras', 'ereğli', 'ASELSAN', 'XYZ', 'ISCTR', 'KRDMA', 'VAKFN']
+    print(f"\n{'SORGU':14} {'COZUM':8} ONERILER")
+    print("-" * 60)
+    for query in queries:
+        print(f"{query:14} {str(resolve_symbol(query)):8} {suggest_symbols(query)}")
+
+    print()
+    rounds = 200
+    for label, clear in (('soğuk (cache yok)', True), ('tekrar (cache)', False)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for query in queries:
+                if clear:
+                    matcher._ranked.cache_clear()
+                matcher.suggest(query)
+        elapsed = time.perf_counter() - start
+        print(f"[OK] {label}: sorgu başına ortalama {elapsed / (rounds * len(queries)) * 1e6:.1f} µs")
+
+    print("\n" + "=" * 60)
+    print("✅ TEST TAMAMLANDI!")
+    print("=" * 60)
@@ -5,16 +5,17 @@ Bu modül çeşitli teknik analiz göstergelerini hesaplar.
 Her gösterge ayrı modülde implement edilmiştir.
 """
 
-from .momentum import calculate_rsi, calculate_macd
-from .volatility import calculate_bollinger_bands
-from .trend import calculate_moving_averages
-from .volume import analyze_volume
-
-__all__ = [
-    'calculate_rsi',
-    'calculate_macd',
-    'calculate_bollinger_bands',
-    'calculate_moving_averages',
-    'analyze_volume'
-]
+from ..utils.lazy import lazy_exports
 
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.momentum': ['calculate_rsi', 'calculate_macd'],
+    '.volatility': ['calculate_bollinger_bands'],
+    '.trend': ['calculate_moving_averages'],
+    '.volume': ['analyze_volume'],
+    '.streaming': [
+        'EMAState', 'RollingMeanStd', 'RSIState', 'MACDState', 'BollingerState',
+        'MovingAverageState', 'VolumeState', 'StreamingIndicators'
+    ],
+    '.panel': ['build_panel', 'calculate_panel_indicators', 'panel_snapshot']
+})
@@ -11,7 +11,49 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Optional, Dict
 
+from .primitives import get_primitive_cache
+from .signals import SELL, HOLD_SELL, HOLD, HOLD_BUY, BUY, decode_signals, shift_rows
+from ..utils.profiling import profiled
 
+
+def wilder_smoothing(values, period: int = 14):
+    """
+    Wilder's Smoothing - tüm seriye tek seferde (vektörel) uygulanır.
+    
+    Klasik tanım:
+        avg[N-1] = ilk N değerin basit ortalaması (tohum)
+        avg[i]   = (avg[i-1] * (N - 1) + değer[i]) / N
+    
+    Bu özyineleme, alpha=1/N olan ve tohumdan başlayan bir EMA'ya
+    (ewm(alpha=1/N, adjust=False)) eşittir. Python döngüsü yerine
+    pandas'ın derlenmiş ewm motoru kullanıldığı için çok daha hızlıdır.
+    
+    Args:
+        values (pd.Series | pd.DataFrame): Smoothing uygulanacak değerler.
+            DataFrame verilirse her sütun ayrı seri olarak işlenir
+            (baştaki NaN'lar o sütunun henüz başlamadığını gösterir).
+        period (int): Smoothing periyodu (N)
+    
+    Returns:
+        pd.Series | pd.DataFrame: Girdi ile aynı şekilde smoothing sonucu
+                                  (tohumdan önceki satırlar NaN)
+    """
+    
+    # Tohum: ilk N değerin basit ortalaması
+    seed = values.rolling(window=period, min_periods=period).mean()
+    
+    # Tohumun ilk geçerli olduğu satırı bul (her sütun için ayrı)
+    seen = seed.notna().cumsum()
+    is_seed = seen == 1
+    after_seed = seen > 1
+    
+    # Tohum satırında ortalama, sonrasında ham değer, öncesinde NaN
+    recursive_input = values.where(after_seed).where(~is_seed, seed)
+    
+    return recursive_input.ewm(alpha=1.0 / period, adjust=False).mean()
+
+
+@profiled()
 def calculate_rsi(data: pd.DataFrame, period: int = 14, column: str = 'Close') -> pd.Series:
     """
     RSI (Relative Strength Index) - Göreceli Güç Endeksi
@@ -55,21 +97,16 @@ def calculate_rsi(data: pd.DataFrame, period: int = 14, column: str = 'Close') -
     """
     
     # Fiyat değişimlerini hesapla
-    delta = data[column].diff()
+    delta = get_primitive_cache().diff(data, column)
     
     # Kazanç ve kayıpları ayır
     gain = delta.where(delta > 0, 0)  # Pozitif değişimler
     loss = -delta.where(delta < 0, 0)  # Negatif değişimler (pozitif yapıyoruz)
     
     # Wilder's Smoothing (EMA benzeri ama farklı)
-    # İlk N günün ortalamasını al
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-    
-    # Sonraki günler için smoothing uygula
-    for i in range(period, len(data)):
-        avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (period - 1) + gain.iloc[i]) / period
-        avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (period - 1) + loss.iloc[i]) / period
+    # İlk N günün ortalaması tohum, sonrası alpha=1/N ile smoothing
+    avg_gain = wilder_smoothing(gain, period)
+    avg_loss = wilder_smoothing(loss, period)
     
     # RS (Relative Strength) hesapla
     rs = avg_gain / avg_loss
@@ -80,6 +117,7 @@ def calculate_rsi(data: pd.DataFrame, period: int = 14, column: str = 'Close') -
     return rsi
 
 
+@profiled()
 def calculate_macd(
     data: pd.DataFrame,
     fast: int = 12,
@@ -145,8 +183,10 @@ def calculate_macd(
     """
     
     # EMA (Exponential Moving Average) hesapla
-    ema_fast = data[column].ewm(span=fast, adjust=False).mean()
-    ema_slow = data[column].ewm(span=slow, adjust=False).mean()
+    # (Aynı frame için daha önce hesaplandıysa paylaşılan cache'ten gelir)
+    primitives = get_primitive_cache()
+    ema_fast = primitives.ema(data, fast, column)
+    ema_slow = primitives.ema(data, slow, column)
     
     # MACD Line = Hızlı EMA - Yavaş EMA
     macd_line = ema_fast - ema_slow
@@ -303,6 +343,120 @@ def interpret_macd(macd: float, signal: float, histogram: float,
     }
 
 
+def rsi_signal_codes(
+    rsi: np.ndarray,
+    oversold: float = 30,
+    overbought: float = 70
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    interpret_rsi eşiklerinin dizi versiyonu (1 boyutlu seri veya bar x hisse panel).
+    
+    Args:
+        rsi (np.ndarray): RSI değerleri
+        oversold (float): Aşırı satım eşiği (interpret_rsi: 30)
+        overbought (float): Aşırı alım eşiği (interpret_rsi: 70)
+    
+    Returns:
+        tuple: (sinyal kodları, güç) - kodlar için bkz. signals.py
+    """
+    
+    values = np.asarray(rsi, dtype=float)
+    
+    # Sıra önemli: interpret_rsi'deki if/elif sırası (NaN hiçbirine uymaz -> HOLD, 0)
+    conditions = [values >= overbought, values <= oversold, values > 55, values < 45]
+    codes = np.select(conditions, [SELL, BUY, HOLD_BUY, HOLD_SELL], default=HOLD)
+    strength = np.select(conditions, [
+        np.minimum(100, (values - overbought) * 3),
+        np.minimum(100, (oversold - values) * 3),
+        (values - 50) * 2,
+        (50 - values) * 2
+    ], default=0)
+    
+    return codes, np.trunc(strength).astype(int)  # int() ile aynı (sıfıra doğru)
+
+
+def interpret_rsi_series(rsi: pd.Series) -> pd.DataFrame:
+    """
+    interpret_rsi'nin tüm seriye vektörel uygulanmış hali (backtest için).
+    
+    Her bar için interpret_rsi ile aynı sinyal ve gücü üretir,
+    Python döngüsü yerine np.select ile eşik karşılaştırması yapar.
+    
+    Args:
+        rsi (pd.Series): RSI serisi (calculate_rsi çıktısı)
+    
+    Returns:
+        pd.DataFrame: 'signal' ve 'strength' sütunları (index = rsi.index)
+    
+    Örnek:
+        >>> signals = interpret_rsi_series(calculate_rsi(data))
+        >>> print(signals['signal'].value_counts())
+    """
+    
+    codes, strength = rsi_signal_codes(rsi.to_numpy(dtype=float))
+    
+    return pd.DataFrame({'signal': decode_signals(codes), 'strength': strength}, index=rsi.index)
+
+
+def macd_signal_codes(
+    macd: np.ndarray,
+    signal: np.ndarray,
+    histogram: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    interpret_macd'nin dizi versiyonu (1 boyutlu seri veya bar x hisse panel).
+    
+    Kesişim tespiti için bir önceki barın MACD/Signal değerleri kullanılır
+    (analyze_stock'taki prev_macd/prev_signal ile aynı).
+    
+    Returns:
+        tuple: (sinyal kodları, güç, kesişim: +1 bullish / -1 bearish / 0)
+    """
+    
+    macd_v = np.asarray(macd, dtype=float)
+    signal_v = np.asarray(signal, dtype=float)
+    prev_macd = shift_rows(macd_v)
+    prev_signal = shift_rows(signal_v)
+    
+    has_data = ~(np.isnan(macd_v) | np.isnan(signal_v))
+    bullish = has_data & (macd_v > signal_v) & (prev_macd <= prev_signal)
+    bearish = has_data & (macd_v < signal_v) & (prev_macd >= prev_signal)
+    above = has_data & (macd_v > signal_v)
+    
+    trend_strength = np.minimum(50, np.abs(np.asarray(histogram, dtype=float)) * 10)
+    
+    conditions = [bullish, bearish, above, has_data]
+    codes = np.select(conditions, [BUY, SELL, HOLD_BUY, HOLD_SELL], default=HOLD)
+    strength = np.select(conditions, [80, 80, trend_strength, trend_strength], default=0)
+    crossover = bullish.astype(int) - bearish.astype(int)
+    
+    return codes, np.trunc(strength).astype(int), crossover
+
+
+def interpret_macd_series(macd: pd.Series, signal: pd.Series, histogram: pd.Series) -> pd.DataFrame:
+    """
+    interpret_macd'nin tüm seriye vektörel uygulanmış hali (backtest için).
+    
+    Args:
+        macd (pd.Series): MACD çizgisi
+        signal (pd.Series): Sinyal çizgisi
+        histogram (pd.Series): Histogram
+    
+    Returns:
+        pd.DataFrame: 'signal', 'strength' ve 'crossover' sütunları
+    """
+    
+    codes, strength, crossover = macd_signal_codes(
+        macd.to_numpy(dtype=float), signal.to_numpy(dtype=float), histogram.to_numpy(dtype=float)
+    )
+    
+    return pd.DataFrame({
+        'signal': decode_signals(codes),
+        'strength': strength,
+        'crossover': np.select([crossover > 0, crossover < 0], ['BULLISH', 'BEARISH'], default=None)
+    }, index=macd.index)
+
+
 # Test fonksiyonu
 if __name__ == "__main__":
     print("=" * 60)
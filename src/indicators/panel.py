@@ -0,0 +1,371 @@
+"""
+Kesitsel (Cross-Sectional) Panel Gösterge Motoru
+
+Bu modüldeki fonksiyonlar tek bir hissenin DataFrame'i yerine
+(bar sayısı x hisse sayısı) boyutunda bir fiyat paneli alır ve
+tüm hisseler için göstergeleri tek vektörel geçişte (axis 0 boyunca) hesaplar:
+
+- panel_rsi: Wilder's RSI
+- panel_macd: MACD, sinyal ve histogram
+- panel_bollinger_bands: Bollinger bantları
+- panel_moving_averages: SMA / EMA
+- panel_volume: Hacim oranı ve fiyat değişimi
+- calculate_panel_indicators: Hepsi bir arada
+- panel_snapshot: Her hissenin son değerleri (tarama tablosu)
+
+Panel Formatı:
+    Satırlar tarih (bar), sütunlar hisse kodu. Farklı tarihlerde işlem
+    görmeye başlayan hisselerin baştaki değerleri NaN olabilir; sonuçlar
+    her sütun için tek hisse fonksiyonlarıyla (calculate_rsi, ...) aynıdır.
+
+    Birleşim indeksinde aradaki / sondaki boşluklar (işlem durdurma, diğer
+    hisselerin işlem gördüğü bir günde bar olmaması) pencereleri kaydırır.
+    Bu yüzden boşluklu sütunlar kendi barlarıyla (dropna) ayrıca hesaplanıp
+    panele geri yerleştirilir; boşluk satırları NaN kalır. Boşluksuz
+    sütunlar tek vektörel geçişte hesaplanır.
+
+Örnek:
+    >>> from src.data.fetcher import get_multiple_stocks
+    >>> stocks = get_multiple_stocks(get_stock_list('BIST100'), period='1y')
+    >>> close = build_panel(stocks, 'Close')
+    >>> volume = build_panel(stocks, 'Volume')
+    >>> table = panel_snapshot(calculate_panel_indicators(close, volume))
+    >>> print(table.sort_values('rsi').head(10))
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Tuple, Optional, Union
+
+from .momentum import wilder_smoothing
+
+
+PanelLike = Union[pd.DataFrame, np.ndarray]
+
+
+def _as_panel(values: PanelLike) -> pd.DataFrame:
+    """NumPy dizisini (n_bars, n_symbols) DataFrame'e çevirir"""
+    if isinstance(values, pd.DataFrame):
+        return values.astype(float)
+
+    array = np.asarray(values, dtype=float)
+    if array.ndim == 1:
+        array = array[:, None]
+    return pd.DataFrame(array)
+
+
+def _gap_columns(*panels: pd.DataFrame) -> List:
+    """İlk barından sonra boşluğu (NaN) olan sütunlar"""
+    valid = panels[0].notna()
+    for panel in panels[1:]:
+        valid &= panel.notna()
+    gapped = (valid.cummax() & ~valid).any()
+    return list(panels[0].columns[gapped.to_numpy()])
+
+
+def _place(result, own, symbol, index: pd.Index) -> None:
+    """Tek hisse sonucunu (DataFrame / tuple / dict) paneldeki sütununa yazar"""
+    if isinstance(own, pd.DataFrame):
+        result[symbol] = own.iloc[:, 0].reindex(index)
+    elif isinstance(own, dict):
+        for key, value in own.items():
+            _place(result[key], value, symbol, index)
+    else:
+        for target, value in zip(result, own):
+            _place(target, value, symbol, index)
+
+
+def _gap_safe(compute, *panels: pd.DataFrame):
+    """
+    compute(*paneller) sonucunu boşluklu sütunlar için düzeltir.
+
+    Boşluklu her sütun, tüm panellerde değeri olan satırlarıyla (tek hisse
+    DataFrame'inde dropna sonrası olduğu gibi) ayrıca hesaplanır.
+    """
+    result = compute(*panels)
+
+    for symbol in _gap_columns(*panels):
+        own = pd.concat([panel[symbol] for panel in panels], axis=1).dropna()
+        columns = [own.iloc[:, [i]] for i in range(len(panels))]
+        _place(result, compute(*columns), symbol, panels[0].index)
+
+    return result
+
+
+def build_panel(stocks: Dict[str, pd.DataFrame], column: str = 'Close') -> pd.DataFrame:
+    """
+    Hisse bazlı DataFrame'lerden tarih x hisse paneli oluşturur.
+
+    Args:
+        stocks: {hisse_kodu: fiyat DataFrame'i} (get_multiple_stocks çıktısı)
+        column: Panele alınacak sütun ('Close', 'Volume', ...)
+
+    Returns:
+        pd.DataFrame: Satırlar tarih (birleşim), sütunlar hisse kodu
+    """
+    columns = {
+        symbol: data[column]
+        for symbol, data in stocks.items()
+        if data is not None and column in data.columns
+    }
+
+    if not columns:
+        return pd.DataFrame()
+
+    return pd.concat(columns, axis=1).sort_index()
+
+
+def panel_rsi(close: PanelLike, period: int = 14) -> pd.DataFrame:
+    """
+    Tüm hisseler için RSI (calculate_rsi ile aynı).
+
+    Args:
+        close: Kapanış paneli (bar x hisse)
+        period: RSI periyodu
+
+    Returns:
+        pd.DataFrame: RSI paneli
+    """
+    return _gap_safe(lambda c: _rsi(c, period), _as_panel(close))
+
+
+def _rsi(close: pd.DataFrame, period: int) -> pd.DataFrame:
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    # Hisse işlem görmeye başlamadan önceki satırlar NaN kalmalı,
+    # yoksa 0 kazanç/kayıp tohum ortalamasına girer
+    started = close.notna().cummax()
+    gain = gain.where(started)
+    loss = loss.where(started)
+
+    avg_gain = wilder_smoothing(gain, period)
+    avg_loss = wilder_smoothing(loss, period)
+
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def panel_macd(
+    close: PanelLike,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Tüm hisseler için MACD (calculate_macd ile aynı).
+
+    Returns:
+        tuple: (macd, signal, histogram) panelleri
+    """
+    return _gap_safe(lambda c: _macd(c, fast, slow, signal), _as_panel(close))
+
+
+def _macd(close: pd.DataFrame, fast: int, slow: int, signal: int):
+    ema_fast = close.ewm(span=fast, adjust=False).mean()
+    ema_slow = close.ewm(span=slow, adjust=False).mean()
+    macd_line = ema_fast - ema_slow
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def panel_bollinger_bands(
+    close: PanelLike,
+    period: int = 20,
+    std_dev: float = 2.0
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Tüm hisseler için Bollinger bantları (calculate_bollinger_bands ile aynı).
+
+    Returns:
+        tuple: (upper, middle, lower) panelleri
+    """
+    return _gap_safe(lambda c: _bollinger(c, period, std_dev), _as_panel(close))
+
+
+def _bollinger(close: pd.DataFrame, period: int, std_dev: float):
+    rolling = close.rolling(window=period)
+    middle = rolling.mean()
+    width = rolling.std() * std_dev
+
+    return middle + width, middle, middle - width
+
+
+def panel_moving_averages(
+    close: PanelLike,
+    periods: List[int] = [20, 50, 200],
+    ma_type: str = 'SMA'
+) -> Dict[int, pd.DataFrame]:
+    """
+    Tüm hisseler için hareketli ortalamalar (calculate_moving_averages ile aynı).
+
+    Returns:
+        dict: {period: MA paneli}
+    """
+    if ma_type.upper() == 'SMA':
+        compute = lambda c: {p: c.rolling(window=p).mean() for p in periods}
+    elif ma_type.upper() == 'EMA':
+        compute = lambda c: {p: c.ewm(span=p, adjust=False).mean() for p in periods}
+    else:
+        raise ValueError(f"MA type '{ma_type}' gecersiz. 'SMA' veya 'EMA' kullanin.")
+
+    return _gap_safe(compute, _as_panel(close))
+
+
+def panel_volume(
+    close: PanelLike,
+    volume: PanelLike,
+    avg_period: int = 20
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tüm hisseler için hacim oranı ve fiyat değişimi (analyze_volume girdileri).
+
+    Returns:
+        dict: {'avg_volume', 'volume_ratio', 'price_change_pct'} panelleri
+    """
+    return _gap_safe(lambda c, v: _volume(c, v, avg_period), _as_panel(close), _as_panel(volume))
+
+
+def _volume(close: pd.DataFrame, volume: pd.DataFrame, avg_period: int) -> Dict[str, pd.DataFrame]:
+    avg_volume = volume.rolling(window=avg_period).mean()
+    # Ortalama 0 veya NaN ise oran 1 (analyze_volume ile aynı)
+    volume_ratio = (volume / avg_volume).where(avg_volume > 0, 1.0)
+
+    previous = close.shift(1)
+    price_change_pct = ((close - previous) / previous) * 100
+
+    return {
+        'avg_volume': avg_volume,
+        'volume_ratio': volume_ratio,
+        'price_change_pct': price_change_pct
+    }
+
+
+def calculate_panel_indicators(
+    close: PanelLike,
+    volume: Optional[PanelLike] = None,
+    rsi_period: int = 14,
+    bb_period: int = 20,
+    bb_std: float = 2.0,
+    ma_periods: List[int] = [20, 50, 200],
+    volume_period: int = 20
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tüm göstergeleri tüm hisseler için tek seferde hesaplar.
+
+    Args:
+        close: Kapanış paneli (bar x hisse)
+        volume: Hacim paneli (opsiyonel, aynı şekilde)
+        rsi_period: RSI periyodu
+        bb_period: Bollinger periyodu
+        bb_std: Bollinger standart sapma çarpanı
+        ma_periods: SMA periyotları
+        volume_period: Ortalama hacim periyodu
+
+    Returns:
+        dict: Gösterge adı -> panel ('rsi', 'macd', 'macd_signal',
+              'macd_histogram', 'bb_upper', 'bb_middle', 'bb_lower',
+              'ma_20', ..., 'volume_ratio', 'price_change_pct')
+    """
+    close = _as_panel(close)
+
+    result = {'close': close, 'rsi': panel_rsi(close, rsi_period)}
+
+    macd, signal, histogram = panel_macd(close)
+    result.update({'macd': macd, 'macd_signal': signal, 'macd_histogram': histogram})
+
+    upper, middle, lower = panel_bollinger_bands(close, bb_period, bb_std)
+    result.update({'bb_upper': upper, 'bb_middle': middle, 'bb_lower': lower})
+
+    for period, ma in panel_moving_averages(close, ma_periods).items():
+        result[f'ma_{period}'] = ma
+
+    if volume is not None:
+        result.update(panel_volume(close, volume, volume_period))
+
+    return result
+
+
+def panel_snapshot(indicators: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Her hissenin son bar değerlerini tabloya çevirir (tarama için).
+
+    Son bar hisse bazında seçilir: birleşim indeksinin son gününde barı
+    olmayan hissenin değerleri kendi son kapanış satırından alınır.
+
+    Args:
+        indicators: calculate_panel_indicators çıktısı
+
+    Returns:
+        pd.DataFrame: Satırlar hisse, sütunlar gösterge
+    """
+    close = indicators['close']
+    valid = close.notna().to_numpy()
+
+    # Her sütunun son geçerli satırı (hiç verisi olmayan sütunda son satır, değerler NaN)
+    rows = len(close) - 1 - valid[::-1].argmax(axis=0)
+    columns = np.arange(close.shape[1])
+
+    return pd.DataFrame({
+        name: pd.Series(panel.to_numpy()[rows, columns], index=panel.columns)
+        for name, panel in indicators.items()
+    })
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+    from src.indicators.momentum import calculate_rsi, calculate_macd
+    from src.indicators.volatility import calculate_bollinger_bands
+    from src.indicators.trend import calculate_moving_averages
+
+    print("=" * 60)
+    print("PANEL GOSTERGE MOTORU - TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(3)
+    n_bars, n_symbols = 1000, 100
+    index = pd.date_range('2022-01-03', periods=n_bars, freq='B')
+    close = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_bars, n_symbols)), axis=0)),
+        index=index, columns=[f"HISSE{i}" for i in range(n_symbols)]
+    )
+    # Sonradan halka arz olan, işlemi durdurulan ve son gün barı olmayan hisseler
+    close.iloc[:300, 0] = np.nan
+    close.iloc[500:510, 1] = np.nan
+    close.iloc[-1, 2] = np.nan
+    volume = pd.DataFrame(rng.integers(1e5, 5e6, (n_bars, n_symbols)).astype(float),
+                          index=index, columns=close.columns)
+
+    start = time.perf_counter()
+    indicators = calculate_panel_indicators(close, volume)
+    panel_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    max_diff = 0.0
+    for symbol in close.columns:
+        single = pd.DataFrame({'Close': close[symbol], 'Volume': volume[symbol]}).dropna()
+        rsi = calculate_rsi(single)
+        macd, _, _ = calculate_macd(single)
+        upper, _, _ = calculate_bollinger_bands(single)
+        ma200 = calculate_moving_averages(single)[200]
+        for name, series in [('rsi', rsi), ('macd', macd), ('bb_upper', upper), ('ma_200', ma200)]:
+            diff = (indicators[name][symbol].loc[single.index] - series).abs().max()
+            max_diff = max(max_diff, float(np.nan_to_num(diff)))
+    loop_time = time.perf_counter() - start
+
+    print(f"\n{n_symbols} hisse x {n_bars} bar")
+    print(f"  Panel motoru:      {panel_time * 1000:8.1f} ms")
+    print(f"  Hisse hisse dongu: {loop_time * 1000:8.1f} ms")
+    print(f"  Max fark:          {max_diff:.2e}")
+
+    table = panel_snapshot(indicators)
+    print(f"  Son gun bari olmayan HISSE2 RSI: {table.loc['HISSE2', 'rsi']:.2f} "
+          f"(tek hisse: {calculate_rsi(close[['HISSE2']].dropna().rename(columns={'HISSE2': 'Close'})).iloc[-1]:.2f})")
+    print("\nEn dusuk RSI'li 5 hisse:")
+    print(table.sort_values('rsi')[['close', 'rsi', 'macd', 'volume_ratio']].head().round(2))
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
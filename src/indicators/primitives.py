@@ -0,0 +1,237 @@
+"""
+Ortak Gösterge Primitifleri (Paylaşılan Ara Hesaplar)
+
+Göstergelerin çoğu aynı temel hesaplardan türetilir:
+- SMA(n): Bollinger orta bandı, MA(20/50/200), ortalama hacim
+- EMA(n): MACD hızlı/yavaş çizgileri, EMA'lar
+- Rolling std(n): Bollinger bant genişliği
+- diff: RSI kazanç/kayıpları
+
+Bu modül her primitifi bir DataFrame için BİR KEZ hesaplar ve aynı
+frame'i kullanan tüm göstergelerle paylaşır. Örneğin analyze_stock
+içinde SMA(20) hem Bollinger hem MA analizinde kullanılır ama tek kez
+hesaplanır. Yeni gösterge eklemek sadece yeni primitifler kadar maliyet getirir.
+
+Cache Anahtarı:
+    - Frame kimliği: id(data) + weakref (frame silinince kayıt da silinir)
+    - Sütun versiyonu: (uzunluk, ilk/son index, değer + index CRC32) -
+      yeni bar, güncellenen son bar veya geçmişte yerinde değişen bir
+      değer eski sonuçları geçersiz kılar
+
+Not:
+    Dönen Series cache'teki sonucun kopyasıdır; üzerinde yapılan
+    değişiklik sonraki çağrıları etkilemez.
+
+Örnek:
+    >>> from src.indicators.primitives import get_primitive_cache
+    >>> cache = get_primitive_cache()
+    >>> sma20 = cache.sma(data, 20)       # Hesaplanır
+    >>> sma20 = cache.sma(data, 20)       # Cache'ten gelir
+    >>> print(cache.stats())
+"""
+
+import threading
+import weakref
+import zlib
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class PrimitiveCache:
+    """Frame bazlı primitif hesap cache'i (thread-safe)"""
+
+    def __init__(self):
+        # id(frame) -> {'ref': weakref, 'columns': {column: (version, {key: sonuç})}}
+        self._frames: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _checksum(values: np.ndarray) -> int:
+        """Dizinin içerik CRC32'si (5000 bar için birkaç mikrosaniye)"""
+        values = np.asarray(values)
+        if values.dtype == object:
+            return hash(tuple(values))
+        return zlib.crc32(np.ascontiguousarray(values).view(np.uint8))
+
+    @classmethod
+    def _version(cls, series: pd.Series) -> Tuple:
+        """Sütun versiyonu (yeni bar, güncellenen veya geçmişte değişen bar tespiti için)"""
+        if len(series) == 0:
+            return (0,)
+        return (len(series), series.index[0], series.index[-1],
+                cls._checksum(series.to_numpy()), cls._checksum(series.index.values))
+
+    def _forget(self, frame_id: int) -> None:
+        """Frame çöpe gidince kaydını siler (weakref callback)"""
+        # Kilit alınmaz: GC, kilit tutulurken (örn. _column_store içinde) aynı
+        # thread'de callback'i çalıştırabilir; dict.pop tek başına atomiktir
+        self._frames.pop(frame_id, None)
+
+    def _column_store(self, data: pd.DataFrame, column: str) -> Optional[Dict[Hashable, Any]]:
+        """Frame + sütun için geçerli sonuç sözlüğünü döndürür"""
+        series = data[column]
+        version = self._version(series)
+        frame_id = id(data)
+
+        with self._lock:
+            entry = self._frames.get(frame_id)
+
+            # Aynı id başka (yeni) bir frame'e ait olabilir
+            if entry is None or entry['ref']() is not data:
+                entry = {
+                    'ref': weakref.ref(data, lambda _, fid=frame_id: self._forget(fid)),
+                    'columns': {}
+                }
+                self._frames[frame_id] = entry
+
+            stored = entry['columns'].get(column)
+            if stored is None or stored[0] != version:
+                stored = (version, {})
+                entry['columns'][column] = stored
+
+            return stored[1]
+
+    def compute(
+        self,
+        data: pd.DataFrame,
+        column: str,
+        key: Hashable,
+        builder: Callable[[pd.Series], Any]
+    ) -> Any:
+        """
+        Primitifi cache'ten döndürür, yoksa hesaplayıp saklar.
+
+        Args:
+            data: Fiyat verileri
+            column: Kullanılan sütun
+            key: Primitif anahtarı (örn: ('sma', 20))
+            builder: Sütun Series'inden sonucu üreten fonksiyon
+
+        Returns:
+            Hesaplanan (veya cache'teki) sonucun kopyası
+        """
+        try:
+            store = self._column_store(data, column)
+        except TypeError:
+            # weakref desteklemeyen nesneler: cache'siz hesapla
+            return builder(data[column])
+
+        with self._lock:
+            cached = store.get(key)
+            if cached is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if cached is None:
+            # Hesap kilit dışında; aynı anda hesaplayan iki thread'den ilki saklanır
+            result = builder(data[column])
+            with self._lock:
+                cached = store.setdefault(key, result)
+
+        return cached.copy()
+
+    def sma(self, data: pd.DataFrame, period: int, column: str = 'Close') -> pd.Series:
+        """Basit hareketli ortalama - rolling(period).mean()"""
+        return self.compute(data, column, ('sma', period),
+                            lambda s: s.rolling(window=period).mean())
+
+    def ema(self, data: pd.DataFrame, span: int, column: str = 'Close') -> pd.Series:
+        """Üstel hareketli ortalama - ewm(span, adjust=False).mean()"""
+        return self.compute(data, column, ('ema', span),
+                            lambda s: s.ewm(span=span, adjust=False).mean())
+
+    def std(self, data: pd.DataFrame, period: int, column: str = 'Close') -> pd.Series:
+        """Kayan standart sapma - rolling(period).std()"""
+        return self.compute(data, column, ('std', period),
+                            lambda s: s.rolling(window=period).std())
+
+    def diff(self, data: pd.DataFrame, column: str = 'Close') -> pd.Series:
+        """Bir önceki bara göre fark - diff()"""
+        return self.compute(data, column, ('diff',), lambda s: s.diff())
+
+    def clear(self) -> None:
+        """Tüm cache'i temizler"""
+        with self._lock:
+            self._frames.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Cache istatistikleri"""
+        with self._lock:
+            return {'frames': len(self._frames), 'hits': self.hits, 'misses': self.misses}
+
+
+# Paylaşılan varsayılan cache
+_default_cache = PrimitiveCache()
+
+
+def get_primitive_cache() -> PrimitiveCache:
+    """
+    Tüm göstergelerin paylaştığı primitif cache'ini döndürür.
+
+    Returns:
+        PrimitiveCache: Varsayılan cache
+    """
+    return _default_cache
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import gc
+    import time
+    import numpy as np
+    from src.analysis.technical import analyze_stock
+    # python -m ile çalıştırınca göstergelerin kullandığı asıl modül örneği
+    from src.indicators.primitives import get_primitive_cache
+
+    print("=" * 60)
+    print("ORTAK PRIMITIF CACHE - TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(5)
+    n = 5000
+    index = pd.date_range('2005-01-03', periods=n, freq='B')
+    data = pd.DataFrame({
+        'Close': 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))),
+        'Volume': rng.integers(100_000, 5_000_000, n).astype(float)
+    }, index=index)
+
+    cache = get_primitive_cache()
+    cache.clear()
+
+    start = time.perf_counter()
+    analyze_stock(data, 'TEST')
+    first = time.perf_counter() - start
+    print(f"\nIlk analiz:   {first * 1000:6.1f} ms | {cache.stats()}")
+
+    start = time.perf_counter()
+    analyze_stock(data, 'TEST')
+    second = time.perf_counter() - start
+    print(f"Ikinci analiz: {second * 1000:6.1f} ms | {cache.stats()}")
+
+    # Yeni bar eklenince eski sonuçlar kullanılmamalı
+    data.loc[index[-1] + pd.offsets.BDay()] = [data['Close'].iloc[-1] * 1.01, 1_000_000.0]
+    sma = cache.sma(data, 20)
+    expected = data['Close'].rolling(window=20).mean()
+    print(f"\nYeni bar sonrasi SMA20 dogru: {sma.equals(expected)}")
+
+    # Geçmişte yerinde değişen değer ve dönen sonucun değiştirilmesi
+    sma.iloc[-1] = -1.0
+    data.iloc[100, 0] *= 1.05
+    sma = cache.sma(data, 20)
+    expected = data['Close'].rolling(window=20).mean()
+    print(f"Gecmis bar degisince / sonuc degistirilince SMA20 dogru: {sma.equals(expected)}")
+
+    del data
+    gc.collect()
+    print(f"Frame silindikten sonra: {cache.stats()}")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
@@ -0,0 +1,50 @@
+"""
+Sayısal Sinyal Kodları
+
+Vektörel yorumlama fonksiyonları (interpret_*_series ve *_signal_codes)
+sinyalleri önce sayı olarak üretir, gerektiğinde metne çevirir:
+
+    -2 = SELL, -1 = HOLD_SELL, 0 = HOLD, 1 = HOLD_BUY, 2 = BUY
+
+Kodun işareti sinyal yönünü verir (generate_signals'taki 'BUY' / 'SELL'
+içerir kontrolü ile aynı). Böylece optimizasyon gibi binlerce kez
+tekrarlanan hesaplar metin karşılaştırması yapmadan çalışır.
+"""
+
+import numpy as np
+
+
+SIGNAL_NAMES = np.array(['SELL', 'HOLD_SELL', 'HOLD', 'HOLD_BUY', 'BUY'])
+
+SELL, HOLD_SELL, HOLD, HOLD_BUY, BUY = -2, -1, 0, 1, 2
+
+
+def decode_signals(codes: np.ndarray) -> np.ndarray:
+    """
+    Sayısal sinyal kodlarını metne çevirir.
+
+    Args:
+        codes: -2..2 arası kodlar (herhangi bir boyutta)
+
+    Returns:
+        np.ndarray: 'SELL'..'BUY' metinleri (aynı boyutta)
+    """
+    return SIGNAL_NAMES[np.asarray(codes, dtype=int) + 2]
+
+
+def signal_direction(codes: np.ndarray) -> np.ndarray:
+    """Kodun yönü: +1 (alım), -1 (satım), 0 (nötr)"""
+    return np.sign(codes)
+
+
+def shift_rows(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """
+    Diziyi 0. eksende (zaman) kaydırır, boşalan satırları NaN yapar.
+
+    1 boyutlu seri veya (bar x hisse) panel için pd.Series.shift ile aynıdır.
+    """
+    values = np.asarray(values, dtype=float)
+    shifted = np.full(values.shape, np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[:len(values) - periods]
+    return shifted
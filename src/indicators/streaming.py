@@ -0,0 +1,533 @@
+"""
+Artımlı (Streaming) Gösterge Durumları
+
+Bu modül canlı barlar için durum tutan gösterge nesnelerini içerir.
+Batch fonksiyonlar (calculate_rsi, calculate_macd, ...) her yeni barda
+tüm DataFrame'i baştan hesaplar. Buradaki nesneler ise sadece son durumu
+saklar ve her yeni bar için O(1) güncelleme yapar:
+
+- EMAState: Üstel hareketli ortalama (ewm(span, adjust=False) ile aynı)
+- RollingMeanStd: Kayan pencere ortalama + standart sapma (rolling().mean()/std() ile aynı)
+- RSIState: Wilder's RSI (calculate_rsi ile aynı)
+- MACDState: MACD, sinyal ve histogram (calculate_macd ile aynı)
+- BollingerState: Bollinger bantları (calculate_bollinger_bands ile aynı)
+- MovingAverageState: Çoklu SMA/EMA (calculate_moving_averages ile aynı)
+- VolumeState: Hacim oranı ve fiyat değişimi (analyze_volume ile aynı)
+- StreamingIndicators: Bir hisse için hepsini bir arada tutan sınıf
+
+Sayısal Uyumluluk:
+    Güncelleme formülleri pandas'ın kendi iç algoritmalarıyla aynı sırada
+    yapılır (ewm ağırlık normalizasyonu, rolling için Kahan toplamı ve
+    Welford varyansı). Bu sayede sonuçlar batch fonksiyonlarla birebir
+    (aynı float değerleri) çıkar.
+
+Örnek:
+    >>> state = StreamingIndicators()
+    >>> state.warm_up(data)                 # Geçmiş barlarla ısıt
+    >>> values = state.update(close=312.5, volume=1_250_000)
+    >>> print(values['rsi'], values['macd'])
+"""
+
+import math
+from collections import deque
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+NAN = float('nan')
+
+
+class EMAState:
+    """
+    Üstel hareketli ortalama (EMA) - artımlı
+
+    pandas ewm(adjust=False) ile aynı formül:
+        y[0] = x[0]
+        y[t] = ((1 - a) * y[t-1] + a * x[t]) / ((1 - a) + a)
+    """
+
+    def __init__(self, span: Optional[float] = None, alpha: Optional[float] = None):
+        """
+        Args:
+            span: EMA periyodu (alpha = 2 / (span + 1))
+            alpha: Doğrudan smoothing katsayısı (span yerine)
+        """
+        if alpha is None:
+            if span is None:
+                raise ValueError("span veya alpha verilmeli")
+            alpha = 2.0 / (span + 1.0)
+
+        self.alpha = alpha
+        self.value = NAN
+        self._old_wt = 1.0
+
+    def update(self, x: float) -> float:
+        """
+        Yeni değer ekler.
+
+        Args:
+            x: Yeni gözlem (NaN olabilir)
+
+        Returns:
+            float: Güncel EMA
+        """
+        is_observation = x == x
+
+        if self.value == self.value:
+            # pandas (ignore_na=False): NaN gözlem de eski ağırlığı azaltır
+            self._old_wt *= 1.0 - self.alpha
+            if is_observation:
+                if self.value != x:
+                    self.value = ((self._old_wt * self.value) + (self.alpha * x)) / (self._old_wt + self.alpha)
+                self._old_wt = 1.0
+        elif is_observation:
+            self.value = x
+
+        return self.value
+
+
+class RollingMeanStd:
+    """
+    Kayan pencere ortalama ve standart sapma - artımlı (O(1))
+
+    pandas rolling(window).mean() ve rolling(window).std() ile aynı
+    algoritmalar kullanılır: ortalama için Kahan toplamı, varyans için
+    Welford yöntemi (önce çıkarma, sonra ekleme sırasıyla).
+    """
+
+    def __init__(self, window: int, with_std: bool = True):
+        """
+        Args:
+            window: Pencere uzunluğu
+            with_std: Standart sapma da hesaplansın mı
+        """
+        self.window = window
+        self.with_std = with_std
+        self._values = deque()
+
+        # Ortalama (Kahan toplamı)
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._nobs = 0
+        self._neg_ct = 0
+
+        # Varyans (Welford)
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._var_comp_add = 0.0
+        self._var_comp_remove = 0.0
+        self._var_nobs = 0
+
+        # Penceredeki değerler tamamen aynı mı (pandas özel durumu)
+        self._same_count = 0
+        self._prev = NAN
+
+        self.mean = NAN
+        self.std = NAN
+
+    def _add(self, val: float) -> None:
+        if val != val:
+            return
+
+        # Ortalama
+        self._nobs += 1
+        y = val - self._comp_add
+        t = self._sum + y
+        self._comp_add = t - self._sum - y
+        self._sum = t
+        if val < 0:
+            self._neg_ct += 1
+
+        if val == self._prev:
+            self._same_count += 1
+        else:
+            self._same_count = 1
+        self._prev = val
+
+        # Varyans
+        if self.with_std:
+            self._var_nobs += 1
+            prev_mean = self._mean - self._var_comp_add
+            y = val - self._var_comp_add
+            t = y - self._mean
+            self._var_comp_add = t + self._mean - y
+            self._mean = self._mean + t / self._var_nobs
+            self._ssqdm += (val - prev_mean) * (val - self._mean)
+
+    def _remove(self, val: float) -> None:
+        if val != val:
+            return
+
+        # Ortalama
+        self._nobs -= 1
+        y = -val - self._comp_remove
+        t = self._sum + y
+        self._comp_remove = t - self._sum - y
+        self._sum = t
+        if val < 0:
+            self._neg_ct -= 1
+
+        # Varyans
+        if self.with_std:
+            self._var_nobs -= 1
+            if self._var_nobs:
+                prev_mean = self._mean - self._var_comp_remove
+                y = val - self._var_comp_remove
+                t = y - self._mean
+                self._var_comp_remove = t + self._mean - y
+                self._mean = self._mean - t / self._var_nobs
+                self._ssqdm -= (val - prev_mean) * (val - self._mean)
+            else:
+                self._mean = 0.0
+                self._ssqdm = 0.0
+
+    def update(self, x: float) -> float:
+        """
+        Yeni değer ekler, pencereden çıkan değeri düşer.
+
+        Args:
+            x: Yeni gözlem
+
+        Returns:
+            float: Güncel ortalama (pencere dolmadıysa NaN)
+        """
+        self._values.append(x)
+
+        # pandas sırası: önce çıkar, sonra ekle
+        if len(self._values) > self.window:
+            self._remove(self._values.popleft())
+        self._add(x)
+
+        if self._nobs >= self.window:
+            if self._same_count >= self._nobs:
+                mean = self._prev
+            else:
+                mean = self._sum / self._nobs
+                if self._neg_ct == 0 and mean < 0:
+                    mean = 0.0
+                elif self._neg_ct == self._nobs and mean > 0:
+                    mean = 0.0
+            self.mean = mean
+        else:
+            self.mean = NAN
+
+        if self.with_std:
+            if self._var_nobs >= self.window and self._var_nobs > 1:
+                if self._same_count >= self._var_nobs:
+                    var = 0.0
+                else:
+                    var = max(0.0, self._ssqdm / (self._var_nobs - 1))
+                self.std = math.sqrt(var)
+            else:
+                self.std = NAN
+
+        return self.mean
+
+
+class RSIState:
+    """
+    Wilder's RSI - artımlı
+
+    calculate_rsi ile aynı: ilk 'period' kazanç/kaybın ortalaması tohum,
+    sonrası alpha = 1/period ile smoothing.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Args:
+            period: RSI periyodu
+        """
+        self.period = period
+        self._prev_close = NAN
+        self._seed_gain = RollingMeanStd(period, with_std=False)
+        self._seed_loss = RollingMeanStd(period, with_std=False)
+        self._avg_gain = EMAState(alpha=1.0 / period)
+        self._avg_loss = EMAState(alpha=1.0 / period)
+        self._seeded = False
+        self.value = NAN
+
+    def update(self, close: float) -> float:
+        """
+        Yeni kapanış fiyatı ekler.
+
+        Args:
+            close: Kapanış fiyatı
+
+        Returns:
+            float: Güncel RSI (yetersiz veri varsa NaN)
+        """
+        # diff() ilk barda NaN -> kazanç/kayıp 0 kabul edilir (batch ile aynı)
+        delta = close - self._prev_close
+        self._prev_close = close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if not self._seeded:
+            seed_gain = self._seed_gain.update(gain)
+            seed_loss = self._seed_loss.update(loss)
+            if seed_gain != seed_gain:
+                return self.value
+            avg_gain = self._avg_gain.update(seed_gain)
+            avg_loss = self._avg_loss.update(seed_loss)
+            self._seeded = True
+        else:
+            avg_gain = self._avg_gain.update(gain)
+            avg_loss = self._avg_loss.update(loss)
+
+        # avg_loss = 0 -> RS sonsuz -> RSI 100 (pandas bölme davranışı)
+        if avg_loss == 0:
+            rs = NAN if avg_gain == 0 else math.inf
+        else:
+            rs = avg_gain / avg_loss
+        self.value = 100 - (100 / (1 + rs))
+
+        return self.value
+
+
+class MACDState:
+    """MACD - artımlı (calculate_macd ile aynı)"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        """
+        Args:
+            fast: Hızlı EMA periyodu
+            slow: Yavaş EMA periyodu
+            signal: Sinyal çizgisi periyodu
+        """
+        self._fast = EMAState(span=fast)
+        self._slow = EMAState(span=slow)
+        self._signal = EMAState(span=signal)
+        self.macd = NAN
+        self.signal = NAN
+        self.histogram = NAN
+
+    def update(self, close: float) -> Dict[str, float]:
+        """
+        Yeni kapanış fiyatı ekler.
+
+        Returns:
+            dict: {'macd', 'signal', 'histogram'}
+        """
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        self.signal = self._signal.update(self.macd)
+        self.histogram = self.macd - self.signal
+
+        return {'macd': self.macd, 'signal': self.signal, 'histogram': self.histogram}
+
+
+class BollingerState:
+    """Bollinger Bantları - artımlı (calculate_bollinger_bands ile aynı)"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        """
+        Args:
+            period: Periyot
+            std_dev: Standart sapma çarpanı
+        """
+        self.std_dev = std_dev
+        self._rolling = RollingMeanStd(period)
+        self.upper = NAN
+        self.middle = NAN
+        self.lower = NAN
+
+    def update(self, close: float) -> Dict[str, float]:
+        """
+        Yeni kapanış fiyatı ekler.
+
+        Returns:
+            dict: {'upper', 'middle', 'lower'}
+        """
+        self.middle = self._rolling.update(close)
+        width = self._rolling.std * self.std_dev
+        self.upper = self.middle + width
+        self.lower = self.middle - width
+
+        return {'upper': self.upper, 'middle': self.middle, 'lower': self.lower}
+
+
+class MovingAverageState:
+    """Çoklu hareketli ortalama - artımlı (calculate_moving_averages ile aynı)"""
+
+    def __init__(self, periods: List[int] = [20, 50, 200], ma_type: str = 'SMA'):
+        """
+        Args:
+            periods: Periyotlar
+            ma_type: 'SMA' veya 'EMA'
+        """
+        if ma_type.upper() == 'SMA':
+            self._states = {p: RollingMeanStd(p, with_std=False) for p in periods}
+        elif ma_type.upper() == 'EMA':
+            self._states = {p: EMAState(span=p) for p in periods}
+        else:
+            raise ValueError(f"MA type '{ma_type}' gecersiz. 'SMA' veya 'EMA' kullanin.")
+
+        self.values = {p: NAN for p in periods}
+
+    def update(self, close: float) -> Dict[int, float]:
+        """
+        Yeni kapanış fiyatı ekler.
+
+        Returns:
+            dict: {period: MA değeri}
+        """
+        for period, state in self._states.items():
+            self.values[period] = state.update(close)
+
+        return dict(self.values)
+
+
+class VolumeState:
+    """Hacim oranı ve fiyat değişimi - artımlı (analyze_volume ile aynı girdiler)"""
+
+    def __init__(self, avg_period: int = 20):
+        """
+        Args:
+            avg_period: Ortalama hacim periyodu
+        """
+        self._avg = RollingMeanStd(avg_period, with_std=False)
+        self._prev_close = NAN
+        self.current_volume = NAN
+        self.avg_volume = NAN
+        self.volume_ratio = NAN
+        self.price_change_pct = NAN
+
+    def update(self, close: float, volume: float) -> Dict[str, float]:
+        """
+        Yeni bar ekler.
+
+        Returns:
+            dict: {'current_volume', 'avg_volume', 'volume_ratio', 'price_change_pct'}
+        """
+        self.current_volume = volume
+        self.avg_volume = self._avg.update(volume)
+        self.volume_ratio = volume / self.avg_volume if self.avg_volume > 0 else 1
+
+        price_change = close - self._prev_close
+        self.price_change_pct = (price_change / self._prev_close) * 100
+        self._prev_close = close
+
+        return {
+            'current_volume': self.current_volume,
+            'avg_volume': self.avg_volume,
+            'volume_ratio': self.volume_ratio,
+            'price_change_pct': self.price_change_pct
+        }
+
+
+class StreamingIndicators:
+    """Bir hisse için tüm göstergelerin artımlı durumunu bir arada tutar"""
+
+    def __init__(self, rsi_period: int = 14, ma_periods: List[int] = [20, 50, 200],
+                 bb_period: int = 20, bb_std: float = 2.0, volume_period: int = 20):
+        self.rsi = RSIState(rsi_period)
+        self.macd = MACDState()
+        self.bollinger = BollingerState(bb_period, bb_std)
+        self.moving_averages = MovingAverageState(ma_periods)
+        self.volume = VolumeState(volume_period)
+        self.close = NAN
+        self.bars = 0
+
+    def update(self, close: float, volume: float = NAN) -> Dict[str, object]:
+        """
+        Yeni bar ile tüm göstergeleri günceller.
+
+        Args:
+            close: Kapanış fiyatı
+            volume: Hacim
+
+        Returns:
+            dict: Tüm göstergelerin güncel değerleri
+        """
+        self.close = close
+        self.bars += 1
+
+        self.rsi.update(close)
+        self.macd.update(close)
+        self.bollinger.update(close)
+        self.moving_averages.update(close)
+        self.volume.update(close, volume)
+
+        return self.snapshot()
+
+    def warm_up(self, data: pd.DataFrame) -> Dict[str, object]:
+        """
+        Geçmiş barları sırayla işleyerek durumu hazırlar (tek seferlik).
+
+        Args:
+            data: Close (ve varsa Volume) sütunlu fiyat verileri
+
+        Returns:
+            dict: Son barın gösterge değerleri
+        """
+        closes = data['Close'].to_numpy(dtype=float)
+        volumes = data['Volume'].to_numpy(dtype=float) if 'Volume' in data.columns else [NAN] * len(closes)
+
+        for close, volume in zip(closes, volumes):
+            self.update(float(close), float(volume))
+
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, object]:
+        """Güncel değerleri döndürür"""
+        return {
+            'close': self.close,
+            'rsi': self.rsi.value,
+            'macd': self.macd.macd,
+            'macd_signal': self.macd.signal,
+            'macd_histogram': self.macd.histogram,
+            'bb_upper': self.bollinger.upper,
+            'bb_middle': self.bollinger.middle,
+            'bb_lower': self.bollinger.lower,
+            'moving_averages': dict(self.moving_averages.values),
+            'volume_ratio': self.volume.volume_ratio,
+            'avg_volume': self.volume.avg_volume,
+            'price_change_pct': self.volume.price_change_pct,
+        }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+    import numpy as np
+    from src.indicators.momentum import calculate_rsi, calculate_macd
+    from src.indicators.volatility import calculate_bollinger_bands
+    from src.indicators.trend import calculate_moving_averages
+
+    print("=" * 60)
+    print("ARTIMLI GOSTERGELER - TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(7)
+    n = 2000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    volume = rng.integers(100_000, 5_000_000, n).astype(float)
+    data = pd.DataFrame({'Close': close, 'Volume': volume})
+
+    state = StreamingIndicators()
+    rows = [state.update(c, v) for c, v in zip(close, volume)]
+
+    rsi = calculate_rsi(data)
+    macd, signal, _ = calculate_macd(data)
+    upper, middle, lower = calculate_bollinger_bands(data)
+    mas = calculate_moving_averages(data)
+
+    def max_diff(stream, batch):
+        return float(np.nanmax(np.abs(np.array(stream) - batch.to_numpy())))
+
+    print(f"\nRSI max fark:      {max_diff([r['rsi'] for r in rows], rsi):.2e}")
+    print(f"MACD max fark:     {max_diff([r['macd'] for r in rows], macd):.2e}")
+    print(f"Signal max fark:   {max_diff([r['macd_signal'] for r in rows], signal):.2e}")
+    print(f"BB ust max fark:   {max_diff([r['bb_upper'] for r in rows], upper):.2e}")
+    print(f"MA200 max fark:    {max_diff([r['moving_averages'][200] for r in rows], mas[200]):.2e}")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        state.update(close[-1], volume[-1])
+    per_update = (time.perf_counter() - start) / 1000 * 1e6
+    print(f"\nBar basina guncelleme suresi: {per_update:.1f} mikrosaniye")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
@@ -8,9 +8,14 @@ Bu modül trend takip göstergelerini hesaplar:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+from .primitives import get_primitive_cache
+from .signals import SELL, HOLD_SELL, HOLD, HOLD_BUY, BUY, decode_signals
+from ..utils.profiling import profiled
 
+
+@profiled()
 def calculate_moving_averages(
     data: pd.DataFrame,
     periods: List[int] = [20, 50, 200],
@@ -68,14 +73,15 @@ def calculate_moving_averages(
     """
     
     results = {}
+    primitives = get_primitive_cache()
     
     for period in periods:
         if ma_type.upper() == 'SMA':
             # Simple Moving Average
-            results[period] = data[column].rolling(window=period).mean()
+            results[period] = primitives.sma(data, period, column)
         elif ma_type.upper() == 'EMA':
             # Exponential Moving Average
-            results[period] = data[column].ewm(span=period, adjust=False).mean()
+            results[period] = primitives.ema(data, period, column)
         else:
             raise ValueError(f"MA type '{ma_type}' gecersiz. 'SMA' veya 'EMA' kullanin.")
     
@@ -201,6 +207,65 @@ def interpret_moving_averages(
     }
 
 
+def ma_signal_codes(
+    price: np.ndarray,
+    mas: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    interpret_moving_averages'in dizi versiyonu (1 boyutlu seri veya bar x hisse panel).
+    
+    Args:
+        price: Fiyat dizisi
+        mas: MA dizileri (her biri fiyat ile aynı boyutta)
+    
+    Returns:
+        tuple: (sinyal kodları, güç, fiyatın üstünde olduğu MA sayısı)
+    """
+    
+    price_v = np.asarray(price, dtype=float)
+    score = np.zeros(price_v.shape, dtype=int)
+    above_count = np.zeros(price_v.shape, dtype=int)
+    
+    for ma in mas:
+        ma_v = np.asarray(ma, dtype=float)
+        valid = ~np.isnan(ma_v)
+        above = valid & (price_v > ma_v)
+        # Üstünde +15, altında (veya eşit) -15, NaN MA atlanır
+        score += np.where(above, 15, np.where(valid, -15, 0))
+        above_count += above
+    
+    conditions = [score > 25, score > 0, score < -25, score < 0]
+    codes = np.select(conditions, [BUY, HOLD_BUY, SELL, HOLD_SELL], default=HOLD)
+    
+    return codes, np.abs(score), above_count
+
+
+def interpret_moving_averages_series(
+    price: pd.Series,
+    mas: Dict[int, pd.Series]
+) -> pd.DataFrame:
+    """
+    interpret_moving_averages'in tüm seriye vektörel uygulanmış hali (backtest için).
+    
+    Args:
+        price: Fiyat serisi
+        mas: {period: MA serisi} (calculate_moving_averages çıktısı)
+    
+    Returns:
+        pd.DataFrame: 'signal', 'strength' ve 'above_count' sütunları
+    """
+    
+    codes, strength, above_count = ma_signal_codes(
+        price.to_numpy(dtype=float), [ma.to_numpy(dtype=float) for ma in mas.values()]
+    )
+    
+    return pd.DataFrame({
+        'signal': decode_signals(codes),
+        'strength': strength,
+        'above_count': above_count
+    }, index=price.index)
+
+
 # Test fonksiyonu
 if __name__ == "__main__":
     print("=" * 60)
@@ -10,7 +10,12 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Dict
 
+from .primitives import get_primitive_cache
+from .signals import SELL, HOLD_SELL, HOLD, HOLD_BUY, BUY, decode_signals
+from ..utils.profiling import profiled
 
+
+@profiled()
 def calculate_bollinger_bands(
     data: pd.DataFrame,
     period: int = 20,
@@ -69,11 +74,12 @@ def calculate_bollinger_bands(
         ...     print("Ust banda dokundu - Asiri alim!")
     """
     
-    # Orta Band = Simple Moving Average
-    middle_band = data[column].rolling(window=period).mean()
+    # Orta Band = Simple Moving Average (MA(20) ile paylaşılır)
+    primitives = get_primitive_cache()
+    middle_band = primitives.sma(data, period, column)
     
     # Standart sapma hesapla
-    rolling_std = data[column].rolling(window=period).std()
+    rolling_std = primitives.std(data, period, column)
     
     # Üst ve Alt Bandları hesapla
     upper_band = middle_band + (rolling_std * std_dev)
@@ -168,6 +174,72 @@ def interpret_bollinger_bands(
     }
 
 
+def bollinger_signal_codes(
+    price: np.ndarray,
+    upper: np.ndarray,
+    middle: np.ndarray,
+    lower: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    interpret_bollinger_bands'in dizi versiyonu (1 boyutlu seri veya bar x hisse panel).
+    
+    Returns:
+        tuple: (sinyal kodları, güç, fiyatın band içindeki pozisyonu 0-100)
+    """
+    
+    price_v = np.asarray(price, dtype=float)
+    upper_v = np.asarray(upper, dtype=float)
+    middle_v = np.asarray(middle, dtype=float)
+    lower_v = np.asarray(lower, dtype=float)
+    
+    has_data = ~(np.isnan(upper_v) | np.isnan(middle_v) | np.isnan(lower_v))
+    
+    # Bantlar çakışırsa (sabit fiyat) 0/0 -> NaN, interpret_bollinger_bands ile aynı
+    with np.errstate(divide='ignore', invalid='ignore'):
+        position = ((price_v - lower_v) / (upper_v - lower_v)) * 100
+    
+    conditions = [
+        ~has_data,
+        position >= 95,
+        position <= 5,
+        position > 70,
+        position < 30,
+        price_v > middle_v
+    ]
+    codes = np.select(conditions, [HOLD, SELL, BUY, HOLD_SELL, HOLD_BUY, HOLD_BUY], default=HOLD_SELL)
+    strength = np.select(conditions, [0, 70, 70, 40, 40, 20], default=20)
+    
+    return codes, strength.astype(int), np.where(has_data, position, np.nan)
+
+
+def interpret_bollinger_bands_series(
+    price: pd.Series,
+    upper: pd.Series,
+    middle: pd.Series,
+    lower: pd.Series
+) -> pd.DataFrame:
+    """
+    interpret_bollinger_bands'in tüm seriye vektörel uygulanmış hali (backtest için).
+    
+    Args:
+        price (pd.Series): Fiyat serisi
+        upper (pd.Series): Üst band
+        middle (pd.Series): Orta band
+        lower (pd.Series): Alt band
+    
+    Returns:
+        pd.DataFrame: 'signal', 'strength' ve 'price_position' sütunları
+    """
+    
+    codes, strength, position = bollinger_signal_codes(price, upper, middle, lower)
+    
+    return pd.DataFrame({
+        'signal': decode_signals(codes),
+        'strength': strength,
+        'price_position': position
+    }, index=price.index)
+
+
 # Test fonksiyonu
 if __name__ == "__main__":
     print("=" * 60)
@@ -9,9 +9,14 @@ Bu modül hacim bazlı analizler yapar:
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Tuple
 
+from .primitives import get_primitive_cache
+from .signals import SELL, HOLD_SELL, HOLD, HOLD_BUY, BUY, decode_signals, shift_rows
+from ..utils.profiling import profiled
 
+
+@profiled()
 def analyze_volume(
     data: pd.DataFrame,
     avg_period: int = 20,
@@ -64,7 +69,7 @@ def analyze_volume(
     current_volume = data['Volume'].iloc[-1]
     
     # Ortalama hacim hesapla
-    avg_volume = data['Volume'].rolling(window=avg_period).mean().iloc[-1]
+    avg_volume = get_primitive_cache().sma(data, avg_period, 'Volume').iloc[-1]
     
     # Hacim oranı
     volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
@@ -132,6 +137,93 @@ def analyze_volume(
     }
 
 
+def volume_signal_codes(
+    volume: np.ndarray,
+    avg_volume: np.ndarray,
+    close: np.ndarray,
+    threshold_multiplier: float = 1.5
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    analyze_volume kurallarının dizi versiyonu (1 boyutlu seri veya bar x hisse panel).
+    
+    Args:
+        volume: Hacim
+        avg_volume: Ortalama hacim (rolling mean)
+        close: Kapanış fiyatı
+        threshold_multiplier: Hangi katı "yüksek hacim" sayılsın
+    
+    Returns:
+        tuple: (sinyal kodları, güç, hacim oranı)
+    """
+    
+    volume = np.asarray(volume, dtype=float)
+    avg_volume = np.asarray(avg_volume, dtype=float)
+    close = np.asarray(close, dtype=float)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        volume_ratio = np.where(avg_volume > 0, volume / avg_volume, 1.0)
+    
+    prev_close = shift_rows(close)
+    price_change = close - prev_close
+    price_change_pct = (price_change / prev_close) * 100
+    rising = price_change > 0
+    
+    conditions = [
+        volume_ratio >= threshold_multiplier * 2,
+        volume_ratio >= threshold_multiplier,
+        volume_ratio < 0.5,
+        np.abs(price_change_pct) > 3
+    ]
+    codes = np.select(conditions, [
+        np.where(rising, BUY, SELL),
+        np.where(rising, HOLD_BUY, HOLD_SELL),
+        HOLD,
+        np.where(rising, HOLD_BUY, HOLD_SELL)
+    ], default=HOLD)
+    strength = np.select(conditions, [
+        np.minimum(100, np.trunc(volume_ratio * 20)),
+        np.trunc(volume_ratio * 25),
+        10,
+        30
+    ], default=10)
+    
+    return codes, strength.astype(int), volume_ratio
+
+
+def analyze_volume_series(
+    data: pd.DataFrame,
+    avg_period: int = 20,
+    threshold_multiplier: float = 1.5
+) -> pd.DataFrame:
+    """
+    analyze_volume'un tüm seriye vektörel uygulanmış hali (backtest için).
+    
+    Args:
+        data (pd.DataFrame): Fiyat ve hacim verileri
+        avg_period (int): Ortalama hacim hesaplama periyodu
+        threshold_multiplier (float): Hangi katı "yüksek hacim" sayılsın
+    
+    Returns:
+        pd.DataFrame: 'signal', 'strength' ve 'volume_ratio' sütunları
+    """
+    
+    if 'Volume' not in data.columns:
+        return pd.DataFrame({'signal': 'HOLD', 'strength': 0, 'volume_ratio': np.nan}, index=data.index)
+    
+    codes, strength, volume_ratio = volume_signal_codes(
+        data['Volume'].to_numpy(dtype=float),
+        get_primitive_cache().sma(data, avg_period, 'Volume').to_numpy(dtype=float),
+        data['Close'].to_numpy(dtype=float),
+        threshold_multiplier
+    )
+    
+    return pd.DataFrame({
+        'signal': decode_signals(codes),
+        'strength': strength,
+        'volume_ratio': volume_ratio
+    }, index=data.index)
+
+
 def detect_volume_trend(data: pd.DataFrame, period: int = 10) -> str:
     """
     Son N günün hacim trendini tespit eder.
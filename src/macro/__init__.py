@@ -2,9 +2,12 @@
 Makro ekonomi analiz modülü
 """
 
-from .fetcher import MacroDataFetcher
-from .analyzer import MacroAnalyzer
-from .sectors import SectorAnalyzer
-
-__all__ = ['MacroDataFetcher', 'MacroAnalyzer', 'SectorAnalyzer']
+from ..utils.lazy import lazy_exports
 
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.fetcher': ['MacroDataFetcher'],
+    '.analyzer': ['MacroAnalyzer'],
+    '.sectors': ['SectorAnalyzer'],
+    '.history': ['MacroHistoryStore']
+})
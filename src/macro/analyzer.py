@@ -1,14 +1,35 @@
 """
 Makroekonomik analiz ve puanlama motoru
 Makro verileri analiz edip -10 ile +10 arası skor üretir
+
+Eşik merdivenleri (USD/TRY seviyesi, petrol momentumu, ...) LADDERS
+tablosunda tanımlıdır. Tek anlık görüntü için analyze_* metodları,
+binlerce tarihlik geçmiş için score_many() aynı tabloları kullanır
+(np.searchsorted ile tek seferde, skaler sonuçla birebir aynı).
 """
 
-from typing import Dict, Tuple, Optional
+from bisect import bisect_right
+from typing import Dict, List, Tuple, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.profiling import profiled
+from ..utils.numeric import py_round
 
 
 class MacroAnalyzer:
     """Makroekonomik verileri analiz eden ve puanlayan sınıf"""
     
+    # Faktör ağırlıkları - USD/TRY ve BIST100 en önemli faktörler (Türkiye için)
+    DEFAULT_WEIGHTS = {
+        'usd': 0.30,   # %30
+        'tcmb': 0.25,  # %25
+        'bist': 0.30,  # %30
+        'oil': 0.10,   # %10
+        'gold': 0.05   # %5
+    }
+    
     def __init__(self, macro_data: Dict):
         """
         Args:
@@ -16,6 +37,115 @@ class MacroAnalyzer:
         """
         self.data = macro_data
     
+    # Eşik tabloları: {ad: (eşikler (artan), skorlar, açıklamalar)}
+    # Değer x için i = eşiklerden x'e eşit/küçük olanların sayısı (np.searchsorted,
+    # side='right'); skor[i] ve açıklama[i] kullanılır. Yani skor[0] en küçük eşiğin
+    # altı, skor[-1] en büyük eşik ve üstüdür ("if x >= e[-1] ... elif ... else"
+    # merdiveninin tablo hali). Açıklamalardaki {change} değişim ile doldurulur.
+    LADDERS = {
+        'usd_level': (
+            (30, 35, 40, 45, 50),
+            (+1, 0, -1, -2, -4, -5),
+            ("Dusuk seviye (<30)", "Normal seviye (30+)", "Orta seviye (35+)",
+             "Orta-yuksek seviye (40+)", "Yuksek seviye (45+)", "Cok yuksek seviye (50+)")
+        ),
+        'usd_momentum': (
+            (-3, -1.5, -0.5, 0.5, 1.5, 3, 5),
+            (+4, +2, +1, 0, -1, -2, -4, -6),
+            ("Hizli dusus (%{change:.1f})", "Dusus (%{change:.1f})",
+             "Hafif dusus (%{change:.1f})", "Stabil (%{change:.1f})",
+             "Hafif yukselis (+%{change:.1f})", "Yukselis (+%{change:.1f})",
+             "Hizli yukselis (+%{change:.1f})", "Cok hizli yukselis (+%{change:.1f})")
+        ),
+        'tcmb_level': (
+            (30, 40, 45, 50, 55),
+            (+1, 0, -1, -2, -3, -4),
+            ("Dusuk faiz (<30)", "Normal faiz (30+)", "Orta faiz (40+)",
+             "Orta-yuksek faiz (45+)", "Yuksek faiz (50+)", "Cok yuksek faiz (55+)")
+        ),
+        'tcmb_change': (
+            (-5, -2, -0.5, 0.5, 2, 5),
+            (+5, +3, +1, 0, -1, -3, -5),
+            ("Cok dustu (%{change:.1f})", "Dustu (%{change:.1f})",
+             "Hafif dustu (%{change:.1f})", "Sabit", "Hafif artti (+%{change:.1f})",
+             "Artti (+%{change:.1f})", "Cok artti (+%{change:.1f})")
+        ),
+        'oil_level': (
+            (50, 60, 75, 85, 100),
+            (+2, +1, 0, -1, -2, -3),
+            ("Cok dusuk (<$50)", "Dusuk ($50+)", "Normal ($60+)",
+             "Orta-yuksek ($75+)", "Yuksek ($85+)", "Cok yuksek ($100+)")
+        ),
+        'oil_momentum': (
+            (-20, -10, -5, 5, 10, 20),
+            (+3, +2, +1, 0, -1, -2, -3),
+            ("Cok hizli dusus (%{change:.1f})", "Hizli dusus (%{change:.1f})",
+             "Dusus (%{change:.1f})", "Stabil (%{change:.1f})", "Yukselis (+%{change:.1f})",
+             "Hizli yukselis (+%{change:.1f})", "Cok hizli yukselis (+%{change:.1f})")
+        ),
+        'gold_level': (
+            (1600, 1800, 2000, 2200, 2400),
+            (+1, +0.5, 0, -0.5, -1.5, -2),
+            ("Cok dusuk (<$1600)", "Dusuk ($1600+)", "Normal ($1800+)",
+             "Orta-yuksek ($2000+)", "Yuksek ($2200+) - Temkinli",
+             "Cok yuksek ($2400+) - Risk kacisi")
+        ),
+        'gold_momentum': (
+            (-15, -8, -3, 3, 8, 15),
+            (+2.5, +1.5, +0.5, 0, -0.5, -1.5, -2.5),
+            ("Cok hizli dusus (%{change:.1f})", "Hizli dusus (%{change:.1f})",
+             "Dusus (%{change:.1f})", "Stabil (%{change:.1f})", "Yukselis (+%{change:.1f})",
+             "Hizli yukselis (+%{change:.1f})", "Cok hizli yukselis (+%{change:.1f})")
+        ),
+        'summary': (
+            (-5, -2, 2, 5),
+            (0, 1, 2, 3, 4),
+            ("[-] Makroekonomik ortam OLUMSUZ - Yuksek risk",
+             "[!] Makroekonomik ortam HAFIF OLUMSUZ - Risk var",
+             "[o] Makroekonomik ortam NOTR - Karma sinyaller",
+             "[+] Makroekonomik ortam HAFIF OLUMLU - Dikkatli iyimserlik",
+             "[+] Makroekonomik ortam OLUMLU - BIST icin destekleyici")
+        ),
+    }
+    
+    # BIST100 trend skorları (trend kategorik, eşik tablosu yerine sözlük)
+    BIST_TREND = {
+        'up': (+6, "[+]", "yukselis trendinde"),
+        'down': (-6, "[-]", "dusus trendinde"),
+    }
+    BIST_FLAT = (0, "[o]", "yatay seyrediyor")
+    
+    # score_many() girdi sütunları ve anlık görüntüdeki yerleri
+    FRAME_FIELDS = {
+        'usd_current': ('usd_try', 'current'),
+        'usd_change': ('usd_try', 'change_30d'),
+        'bist_change': ('bist100', 'change_30d'),
+        'oil_current': ('oil', 'current'),
+        'oil_change': ('oil', 'change_30d'),
+        'gold_current': ('gold', 'current'),
+        'gold_change': ('gold', 'change_30d'),
+    }
+    
+    @classmethod
+    def lookup(cls, table: str, value: float, change: Optional[float] = None) -> Tuple[float, str]:
+        """
+        Tek değer için eşik tablosundan (skor, açıklama) döndürür.
+        
+        Args:
+            table: LADDERS anahtarı (örn: 'usd_level')
+            value: Değerlendirilecek değer
+            change: Açıklamaya yazılacak değişim (varsayılan: value)
+        """
+        edges, scores, labels = cls.LADDERS[table]
+        i = bisect_right(edges, value)
+        return scores[i], labels[i].format(change=value if change is None else change)
+    
+    @classmethod
+    def lookup_many(cls, table: str, values: np.ndarray) -> np.ndarray:
+        """Eşik tablosunu dizinin tamamına uygular (NaN için skor[0] döner, maskelenmeli)"""
+        edges, scores, _ = cls.LADDERS[table]
+        return np.asarray(scores, dtype=float)[np.searchsorted(edges, values, side='right')]
+    
     def analyze_usd_try(self) -> Tuple[float, str]:
         """
         USD/TRY değişimini analiz eder (Hibrid: Seviye + Momentum)
@@ -32,56 +162,10 @@ class MacroAnalyzer:
                 return 0, "USD/TRY verisi eksik"
             
             # 1) Mutlak Seviye Değerlendirmesi (Baz Risk)
-            level_score = 0
-            level_desc = ""
-            
-            if current >= 50:
-                level_score = -5
-                level_desc = "Cok yuksek seviye (50+)"
-            elif current >= 45:
-                level_score = -4
-                level_desc = "Yuksek seviye (45+)"
-            elif current >= 40:
-                level_score = -2
-                level_desc = "Orta-yuksek seviye (40+)"
-            elif current >= 35:
-                level_score = -1
-                level_desc = "Orta seviye (35+)"
-            elif current >= 30:
-                level_score = 0
-                level_desc = "Normal seviye (30+)"
-            else:
-                level_score = +1
-                level_desc = "Dusuk seviye (<30)"
+            level_score, level_desc = self.lookup('usd_level', current)
             
             # 2) Momentum Değerlendirmesi (30 günlük değişim)
-            momentum_score = 0
-            momentum_desc = ""
-            
-            if change >= 5:
-                momentum_score = -6
-                momentum_desc = f"Cok hizli yukselis (+%{change:.1f})"
-            elif change >= 3:
-                momentum_score = -4
-                momentum_desc = f"Hizli yukselis (+%{change:.1f})"
-            elif change >= 1.5:
-                momentum_score = -2
-                momentum_desc = f"Yukselis (+%{change:.1f})"
-            elif change >= 0.5:
-                momentum_score = -1
-                momentum_desc = f"Hafif yukselis (+%{change:.1f})"
-            elif change >= -0.5:
-                momentum_score = 0
-                momentum_desc = f"Stabil (%{change:.1f})"
-            elif change >= -1.5:
-                momentum_score = +1
-                momentum_desc = f"Hafif dusus (%{change:.1f})"
-            elif change >= -3:
-                momentum_score = +2
-                momentum_desc = f"Dusus (%{change:.1f})"
-            else:
-                momentum_score = +4
-                momentum_desc = f"Hizli dusus (%{change:.1f})"
+            momentum_score, momentum_desc = self.lookup('usd_momentum', change)
             
             # 3) Seviye-Momentum İnteraksiyonu
             # Yüksek seviyelerde momentum daha kritik
@@ -122,56 +206,14 @@ class MacroAnalyzer:
             # 1) Mutlak Seviye Değerlendirmesi
             # Yüksek faiz = sıkı para politikası = BIST için olumsuz (kısa vadede)
             # Ama enflasyonu kontrol ederse uzun vadede iyi
-            level_score = 0
-            level_desc = ""
-            
-            if current_rate >= 55:
-                level_score = -4
-                level_desc = "Cok yuksek faiz (55+)"
-            elif current_rate >= 50:
-                level_score = -3
-                level_desc = "Yuksek faiz (50+)"
-            elif current_rate >= 45:
-                level_score = -2
-                level_desc = "Orta-yuksek faiz (45+)"
-            elif current_rate >= 40:
-                level_score = -1
-                level_desc = "Orta faiz (40+)"
-            elif current_rate >= 30:
-                level_score = 0
-                level_desc = "Normal faiz (30+)"
-            else:
-                level_score = +1
-                level_desc = "Dusuk faiz (<30)"
+            level_score, level_desc = self.lookup('tcmb_level', current_rate)
             
             # 2) Değişim Değerlendirmesi (eğer önceki oran biliniyorsa)
             change_score = 0
             change_desc = ""
             
             if previous_rate is not None:
-                change = current_rate - previous_rate
-                
-                if change >= 5:
-                    change_score = -5
-                    change_desc = f"Cok artti (+%{change:.1f})"
-                elif change >= 2:
-                    change_score = -3
-                    change_desc = f"Artti (+%{change:.1f})"
-                elif change >= 0.5:
-                    change_score = -1
-                    change_desc = f"Hafif artti (+%{change:.1f})"
-                elif change >= -0.5:
-                    change_score = 0
-                    change_desc = "Sabit"
-                elif change >= -2:
-                    change_score = +1
-                    change_desc = f"Hafif dustu (%{change:.1f})"
-                elif change >= -5:
-                    change_score = +3
-                    change_desc = f"Dustu (%{change:.1f})"
-                else:
-                    change_score = +5
-                    change_desc = f"Cok dustu (%{change:.1f})"
+                change_score, change_desc = self.lookup('tcmb_change', current_rate - previous_rate)
             else:
                 change_desc = "Degisim bilinmiyor"
             
@@ -209,18 +251,7 @@ class MacroAnalyzer:
             current = self.data['bist100']['current']
             
             # Trend bazlı puanlama
-            if trend == 'up':
-                base_score = +6
-                emoji = "[+]"
-                trend_desc = "yukselis trendinde"
-            elif trend == 'down':
-                base_score = -6
-                emoji = "[-]"
-                trend_desc = "dusus trendinde"
-            else:
-                base_score = 0
-                emoji = "[o]"
-                trend_desc = "yatay seyrediyor"
+            base_score, emoji, trend_desc = self.BIST_TREND.get(trend, self.BIST_FLAT)
             
             # Değişim oranına göre ayarlama
             if change is not None:
@@ -253,53 +284,10 @@ class MacroAnalyzer:
                 return 0, "Petrol verisi eksik"
             
             # 1) Mutlak Seviye Değerlendirmesi
-            level_score = 0
-            level_desc = ""
-            
-            if current >= 100:
-                level_score = -3
-                level_desc = "Cok yuksek ($100+)"
-            elif current >= 85:
-                level_score = -2
-                level_desc = "Yuksek ($85+)"
-            elif current >= 75:
-                level_score = -1
-                level_desc = "Orta-yuksek ($75+)"
-            elif current >= 60:
-                level_score = 0
-                level_desc = "Normal ($60+)"
-            elif current >= 50:
-                level_score = +1
-                level_desc = "Dusuk ($50+)"
-            else:
-                level_score = +2
-                level_desc = "Cok dusuk (<$50)"
+            level_score, level_desc = self.lookup('oil_level', current)
             
             # 2) Momentum Değerlendirmesi
-            momentum_score = 0
-            momentum_desc = ""
-            
-            if change >= 20:
-                momentum_score = -3
-                momentum_desc = f"Cok hizli yukselis (+%{change:.1f})"
-            elif change >= 10:
-                momentum_score = -2
-                momentum_desc = f"Hizli yukselis (+%{change:.1f})"
-            elif change >= 5:
-                momentum_score = -1
-                momentum_desc = f"Yukselis (+%{change:.1f})"
-            elif change >= -5:
-                momentum_score = 0
-                momentum_desc = f"Stabil (%{change:.1f})"
-            elif change >= -10:
-                momentum_score = +1
-                momentum_desc = f"Dusus (%{change:.1f})"
-            elif change >= -20:
-                momentum_score = +2
-                momentum_desc = f"Hizli dusus (%{change:.1f})"
-            else:
-                momentum_score = +3
-                momentum_desc = f"Cok hizli dusus (%{change:.1f})"
+            momentum_score, momentum_desc = self.lookup('oil_momentum', change)
             
             # 3) Seviye-Momentum İnteraksiyonu
             # Yüksek seviyede artış enflasyon için çok kötü
@@ -336,53 +324,10 @@ class MacroAnalyzer:
             
             # 1) Mutlak Seviye Değerlendirmesi
             # Yüksek altın = güvensizlik/risk kaçışı = hisse için olumsuz
-            level_score = 0
-            level_desc = ""
-            
-            if current >= 2400:
-                level_score = -2
-                level_desc = "Cok yuksek ($2400+) - Risk kacisi"
-            elif current >= 2200:
-                level_score = -1.5
-                level_desc = "Yuksek ($2200+) - Temkinli"
-            elif current >= 2000:
-                level_score = -0.5
-                level_desc = "Orta-yuksek ($2000+)"
-            elif current >= 1800:
-                level_score = 0
-                level_desc = "Normal ($1800+)"
-            elif current >= 1600:
-                level_score = +0.5
-                level_desc = "Dusuk ($1600+)"
-            else:
-                level_score = +1
-                level_desc = "Cok dusuk (<$1600)"
+            level_score, level_desc = self.lookup('gold_level', current)
             
             # 2) Momentum Değerlendirmesi
-            momentum_score = 0
-            momentum_desc = ""
-            
-            if change >= 15:
-                momentum_score = -2.5
-                momentum_desc = f"Cok hizli yukselis (+%{change:.1f})"
-            elif change >= 8:
-                momentum_score = -1.5
-                momentum_desc = f"Hizli yukselis (+%{change:.1f})"
-            elif change >= 3:
-                momentum_score = -0.5
-                momentum_desc = f"Yukselis (+%{change:.1f})"
-            elif change >= -3:
-                momentum_score = 0
-                momentum_desc = f"Stabil (%{change:.1f})"
-            elif change >= -8:
-                momentum_score = +0.5
-                momentum_desc = f"Dusus (%{change:.1f})"
-            elif change >= -15:
-                momentum_score = +1.5
-                momentum_desc = f"Hizli dusus (%{change:.1f})"
-            else:
-                momentum_score = +2.5
-                momentum_desc = f"Cok hizli dusus (%{change:.1f})"
+            momentum_score, momentum_desc = self.lookup('gold_momentum', change)
             
             # 3) Seviye-Momentum İnteraksiyonu
             # Zaten yüksek seviyede hızlı yükseliş = panik
@@ -402,10 +347,29 @@ class MacroAnalyzer:
         except Exception as e:
             return 0, f"Altin analiz hatası: {e}"
     
-    def calculate_overall_macro_score(self) -> Dict:
+    def component_scores(self) -> Dict[str, float]:
+        """
+        Her faktörün ağırlıksız skorunu döndürür (optimizasyon için)
+        
+        Returns:
+            Dict: {'usd', 'tcmb', 'bist', 'oil', 'gold'} -> skor
+        """
+        return {
+            'usd': self.analyze_usd_try()[0],
+            'tcmb': self.analyze_tcmb_rate()[0],
+            'bist': self.analyze_bist100()[0],
+            'oil': self.analyze_oil()[0],
+            'gold': self.analyze_gold()[0]
+        }
+    
+    @profiled()
+    def calculate_overall_macro_score(self, weights: Optional[Dict[str, float]] = None) -> Dict:
         """
         Tüm makro faktörleri analiz edip genel skor hesaplar
         
+        Args:
+            weights: Faktör ağırlıkları (varsayılan: DEFAULT_WEIGHTS)
+        
         Returns:
             Dict: {
                 'total_score': -10 ile +10 arası,
@@ -421,14 +385,7 @@ class MacroAnalyzer:
         gold_score, gold_desc = self.analyze_gold()
         
         # Ağırlıklı ortalama hesapla
-        # USD/TRY ve BIST100 en önemli faktörler (Türkiye için)
-        weights = {
-            'usd': 0.30,   # %30
-            'tcmb': 0.25,  # %25
-            'bist': 0.30,  # %30
-            'oil': 0.10,   # %10
-            'gold': 0.05   # %5
-        }
+        weights = weights or self.DEFAULT_WEIGHTS
         
         total = (
             usd_score * weights['usd'] +
@@ -442,16 +399,7 @@ class MacroAnalyzer:
         total = max(-10, min(10, total))
         
         # Özet oluştur
-        if total >= 5:
-            summary = "[+] Makroekonomik ortam OLUMLU - BIST icin destekleyici"
-        elif total >= 2:
-            summary = "[+] Makroekonomik ortam HAFIF OLUMLU - Dikkatli iyimserlik"
-        elif total >= -2:
-            summary = "[o] Makroekonomik ortam NOTR - Karma sinyaller"
-        elif total >= -5:
-            summary = "[!] Makroekonomik ortam HAFIF OLUMSUZ - Risk var"
-        else:
-            summary = "[-] Makroekonomik ortam OLUMSUZ - Yuksek risk"
+        _, summary = self.lookup('summary', total)
         
         return {
             'total_score': round(total, 2),
@@ -467,6 +415,137 @@ class MacroAnalyzer:
             'last_update': self.data.get('last_update', 'Bilinmiyor')
         }
 
+    
+    @classmethod
+    def macro_frame(cls, snapshots: List[Optional[Dict]], index=None) -> pd.DataFrame:
+        """
+        Makro anlık görüntü listesini score_many() girdisi olan düz tabloya çevirir.
+        
+        Args:
+            snapshots: config/macro_data.json formatında sözlükler
+                       (MacroHistoryStore.as_of_many çıktısı, None olabilir)
+            index: Tablo indeksi (örn. tarihler)
+        
+        Returns:
+            pd.DataFrame: FRAME_FIELDS sütunları + tcmb_rate, bist_trend (eksikler NaN)
+        """
+        columns = {name: np.full(len(snapshots), np.nan) for name in cls.FRAME_FIELDS}
+        columns['tcmb_rate'] = np.full(len(snapshots), np.nan)
+        trends = np.full(len(snapshots), 'flat', dtype=object)
+        
+        for i, snapshot in enumerate(snapshots):
+            if not snapshot:
+                continue
+            for name, (group, field) in cls.FRAME_FIELDS.items():
+                value = (snapshot.get(group) or {}).get(field)
+                if value is not None:
+                    columns[name][i] = value
+            if snapshot.get('tcmb_rate') is not None:
+                columns['tcmb_rate'][i] = snapshot['tcmb_rate']
+            # analyze_bist100 üç alandan biri eksikse 0 (yatay) döndürür
+            bist = snapshot.get('bist100') or {}
+            if all(key in bist for key in ('trend', 'change_30d', 'current')):
+                trends[i] = bist['trend']
+        
+        columns['bist_trend'] = trends
+        return pd.DataFrame(columns, index=index)
+    
+    @classmethod
+    @profiled()
+    def score_many(cls, macro: Union[pd.DataFrame, List[Optional[Dict]]],
+                   weights: Optional[Dict[str, float]] = None,
+                   previous_rate: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Bir makro geçmişinin tamamını tek seferde (vektörel) puanlar.
+        
+        Her satırın sonucu o satırın anlık görüntüsüyle çağrılan
+        calculate_overall_macro_score() ile birebir aynıdır.
+        
+        Args:
+            macro: macro_frame() tablosu veya anlık görüntü listesi
+            weights: Faktör ağırlıkları (varsayılan: DEFAULT_WEIGHTS)
+            previous_rate: Satır bazlı önceki TCMB faizi (analyze_tcmb_rate(previous_rate))
+        
+        Returns:
+            pd.DataFrame: usd, tcmb, bist, oil, gold, total_score,
+                          normalized_score, summary sütunları
+        
+        Örnek:
+            >>> store = MacroHistoryStore()
+            >>> dates = store.dates()
+            >>> scores = MacroAnalyzer.score_many(store.as_of_many(dates))
+        """
+        if not isinstance(macro, pd.DataFrame):
+            macro = cls.macro_frame(macro)
+        
+        weights = weights or cls.DEFAULT_WEIGHTS
+        
+        def column(name):
+            return macro[name].to_numpy(dtype=float)
+        
+        def level_momentum(prefix, current, change, boost):
+            """Seviye + momentum skoru (eksik veri = 0)"""
+            missing = np.isnan(current) | np.isnan(change)
+            total = cls.lookup_many(f'{prefix}_level', current) + \
+                cls.lookup_many(f'{prefix}_momentum', change) * boost
+            return np.where(missing, 0.0, py_round(np.clip(total, -10, 10), 1))
+        
+        # USD/TRY: yüksek seviyede yükseliş daha sert, düşük seviyede düşüş daha yumuşak
+        usd_current, usd_change = column('usd_current'), column('usd_change')
+        usd_boost = np.where((usd_current >= 40) & (usd_change > 0), 1.3,
+                             np.where((usd_current < 35) & (usd_change < 0), 0.7, 1.0))
+        usd = level_momentum('usd', usd_current, usd_change, usd_boost)
+        
+        # TCMB: önceki faiz verilmediyse sadece seviye
+        rate = column('tcmb_rate')
+        change_score = np.zeros(len(rate))
+        if previous_rate is not None:
+            previous_rate = np.asarray(previous_rate, dtype=float)
+            known = ~np.isnan(previous_rate)
+            change_score = np.where(known, cls.lookup_many('tcmb_change', rate - previous_rate), 0.0)
+            change_score = np.where((rate >= 50) & (change_score < 0), change_score * 1.2, change_score)
+        tcmb = cls.lookup_many('tcmb_level', rate) + change_score
+        tcmb = np.where(np.isnan(rate), 0.0, py_round(np.clip(tcmb, -10, 10), 1))
+        
+        # BIST100: trend skoru, %10'dan sert hareketlerde 1.3 kat
+        trend = macro['bist_trend'].to_numpy()
+        bist_change = column('bist_change')
+        bist = np.select([trend == 'up', trend == 'down'],
+                         [cls.BIST_TREND['up'][0], cls.BIST_TREND['down'][0]], cls.BIST_FLAT[0]).astype(float)
+        bist = np.where(np.abs(bist_change) > 10, bist * 1.3, bist)
+        bist = py_round(bist, 1)
+        
+        # Petrol ve altın: yüksek seviyede sert yükseliş ek ceza
+        oil_current, oil_change = column('oil_current'), column('oil_change')
+        oil_boost = np.where((oil_current >= 85) & (oil_change > 5), 1.4, 1.0)
+        oil = level_momentum('oil', oil_current, oil_change, oil_boost)
+        
+        gold_current, gold_change = column('gold_current'), column('gold_change')
+        gold_boost = np.where((gold_current >= 2200) & (gold_change > 8), 1.5, 1.0)
+        gold = level_momentum('gold', gold_current, gold_change, gold_boost)
+        
+        # Ağırlıklı toplam (calculate_overall_macro_score ile aynı toplama sırası)
+        total = (
+            usd * weights['usd'] +
+            tcmb * weights['tcmb'] +
+            bist * weights['bist'] +
+            oil * weights['oil'] +
+            gold * weights['gold']
+        )
+        total = np.clip(total, -10, 10)
+        
+        _, _, labels = cls.LADDERS['summary']
+        summary = np.asarray(labels, dtype=object)[
+            np.searchsorted(cls.LADDERS['summary'][0], total, side='right')
+        ]
+        
+        return pd.DataFrame({
+            'usd': usd, 'tcmb': tcmb, 'bist': bist, 'oil': oil, 'gold': gold,
+            'total_score': py_round(total, 2),
+            'normalized_score': py_round((total + 10) * 5, 1),
+            'summary': summary,
+        }, index=macro.index)
+
 
 # Test fonksiyonu
 if __name__ == "__main__":
@@ -499,3 +578,11 @@ if __name__ == "__main__":
         print(f"  Skor: {comp['score']:.1f}/10 (Ağırlık: %{comp['weight']*100:.0f})")
         print(f"  {comp['description']}")
 
+    
+    # Vektörel skor: aynı görüntünün farklı varyasyonları tek çağrıda
+    history = [test_data, {**test_data, 'usd_try': {'current': 45.0, 'change_30d': 5.0}}, None]
+    table = MacroAnalyzer.score_many(history)
+    print("\n" + "-" * 60)
+    print("VEKTOREL SKOR (score_many):")
+    print(table[['usd', 'tcmb', 'bist', 'oil', 'gold', 'total_score']].to_string())
+    print(f"\nSkaler sonucla ayni: {table['total_score'].iloc[0] == result['total_score']}")
@@ -3,19 +3,27 @@ Makroekonomik veri çekme modülü
 USD/TRY, EUR/TRY, BIST100, Petrol, Altın verilerini yfinance'den çeker
 """
 
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 import json
 import os
+from .history import MacroHistoryStore
+from ..data.providers import get_provider
 
 
 class MacroDataFetcher:
     """Makroekonomik verileri çeken ve yöneten sınıf"""
     
-    def __init__(self, config_path: str = "config/macro_data.json"):
+    def __init__(self, config_path: str = "config/macro_data.json",
+                 history_path: Optional[str] = "data/macro_history.db"):
+        """
+        Args:
+            config_path: Güncel makro verilerin tutulduğu JSON dosyası
+            history_path: Geçmiş deposu (SQLite), None ise geçmiş tutulmaz
+        """
         self.config_path = config_path
+        self.history = MacroHistoryStore(history_path) if history_path else None
         
         # Veri sembolleri
         self.symbols = {
@@ -37,7 +45,7 @@ class MacroDataFetcher:
             float: Güncel fiyat veya None
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_provider().ticker(symbol)
             # Son 5 günlük veriyi çek (güncel fiyat için)
             hist = ticker.history(period='5d')
             
@@ -65,7 +73,7 @@ class MacroDataFetcher:
             float: Yüzdesel değişim (örn: 3.5 = %3.5 artış)
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_provider().ticker(symbol)
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days+5)  # Biraz buffer
             
@@ -93,37 +101,197 @@ class MacroDataFetcher:
             str: 'up', 'down', veya 'flat'
         """
         try:
-            ticker = yf.Ticker(self.symbols['bist100'])
+            ticker = get_provider().ticker(self.symbols['bist100'])
             hist = ticker.history(period='3mo')
             
-            if len(hist) < 50:
-                return 'flat'
-            
-            # 20 ve 50 günlük hareketli ortalamalar
-            ma20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-            ma50 = hist['Close'].rolling(window=50).mean().iloc[-1]
-            
-            # Trend belirleme
-            if ma20 > ma50 * 1.02:  # %2+ üstünde
-                return 'up'
-            elif ma20 < ma50 * 0.98:  # %2+ altında
-                return 'down'
-            else:
-                return 'flat'
+            return self.trend_from_close(hist['Close'])
                 
         except Exception as e:
             print(f"[ERROR] BIST100 trend hesaplanirken hata: {e}")
             return 'flat'
     
-    def fetch_all_macro_data(self) -> Dict:
+    @staticmethod
+    def trend_from_close(close: pd.Series) -> str:
+        """
+        Kapanış serisinden trend belirler (MA20 vs MA50)
+        
+        Args:
+            close: Günlük kapanış fiyatları (en az 50 gün)
+            
+        Returns:
+            str: 'up', 'down', veya 'flat'
+        """
+        if len(close) < 50:
+            return 'flat'
+        
+        # 20 ve 50 günlük hareketli ortalamalar
+        ma20 = close.rolling(window=20).mean().iloc[-1]
+        ma50 = close.rolling(window=50).mean().iloc[-1]
+        
+        # Trend belirleme
+        if ma20 > ma50 * 1.02:  # %2+ üstünde
+            return 'up'
+        elif ma20 < ma50 * 0.98:  # %2+ altında
+            return 'down'
+        else:
+            return 'flat'
+    
+    @staticmethod
+    def change_from_close(close: pd.Series, days: int = 30,
+                          now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Kapanış serisinden son N gündeki yüzdesel değişimi hesaplar
+        (fetch_price_change ile aynı pencere: N+5 gün buffer)
+        
+        Args:
+            close: Günlük kapanış fiyatları (timezone'suz tarih indeksli)
+            days: Kaç gün öncesiyle karşılaştırılacak
+            now: Referans zaman (varsayılan: şimdi)
+            
+        Returns:
+            float: Yüzdesel değişim veya None
+        """
+        now = now or datetime.now()
+        window = close[close.index >= pd.Timestamp(now - timedelta(days=days+5))]
+        
+        if len(window) < 2:
+            return None
+        
+        old_price = window.iloc[0]
+        new_price = window.iloc[-1]
+        
+        change_pct = ((new_price - old_price) / old_price) * 100
+        return round(float(change_pct), 2)
+    
+    def fetch_history(self, period: str = '3mo') -> Dict[str, pd.Series]:
+        """
+        Tüm makro sembollerin kapanış geçmişini TEK toplu istekle çeker
+        
+        Args:
+            period: Geçmiş uzunluğu (MA50 ve 30g değişim için 3mo yeterli)
+            
+        Returns:
+            Dict: {anahtar: kapanış serisi} (örn: {'usd_try': Series, ...})
+                  Verisi gelmeyen semboller dahil edilmez
+        """
+        tickers = list(self.symbols.values())
+        
+        try:
+            raw = get_provider().download(
+                tickers,
+                period=period,
+                interval='1d',
+                group_by='ticker',
+                auto_adjust=True,
+                ignore_tz=True,   # Farklı borsalar ortak (yerel) tarih indeksinde
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            print(f"[ERROR] Makro toplu veri cekilemedi: {e}")
+            return {}
+        
+        closes = {}
+        
+        if raw is None or raw.empty:
+            return closes
+        
+        for key, ticker in self.symbols.items():
+            if isinstance(raw.columns, pd.MultiIndex):
+                if ticker not in raw.columns.get_level_values(0):
+                    continue
+                close = raw[ticker]['Close']
+            else:
+                close = raw['Close']
+            
+            # Sembolün işlem görmediği günler NaN gelir (farklı tatil takvimleri)
+            close = close.dropna()
+            if close.index.tz is not None:
+                close.index = close.index.tz_localize(None)
+            
+            if not close.empty:
+                closes[key] = close
+        
+        return closes
+    
+    def build_snapshot(self, closes: Dict[str, pd.Series],
+                       now: Optional[datetime] = None) -> Dict:
+        """
+        Kapanış geçmişinden makro veri sözlüğünü türetir
+        (güncel fiyat, 30g değişim ve BIST100 trendi - ekstra istek yok)
+        
+        Args:
+            closes: fetch_history() çıktısı
+            now: Referans zaman (varsayılan: şimdi)
+            
+        Returns:
+            Dict: config/macro_data.json formatında makro veriler
+        """
+        now = now or datetime.now()
+        
+        def _current(key):
+            close = closes.get(key)
+            return round(float(close.iloc[-1]), 2) if close is not None else None
+        
+        def _change(key):
+            close = closes.get(key)
+            return self.change_from_close(close, 30, now=now) if close is not None else None
+        
+        bist_close = closes.get('bist100')
+        
+        return {
+            'last_update': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'usd_try': {'current': _current('usd_try'), 'change_30d': _change('usd_try')},
+            'eur_try': {'current': _current('eur_try'), 'change_30d': _change('eur_try')},
+            'bist100': {
+                'current': _current('bist100'),
+                'trend': self.trend_from_close(bist_close) if bist_close is not None else 'flat',
+                'change_30d': _change('bist100')
+            },
+            'oil': {'current': _current('oil'), 'change_30d': _change('oil')},
+            'gold': {'current': _current('gold'), 'change_30d': _change('gold')},
+            'tcmb_rate': None  # Manuel input gerekecek
+        }
+    
+    def fetch_all_macro_data(self, batch: bool = True) -> Dict:
         """
         Tüm makroekonomik verileri çeker ve dict olarak döner
         
+        Varsayılan olarak tüm semboller için tek bir toplu geçmiş isteği atılır;
+        güncel fiyat, 30 günlük değişim ve BIST100 trendi bu tek tablodan
+        türetilir (~11 istek yerine 1). Toplu istekte eksik gelen semboller
+        için sembol bazlı yönteme geri dönülür.
+        
+        Args:
+            batch: False ise eski yöntemle sembol başına ayrı istekler atılır
+        
         Returns:
             Dict: Tüm makro veriler
         """
         print("[*] Makro veriler cekiliyor...")
         
+        if batch:
+            closes = self.fetch_history(period='3mo')
+            data = self.build_snapshot(closes)
+            
+            missing = [key for key in self.symbols if key not in closes]
+            
+            if not missing:
+                print("[OK] Makro veriler cekildi! (1 toplu istek)")
+                return data
+            
+            print(f"[WARN] Toplu istekte eksik: {', '.join(missing)} - tek tek deneniyor")
+            
+            for key in missing:
+                symbol = self.symbols[key]
+                data[key]['current'] = self.fetch_current_price(symbol)
+                data[key]['change_30d'] = self.fetch_price_change(symbol, 30)
+                if key == 'bist100':
+                    data[key]['trend'] = self.fetch_bist100_trend()
+            
+            print("[OK] Makro veriler cekildi!")
+            return data
+        
         data = {
             'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'usd_try': {
@@ -153,6 +321,70 @@ class MacroDataFetcher:
         print("[OK] Makro veriler cekildi!")
         return data
     
+    def build_history(self, closes: Dict[str, pd.Series],
+                      start: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Kapanış geçmişinden her işlem günü için makro anlık görüntü üretir
+        (her gün sadece o güne kadarki veri kullanılır - look-ahead yok)
+        
+        Args:
+            closes: fetch_history() çıktısı
+            start: Bu tarihten önceki günleri atla ('YYYY-MM-DD')
+            
+        Returns:
+            Dict: {'YYYY-MM-DD': makro veri} sözlüğü
+        """
+        # Günler BIST100 takvimine göre (yoksa USD/TRY)
+        calendar_key = 'bist100' if 'bist100' in closes else next(iter(closes), None)
+        if calendar_key is None:
+            return {}
+        
+        days = closes[calendar_key].index
+        if start is not None:
+            days = days[days >= pd.Timestamp(start)]
+        
+        snapshots = {}
+        for day in days:
+            # Gün sonu itibarıyla bilinen veriler
+            end_of_day = day + pd.Timedelta(hours=23, minutes=59)
+            visible = {key: close[close.index <= end_of_day] for key, close in closes.items()}
+            visible = {key: close for key, close in visible.items() if not close.empty}
+            
+            snapshot = self.build_snapshot(visible, now=end_of_day.to_pydatetime())
+            snapshots[day.strftime('%Y-%m-%d')] = snapshot
+        
+        return snapshots
+    
+    def backfill_history(self, period: str = '5y') -> int:
+        """
+        Geçmiş makro verileri tek toplu istekle çekip geçmiş deposunu doldurur
+        
+        Args:
+            period: Ne kadar geriye gidilsin ('1y', '5y', 'max' ...)
+            
+        Returns:
+            int: Yeni yazılan gün sayısı (kayıtlı günlerin üzerine yazılmaz)
+        """
+        if self.history is None:
+            print("[WARN] Gecmis deposu kapali (history_path=None)")
+            return 0
+        
+        print(f"[*] Makro gecmis cekiliyor ({period})...")
+        closes = self.fetch_history(period=period)
+        
+        if not closes:
+            print("[ERROR] Makro gecmis cekilemedi")
+            return 0
+        
+        # İlk ~50 gün MA50 için ısınma süresi, trend hesaplanamaz
+        snapshots = self.build_history(closes)
+        written = self.history.append_many(snapshots)
+        
+        skipped = len(snapshots) - written
+        print(f"[OK] {written} gunluk makro gecmis kaydedildi"
+              + (f" ({skipped} gun zaten kayitli, korundu)" if skipped else ""))
+        return written
+    
     def save_to_config(self, data: Dict) -> bool:
         """
         Makro verileri config/macro_data.json'a kaydeder
@@ -171,6 +403,11 @@ class MacroDataFetcher:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
             print(f"[OK] Veriler kaydedildi: {self.config_path}")
+            
+            # Geçmişe de ekle (JSON sadece son durumu tutar)
+            if self.history is not None:
+                self.history.append(data)
+            
             return True
             
         except Exception as e:
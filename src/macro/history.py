@@ -0,0 +1,234 @@
+"""
+Makroekonomik veri geçmişi (zaman serisi) deposu
+Her güncellemede config/macro_data.json üzerine yazılan anlık görüntüleri
+tarih bazlı bir SQLite tablosunda saklar ve geçmişe dönük sorgulamayı sağlar
+"""
+
+import json
+import os
+import sqlite3
+from bisect import bisect_right
+from datetime import datetime, date
+from typing import Dict, List, Optional, Union
+
+
+DateLike = Union[str, date, datetime]
+
+
+def _to_date_key(value: DateLike) -> str:
+    """Tarih benzeri değeri 'YYYY-MM-DD' anahtarına çevirir"""
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%Y-%m-%d')
+    # '2025-11-11 18:35:32' gibi last_update değerleri de kabul edilir
+    return str(value)[:10]
+
+
+class MacroHistoryStore:
+    """Tarih anahtarlı makro veri geçmişi (SQLite)"""
+
+    def __init__(self, db_path: str = "data/macro_history.db"):
+        """
+        Args:
+            db_path: SQLite dosyasının yolu
+        """
+        self.db_path = db_path
+
+        # Toplu sorgular için bellek içi indeks (load_index ile doldurulur)
+        self._dates: Optional[List[str]] = None
+        self._payloads: Optional[List[Dict]] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Veritabanına bağlanır, tablo yoksa oluşturur"""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        # date PRIMARY KEY -> B-tree indeks, as_of sorgusu O(log n)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS macro_history ("
+            "  date TEXT PRIMARY KEY,"
+            "  payload TEXT NOT NULL,"
+            "  saved_at TEXT NOT NULL"
+            ")"
+        )
+        return conn
+
+    def append(self, data: Dict, as_of_date: Optional[DateLike] = None) -> bool:
+        """
+        Bir makro anlık görüntüsünü geçmişe ekler
+
+        Aynı güne ait kayıt varsa günün son görüntüsü saklanır (gün başına tek satır).
+
+        Args:
+            data: config/macro_data.json formatında makro veriler
+            as_of_date: Kaydın tarihi (varsayılan: data['last_update'] veya bugün)
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        key = _to_date_key(as_of_date or data.get('last_update') or datetime.now())
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO macro_history (date, payload, saved_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(data, ensure_ascii=False),
+                     datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                )
+            conn.close()
+            self._dates = None  # Bellek içi indeks geçersiz
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Makro gecmise yazilamadi: {e}")
+            return False
+
+    def append_many(self, snapshots: Dict[str, Dict]) -> int:
+        """
+        Birden fazla günü tek transaction'da ekler (geçmiş doldurma için)
+
+        Sadece kaydı olmayan günler yazılır: canlı kaydedilmiş günlük görüntüler
+        (tcmb_rate ve anlık değerler dahil) yeniden oluşturulmuş verilerle
+        ezilmez. Aynı günün canlı güncellemesi için append kullanılır.
+
+        Args:
+            snapshots: {'YYYY-MM-DD': makro veri} sözlüğü
+
+        Returns:
+            int: Yeni yazılan kayıt sayısı (mevcut günler atlanır)
+        """
+        saved_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [
+            (_to_date_key(day), json.dumps(data, ensure_ascii=False), saved_at)
+            for day, data in snapshots.items()
+        ]
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.executemany(
+                    "INSERT OR IGNORE INTO macro_history (date, payload, saved_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                written = cursor.rowcount
+            conn.close()
+            self._dates = None
+            return written
+
+        except Exception as e:
+            print(f"[ERROR] Makro gecmise yazilamadi: {e}")
+            return 0
+
+    def as_of(self, as_of_date: DateLike) -> Optional[Dict]:
+        """
+        Belirli bir tarihte bilinen en son makro veriyi döndürür (point-in-time)
+
+        Geleceğe bakma (look-ahead) olmaz: o tarihten SONRA kaydedilmiş veri dönmez.
+
+        Args:
+            as_of_date: Sorgu tarihi
+
+        Returns:
+            Dict: MacroAnalyzer'ın beklediği formatta makro veri veya None
+
+        Örnek:
+            >>> store = MacroHistoryStore()
+            >>> data = store.as_of('2025-06-30')
+            >>> MacroAnalyzer(data).calculate_overall_macro_score()
+        """
+        key = _to_date_key(as_of_date)
+
+        # Bellek içi indeks yüklüyse diske gitmeden ikili arama
+        if self._dates is not None:
+            pos = bisect_right(self._dates, key)
+            return self._payloads[pos - 1] if pos > 0 else None
+
+        if not os.path.exists(self.db_path):
+            return None
+
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT payload FROM macro_history WHERE date <= ? ORDER BY date DESC LIMIT 1",
+                (key,)
+            ).fetchone()
+            conn.close()
+
+        except Exception as e:
+            print(f"[ERROR] Makro gecmis okunamadi: {e}")
+            return None
+
+        return json.loads(row[0]) if row else None
+
+    def load_index(self) -> int:
+        """
+        Tüm geçmişi belleğe yükler (binlerce tarihlik toplu sorgular için)
+
+        Sonraki as_of() / as_of_many() çağrıları diske gitmeden
+        sıralı tarih listesinde ikili arama (O(log n)) ile cevaplanır.
+
+        Returns:
+            int: Yüklenen kayıt sayısı
+        """
+        if not os.path.exists(self.db_path):
+            self._dates, self._payloads = [], []
+            return 0
+
+        conn = self._connect()
+        rows = conn.execute("SELECT date, payload FROM macro_history ORDER BY date").fetchall()
+        conn.close()
+
+        self._dates = [row[0] for row in rows]
+        self._payloads = [json.loads(row[1]) for row in rows]
+        return len(rows)
+
+    def as_of_many(self, dates: List[DateLike]) -> List[Optional[Dict]]:
+        """
+        Birden fazla tarih için point-in-time makro veri döndürür
+
+        Args:
+            dates: Sorgu tarihleri
+
+        Returns:
+            List[Dict]: Her tarih için makro veri (o tarihte veri yoksa None)
+        """
+        if self._dates is None:
+            self.load_index()
+
+        return [self.as_of(d) for d in dates]
+
+    def dates(self) -> List[str]:
+        """Kayıtlı tüm tarihleri sıralı döndürür"""
+        if self._dates is None:
+            self.load_index()
+        return list(self._dates)
+
+    def __len__(self) -> int:
+        return len(self.dates())
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import tempfile
+
+    print("=" * 60)
+    print("MAKRO GEÇMİŞ DEPOSU TESTİ")
+    print("=" * 60)
+
+    tmp_path = os.path.join(tempfile.mkdtemp(), 'macro_history.db')
+    store = MacroHistoryStore(tmp_path)
+
+    for day, usd in [('2025-11-03', 41.9), ('2025-11-05', 42.0), ('2025-11-11', 42.2)]:
+        store.append({
+            'last_update': f'{day} 18:30:00',
+            'usd_try': {'current': usd, 'change_30d': 1.2},
+            'tcmb_rate': 39.5
+        })
+
+    print(f"\nKayit sayisi: {len(store)}")
+    for query in ['2025-11-01', '2025-11-04', '2025-11-11', '2025-12-31']:
+        result = store.as_of(query)
+        usd = result['usd_try']['current'] if result else None
+        print(f"  as_of({query}) -> USD/TRY: {usd}")
+
+    print("\n✅ Geçmiş deposu çalışıyor!")
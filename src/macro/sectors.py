@@ -5,39 +5,14 @@ Farklı sektörlerdeki hisseler için özel makro değerlendirmesi
 
 from typing import Dict, Tuple, Optional
 
+from ..data.bist_stocks import SECTOR_STOCKS, get_sector
+
 
 class SectorAnalyzer:
     """Sektöre özel makro analiz yapan sınıf"""
     
-    # Sektör tanımları (BIST hisseleri için)
-    SECTORS = {
-        # Havayolu şirketleri
-        'airline': ['THYAO', 'PGSUS'],
-        
-        # Bankalar
-        'bank': ['GARAN', 'AKBNK', 'ISCTR', 'YKBNK', 'HALKB', 'VAKBN'],
-        
-        # Holding'ler
-        'holding': ['SAHOL', 'KCHOL', 'DOHOL', 'TAVHL'],
-        
-        # Enerji
-        'energy': ['TUPRS', 'PETKM', 'PENTA', 'AKENR'],
-        
-        # Teknoloji
-        'tech': ['ASELS', 'LOGO', 'NETAS', 'KAREL'],
-        
-        # İhracatçı sanayi
-        'export': ['EREGL', 'ARCLK', 'VESTEL', 'FROTO', 'TOASO', 'SISE'],
-        
-        # İthalatçı perakende
-        'retail': ['BIMAS', 'MGROS', 'SOKM', 'MAVI'],
-        
-        # Turizm
-        'tourism': ['MAALT', 'AYCES', 'KSTUR'],
-        
-        # Telekom
-        'telecom': ['TTKOM', 'TCELL', 'TURKCELL']
-    }
+    # Sektör tanımları: tek kaynak src/data/bist_stocks.SECTOR_STOCKS
+    SECTORS = SECTOR_STOCKS
     
     def __init__(self, macro_data: Dict):
         """
@@ -56,14 +31,8 @@ class SectorAnalyzer:
         Returns:
             str: Sektör adı veya None
         """
-        # .IS suffix'ini temizle
-        clean_symbol = symbol.replace('.IS', '').upper()
-        
-        for sector, stocks in self.SECTORS.items():
-            if clean_symbol in stocks:
-                return sector
-        
-        return None
+        # Hazır sembol -> sektör indeksinden O(1) arama
+        return get_sector(symbol)
     
     def analyze_airline_sector(self) -> Tuple[float, str]:
         """
@@ -251,8 +220,18 @@ class SectorAnalyzer:
         Returns:
             Tuple[float, str]: (skor, açıklama)
         """
-        sector = self.get_sector(symbol)
+        return self.analyze_sector(self.get_sector(symbol))
+    
+    def analyze_sector(self, sector: Optional[str]) -> Tuple[float, str]:
+        """
+        Sektör adına göre özel analiz yapar (aynı sektördeki tüm hisseler için aynı)
         
+        Args:
+            sector: SECTORS anahtarı (örn: 'bank') veya None
+            
+        Returns:
+            Tuple[float, str]: (skor, açıklama)
+        """
         if sector is None:
             return 0, "Sektör bilgisi yok (genel makro analiz kullanılıyor)"
         
@@ -5,7 +5,9 @@ Analiz sonuçlarını kullanıcıya
 anlaşılır formatta sunar.
 """
 
-from .terminal import print_analysis_report
-
-__all__ = ['print_analysis_report']
+from ..utils.lazy import lazy_exports
 
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.terminal': ['print_analysis_report']
+})
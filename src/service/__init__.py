@@ -0,0 +1,13 @@
+"""
+Analiz Servisi
+
+Fiyat verilerini, gösterge sonuçlarını ve makro veriyi bellekte tutan
+uzun ömürlü HTTP/JSON servisi (bkz. serve.py).
+"""
+
+from ..utils.lazy import lazy_exports
+
+# Alt modüller ilk erişimde yüklenir (bkz. src/utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.daemon': ['AnalysisService', 'create_server']
+})
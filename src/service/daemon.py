@@ -0,0 +1,438 @@
+"""
+Analiz Servisi (Daemon)
+
+Her `python analyze.py X` çağrısı yorumlayıcı açılışını, pandas/yfinance
+importunu, makro JSON okumasını ve veri çekmeyi baştan öder. Bu modül
+bunları bir kez yapıp bellekte tutan, stdlib http.server tabanlı bir
+JSON servisi sağlar:
+
+    GET /health                         -> Servis durumu
+    GET /analyze/THYAO                  -> Teknik analiz + sinyal
+    GET /hybrid/THYAO                   -> Hibrid analiz (Teknik + Makro)
+    GET /screen?universe=BIST30&top=20  -> Sıralı tarama tablosu (&macro=1)
+
+Bellekteki katmanlar:
+    - Fiyat verisi: bir sonraki seans kapanışına kadar (cache.expires_at)
+    - Analiz sonucu: fiyat verisi değişene kadar
+    - Makro veri: config dosyası değişene kadar (mtime kontrolü)
+
+Eşzamanlılık:
+    Ortak kilit sadece kayıt sözlüğünü okurken/değiştirirken tutulur; ağdan
+    veri çekme ve analiz kilit dışında yapılır. Aynı hisse için aynı anda
+    gelen istekler tek bir çekimi (Future) bekler, analiz hesapları hisse
+    bazlı kilitle korunur. Böylece yavaş bir çekim diğer hisseleri bekletmez.
+
+Cache'teki bir hisse için istek süresi birkaç milisaniyedir.
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+import pandas as pd
+
+from ..data.cache import expires_at
+from ..data.fetcher import fetch_stock_data, get_multiple_stocks
+from ..data.bist_stocks import get_stock_list
+from ..analysis.technical import analyze_stock, generate_signals
+from ..analysis.hybrid import HybridAnalyzer
+from ..analysis.screener import summarize_analysis, rank_table
+from ..macro.fetcher import MacroDataFetcher
+
+
+class AnalysisService:
+    """Fiyat, analiz ve makro veriyi bellekte tutan analiz servisi"""
+
+    def __init__(self, period: str = "1y", macro_config: str = "config/macro_data.json"):
+        """
+        Args:
+            period: Analizde kullanılacak veri periyodu
+            macro_config: Makro veri dosyası (hibrid analiz için)
+        """
+        self.period = period
+        self.macro_config = macro_config
+        self.started_at = time.time()
+
+        # {symbol: {'symbol', 'data', 'expires', 'analysis', 'signals', 'hybrid', 'lock'}}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Devam eden çekimler: {symbol: Future(kayıt veya None)}
+        self._inflight: Dict[str, Future] = {}
+        self._macro: Optional[Dict] = None
+        self._macro_mtime: Optional[float] = None
+        # Sadece _entries / _inflight erişimi için (ağ ve analiz kilit dışında)
+        self._lock = threading.Lock()
+        self._macro_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Bellek katmanları
+    # -------------------------------------------------------------------------
+
+    def _store(self, symbol: str, data: pd.DataFrame) -> Dict[str, Any]:
+        """Yeni fiyat verisini kaydeder (eski analiz sonuçları düşer)"""
+        entry = {
+            'symbol': symbol,
+            'data': data,
+            'expires': expires_at(datetime.now(timezone.utc), '1d'),
+            'analysis': None,
+            'signals': None,
+            'hybrid': None,
+            'lock': threading.Lock(),
+        }
+        with self._lock:
+            self._entries[symbol] = entry
+        return entry
+
+    def _claim(self, symbols: List[str]) -> Tuple[Dict[str, Future], Dict[str, Future]]:
+        """
+        Bayat hisseler için çekim sahipliği alır (kilit altında).
+
+        Returns:
+            tuple: (bu çağrının çekeceği {symbol: Future},
+                    başka bir isteğin çekmekte olduğu {symbol: Future})
+        """
+        owned, waiting = {}, {}
+        with self._lock:
+            for symbol in symbols:
+                if self._is_fresh(self._entries.get(symbol)):
+                    continue
+                if symbol in self._inflight:
+                    waiting[symbol] = self._inflight[symbol]
+                else:
+                    owned[symbol] = self._inflight[symbol] = Future()
+        return owned, waiting
+
+    def _release(self, owned: Dict[str, Future], stocks: Dict[str, pd.DataFrame]) -> None:
+        """Çekilen verileri kaydeder ve bekleyen isteklere sonucu bildirir"""
+        for symbol, future in owned.items():
+            data = stocks.get(symbol)
+            entry = self._store(symbol, data) if data is not None and not data.empty else None
+            with self._lock:
+                self._inflight.pop(symbol, None)
+            future.set_result(entry)
+
+    def _fail(self, owned: Dict[str, Future], error: Exception) -> None:
+        """Çekim hata verdiyse bekleyen isteklere hatayı iletir"""
+        for symbol, future in owned.items():
+            with self._lock:
+                self._inflight.pop(symbol, None)
+            if not future.done():
+                future.set_exception(error)
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return entry is not None and datetime.now(timezone.utc) < entry['expires']
+
+    def get_entry(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Hissenin bellek kaydını döndürür; yoksa veya bayatsa veriyi çeker.
+
+        Returns:
+            dict: Kayıt (data, analysis, signals, hybrid)
+            None: Veri çekilemediyse
+        """
+        symbol = symbol.upper().strip()
+        owned, waiting = self._claim([symbol])
+
+        if owned:
+            try:
+                data = fetch_stock_data(symbol, period=self.period)
+            except Exception as e:
+                self._fail(owned, e)
+                raise
+            self._release(owned, {symbol: data})
+            return owned[symbol].result()
+
+        if waiting:
+            return waiting[symbol].result()
+
+        with self._lock:
+            return self._entries.get(symbol)
+
+    def preload(self, symbols: List[str]) -> int:
+        """
+        Bellekte olmayan/bayat hisseleri toplu çeker ve analiz eder.
+
+        Returns:
+            int: Bellekteki hazır hisse sayısı
+        """
+        symbols = [s.upper().strip() for s in symbols]
+        owned, waiting = self._claim(symbols)
+
+        if owned:
+            try:
+                stocks = get_multiple_stocks(list(owned), period=self.period, show_stats=False)
+            except Exception as e:
+                self._fail(owned, e)
+                raise
+            self._release(owned, stocks)
+
+        for future in waiting.values():
+            try:
+                future.result()
+            except Exception:
+                pass
+
+        with self._lock:
+            ready = [self._entries[s] for s in symbols if s in self._entries]
+        for entry in ready:
+            self._technical(entry)
+
+        return len(ready)
+
+    def _technical(self, entry: Dict[str, Any]) -> Tuple[Dict, Dict]:
+        """Teknik analiz sonucunu (gerekirse hesaplayarak) döndürür"""
+        with entry['lock']:
+            if entry['analysis'] is None:
+                analysis = analyze_stock(entry['data'], symbol=entry['symbol'])
+                entry['signals'] = generate_signals(analysis)
+                entry['analysis'] = analysis
+            return entry['analysis'], entry['signals']
+
+    def macro_data(self) -> Optional[Dict]:
+        """Makro veriyi döndürür; config dosyası değiştiyse yeniden yükler"""
+        try:
+            mtime = os.path.getmtime(self.macro_config)
+        except OSError:
+            return None
+
+        with self._macro_lock:
+            if mtime != self._macro_mtime:
+                self._macro = MacroDataFetcher(config_path=self.macro_config).load_from_config()
+                self._macro_mtime = mtime
+            return self._macro
+
+    # -------------------------------------------------------------------------
+    # Endpoint'ler
+    # -------------------------------------------------------------------------
+
+    def analyze(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Teknik analiz (analyze.py ile aynı içerik).
+
+        Returns:
+            dict: {'symbol', 'analysis', 'signals'} veya None (veri yok)
+        """
+        entry = self.get_entry(symbol)
+        if entry is None:
+            return None
+        analysis, signals = self._technical(entry)
+
+        return {'symbol': symbol.upper(), 'analysis': analysis, 'signals': signals}
+
+    def hybrid(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Hibrid analiz (analyze.py --macro ile aynı içerik).
+
+        Returns:
+            dict: analyze() + {'hybrid', 'recommendation'}
+            None: Veri yok
+
+        Raises:
+            LookupError: Makro veri yüklenemediyse
+        """
+        macro_data = self.macro_data()
+        if macro_data is None:
+            raise LookupError("Makro veriler bulunamadi (python update_macro.py)")
+
+        entry = self.get_entry(symbol)
+        if entry is None:
+            return None
+        analysis, signals = self._technical(entry)
+
+        with entry['lock']:
+            # Hibrid sonuç, makro veri değişene kadar geçerli
+            if entry['hybrid'] is None or entry['hybrid'][0] is not macro_data:
+                analyzer = HybridAnalyzer(
+                    technical_score=signals.get('score', 50),
+                    macro_data=macro_data,
+                    symbol=symbol.upper()
+                )
+                result = analyzer.calculate_hybrid_score()
+                entry['hybrid'] = (macro_data, result, analyzer.get_recommendation(result))
+
+            _, result, recommendation = entry['hybrid']
+
+        return {
+            'symbol': symbol.upper(),
+            'analysis': analysis,
+            'signals': signals,
+            'hybrid': result,
+            'recommendation': recommendation
+        }
+
+    def screen(self, universe: str = "BIST30", macro: bool = False,
+               top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Hisse listesini tarar (screen.py ile aynı sıralama).
+
+        Returns:
+            list: Sıralı satırlar
+        """
+        symbols = get_stock_list(universe)
+        self.preload(symbols)
+
+        with self._lock:
+            loaded = set(self._entries)
+
+        rows = []
+        for symbol in symbols:
+            if symbol not in loaded:
+                rows.append({'symbol': symbol, 'error': 'Veri cekilemedi'})
+                continue
+            try:
+                if macro:
+                    result = self.hybrid(symbol)
+                    rows.append(summarize_analysis(symbol, result['analysis'],
+                                                   result['signals'], result['hybrid']))
+                else:
+                    result = self.analyze(symbol)
+                    rows.append(summarize_analysis(symbol, result['analysis'], result['signals']))
+            except LookupError:
+                raise
+            except Exception as e:
+                rows.append({'symbol': symbol, 'error': str(e)})
+
+        table = rank_table(rows)
+        if top:
+            table = table.head(top)
+        return table.astype(object).where(table.notna(), None).to_dict('records')
+
+    def health(self) -> Dict[str, Any]:
+        """Servis durumu"""
+        return {
+            'status': 'ok',
+            'period': self.period,
+            'symbols': len(self._entries),
+            'macro_loaded': self._macro is not None,
+            'uptime': round(time.time() - self.started_at, 1)
+        }
+
+
+# =============================================================================
+# HTTP katmanı
+# =============================================================================
+
+def _json_default(value: Any) -> Any:
+    """numpy/pandas tiplerini JSON'a çevirir"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """GET isteklerini AnalysisService'e yönlendirir"""
+
+    server_version = "AlgoTradingBot/0.1"
+
+    def do_GET(self):
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        service: AnalysisService = self.server.service
+
+        try:
+            if parts == ['health']:
+                status, body = 200, service.health()
+            elif len(parts) == 2 and parts[0] == 'analyze':
+                body = service.analyze(parts[1])
+                status = 200 if body else 404
+            elif len(parts) == 2 and parts[0] == 'hybrid':
+                body = service.hybrid(parts[1])
+                status = 200 if body else 404
+            elif parts == ['screen']:
+                status, body = 200, service.screen(
+                    universe=query.get('universe', 'BIST30'),
+                    macro=query.get('macro', '0').lower() in ('1', 'true', 'yes'),
+                    top=int(query['top']) if 'top' in query else None
+                )
+            else:
+                status, body = 404, {'error': f"Bilinmeyen adres: {url.path}"}
+
+            if body is None:
+                body = {'error': f"{parts[1].upper()} verisi cekilemedi"}
+
+        except LookupError as e:
+            status, body = 503, {'error': str(e)}
+        except ValueError as e:
+            status, body = 400, {'error': str(e)}
+        except Exception as e:
+            status, body = 500, {'error': f"Beklenmeyen hata: {e}"}
+
+        payload = json.dumps(body, ensure_ascii=False, default=_json_default).encode('utf-8')
+        elapsed = (time.perf_counter() - started) * 1000
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('X-Response-Time', f"{elapsed:.2f}ms")
+        self.end_headers()
+        self.wfile.write(payload)
+
+        print(f"[API] GET {self.path} {status} {elapsed:.1f} ms")
+
+    def log_message(self, format, *args):
+        # Varsayılan stderr logu yerine do_GET içindeki kısa satır kullanılır
+        pass
+
+
+def create_server(service: AnalysisService, host: str = "127.0.0.1",
+                  port: int = 8765) -> ThreadingHTTPServer:
+    """
+    Servisi sunan HTTP sunucusunu oluşturur (serve_forever ile başlatılır).
+
+    Örnek:
+        >>> server = create_server(AnalysisService(), port=8765)
+        >>> server.serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), AnalysisRequestHandler)
+    server.service = service
+    return server
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    from urllib.request import urlopen
+
+    print("=" * 60)
+    print("ANALIZ SERVISI - TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(3)
+    index = pd.date_range('2024-01-01', periods=250, freq='B')
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, len(index))))
+    data = pd.DataFrame({
+        'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+        'Volume': rng.integers(100_000, 5_000_000, len(index)).astype(float)
+    }, index=index)
+
+    service = AnalysisService()
+    service._store('TEST', data)
+
+    server = create_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    for path in ['/health', '/analyze/TEST', '/analyze/TEST', '/yok']:
+        try:
+            with urlopen(base + path) as response:
+                json.loads(response.read())
+                print(f"  {path}: {response.status} {response.headers['X-Response-Time']}")
+        except Exception as e:
+            print(f"  {path}: {e}")
+
+    print(f"\n[OK] TEST sinyali: {service.analyze('TEST')['signals']['overall_signal']}")
+
+    server.shutdown()
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
@@ -0,0 +1,5 @@
+"""
+Yardımcı Araçlar
+
+Paketler arası ortak altyapı (lazy import, profil, sayısal yardımcılar, ...).
+"""
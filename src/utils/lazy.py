@@ -0,0 +1,47 @@
+"""
+Lazy Import Yardımcısı
+
+Paket __init__ dosyalarının alt modülleri (ve onların pandas / yfinance
+gibi ağır bağımlılıklarını) açılışta değil, bir isme ilk erişildiğinde
+yüklemesini sağlar (PEP 562 modül seviyesinde __getattr__).
+
+Örnek Kullanım (paket __init__.py içinde):
+    >>> from ..utils.lazy import lazy_exports
+    >>> __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ...     '.fetcher': ['fetch_stock_data', 'get_stock_info'],
+    ... })
+"""
+
+import sys
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, List[str]]) -> Tuple[Callable, Callable, List[str]]:
+    """
+    Paket için lazy __getattr__, __dir__ ve __all__ üretir.
+
+    Args:
+        package: Paket adı (__name__)
+        exports: {alt modül ('.fetcher'): [dışa açılan isimler]}
+
+    Returns:
+        tuple: (__getattr__, __dir__, __all__)
+    """
+    owners = {name: module for module, names in exports.items() for name in names}
+    names = list(owners)
+
+    def __getattr__(name: str):
+        if name not in owners:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(owners[name], package), name)
+
+        # Sonraki erişimler __getattr__'a düşmesin
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(names))
+
+    return __getattr__, __dir__, names
@@ -0,0 +1,28 @@
+"""
+Sayısal Yardımcılar
+
+Skaler (Python) ve vektörel (NumPy) hesapların birebir aynı sonucu
+vermesi için ortak fonksiyonlar.
+"""
+
+import numpy as np
+
+
+def py_round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Diziyi Python round() ile birebir aynı şekilde yuvarlar.
+
+    np.round ondalık sınırdaki bazı değerlerde (örn. 0.285) round()'dan
+    farklı sonuç verir. Skorlar genelde az sayıda farklı değer aldığı için
+    tekil değerler round() ile yuvarlanıp geri dağıtılır.
+
+    Args:
+        values: Sayısal dizi (her boyutta)
+        ndigits: Ondalık basamak sayısı
+
+    Returns:
+        np.ndarray: Aynı şekilde, yuvarlanmış float dizi
+    """
+    values = np.asarray(values, dtype=float)
+    unique, inverse = np.unique(values, return_inverse=True)
+    return np.array([round(float(v), ndigits) for v in unique])[inverse.reshape(values.shape)]
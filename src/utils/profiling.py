@@ -0,0 +1,260 @@
+"""
+Profil (Süre Ölçüm) Modülü
+
+Sıcak yoldaki fonksiyonların (veri çekme, gösterge hesaplama, analiz,
+makro/hibrid skor) süresini, çağrı sayısını ve çekilen bayt miktarını
+kaydeden hafif bir ölçüm katmanı.
+
+Ölçüm varsayılan olarak KAPALIDIR; kapalıyken dekoratörün maliyeti tek
+bir bayrak kontrolüdür. analyze.py --profile ile açılır.
+
+Örnek Kullanım:
+    >>> from src.utils.profiling import profiled, profile_stage, enable_profiling
+    >>> enable_profiling()
+    >>> @profiled()
+    ... def calculate_rsi(data): ...
+    >>> with profile_stage('ADIM 1: veri'):
+    ...     data = fetch_stock_data('THYAO')
+    >>> print_profile_report()
+    >>> dump_trace('trace.json')   # chrome://tracing veya ui.perfetto.dev ile açılır
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Profiler:
+    """Aşama bazlı süre, çağrı sayısı ve bayt istatistikleri"""
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Dict[str, Any]]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def reset(self) -> None:
+        """Tüm kayıtları siler"""
+        with self._lock:
+            self.started = time.perf_counter()
+            self.stats.clear()
+            self.events.clear()
+
+    @contextmanager
+    def span(self, name: str):
+        """Bir kod bloğunun süresini 'name' altında kaydeder"""
+        if not self.enabled:
+            yield
+            return
+
+        frame = {'name': name, 'child': 0.0, 'bytes': 0}
+        stack = self._stack()
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1]['child'] += elapsed
+                stack[-1]['bytes'] += frame['bytes']
+            self._record(name, start, elapsed, elapsed - frame['child'], frame['bytes'])
+
+    def _record(self, name: str, start: float, elapsed: float, self_time: float, nbytes: int) -> None:
+        with self._lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = {
+                    'calls': 0, 'total': 0.0, 'self': 0.0, 'min': float('inf'), 'max': 0.0, 'bytes': 0
+                }
+            stat['calls'] += 1
+            stat['total'] += elapsed
+            stat['self'] += self_time
+            stat['min'] = min(stat['min'], elapsed)
+            stat['max'] = max(stat['max'], elapsed)
+            stat['bytes'] += nbytes
+
+            self.events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': round((start - self.started) * 1e6, 1),
+                'dur': round(elapsed * 1e6, 1),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': {'bytes': nbytes} if nbytes else {}
+            })
+
+    def add_bytes(self, nbytes: int) -> None:
+        """Açık olan en içteki aşamaya çekilen bayt ekler"""
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                stack[-1]['bytes'] += int(nbytes)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Toplam süreye göre sıralı istatistik satırları"""
+        with self._lock:
+            rows = [{'name': name, **stat} for name, stat in self.stats.items()]
+        return sorted(rows, key=lambda row: row['total'], reverse=True)
+
+
+_PROFILER = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Modül seviyesindeki varsayılan profiler'ı döndürür"""
+    return _PROFILER
+
+
+def enable_profiling(reset: bool = True) -> None:
+    """Ölçümü açar (varsayılan: önceki kayıtları siler)"""
+    if reset:
+        _PROFILER.reset()
+    _PROFILER.enabled = True
+
+
+def disable_profiling() -> None:
+    """Ölçümü kapatır (kayıtlar korunur)"""
+    _PROFILER.enabled = False
+
+
+def profile_stage(name: str):
+    """
+    Kod bloğunu ölçen context manager.
+
+    Örnek:
+        >>> with profile_stage('ADIM 2: gostergeler'):
+        ...     analysis = analyze_stock(data)
+    """
+    return _PROFILER.span(name)
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Fonksiyonu ölçen dekoratör. Ölçüm kapalıyken doğrudan çağırır.
+
+    Args:
+        name: Rapor adı (varsayılan: fonksiyonun __qualname__'i)
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _PROFILER.enabled:
+                return func(*args, **kwargs)
+            with _PROFILER.span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_bytes(nbytes: int) -> None:
+    """Çekilen veri miktarını açık aşamaya (örn. fetch_stock_data) ekler"""
+    _PROFILER.add_bytes(nbytes)
+
+
+def _format_bytes(nbytes: float) -> str:
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if nbytes < 1024 or unit == 'GB':
+            return f"{nbytes:.0f} {unit}" if unit == 'B' else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+
+
+def print_profile_report() -> None:
+    """Aşama bazlı süre dökümünü terminale yazdırır"""
+    rows = _PROFILER.report()
+
+    print("\n" + "=" * 88)
+    print("PROFIL RAPORU")
+    print("=" * 88)
+
+    if not rows:
+        print("[UYARI] Kayit yok (profil acik mi?)")
+        print("=" * 88)
+        return
+
+    print(f"{'ASAMA':40} {'CAGRI':>6} {'TOPLAM':>10} {'ORTALAMA':>10} {'MAX':>9} {'KENDI':>9} {'VERI':>9}")
+    print("-" * 88)
+    for row in rows:
+        print(f"{row['name'][:40]:40} {row['calls']:>6} {row['total'] * 1000:>8.1f}ms "
+              f"{row['total'] / row['calls'] * 1000:>8.2f}ms {row['max'] * 1000:>7.1f}ms "
+              f"{row['self'] * 1000:>7.1f}ms {_format_bytes(row['bytes']) if row['bytes'] else '-':>9}")
+    print("=" * 88)
+
+
+def dump_trace(path: str) -> bool:
+    """
+    Kayıtları Chrome trace formatında JSON olarak yazar.
+
+    Dosya chrome://tracing veya ui.perfetto.dev ile açılabilir;
+    'summary' alanı print_profile_report ile aynı istatistikleri içerir.
+
+    Returns:
+        bool: Başarılı ise True
+    """
+    with _PROFILER._lock:
+        events = list(_PROFILER.events)
+
+    summary = _PROFILER.report()
+
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms', 'summary': summary}, f, indent=1)
+        print(f"[OK] Profil izi kaydedildi: {path} ({len(events)} olay)")
+        return True
+    except Exception as e:
+        print(f"[HATA] Profil izi kaydedilemedi: {e}")
+        return False
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import tempfile
+
+    print("=" * 60)
+    print("PROFIL MODULU - TEST")
+    print("=" * 60)
+
+    @profiled('icteki')
+    def inner():
+        time.sleep(0.002)
+        record_bytes(2048)
+
+    @profiled('distaki')
+    def outer():
+        for _ in range(3):
+            inner()
+        time.sleep(0.001)
+
+    outer()
+    print(f"\n[OK] Kapaliyken kayit yok: {not _PROFILER.stats}")
+
+    enable_profiling()
+    with profile_stage('ADIM 1'):
+        outer()
+    print_profile_report()
+
+    path = os.path.join(tempfile.gettempdir(), 'profile_test.json')
+    dump_trace(path)
+    with open(path, encoding='utf-8') as f:
+        print(f"[OK] Iz dosyasinda {len(json.load(f)['traceEvents'])} olay var")
+
+    print("\n" + "=" * 60)
+    print("[OK] TEST TAMAMLANDI!")
+    print("=" * 60)
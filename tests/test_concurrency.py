@@ -0,0 +1,21 @@
+"""
+TokenBucket: kesirli hız ve kapasiteyi aşan istek regresyon testleri
+"""
+
+import pytest
+
+from src.data.concurrency import TokenBucket
+
+
+def test_fractional_rate_holds_a_whole_token():
+    bucket = TokenBucket(rate=0.5)
+
+    assert bucket.capacity == 1.0
+    assert bucket.acquire() == 0.0
+
+
+def test_request_above_capacity_raises():
+    bucket = TokenBucket(rate=20, capacity=5)
+
+    with pytest.raises(ValueError):
+        bucket.acquire(6)
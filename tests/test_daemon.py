@@ -0,0 +1,64 @@
+"""
+AnalysisService: ağdan veri çekimi ortak kilidi tutmamalı
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.service import daemon
+from src.service.daemon import AnalysisService
+
+
+def make_data(n: int = 250) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    index = pd.date_range('2024-01-01', periods=n, freq='B')
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+    return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+                         'Volume': rng.integers(100_000, 5_000_000, n).astype(float)}, index=index)
+
+
+def test_slow_fetch_does_not_block_cached_symbols(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_fetch(symbol, **kwargs):
+        calls.append(symbol)
+        started.set()
+        release.wait(5)
+        return make_data()
+
+    monkeypatch.setattr(daemon, 'fetch_stock_data', slow_fetch)
+    service = AnalysisService()
+    service._store('CACHED', make_data())
+
+    results = []
+    fetchers = [threading.Thread(target=lambda: results.append(service.analyze('SLOW')))
+                for _ in range(3)]
+    for thread in fetchers:
+        thread.start()
+    assert started.wait(5)
+
+    # Yavaş çekim sürerken cache'teki hisse hemen cevaplanır
+    cached = []
+    reader = threading.Thread(target=lambda: cached.append(service.analyze('CACHED')))
+    reader.start()
+    reader.join(2)
+    assert cached and cached[0]['symbol'] == 'CACHED'
+
+    release.set()
+    for thread in fetchers:
+        thread.join(5)
+
+    # Aynı hisse için eşzamanlı istekler tek çekimi paylaşır
+    assert calls == ['SLOW']
+    assert len(results) == 3 and all(r['symbol'] == 'SLOW' for r in results)
+
+
+def test_failed_fetch_is_not_cached(monkeypatch):
+    monkeypatch.setattr(daemon, 'fetch_stock_data', lambda symbol, **kwargs: None)
+    service = AnalysisService()
+
+    assert service.analyze('YOK') is None
+    assert service.health()['symbols'] == 0
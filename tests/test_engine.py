@@ -0,0 +1,66 @@
+"""
+Backtest motoru: -%100 getiri ve eşit ağırlıklı portföy regresyon testleri
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.engine import backtest_positions
+
+
+def test_total_loss_does_not_produce_nan_trades():
+    index = pd.bdate_range('2024-01-01', periods=6)
+    close = pd.DataFrame({'AAA': [100.0, 100.0, 0.0, 0.0, 5.0, 5.0]}, index=index)
+    target = pd.DataFrame({'AAA': [1.0, 1.0, 1.0, 0.0, 0.0, 0.0]}, index=index)
+
+    result = backtest_positions(close, target)
+
+    assert (result['returns']['AAA'] >= -1.0).all()
+    assert result['equity']['AAA'].iloc[-1] == 0.0
+    assert result['metrics'].loc['AAA', 'avg_trade'] == -1.0
+    assert np.isfinite(result['portfolio_metrics']['avg_trade'])
+
+
+def test_portfolio_averages_only_listed_symbols():
+    index = pd.bdate_range('2024-01-01', periods=5)
+    close = pd.DataFrame({
+        'AAA': [100.0, 110.0, 121.0, 133.1, 146.41],
+        'BBB': [np.nan, np.nan, np.nan, 50.0, 50.0],  # sonradan halka arz
+    }, index=index)
+    target = pd.DataFrame({'AAA': 1.0, 'BBB': 0.0}, index=index)
+
+    result = backtest_positions(close, target, commission=0.0, slippage=0.0)
+    portfolio = result['portfolio']['returns']
+
+    # BBB listelenmeden önce portföy getirisi sadece AAA'nınkidir
+    assert np.isclose(portfolio.iloc[2], 0.10)
+    # BBB listelendikten sonra (nakitte) ortalamaya katılır
+    assert np.isclose(portfolio.iloc[4], 0.05)
+
+
+def test_position_held_through_gap_realizes_move():
+    index = pd.bdate_range('2024-01-01', periods=5)
+    close = pd.DataFrame({'AAA': [100.0, 100.0, np.nan, 50.0, 50.0]}, index=index)
+    target = pd.DataFrame({'AAA': 1.0}, index=index)
+
+    result = backtest_positions(close, target, commission=0.0, slippage=0.0)
+
+    assert np.allclose(result['equity']['AAA'].to_numpy(), [1.0, 1.0, 1.0, 0.5, 0.5])
+    assert np.isclose(result['portfolio']['equity'].iloc[-1], 0.5)
+
+
+def test_optimizer_segment_metrics_match_engine_portfolio():
+    from src.backtesting.optimizer import _segment_metrics
+
+    rng = np.random.default_rng(3)
+    index = pd.bdate_range('2024-01-01', periods=60)
+    close = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.02, (60, 3)), axis=0)),
+                         index=index, columns=['AAA', 'BBB', 'CCC'])
+    close.iloc[:30, 2] = np.nan  # sonradan halka arz
+    target = pd.DataFrame((rng.random((60, 3)) > 0.5).astype(float), index=index, columns=close.columns)
+
+    result = backtest_positions(close, target)
+    metrics = _segment_metrics(result['positions'], result['returns'], close.to_numpy())
+
+    for name in ['sharpe', 'total_return', 'max_drawdown', 'exposure']:
+        assert np.isclose(metrics[name], result['portfolio_metrics'][name])
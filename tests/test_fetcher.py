@@ -0,0 +1,148 @@
+"""
+get_multiple_stocks toplu indirme yolu için regresyon testleri
+
+Ağa çıkılmaz: toplu indirme sahte downloader ile, tek tek deneme
+(fetch_stock_data) kayıt tutan bir taklit ile değiştirilir.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from src.data import fetcher
+from src.data.cache import OHLCVCache
+
+
+STALE = datetime.now(timezone.utc) - timedelta(days=10)
+
+
+def make_bars(n: int = 30, end: str = '2025-11-07') -> pd.DataFrame:
+    index = pd.bdate_range(end=end, periods=n, tz='Europe/Istanbul')
+    close = np.linspace(100, 110, n)
+    return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                         'Volume': 1000.0}, index=index)
+
+
+def setup_stale_cache(tmp_path, monkeypatch, symbols):
+    """Bayat cache + tek tek denemeleri kaydeden fetch_stock_data taklidi"""
+    cache = OHLCVCache(str(tmp_path))
+    for symbol in symbols:
+        cache.save(symbol, make_bars(), period='1y', fetched_at=STALE)
+
+    fallback = []
+    monkeypatch.setattr(fetcher, 'get_default_cache', lambda: cache)
+    monkeypatch.setattr(fetcher, 'fetch_stock_data',
+                        lambda symbol, **kwargs: fallback.append(symbol))
+    return cache, fallback
+
+
+def test_failed_batch_falls_back_and_keeps_cache_stale(tmp_path, monkeypatch):
+    symbols = ['THYAO', 'GARAN']
+    cache, fallback = setup_stale_cache(tmp_path, monkeypatch, symbols)
+
+    def downloader(*args, **kwargs):
+        raise ConnectionError('ag yok')
+
+    results = fetcher.get_multiple_stocks(symbols, downloader=downloader, show_stats=False)
+
+    assert results == {}
+    assert sorted(fallback) == sorted(symbols)
+    for symbol in symbols:
+        assert cache.load_meta(symbol)['fetched_at'] == STALE.isoformat()
+
+
+def test_symbol_missing_from_batch_goes_to_fallback(tmp_path, monkeypatch):
+    symbols = ['THYAO', 'GARAN']
+    cache, fallback = setup_stale_cache(tmp_path, monkeypatch, symbols)
+    delta = make_bars(3, end='2025-11-12')
+
+    def downloader(tickers, **kwargs):
+        # Sadece THYAO cevapta var
+        return pd.concat({'THYAO.IS': delta}, axis=1)
+
+    results = fetcher.get_multiple_stocks(symbols, downloader=downloader, show_stats=False)
+
+    assert list(results) == ['THYAO']
+    assert results['THYAO'].index[-1] == delta.index[-1]
+    assert fallback == ['GARAN']
+    assert cache.load_meta('GARAN')['fetched_at'] == STALE.isoformat()
+    assert cache.load_meta('THYAO')['fetched_at'] != STALE.isoformat()
+
+
+def test_append_without_response_does_not_touch_cache(tmp_path):
+    cache = OHLCVCache(str(tmp_path))
+    cache.save('THYAO', make_bars(), period='1y', fetched_at=STALE)
+
+    merged = cache.append('THYAO', None)
+
+    assert len(merged) == 30
+    assert cache.load_meta('THYAO')['fetched_at'] == STALE.isoformat()
+
+
+class FakeTicker:
+    """İstekleri kaydeden, verilen barları döndüren sağlayıcı taklidi"""
+
+    def __init__(self, bars, requests):
+        self.bars, self.requests = bars, requests
+
+    def history(self, **request):
+        self.requests.append(request)
+        if 'start' in request:
+            return self.bars[self.bars.index >= request['start']].copy()
+        return self.bars.copy()
+
+
+def test_old_intraday_base_is_refetched_in_full_and_merged(tmp_path, monkeypatch):
+    now = pd.Timestamp.now(tz='Europe/Istanbul').floor('min')
+    old = make_bars(30, end=str((now - pd.Timedelta(days=20)).date()))
+    old.index = old.index + pd.Timedelta(hours=10)
+    recent = pd.DataFrame(old.iloc[:3].to_numpy(), columns=old.columns,
+                          index=pd.date_range(now - pd.Timedelta(minutes=2), periods=3, freq='min'))
+
+    cache = OHLCVCache(str(tmp_path))
+    cache.save('THYAO', old, period='max', interval='1m', fetched_at=STALE)
+    requests = []
+    monkeypatch.setattr(fetcher, 'get_provider',
+                        lambda: type('P', (), {'ticker': lambda self, s: FakeTicker(recent, requests)})())
+
+    data = fetcher.fetch_stock_data('THYAO', period='5d', interval='1m', cache=cache)
+
+    assert requests == [{'interval': '1m', 'period': '5d'}]
+    stored = cache.load('THYAO', '1m')['data']
+    assert len(stored) == len(old) + len(recent)
+    assert stored.index[-1] == recent.index[-1]
+    assert data.index[-1] == recent.index[-1]
+
+
+def test_readjusted_history_drops_cache_and_refetches_full_period(tmp_path, monkeypatch):
+    cache = OHLCVCache(str(tmp_path))
+    cache.save('THYAO', make_bars(), period='1y', fetched_at=STALE)
+
+    # Temettü sonrası sağlayıcı tüm geçmişi %2 aşağı ölçekler
+    adjusted = pd.concat([make_bars() * [0.98, 0.98, 0.98, 0.98, 1.0],
+                          make_bars(3, end='2025-11-12')])
+    adjusted = adjusted[~adjusted.index.duplicated(keep='last')]
+    requests = []
+    monkeypatch.setattr(fetcher, 'get_provider',
+                        lambda: type('P', (), {'ticker': lambda self, s: FakeTicker(adjusted, requests)})())
+
+    data = fetcher.fetch_stock_data('THYAO', period='1y', cache=cache)
+
+    assert requests == [{'interval': '1d', 'start': '2025-11-07'}, {'period': '1y', 'interval': '1d'}]
+    assert len(data) == len(adjusted)
+    stored = cache.load('THYAO')['data']
+    assert np.allclose(stored['Close'].to_numpy(), adjusted['Close'].to_numpy())
+
+
+def test_append_keeps_cache_when_overlap_matches(tmp_path):
+    cache = OHLCVCache(str(tmp_path))
+    cache.save('THYAO', make_bars(), period='1y', fetched_at=STALE)
+    delta = make_bars(3, end='2025-11-11')
+    # Seans içinde yazılmış son barın kapanışı değişebilir, Open'ı değişmez
+    delta.loc[delta.index[0]] = [110.0, 112.0, 110.0, 112.0, 2000.0]
+
+    merged = cache.append('THYAO', delta)
+
+    assert len(merged) == 32
+    assert merged.loc[delta.index[0], 'Close'] == 112.0
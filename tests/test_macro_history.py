@@ -0,0 +1,30 @@
+"""
+MacroHistoryStore için regresyon testleri
+"""
+
+from src.macro.history import MacroHistoryStore
+
+
+def test_backfill_does_not_overwrite_live_snapshot(tmp_path):
+    store = MacroHistoryStore(str(tmp_path / 'macro.db'))
+    live = {'last_update': '2025-11-10 18:30:00', 'tcmb_rate': 39.5,
+            'usd_try': {'current': 42.1, 'change_30d': 1.2}}
+    store.append(live)
+
+    backfilled = {
+        '2025-11-07': {'tcmb_rate': None, 'usd_try': {'current': 41.9, 'change_30d': 1.0}},
+        '2025-11-10': {'tcmb_rate': None, 'usd_try': {'current': 42.0, 'change_30d': 1.1}},
+    }
+    written = store.append_many(backfilled)
+
+    assert written == 1
+    assert store.as_of('2025-11-10') == live
+    assert store.as_of('2025-11-07') == backfilled['2025-11-07']
+
+
+def test_live_append_replaces_same_day(tmp_path):
+    store = MacroHistoryStore(str(tmp_path / 'macro.db'))
+    store.append({'tcmb_rate': 39.5}, as_of_date='2025-11-10')
+    store.append({'tcmb_rate': 38.0}, as_of_date='2025-11-10')
+
+    assert store.as_of('2025-11-10') == {'tcmb_rate': 38.0}
@@ -0,0 +1,50 @@
+"""
+Panel göstergelerinin boşluklu sütunlarda tek hisse fonksiyonlarıyla
+aynı kaldığını doğrulayan regresyon testleri
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.indicators.panel import calculate_panel_indicators, panel_snapshot
+from src.indicators.momentum import calculate_macd, calculate_rsi
+
+
+def make_panel(n: int = 260, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2024-01-01', periods=n)
+    close = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n, 3)), axis=0)),
+                         index=index, columns=['AAA', 'BBB', 'CCC'])
+    volume = pd.DataFrame(rng.integers(1_000, 9_000, (n, 3)).astype(float),
+                          index=index, columns=close.columns)
+    return close, volume
+
+
+def test_interior_gap_matches_single_symbol():
+    close, volume = make_panel()
+    close.iloc[100:105, 1] = np.nan  # BBB işlem durdurma
+    volume.iloc[100:105, 1] = np.nan
+
+    indicators = calculate_panel_indicators(close, volume)
+    single = pd.DataFrame({'Close': close['BBB']}).dropna()
+
+    expected_rsi = calculate_rsi(single)
+    expected_macd = calculate_macd(single)[0]
+    pd.testing.assert_series_equal(indicators['rsi']['BBB'].dropna(), expected_rsi.dropna(),
+                                   check_names=False)
+    pd.testing.assert_series_equal(indicators['macd']['BBB'].dropna(), expected_macd.dropna(),
+                                   check_names=False)
+    assert indicators['rsi']['BBB'].iloc[100:105].isna().all()
+
+
+def test_snapshot_uses_each_symbols_last_bar():
+    close, volume = make_panel()
+    close.iloc[-1, 2] = np.nan  # CCC son gün bar yok
+    volume.iloc[-1, 2] = np.nan
+
+    table = panel_snapshot(calculate_panel_indicators(close, volume))
+
+    assert table.notna().all().all()
+    assert table.loc['CCC', 'close'] == close['CCC'].iloc[-2]
+    expected = calculate_rsi(pd.DataFrame({'Close': close['CCC']}).dropna()).iloc[-1]
+    assert np.isclose(table.loc['CCC', 'rsi'], expected)
@@ -0,0 +1,77 @@
+"""
+PrimitiveCache geçersiz kılma ve paylaşılan sonuç regresyon testleri
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.indicators.primitives import PrimitiveCache
+
+
+def make_data(n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    index = pd.bdate_range('2024-01-01', periods=n, tz='Europe/Istanbul')
+    return pd.DataFrame({'Close': 100 + np.cumsum(rng.normal(0, 1, n))}, index=index)
+
+
+def test_history_change_with_same_last_bar_invalidates():
+    cache = PrimitiveCache()
+    data = make_data()
+    cache.sma(data, 20)
+
+    data.iloc[100, 0] += 5.0
+    result = cache.sma(data, 20)
+
+    pd.testing.assert_series_equal(result, data['Close'].rolling(window=20).mean())
+    assert cache.stats()['misses'] == 2
+
+
+def test_mutating_result_does_not_corrupt_cache():
+    cache = PrimitiveCache()
+    data = make_data()
+
+    first = cache.sma(data, 20)
+    first.iloc[-1] = -1.0
+    second = cache.sma(data, 20)
+
+    assert second.iloc[-1] == data['Close'].iloc[-20:].mean()
+    assert cache.stats()['hits'] == 1
+
+
+def test_counters_are_consistent_under_threads():
+    cache = PrimitiveCache()
+    data = make_data()
+
+    def worker():
+        for period in range(5, 25):
+            cache.sma(data, period)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8 * 20
+
+
+def test_frame_collected_while_lock_is_held_does_not_deadlock():
+    cache = PrimitiveCache()
+    data = make_data()
+    cache.sma(data, 20)
+
+    def collect_under_lock():
+        nonlocal data
+        # _column_store içinde GC tetiklenmesinin benzeri: callback aynı thread'de
+        with cache._lock:
+            data = None
+
+    thread = threading.Thread(target=collect_under_lock, daemon=True)
+    thread.start()
+    thread.join(timeout=2.0)
+
+    assert not thread.is_alive()
+    assert cache.stats()['frames'] == 0
@@ -0,0 +1,100 @@
+"""
+BarStore sürüm anahtarı ve artımlı yeniden örnekleme regresyon testleri
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import OHLCVCache
+from src.data.resample import BarStore, resample_ohlcv
+
+
+def make_minutes(n_days: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(4)
+    days = pd.bdate_range('2025-10-01', periods=n_days)
+    index = pd.DatetimeIndex(np.concatenate([
+        (day + pd.Timedelta(hours=10) + pd.to_timedelta(np.arange(480), unit='min')).values
+        for day in days
+    ])).tz_localize('Europe/Istanbul')
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, len(index))))
+    return pd.DataFrame({'Open': close, 'High': close * 1.001, 'Low': close * 0.999,
+                         'Close': close, 'Volume': rng.integers(100, 10_000, len(index)).astype(float)},
+                        index=index)
+
+
+def test_corrected_last_bar_invalidates_derived_frame():
+    base = make_minutes()
+    store = BarStore()
+    store.ingest('TEST', base, persist=False)
+    store.bars('TEST', '15m', refresh=False)
+
+    corrected = base.iloc[-1:].copy()
+    corrected['Close'] *= 1.05
+    store.ingest('TEST', corrected, persist=False)
+    result = store.bars('TEST', '15m', refresh=False)
+
+    expected = pd.concat([base.iloc[:-1], corrected])
+    assert result.equals(resample_ohlcv(expected, '15m'))
+    assert store.counts['hit'] == 0
+
+
+def test_rewritten_last_bar_with_new_bars_recomputes_changed_bins():
+    base = make_minutes()
+    store = BarStore()
+    store.ingest('TEST', base.iloc[:-60], persist=False)
+    store.bars('TEST', '1h', refresh=False)
+
+    # Eski son bar düzeltildi ve yeni barlar geldi: sadece sona ekleme değil
+    changed = base.copy()
+    changed.iloc[len(base) - 61, changed.columns.get_loc('High')] *= 1.2
+    store.ingest('TEST', changed.iloc[-61:], persist=False)
+    result = store.bars('TEST', '1h', refresh=False)
+
+    assert result.equals(resample_ohlcv(changed, '1h'))
+
+
+def test_overlapping_ingest_correcting_earlier_bar_recomputes_its_bin():
+    base = make_minutes()
+    store = BarStore()
+    store.ingest('T', base.iloc[:-30], persist=False)
+    store.bars('T', '1h', refresh=False)
+
+    # 200 dakika önceki barın düzeltmesi + yeni barlar tek ingest'te
+    changed = base.copy()
+    position = len(base) - 30 - 200
+    changed.iloc[position, changed.columns.get_loc('High')] *= 1.2
+    store.ingest('T', changed.iloc[position:], persist=False)
+    result = store.bars('T', '1h', refresh=False)
+
+    assert result.equals(resample_ohlcv(changed, '1h'))
+    assert store.counts['incremental'] == 1
+
+
+def test_untracked_base_change_recomputes_in_full():
+    base = make_minutes()
+    store = BarStore()
+    store.resample('T', base, '1h')
+
+    changed = base.copy()
+    changed.iloc[10, changed.columns.get_loc('Low')] *= 0.5
+    changed = pd.concat([changed, base.iloc[-1:].set_axis(base.index[-1:] + pd.Timedelta(minutes=1))])
+    result = store.resample('T', changed, '1h')
+
+    assert result.equals(resample_ohlcv(changed, '1h'))
+    assert store.counts == {'hit': 0, 'incremental': 0, 'full': 2}
+
+
+def test_disk_version_sees_same_shape_rewrite(tmp_path):
+    base = make_minutes(1)
+    cache = OHLCVCache(str(tmp_path))
+    store = BarStore(cache)
+    store.ingest('TEST', base)
+    first = store.bars('TEST', '1d', refresh=False)
+
+    # Başka bir süreç aynı satır sayısı/zamanla farklı son bar yazdı
+    changed = base.copy()
+    changed.iloc[-1, changed.columns.get_loc('Close')] += 1.0
+    cache.save('TEST', changed, period='max', interval='1m', fetched_at=pd.Timestamp(0, tz='UTC'))
+    second = store.bars('TEST', '1d', refresh=False)
+
+    assert second['Close'].iloc[-1] == first['Close'].iloc[-1] + 1.0
@@ -0,0 +1,21 @@
+"""
+Tarama raporunda eksik değerlerin yazdırılması
+"""
+
+import numpy as np
+import pandas as pd
+
+from screen import print_screen_report
+
+
+def test_missing_values_are_printed_as_dash(capsys):
+    table = pd.DataFrame([{
+        'rank': 1, 'symbol': 'THYAO', 'price': 300.5, 'signal': 'BUY', 'confidence': 70,
+        'score': 12, 'buy_count': 5, 'sell_count': 1, 'rsi': None,
+        'hybrid_score': np.nan, 'hybrid_signal': 'AL',
+    }]).astype({'rsi': object})
+
+    print_screen_report(table)
+
+    line = [l for l in capsys.readouterr().out.splitlines() if 'THYAO' in l][0]
+    assert line.split()[-3:] == ['-', '-', 'AL']
@@ -0,0 +1,23 @@
+"""
+Etkileşimsiz hisse kodu çözümlemesi: geçerli görünen kodlar değiştirilmez
+"""
+
+import pytest
+
+from src.data.symbol_matcher import resolve_symbol
+
+
+@pytest.mark.parametrize('query', ['KRDMA', 'KRDMB', 'VAKFN'])
+def test_plausible_tickers_are_not_rewritten(query):
+    assert resolve_symbol(query) is None
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('thyao.is', 'THYAO'),
+    ('THYA', 'THYAO'),
+    ('TYHAO', 'THYAO'),
+    ('türk hava', 'THYAO'),
+    ('AKBANK', 'AKBNK'),
+])
+def test_typos_and_names_still_resolve(query, expected):
+    assert resolve_symbol(query) == expected
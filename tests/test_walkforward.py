@@ -0,0 +1,90 @@
+"""
+Walk-forward out-of-sample eğrisinin pencere sınırı regresyon testleri
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.engine import DEFAULT_COMMISSION, DEFAULT_SLIPPAGE
+from src.backtesting.optimizer import SharedArrays, _WORKER, strategy_for_params
+from src.backtesting.walkforward import _init_walk_forward, make_folds, stitch_out_of_sample
+
+COST = DEFAULT_COMMISSION + DEFAULT_SLIPPAGE
+
+
+def make_close(n_bars: int = 700, n_symbols: int = 4) -> np.ndarray:
+    rng = np.random.default_rng(8)
+    return 100 * np.exp(np.cumsum(rng.normal(0.0, 0.03, (n_bars, n_symbols)), axis=0))
+
+
+def stitched(close: np.ndarray, folds, chosen):
+    with SharedArrays({'close': close}) as shared:
+        _init_walk_forward(shared.specs, folds, (DEFAULT_COMMISSION, DEFAULT_SLIPPAGE))
+        try:
+            result = stitch_out_of_sample(folds, chosen)
+            strategies = [tuple(f.to_numpy() for f in strategy_for_params(p)) for p in chosen]
+        finally:
+            _WORKER.clear()
+    return result, strategies
+
+
+def carried_reference(close: np.ndarray, folds, positions):
+    """Bar bar döngüyle devralınan pozisyon ve net getiri (test_end'ler ardışık)"""
+    asset = np.zeros_like(close)
+    asset[1:] = close[1:] / close[:-1] - 1
+    held = np.zeros(close.shape[1])
+    expected_pos, expected_ret = [], []
+
+    for (_, train_end, test_end), position in zip(folds, positions):
+        following = np.zeros(close.shape[1], dtype=bool)
+        for t in range(train_end, test_end):
+            following |= position[t] != position[t - 1]
+            current = np.where(following, position[t], held)
+            expected_ret.append(current * asset[t] - np.abs(current - held) * COST)
+            expected_pos.append(current)
+            held = current
+
+    return np.array(expected_pos), np.array(expected_ret)
+
+
+def test_same_combo_carries_cash_until_first_trade_then_matches_continuous_run():
+    close = make_close()
+    folds = make_folds(len(close), 300, 100)
+    params = {'entry_score': 10, 'exit_score': -10}
+
+    (index, position, returns), strategies = stitched(close, folds, [params] * len(folds))
+    full_pos, full_ret = strategies[0]
+    expected_pos, expected_ret = carried_reference(close, folds, [full_pos] * len(folds))
+
+    assert np.array_equal(index, np.arange(300, 700))
+    assert np.array_equal(position, expected_pos)
+    assert np.allclose(returns, expected_ret)
+
+    # İlk işlemden sonra pencere sınırları sürekli çalıştırmayı bozmaz
+    changed = np.diff(full_pos[299:], axis=0) != 0
+    following = np.logical_or.accumulate(changed, axis=0)
+    after = np.vstack([np.zeros((1, following.shape[1]), dtype=bool), following[:-1]])
+    assert after[-1].any()
+    assert np.array_equal(position[following], full_pos[300:][following])
+    assert np.allclose(returns[after], full_ret[300:][after])
+
+
+def test_boundary_holds_previous_fold_position_until_new_combo_trades():
+    close = make_close()
+    folds = make_folds(len(close), 300, 200)
+    chosen = [{'entry_score': 10, 'exit_score': -10}, {'entry_score': 90, 'exit_score': 80}]
+
+    (_, position, returns), strategies = stitched(close, folds, chosen)
+    expected_pos, expected_ret = carried_reference(close, folds, [p for p, _ in strategies])
+
+    assert np.array_equal(position, expected_pos)
+    assert np.allclose(returns, expected_ret)
+
+    # Hiç işlem yapmayan kombinasyon ilk pencerenin kapanış pozisyonunu
+    # pencere sonuna kadar taşır (kendi sanal nakit pozisyonuna geçmez)
+    idle = [chosen[0], {'entry_score': 1000, 'exit_score': -1000}]
+    (_, position, returns), _ = stitched(close, folds, idle)
+
+    assert position[199].any()
+    assert np.array_equal(position[200:], np.broadcast_to(position[199], position[200:].shape))
+    assert np.allclose(returns[201:], position[199] * (close[501:] / close[500:-1] - 1))
@@ -0,0 +1,106 @@
+"""
+Hisse Verisi Güncelleme Scripti
+
+BIST hisselerinin fiyat verilerini data/ohlcv/ cache'ine çeker.
+Cache'te verisi olan hisseler için sadece yeni barlar indirilir
+(artımlı güncelleme), yoksa tüm periyot çekilir.
+
+Gece çalıştırılarak ertesi günün analizleri internete çıkmadan yapılabilir.
+"""
+
+import argparse
+import sys
+from src.data.fetcher import get_multiple_stocks
+from src.data.concurrency import configure_rate_limit
+from src.data.bist_stocks import get_stock_list
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Hisse fiyat verilerini cache\'e cek/guncelle',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ornekler:
+  python update_data.py                          # BIST100, 5 yillik gunluk veri
+  python update_data.py --list BIST30            # Sadece BIST30
+  python update_data.py THYAO SASA --period max  # Belirli hisseler, tum gecmis
+  python update_data.py --full                   # Bayat cache'i artimli degil, bastan cek
+        """
+    )
+    
+    parser.add_argument(
+        'symbols',
+        nargs='*',
+        help='Hisse kodlari (bos birakilirsa --list kullanilir)'
+    )
+    
+    parser.add_argument(
+        '--list',
+        type=str,
+        default='BIST100',
+        help='Hisse listesi: BIST30, BIST100, POPULAR (varsayilan: BIST100)'
+    )
+    
+    parser.add_argument(
+        '--period',
+        type=str,
+        default='5y',
+        help='Cache\'te tutulacak periyot (varsayilan: 5y)'
+    )
+    
+    parser.add_argument(
+        '--interval',
+        type=str,
+        default='1d',
+        help='Veri araligi (varsayilan: 1d)'
+    )
+    
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Bayat cache icin artimli guncelleme yerine tum periyodu yeniden cek'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Eszamanli istek sayisi (varsayilan: 8)'
+    )
+    
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=5.0,
+        help='Saniyede izin verilen istek sayisi (varsayilan: 5)'
+    )
+    
+    args = parser.parse_args()
+    
+    configure_rate_limit(args.rate)
+    
+    symbols = [s.upper() for s in args.symbols] or get_stock_list(args.list)
+    
+    print("=" * 70)
+    print(f"HISSE VERISI GUNCELLEMESI ({len(symbols)} hisse, {args.period}, {args.interval})")
+    print("=" * 70)
+    
+    results = get_multiple_stocks(
+        symbols,
+        period=args.period,
+        interval=args.interval,
+        incremental=not args.full,
+        max_workers=args.workers
+    )
+    
+    if not results:
+        print("[ERROR] Hicbir hisse verisi cekilemedi!")
+        sys.exit(1)
+    
+    failed = [s for s in symbols if s not in results]
+    if failed:
+        print(f"[WARN] Cekilemeyen hisseler: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
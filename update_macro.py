@@ -6,8 +6,6 @@ Makroekonomik verileri günceller ve config/macro_data.json'a kaydeder.
 
 import argparse
 import sys
-from src.macro.fetcher import MacroDataFetcher
-from src.reporting.terminal import print_macro_data_summary
 
 
 def main():
@@ -19,6 +17,8 @@ Ornekler:
   python update_macro.py                    # Tum verileri guncelle
   python update_macro.py --tcmb-rate 51.5   # TCMB faizini guncelle
   python update_macro.py --show             # Mevcut verileri goster
+  python update_macro.py --backfill 5y      # Makro gecmisi doldur (backtest icin)
+  python update_macro.py --replay data/tapes  # Kayitli veriden (internetsiz) guncelle
         """
     )
     
@@ -34,10 +34,49 @@ Ornekler:
         help='Mevcut makro verileri goster (guncelleme yapma)'
     )
     
+    parser.add_argument(
+        '--backfill',
+        type=str,
+        metavar='PERIOD',
+        help='Makro gecmis deposunu doldur (ornek: 1y, 5y, max)'
+    )
+    
+    parser.add_argument(
+        '--record',
+        type=str,
+        metavar='KLASOR',
+        help='Cekilen ham verileri klasore kaydet (sonra --replay ile kullanilir)'
+    )
+    
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='KLASOR',
+        help='Internete cikmadan kayitli veriyi kullan'
+    )
+    
     args = parser.parse_args()
     
+    # Ağır modüller (pandas, yfinance) argümanlar okunduktan sonra yüklenir:
+    # --help anında cevaplanır
+    from src.macro.fetcher import MacroDataFetcher
+    from src.reporting.terminal import print_macro_data_summary
+    
+    if args.record or args.replay:
+        from src.data.providers import configure_provider
+        try:
+            configure_provider(record=args.record, replay=args.replay)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+    
     fetcher = MacroDataFetcher()
     
+    # Geçmiş doldurma modu
+    if args.backfill:
+        written = fetcher.backfill_history(period=args.backfill)
+        sys.exit(0 if written else 1)
+    
     # Sadece gösterme modu
     if args.show:
         print("Mevcut makro veriler yukleniyor...")